@@ -0,0 +1 @@
+"""Micro-benchmarks for the Python client (not part of the package)."""
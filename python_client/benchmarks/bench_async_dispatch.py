@@ -0,0 +1,84 @@
+"""
+Benchmark how long a slow subscriber stalls reading attribute_updated events, sync vs async dispatch.
+
+Run with: python -m benchmarks.bench_async_dispatch
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+from matter_server.client import MatterClient
+from matter_server.client.dispatch import DispatchOptions, OverflowPolicy
+from matter_server.common.models import EventMessage, EventType
+
+from .common import make_attribute_updates, make_fabric, report
+
+NODE_COUNT = 10
+BRIDGED_ENDPOINTS = 4
+# e.g. a subscriber writing to a database or pushing to a remote service
+CALLBACK_TIME = 0.0005
+
+
+def make_client(async_dispatch: bool) -> MatterClient:
+    """Return a client with the nodes of a fabric."""
+    client = MatterClient(
+        "ws://localhost:5580/ws",
+        MagicMock(),
+        dispatch_options=DispatchOptions(async_dispatch=async_dispatch, overflow_policy=OverflowPolicy.COALESCE),
+    )
+    client._loop = asyncio.get_running_loop()
+    for node_data in make_fabric(NODE_COUNT, bridged_endpoints=BRIDGED_ENDPOINTS):
+        client._handle_event_message(EventMessage(event=EventType.NODE_ADDED, data=node_data))
+    return client
+
+
+async def read_messages(client: MatterClient, messages: list[EventMessage]) -> float:
+    """Return the time it takes the read loop to handle the messages (yielding after each read)."""
+    start = time.perf_counter()
+    for message in messages:
+        client._handle_event_message(message)
+        if client._dispatcher.full:
+            await client._dispatcher.wait_for_space()
+        # receiving the next frame from the websocket
+        await asyncio.sleep(0)
+    return time.perf_counter() - start
+
+
+async def run() -> None:
+    """Run the benchmark."""
+    updates = make_attribute_updates(NODE_COUNT, bridged_endpoints=BRIDGED_ENDPOINTS) * 5
+    messages = [EventMessage(event=EventType.ATTRIBUTE_UPDATED, data=x["data"]) for x in updates]
+
+    def slow_callback(_event: EventType, _data: Any) -> None:
+        time.sleep(CALLBACK_TIME)
+
+    async def slow_async_callback(_event: EventType, _data: Any) -> None:
+        await asyncio.sleep(CALLBACK_TIME)
+
+    client = make_client(async_dispatch=False)
+    client.subscribe_events(slow_callback, EventType.ATTRIBUTE_UPDATED)
+    before = await read_messages(client, messages)
+
+    async_client = make_client(async_dispatch=True)
+    async_client.subscribe_events(slow_async_callback, EventType.ATTRIBUTE_UPDATED)
+    after = await read_messages(async_client, messages)
+
+    report(f"reading {len(messages)} attribute updates with a slow subscriber", before, after, len(messages), "event")
+    (metrics,) = async_client.get_subscriber_metrics()
+    print(
+        f"  async subscriber: max queue depth {metrics.max_queue_depth}, "
+        f"{metrics.coalesced} coalesced, {metrics.dropped} dropped"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
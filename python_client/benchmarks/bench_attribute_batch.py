@@ -0,0 +1,72 @@
+"""
+Benchmark bursts of attribute_updated events, one by one vs batched per node.
+
+Run with: python -m benchmarks.bench_attribute_batch
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+from matter_server.client import MatterClient
+from matter_server.common.models import EventMessage, EventType
+
+from .common import make_attribute_updates, make_fabric, measure, report
+
+NODE_COUNT = 20
+BRIDGED_ENDPOINTS = 8
+
+
+def make_client(batch_attribute_updates: bool) -> MatterClient:
+    """Return a client with the nodes of a fabric and a subscriber to the attribute updates."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock(), batch_attribute_updates=batch_attribute_updates)
+    client._loop = asyncio.get_running_loop()
+    for node_data in make_fabric(NODE_COUNT, bridged_endpoints=BRIDGED_ENDPOINTS):
+        client._handle_event_message(EventMessage(event=EventType.NODE_ADDED, data=node_data))
+    return client
+
+
+async def run() -> None:
+    """Run the benchmark."""
+    # a burst of updates per node, e.g. a light changing level and color at once
+    updates = make_attribute_updates(NODE_COUNT, bridged_endpoints=BRIDGED_ENDPOINTS)
+    messages = [
+        EventMessage(event=EventType.ATTRIBUTE_UPDATED, data=x["data"])
+        for x in sorted(updates, key=lambda x: x["data"][0])
+    ]
+    received: list[Any] = []
+
+    client = make_client(batch_attribute_updates=False)
+    client.subscribe_events(lambda _, data: received.append(data), EventType.ATTRIBUTE_UPDATED)
+
+    def one_by_one() -> None:
+        for message in messages:
+            client._handle_event_message(message)
+
+    batched_client = make_client(batch_attribute_updates=True)
+    batched_client.subscribe_attribute_updates(lambda _, updates: received.append(updates))
+
+    def batched() -> None:
+        for message in messages:
+            batched_client._handle_event_message(message)
+        # what the event loop does on its next iteration
+        batched_client._flush_attribute_updates()
+
+    report(
+        f"burst of {len(messages)} attribute updates of {NODE_COUNT} nodes",
+        measure(one_by_one),
+        measure(batched),
+        len(messages),
+        "update",
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark the integer id attribute index vs string attribute paths.
+
+Run with: python -m benchmarks.bench_attribute_index
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from chip.clusters import Objects as Clusters
+from matter_server.client.models.attribute_index import AttributeIndex, parse_path
+from matter_server.common.helpers.util import create_attribute_path, parse_attribute_path
+
+from .common import make_node_data, measure, report
+
+BRIDGED_ENDPOINTS = 100
+
+
+def group_by_endpoint(attributes: dict[str, Any]) -> dict[int, dict[str, Any]]:
+    """Group the raw attributes per endpoint by splitting the paths (as done on every node update before)."""
+    endpoint_data: dict[int, dict[str, Any]] = {}
+    for attribute_path, attribute_data in attributes.items():
+        endpoint_id = int(attribute_path.split("/")[0])
+        if endpoint_id not in endpoint_data:
+            endpoint_data[endpoint_id] = {}
+        endpoint_data[endpoint_id][attribute_path] = attribute_data
+    return endpoint_data
+
+
+def group_by_index(index: AttributeIndex, attributes: dict[str, Any]) -> dict[int, dict[str, Any]]:
+    """Group the raw attributes per endpoint with the (updated) index."""
+    index.update(attributes)
+    return {
+        endpoint_id: {path: attributes[path] for paths in clusters.values() for path in paths.values()}
+        for endpoint_id, clusters in index.by_endpoint.items()
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    attributes = make_node_data(1, bridged_endpoints=BRIDGED_ENDPOINTS)["attributes"]
+    index = AttributeIndex(attributes)
+    count = len(attributes)
+
+    report(
+        f"group node attributes per endpoint ({count} attributes)",
+        measure(lambda: group_by_endpoint(attributes)),
+        measure(lambda: group_by_index(index, attributes)),
+        count,
+        "attribute",
+    )
+
+    paths = list(attributes)
+    report(
+        f"parse attribute paths ({count} paths)",
+        measure(lambda: [parse_attribute_path(path) for path in paths]),
+        measure(lambda: [parse_path(path) for path in paths]),
+        count,
+        "path",
+    )
+
+    ids = [parse_path(path) for path in paths]
+    report(
+        f"has attribute ({count} lookups)",
+        measure(lambda: [create_attribute_path(*x) in attributes for x in ids]),
+        measure(lambda: [x in index for x in ids]),
+        count,
+        "lookup",
+    )
+
+    cluster_id = Clusters.OnOff.id
+    prefix = f"/{cluster_id}/"
+    report(
+        f"all OnOff attributes across endpoints ({count} attributes)",
+        measure(lambda: [path for path in attributes if prefix in path]),
+        measure(lambda: [path for _, path in index.query(cluster_id=cluster_id)]),
+        BRIDGED_ENDPOINTS,
+        "endpoint",
+    )
+
+
+if __name__ == "__main__":
+    main()
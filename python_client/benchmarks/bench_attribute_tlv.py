@@ -0,0 +1,90 @@
+"""
+Benchmark TLV encoding/decoding of all standard attributes.
+
+Run with: python -m benchmarks.bench_attribute_tlv
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from chip import tlv
+from chip.clusters.ClusterObjects import ALL_ATTRIBUTES, ClusterAttributeDescriptor
+
+from .common import make_raw_value, measure, report
+
+
+def interpreted_to_tlv(attribute: type[ClusterAttributeDescriptor], value: Any) -> bytearray:
+    """Encode an attribute value by interpreting its field descriptor (the path before compiled encoders)."""
+    writer = tlv.TLVWriter()  # type: ignore[no-untyped-call]
+    obj_class: Any = attribute._cluster_object
+    attribute.attribute_type.PutFieldToTLV(None, asdict(obj_class(Value=value))["Value"], writer, "")
+    encoding: bytearray = writer.encoding
+    return encoding
+
+
+def interpreted_from_tlv(attribute: type[ClusterAttributeDescriptor], encoded: bytes) -> Any:
+    """Decode an attribute value with the descriptor and dacite (the path before compiled decoders)."""
+    obj_class: Any = attribute._cluster_object
+    raw = tlv.TLVReader(encoded).get().get("Any", {})  # type: ignore[no-untyped-call]
+    return obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict("", {0: raw})).Value
+
+
+def get_attribute_values() -> list[tuple[type[ClusterAttributeDescriptor], Any, bytes]]:
+    """Return a (typed) value and its TLV encoding for all standard attributes that support it."""
+    result = []
+    for attributes in ALL_ATTRIBUTES.values():
+        for attribute in attributes.values():
+            try:
+                value = attribute.FromTagDictOrRawValue(make_raw_value(attribute.attribute_type.Type, tlv=True))
+                encoded = bytes(attribute.ToTLV(None, value))
+                attribute.FromTLV(encoded)
+            except Exception:  # noqa: S112
+                # some (custom) attributes can not be round tripped with synthetic values
+                continue
+            result.append((attribute, value, encoded))
+    return result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    values = get_attribute_values()
+
+    def encode() -> None:
+        for attribute, value, _ in values:
+            attribute.ToTLV(None, value)
+
+    def decode() -> None:
+        for attribute, _, encoded in values:
+            attribute.FromTLV(encoded)
+
+    encode_after = measure(encode)
+    decode_after = measure(decode)
+
+    def interpreted_encode() -> None:
+        for attribute, value, _ in values:
+            interpreted_to_tlv(attribute, value)
+
+    def interpreted_decode() -> None:
+        for attribute, _, encoded in values:
+            interpreted_from_tlv(attribute, encoded)
+
+    report(
+        f"ToTLV ({len(values)} attributes), interpreted vs compiled",
+        measure(interpreted_encode),
+        encode_after,
+        len(values),
+        "attribute",
+    )
+    report(
+        f"FromTLV ({len(values)} attributes), interpreted vs compiled",
+        measure(interpreted_decode),
+        decode_after,
+        len(values),
+        "attribute",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark a consumer of fast-changing attributes, every update vs coalesced per attribute path.
+
+Run with: python -m benchmarks.bench_coalesce
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+from matter_server.client import MatterClient
+from matter_server.common.models import EventMessage, EventType
+
+from .common import make_fabric, report
+
+NODE_COUNT = 10
+BURSTS = 50
+# e.g. the ElectricalPowerMeasurement voltage, current and active power of each node
+PATHS = ["1/144/4", "1/144/5", "1/144/8"]
+UPDATES_PER_PATH = 20
+# the work a consumer does per callback, e.g. writing a state
+CALLBACK_TIME = 0.00005
+
+
+def make_client() -> MatterClient:
+    """Return a client with the nodes of a fabric."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock())
+    client._loop = asyncio.get_running_loop()
+    for node_data in make_fabric(NODE_COUNT, bridged_endpoints=0):
+        client._handle_event_message(EventMessage(event=EventType.NODE_ADDED, data=node_data))
+    return client
+
+
+async def run() -> None:
+    """Run the benchmark."""
+    # bursts of updates received within one event loop iteration
+    burst = [
+        EventMessage(event=EventType.ATTRIBUTE_UPDATED, data=[node_id, path, 230_000 + value])
+        for value in range(UPDATES_PER_PATH)
+        for node_id in range(1, NODE_COUNT + 1)
+        for path in PATHS
+    ]
+    results: dict[str, tuple[float, int]] = {}
+    for name, coalesce_interval in (("every update", None), ("coalesced", 0.0)):
+        client = make_client()
+        calls = 0
+
+        def callback(_event: EventType, _data: Any) -> None:
+            nonlocal calls
+            calls += 1
+            time.sleep(CALLBACK_TIME)
+
+        client.subscribe_events(callback, EventType.ATTRIBUTE_UPDATED, coalesce_interval=coalesce_interval)
+        start = time.perf_counter()
+        for _ in range(BURSTS):
+            for message in burst:
+                client._handle_event_message(message)
+            await asyncio.sleep(0)
+        results[name] = (time.perf_counter() - start, calls)
+
+    updates = BURSTS * len(burst)
+    (before, before_calls), (after, after_calls) = results.values()
+    report(f"{updates} attribute updates of fast-changing attributes", before, after, updates, "update")
+    print(f"  callbacks: {before_calls} -> {after_calls}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
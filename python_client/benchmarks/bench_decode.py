@@ -0,0 +1,45 @@
+"""
+Benchmark the compiled dataclass decoders against the reflective implementation.
+
+Run with: python -m benchmarks.bench_decode
+"""
+
+from __future__ import annotations
+
+from matter_server.common.helpers.util import (
+    _dataclass_from_dict_reflective,
+    dataclass_from_dict,
+)
+from matter_server.common.models import EventMessage, MatterNodeData
+
+from .common import make_attribute_updates, make_fabric, measure, report
+
+NODE_COUNT = 400
+
+
+def main() -> None:
+    """Run the benchmark."""
+    fabric = make_fabric(NODE_COUNT)
+    updates = make_attribute_updates(NODE_COUNT)
+    # compile (and warm up) the decoders first
+    dataclass_from_dict(MatterNodeData, fabric[0])
+    dataclass_from_dict(EventMessage, updates[0])
+
+    report(
+        f"start_listening dump ({NODE_COUNT} nodes, {len(fabric[0]['attributes'])} attributes each)",
+        measure(lambda: [_dataclass_from_dict_reflective(MatterNodeData, x) for x in fabric], repeat=3),
+        measure(lambda: [dataclass_from_dict(MatterNodeData, x) for x in fabric], repeat=3),
+        len(fabric),
+        "node",
+    )
+    report(
+        f"attribute_updated stream ({len(updates)} events)",
+        measure(lambda: [_dataclass_from_dict_reflective(EventMessage, x) for x in updates]),
+        measure(lambda: [dataclass_from_dict(EventMessage, x) for x in updates]),
+        len(updates),
+        "event",
+    )
+
+
+if __name__ == "__main__":
+    main()
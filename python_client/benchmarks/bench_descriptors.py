@@ -0,0 +1,73 @@
+"""
+Benchmark the memoized cluster descriptors on the attribute update path.
+
+Run with: python -m benchmarks.bench_descriptors
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from chip import ChipUtility
+from chip.clusters.ClusterObjects import ALL_ATTRIBUTES, ALL_CLUSTERS
+from matter_server.client.models.node import MatterNode
+from matter_server.common.helpers.util import dataclass_from_dict
+from matter_server.common.models import MatterNodeData
+
+from .common import make_attribute_updates, make_node_data, measure, report
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@contextmanager
+def uncached_descriptors() -> Iterator[None]:
+    """Temporarily build the cluster descriptors on every access again."""
+    cached = {cls: cls.__dict__["descriptor"] for cls in ALL_CLUSTERS.values()}
+    for cls, prop in cached.items():
+        cls.descriptor = ChipUtility.classproperty(prop.fget)
+    try:
+        yield
+    finally:
+        for cls, prop in cached.items():
+            cls.descriptor = prop
+
+
+def main() -> None:
+    """Run the benchmark."""
+    clusters = list(ALL_CLUSTERS.values())
+    with uncached_descriptors():
+        before = measure(lambda: [cls.descriptor for cls in clusters])
+    after = measure(lambda: [cls.descriptor for cls in clusters])
+    report(f"descriptor access ({len(clusters)} clusters)", before, after, len(clusters), "access")
+
+    lookups = [
+        (ALL_CLUSTERS[cluster_id].descriptor, attribute_id)
+        for cluster_id, attributes in ALL_ATTRIBUTES.items()
+        if cluster_id in ALL_CLUSTERS
+        for attribute_id in attributes
+    ]
+    report(
+        f"GetFieldByTag ({len(lookups)} attributes)",
+        measure(lambda: [next((x for x in desc.Fields if x.Tag == tag), None) for desc, tag in lookups]),
+        measure(lambda: [desc.GetFieldByTag(tag) for desc, tag in lookups]),
+        len(lookups),
+        "lookup",
+    )
+
+    node = MatterNode(dataclass_from_dict(MatterNodeData, make_node_data(1, bridged_endpoints=16)))
+    updates = [x["data"] for x in make_attribute_updates(1, bridged_endpoints=16)] * 50
+
+    def apply_updates() -> None:
+        for _, attribute_path, value in updates:
+            node.update_attribute(attribute_path, value)
+
+    with uncached_descriptors():
+        before = measure(apply_updates)
+    after = measure(apply_updates)
+    report(f"MatterNode.update_attribute ({len(updates)} updates)", before, after, len(updates), "update")
+
+
+if __name__ == "__main__":
+    main()
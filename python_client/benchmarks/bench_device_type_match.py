@@ -0,0 +1,68 @@
+"""
+Benchmark matching the clusters of an endpoint against all device types (bitsets vs cluster sets).
+
+Run with: python -m benchmarks.bench_device_type_match
+"""
+
+from __future__ import annotations
+
+from chip.clusters import Objects as Clusters
+from matter_server.client.models.device_type_index import (
+    get_cluster_set,
+    get_device_types_requiring,
+    get_matching_device_types,
+)
+from matter_server.client.models.device_types import ALL_TYPES, DeviceType
+
+from .common import LIGHT_CLUSTERS, ROOT_CLUSTERS, measure, report
+
+ENDPOINTS = [[cluster.id for cluster in clusters] for clusters in (ROOT_CLUSTERS, LIGHT_CLUSTERS)] * 50
+
+
+def scan_matching_device_types(cluster_ids: list[int]) -> list[type[DeviceType]]:
+    """Return the matching device types by testing the clusters of every device type."""
+    present = set(cluster_ids)
+    return [
+        device_type
+        for device_type in ALL_TYPES.values()
+        if device_type.clusters and all(cluster.id in present for cluster in device_type.clusters)
+    ]
+
+
+def scan_device_types_requiring(cluster_id: int) -> list[type[DeviceType]]:
+    """Return the device types requiring a cluster by testing every device type."""
+    return [x for x in ALL_TYPES.values() if any(cluster.id == cluster_id for cluster in x.clusters)]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    # resolve (import) the clusters of all device types first
+    scan_matching_device_types(ENDPOINTS[0])
+    report(
+        f"match endpoint clusters against all {len(ALL_TYPES)} device types ({len(ENDPOINTS)} endpoints)",
+        measure(lambda: [scan_matching_device_types(x) for x in ENDPOINTS]),
+        measure(lambda: [get_matching_device_types(x) for x in ENDPOINTS]),
+        len(ENDPOINTS),
+        "endpoint",
+    )
+    # e.g. when the cluster set of an endpoint is kept up to date
+    cluster_sets = [get_cluster_set(x) for x in ENDPOINTS]
+    report(
+        "match with a precomputed cluster set",
+        measure(lambda: [scan_matching_device_types(x) for x in ENDPOINTS]),
+        measure(lambda: [get_matching_device_types(x) for x in cluster_sets]),
+        len(ENDPOINTS),
+        "endpoint",
+    )
+    cluster_ids = [cluster.id for cluster in (*ROOT_CLUSTERS, *LIGHT_CLUSTERS)] + [Clusters.Thermostat.id]
+    report(
+        f"device types requiring a cluster ({len(cluster_ids)} clusters)",
+        measure(lambda: [scan_device_types_requiring(x) for x in cluster_ids]),
+        measure(lambda: [get_device_types_requiring(x) for x in cluster_ids]),
+        len(cluster_ids),
+        "cluster",
+    )
+
+
+if __name__ == "__main__":
+    main()
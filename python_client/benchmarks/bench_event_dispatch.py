@@ -0,0 +1,166 @@
+"""
+Benchmark signalling events with 10k subscriptions, string keys per event vs the nested subscriber index.
+
+Run with: python -m benchmarks.bench_event_dispatch
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from matter_server.client.subscribers import SUB_WILDCARD, SubscriberIndex, make_path_filters, parse_path_filter
+from matter_server.common.models import EventType
+
+from .common import measure, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+NODE_COUNT = 100
+PATHS_PER_NODE = 100
+EVENT_COUNT = 10_000
+
+
+class StringKeySubscribers:
+    """The former dispatch: a callback list per "event/node/attribute_path" key."""
+
+    def __init__(self) -> None:
+        """Initialize StringKeySubscribers."""
+        self._subscribers: dict[str, list[Callable[[EventType, Any], None]]] = {}
+
+    def subscribe(
+        self,
+        callback: Callable[[EventType, Any], None],
+        event_filter: EventType | None = None,
+        node_filter: int | None = None,
+        attr_path_filter: str | None = None,
+    ) -> Callable[[], None]:
+        """Add a subscriber and return the function to unsubscribe."""
+        _event_filter = SUB_WILDCARD if event_filter is None else event_filter.value
+        _node_filter = SUB_WILDCARD if node_filter is None else str(node_filter)
+        key = f"{_event_filter}/{_node_filter}/{attr_path_filter or SUB_WILDCARD}"
+        self._subscribers.setdefault(key, []).append(callback)
+        return lambda: self._subscribers[key].remove(callback)
+
+    def signal(
+        self,
+        event: EventType,
+        data: Any = None,
+        node_id: int | None = None,
+        attribute_path: str | None = None,
+    ) -> None:
+        """Call the subscribers matching the event, node and attribute path."""
+        for evt_key in (event.value, SUB_WILDCARD):
+            for node_key in (node_id, SUB_WILDCARD):
+                if node_key is None:
+                    continue
+                for attribute_path_key in (attribute_path, SUB_WILDCARD):
+                    if attribute_path_key is None:
+                        continue
+                    key = f"{evt_key}/{node_key}/{attribute_path_key}"
+                    for callback in self._subscribers.get(key, []):
+                        callback(event, data)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    paths = [f"{1 + x // 20}/{x % 20}/0" for x in range(PATHS_PER_NODE)]
+    subscriptions = [(node_id, path) for node_id in range(1, NODE_COUNT + 1) for path in paths]
+    events = [subscriptions[(x * 7919) % len(subscriptions)] for x in range(EVENT_COUNT)]
+    calls = 0
+
+    def callback(_event: EventType, _data: Any) -> None:
+        nonlocal calls
+        calls += 1
+
+    for index in (StringKeySubscribers(), SubscriberIndex()):
+        # an entity per attribute, plus some node-wide listeners
+        if isinstance(index, StringKeySubscribers):
+            unsubscribes = [
+                index.subscribe(callback, EventType.ATTRIBUTE_UPDATED, node_id, path) for node_id, path in subscriptions
+            ]
+        else:
+            unsubscribes = [
+                index.subscribe(callback, EventType.ATTRIBUTE_UPDATED, node_id, [parse_path_filter(path)])
+                for node_id, path in subscriptions
+            ]
+        for node_id in range(1, NODE_COUNT + 1, 10):
+            index.subscribe(callback, None, node_id)
+
+        def run(index: StringKeySubscribers | SubscriberIndex = index) -> None:
+            for node_id, path in events:
+                index.signal(EventType.ATTRIBUTE_UPDATED, None, node_id, path)
+
+        def unsubscribe_all(unsubscribes: list[Callable[[], None]] = unsubscribes) -> None:
+            for unsubscribe in unsubscribes:
+                unsubscribe()
+
+        # e.g. an entity per attribute that also listens to the updates of its node
+        shared = [index.subscribe(callback, EventType.NODE_UPDATED) for _ in range(len(subscriptions))]
+
+        def unsubscribe_shared(unsubscribes: list[Callable[[], None]] = shared) -> None:
+            for unsubscribe in unsubscribes:
+                unsubscribe()
+
+        if isinstance(index, StringKeySubscribers):
+            before = measure(run)
+            before_unsubscribe = measure(unsubscribe_all, repeat=1)
+            before_shared = measure(unsubscribe_shared, repeat=1)
+        else:
+            after = measure(run)
+            after_unsubscribe = measure(unsubscribe_all, repeat=1)
+            after_shared = measure(unsubscribe_shared, repeat=1)
+
+    title = f"signal {EVENT_COUNT} attribute events with {len(subscriptions)} subscriptions"
+    report(title, before, after, EVENT_COUNT, "event")
+    count = len(subscriptions)
+    report(f"unsubscribe {count} subscribers (one per filter)", before_unsubscribe, after_unsubscribe, count)
+    report(f"unsubscribe {count} subscribers (all of the same filter)", before_shared, after_shared, count)
+    bench_cluster_filters(events)
+
+
+def bench_cluster_filters(events: list[tuple[int, str]]) -> None:
+    """Compare consumers of one cluster per endpoint filtering node-wide events vs structured filters."""
+    # a consumer per (endpoint, cluster) of every node
+    consumers = [
+        (node_id, endpoint_id, cluster_id)
+        for node_id in range(1, NODE_COUNT + 1)
+        for endpoint_id in range(1, 6)
+        for cluster_id in range(0, 20, 4)
+    ]
+    calls = 0
+
+    def make_filtering_callback(endpoint_id: int, cluster_id: int) -> Callable[[EventType, Any], None]:
+        prefix = f"{endpoint_id}/{cluster_id}/"
+
+        def callback(_event: EventType, data: Any) -> None:
+            nonlocal calls
+            if data.startswith(prefix):
+                calls += 1
+
+        return callback
+
+    def callback(_event: EventType, _data: Any) -> None:
+        nonlocal calls
+        calls += 1
+
+    node_wide = SubscriberIndex()
+    structured = SubscriberIndex()
+    for node_id, endpoint_id, cluster_id in consumers:
+        node_wide.subscribe(make_filtering_callback(endpoint_id, cluster_id), EventType.ATTRIBUTE_UPDATED, node_id)
+        path_filters = make_path_filters(endpoint_id, cluster_id)
+        structured.subscribe(callback, EventType.ATTRIBUTE_UPDATED, node_id, path_filters)
+
+    def run(index: SubscriberIndex) -> None:
+        for node_id, path in events:
+            # the path as data, for the filtering callbacks
+            index.signal(EventType.ATTRIBUTE_UPDATED, path, node_id, path)
+
+    before = measure(lambda: run(node_wide))
+    after = measure(lambda: run(structured))
+    title = f"signal {len(events)} events to {len(consumers)} cluster consumers (node-wide + filter vs structured)"
+    report(title, before, after, len(events), "event")
+
+
+if __name__ == "__main__":
+    main()
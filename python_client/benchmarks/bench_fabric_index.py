@@ -0,0 +1,99 @@
+"""
+Benchmark fabric-wide endpoint queries (by cluster and device type) vs scanning all nodes.
+
+Run with: python -m benchmarks.bench_fabric_index
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+from chip.clusters import Objects as Clusters
+from matter_server.client import MatterClient
+from matter_server.client.models.device_types import DeviceType, ExtendedColorLight
+from matter_server.client.models.fabric_index import FabricIndex
+from matter_server.common.models import EventMessage, EventType
+
+from .common import make_attribute_updates, make_fabric, measure, report
+
+if TYPE_CHECKING:
+    from matter_server.client.models.node import MatterEndpoint, MatterNode
+
+NODE_COUNT = 200
+BRIDGED_ENDPOINTS = 8
+VENDOR_COUNT = 10
+
+
+class UnmaintainedFabricIndex(FabricIndex):
+    """A fabric index that is not kept up to date on attribute updates."""
+
+    __slots__ = ()
+
+    def attribute_updated(self, node: MatterNode, attribute_path: str) -> None:
+        """Ignore the attribute update."""
+
+
+def scan_endpoints(
+    client: MatterClient, cluster: type[Clusters.Cluster], device_type: type[DeviceType]
+) -> list[MatterEndpoint]:
+    """Find the endpoints by iterating all endpoints of all nodes (as done before)."""
+    return [
+        endpoint
+        for node in client.get_nodes()
+        for endpoint in node.endpoints.values()
+        if endpoint.has_cluster(cluster) and device_type in endpoint.device_types
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock())
+    for node_data in make_fabric(NODE_COUNT, bridged_endpoints=BRIDGED_ENDPOINTS):
+        node_data["attributes"][f"0/{Clusters.BasicInformation.id}/2"] = node_data["node_id"] % VENDOR_COUNT
+        client._handle_event_message(EventMessage(event=EventType.NODE_ADDED, data=node_data))
+    endpoint_count = sum(len(node.endpoints) for node in client.get_nodes())
+
+    report(
+        f"ColorControl endpoints of extended color lights ({endpoint_count} endpoints)",
+        measure(lambda: scan_endpoints(client, Clusters.ColorControl, ExtendedColorLight)),
+        measure(lambda: client.get_endpoints(Clusters.ColorControl, ExtendedColorLight)),
+    )
+    report(
+        f"endpoints of the nodes of a vendor ({endpoint_count} endpoints)",
+        measure(
+            lambda: [
+                endpoint
+                for node in client.get_nodes()
+                if node.get_attribute_value(0, None, Clusters.BasicInformation.Attributes.VendorID) == 1
+                for endpoint in node.endpoints.values()
+            ]
+        ),
+        measure(lambda: client.get_endpoints(vendor_id=1)),
+    )
+
+    # the cost of keeping the index up to date on the attribute_updated event path
+    messages = [
+        EventMessage(event=EventType.ATTRIBUTE_UPDATED, data=x["data"])
+        for x in make_attribute_updates(NODE_COUNT, bridged_endpoints=BRIDGED_ENDPOINTS)
+    ]
+
+    def handle_updates() -> None:
+        for message in messages:
+            client._handle_event_message(message)
+
+    fabric_index = client._fabric_index
+    client._fabric_index = UnmaintainedFabricIndex()
+    without_upkeep = measure(handle_updates)
+    client._fabric_index = fabric_index
+    report(
+        "attribute_updated events, without vs with index upkeep",
+        without_upkeep,
+        measure(handle_updates),
+        len(messages),
+        "event",
+    )
+
+
+if __name__ == "__main__":
+    main()
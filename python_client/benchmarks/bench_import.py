@@ -0,0 +1,92 @@
+"""
+Benchmark the import time of the client with lazily vs eagerly imported cluster definitions.
+
+Run with: python -m benchmarks.bench_import
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import textwrap
+
+from .common import make_fabric, report, report_single
+
+IMPORT_CODE = """
+    import time
+
+    start = time.perf_counter()
+    import matter_server.client.models.node
+    from chip.clusters import cluster_defs
+    {import_all}
+    print(time.perf_counter() - start)
+    from chip.clusters import Objects as clusters
+    start = time.perf_counter()
+    clusters.ColorControl
+    print(time.perf_counter() - start)
+    """
+
+# resolve the name and type of the attributes of a fabric (as received from the server)
+RESOLVE_CODE = """
+    import json
+    import sys
+    import time
+
+    import matter_server.client.models.node
+    from chip.clusters import ClusterIndex
+    from chip.clusters.ClusterObjects import ALL_ATTRIBUTES, ALL_CLUSTERS
+
+    paths = json.load(sys.stdin)
+    start = time.perf_counter()
+    {resolve}
+    print(time.perf_counter() - start)
+    """
+RESOLVE_CLASSES = """for path in paths:
+        _, cluster_id, attribute_id = (int(x) for x in path.split("/"))
+        field = ALL_CLUSTERS[cluster_id].descriptor.GetFieldByTag(attribute_id)
+        name, type_ = ALL_ATTRIBUTES[cluster_id][attribute_id].__name__, field.Type"""
+RESOLVE_INDEX = """for path in paths:
+        _, cluster, attribute = ClusterIndex.ResolveAttributePath(path)
+        name, type_ = attribute.name, attribute.type"""
+
+
+def run_timed(code: str, stdin: str = "", repeat: int = 5) -> list[float]:
+    """Return the median of each timing printed by the code, each run in a fresh interpreter."""
+    timings = [
+        [
+            float(line)
+            for line in subprocess.run(  # noqa: S603
+                [sys.executable, "-c", textwrap.dedent(code)],
+                capture_output=True,
+                check=True,
+                cwd=Path(__file__).parent.parent,
+                input=stdin,
+                text=True,
+            ).stdout.split()
+        ]
+        for _ in range(repeat)
+    ]
+    return [statistics.median(column) for column in zip(*timings, strict=True)]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    eager_import, _ = run_timed(IMPORT_CODE.format(import_all="cluster_defs.import_all()"))
+    lazy_import, first_access = run_timed(IMPORT_CODE.format(import_all=""))
+    report("import matter_server.client.models.node", eager_import, lazy_import)
+    if lazy_import >= eager_import / 2:
+        # importing a cluster definition on import of the client (e.g. a new module level lookup) undoes the lazy import
+        print("  WARNING: the lazy import is not (much) faster than importing all cluster definitions")
+    report_single("first access of a lazily imported cluster", first_access)
+
+    paths = json.dumps([path for node in make_fabric(10) for path in node["attributes"]])
+    (classes,) = run_timed(RESOLVE_CODE.format(resolve=RESOLVE_CLASSES), paths)
+    (index,) = run_timed(RESOLVE_CODE.format(resolve=RESOLVE_INDEX), paths)
+    report("resolve attribute paths of 10 nodes (first use)", classes, index)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark encoding the command messages sent to the server (compact vs indented json).
+
+Run with: python -m benchmarks.bench_json
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+import uuid
+import zlib
+
+from chip.clusters import Objects as Clusters
+from chip.clusters.Types import NullValue
+from chip.tlv import uint
+from matter_server.common.helpers import json as json_helpers
+from matter_server.common.helpers.json import json_dumps, json_dumps_compact
+from matter_server.common.helpers.util import create_attribute_path_from_attribute, dataclass_to_dict
+from matter_server.common.models import APICommand, CommandMessage
+
+from .common import measure, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+ACL_ENTRIES = 8
+
+
+def make_messages() -> list[CommandMessage]:
+    """Return a realistic mix of the commands a client sends to the server."""
+    commands: list[Any] = [
+        Clusters.OnOff.Commands.On(),
+        Clusters.LevelControl.Commands.MoveToLevelWithOnOff(level=uint(128), transitionTime=uint(10)),
+        Clusters.ColorControl.Commands.MoveToColor(colorX=uint(24939), colorY=uint(24701), transitionTime=uint(0)),
+        Clusters.DoorLock.Commands.SetCredential(
+            operationType=Clusters.DoorLock.Enums.DataOperationTypeEnum.kAdd,
+            credential=Clusters.DoorLock.Structs.CredentialStruct(
+                credentialType=Clusters.DoorLock.Enums.CredentialTypeEnum.kPin, credentialIndex=uint(1)
+            ),
+            credentialData=b"123456",
+            userIndex=NullValue,
+            userStatus=NullValue,
+            userType=NullValue,
+        ),
+    ]
+    messages = [
+        CommandMessage(
+            message_id=uuid.uuid4().hex,
+            command=APICommand.DEVICE_COMMAND,
+            args={
+                "node_id": 1,
+                "endpoint_id": 1,
+                "cluster_id": command.cluster_id,
+                "command_name": type(command).__name__,
+                "payload": dataclass_to_dict(command),
+                "response_type": None,
+                "timed_request_timeout_ms": None,
+                "interaction_timeout_ms": None,
+            },
+        )
+        for command in commands
+    ]
+    acl = [
+        Clusters.AccessControl.Structs.AccessControlEntryStruct(
+            privilege=Clusters.AccessControl.Enums.AccessControlEntryPrivilegeEnum.kOperate,
+            authMode=Clusters.AccessControl.Enums.AccessControlEntryAuthModeEnum.kCase,
+            subjects=[uint(112233 + index)],
+            targets=NullValue,
+            fabricIndex=uint(1),
+        )
+        for index in range(ACL_ENTRIES)
+    ]
+    messages.append(
+        CommandMessage(
+            message_id=uuid.uuid4().hex,
+            command=APICommand.WRITE_ATTRIBUTE,
+            args={
+                "node_id": 1,
+                "attribute_path": create_attribute_path_from_attribute(0, Clusters.AccessControl.Attributes.Acl),
+                "value": [dataclass_to_dict(entry) for entry in acl],
+            },
+        )
+    )
+    return messages
+
+
+@contextmanager
+def isinstance_default() -> Iterator[None]:
+    """Temporarily convert the special types with the isinstance chain only (no exact type dispatch)."""
+    encoders = dict(json_helpers._ENCODERS)
+    json_helpers._ENCODERS.clear()
+    try:
+        yield
+    finally:
+        json_helpers._ENCODERS.update(encoders)
+
+
+def wire_size(messages: list[Any], dumps: Callable[[Any], str]) -> tuple[int, int]:
+    """Return the total (raw, deflate compressed) size of the encoded messages."""
+    raw = compressed = 0
+    for message in messages:
+        data = dumps(message).encode("utf-8")
+        # permessage-deflate, as used by the websocket connection (compress=15)
+        compressor = zlib.compressobj(wbits=-15)
+        raw += len(data)
+        compressed += len(compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH))
+    return raw, compressed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    messages = make_messages() * 100
+    with isinstance_default():
+        before = measure(lambda: [json_dumps(message) for message in messages])
+    after = measure(lambda: [json_dumps_compact(message) for message in messages])
+    report(f"encode command messages ({len(messages)} messages)", before, after, len(messages), "message")
+
+    for title, dumps in (("indented", json_dumps), ("compact", json_dumps_compact)):
+        raw, compressed = wire_size(messages, dumps)
+        print(f"{title}: {raw / len(messages):.0f} bytes/message, {compressed / len(messages):.0f} bytes deflated")
+
+
+if __name__ == "__main__":
+    main()
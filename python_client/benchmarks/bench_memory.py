@@ -0,0 +1,60 @@
+"""
+Benchmark the memory used per attribute by the nodes of a fabric, in each storage mode.
+
+Run with: python -m benchmarks.bench_memory
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from typing import Any
+
+from matter_server.client.models.node import MatterNode
+from matter_server.common.helpers.json import json_dumps_compact, json_loads
+from matter_server.common.helpers.util import dataclass_from_dict
+from matter_server.common.models import MatterNodeData
+
+from .common import make_fabric
+
+NODE_COUNT = 100
+# (title, MatterNode kwargs, materialize all clusters)
+MODES: tuple[tuple[str, dict[str, Any], bool], ...] = (
+    ("eager (raw + parsed)", {}, False),
+    ("eager, raw dropped", {"keep_raw": False}, False),
+    ("lazy, nothing accessed", {"lazy": True}, False),
+    ("lazy, all clusters accessed", {"lazy": True}, True),
+)
+
+
+def traced_size() -> int:
+    """Return the size of the currently allocated (traced) memory."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    # the raw data as received over the wire (json decoding shares the path keys)
+    wire = json_dumps_compact(make_fabric(NODE_COUNT))
+    tracemalloc.start()
+    for title, kwargs, materialize in MODES:
+        start = traced_size()
+        node_data = [dataclass_from_dict(MatterNodeData, x) for x in json_loads(wire)]
+        attribute_count = sum(len(x.attributes) for x in node_data)
+        raw = traced_size() - start
+        nodes = [MatterNode(x, **kwargs) for x in node_data]
+        if materialize:
+            for node in nodes:
+                for endpoint in node.endpoints.values():
+                    for cluster_id in endpoint.clusters:
+                        endpoint.get_cluster(cluster_id)
+        total = traced_size() - start
+        print(f"{title}")
+        print(f"  {total / attribute_count:6.0f} bytes/attribute (raw data received: {raw / attribute_count:.0f})")
+        del node_data, nodes
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark the latency of a command result behind a burst of node_updated messages, inline vs queued processing.
+
+Run with: python -m benchmarks.bench_message_queue
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
+
+from matter_server.client import MatterClient
+from matter_server.client.connection import MatterClientConnection
+from matter_server.client.exceptions import ConnectionClosed
+from matter_server.common.helpers.json import json_dumps_compact
+from matter_server.common.models import SuccessResultMessage
+
+from .common import make_fabric, report
+
+if TYPE_CHECKING:
+    from matter_server.client.dispatch import ReaderMetrics
+
+NODE_COUNT = 20
+BRIDGED_ENDPOINTS = 16
+
+
+def make_client(frames: list[str], message_queue_size: int) -> MatterClient:
+    """Return a client with a fake connection that receives the frames, then closes."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock(), message_queue_size=message_queue_size)
+    connection = MagicMock()
+    connection.connected = True
+    connection.send_message = AsyncMock()
+    connection.disconnect = AsyncMock()
+    connection.decode_message = MatterClientConnection.decode_message
+    remaining = iter(frames)
+    initial = [SuccessResultMessage(message_id="1", result=[])]
+
+    async def receive_frame_or_raise() -> str:
+        if (frame := next(remaining, None)) is None:
+            msg = "Connection was closed."
+            raise ConnectionClosed(msg)
+        return frame
+
+    async def receive_message_or_raise() -> Any:
+        # the (empty) node dump of the start_listening command, then the frames
+        if initial:
+            return initial.pop()
+        return MatterClientConnection.decode_message(await receive_frame_or_raise())
+
+    connection.receive_frame_or_raise = receive_frame_or_raise
+    connection.receive_message_or_raise = receive_message_or_raise
+    client.connection = connection
+    return client
+
+
+class _TimedFuture(asyncio.Future[Any]):
+    """Future that records when its result is set."""
+
+    resolved = 0.0
+
+    def set_result(self, result: Any) -> None:
+        self.resolved = time.perf_counter()
+        super().set_result(result)
+
+
+async def result_latency(frames: list[str], message_queue_size: int) -> tuple[float, float, ReaderMetrics | None]:
+    """Return the time until the command result is handled, until all messages are processed and the metrics."""
+    client = make_client(frames, message_queue_size)
+    future = _TimedFuture()
+    client._result_futures["command"] = future
+    start = time.perf_counter()
+    await client.start_listening()
+    return future.resolved - start, time.perf_counter() - start, client.get_reader_metrics()
+
+
+async def run() -> None:
+    """Run the benchmark."""
+    frames = [
+        json_dumps_compact({"event": "node_updated", "data": x}) for x in make_fabric(NODE_COUNT, BRIDGED_ENDPOINTS)
+    ]
+    frames.append(json_dumps_compact({"message_id": "command", "result": None}))
+    before, before_total, _ = await result_latency(frames, 0)
+    after, after_total, metrics = await result_latency(frames, 100)
+    report(f"command result behind {NODE_COUNT} node_updated messages", before, after)
+    print(f"  all messages processed: {before_total * 1000:.1f} ms -> {after_total * 1000:.1f} ms")
+    if metrics is not None:
+        print(
+            f"  max queue depth: {metrics.max_queue_depth}, "
+            f"processing lag: {metrics.average_processing_lag * 1000:.1f} ms average, "
+            f"{metrics.max_processing_lag * 1000:.1f} ms max"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
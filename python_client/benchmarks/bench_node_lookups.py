@@ -0,0 +1,61 @@
+"""
+Benchmark the composed device and cluster lookups done for every endpoint on entity setup.
+
+Run with: python -m benchmarks.bench_node_lookups
+"""
+
+from __future__ import annotations
+
+from chip.clusters import Objects as Clusters
+from matter_server.client.models.node import MatterNode
+from matter_server.common.helpers.util import dataclass_from_dict
+from matter_server.common.models import MatterNodeData
+
+from .common import make_node_data, measure, report
+
+BRIDGED_ENDPOINTS = 400
+CLUSTERS = (Clusters.OnOff, Clusters.LevelControl, Clusters.ColorControl, Clusters.Thermostat)
+
+
+def scan_compose_child_ids(node: MatterNode, endpoint_id: int) -> tuple[int, ...]:
+    """Return the composed device children by scanning all composed endpoints (as done before)."""
+    return tuple(x for x, y in node._composed_endpoints.items() if y == endpoint_id)
+
+
+def scan_has_cluster(node: MatterNode, cluster: type[Clusters.Cluster], endpoint: int) -> bool:
+    """Check for a cluster on an endpoint by iterating all endpoints (as done before)."""
+    return any(x for x in node.endpoints.values() if x.has_cluster(cluster) and x.endpoint_id == endpoint)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    raw = make_node_data(1, bridged_endpoints=BRIDGED_ENDPOINTS)
+    # every other bridged device is composed of the next endpoint
+    for endpoint_id in range(2, 2 + BRIDGED_ENDPOINTS, 2):
+        raw["attributes"][f"{endpoint_id}/{Clusters.Descriptor.id}/3"] = [endpoint_id + 1]
+    node = MatterNode(dataclass_from_dict(MatterNodeData, raw))
+    endpoint_ids = list(node.endpoints)
+
+    def before() -> None:
+        for endpoint_id in endpoint_ids:
+            scan_compose_child_ids(node, endpoint_id)
+            for cluster in CLUSTERS:
+                scan_has_cluster(node, cluster, endpoint_id)
+
+    def after() -> None:
+        for endpoint_id in endpoint_ids:
+            node.get_compose_child_ids(endpoint_id)
+            for cluster in CLUSTERS:
+                node.has_cluster(cluster, endpoint_id)
+
+    report(
+        f"compose children + has_cluster for all {len(endpoint_ids)} endpoints",
+        measure(before, repeat=3),
+        measure(after),
+        len(endpoint_ids),
+        "endpoint",
+    )
+
+
+if __name__ == "__main__":
+    main()
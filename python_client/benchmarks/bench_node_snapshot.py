@@ -0,0 +1,43 @@
+"""
+Benchmark taking a consistent view of a node's attribute values after every attribute update.
+
+Before: deep copy of the clusters of all endpoints, after: MatterNode.snapshot().
+
+Run with: python -m benchmarks.bench_node_snapshot
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+from matter_server.client.models.node import MatterNode
+from matter_server.common.helpers.util import dataclass_from_dict
+from matter_server.common.models import MatterNodeData
+
+from .common import make_attribute_updates, make_node_data, measure, report
+
+BRIDGED_ENDPOINTS = 16
+
+
+def main() -> None:
+    """Run the benchmark."""
+    node = MatterNode(dataclass_from_dict(MatterNodeData, make_node_data(1, bridged_endpoints=BRIDGED_ENDPOINTS)))
+    updates = [tuple(x["data"][1:]) for x in make_attribute_updates(1, bridged_endpoints=BRIDGED_ENDPOINTS)] * 5
+
+    def run_deepcopy() -> None:
+        for attribute_path, value in updates:
+            node.update_attribute(attribute_path, value)
+            deepcopy({endpoint_id: dict(endpoint.clusters) for endpoint_id, endpoint in node.endpoints.items()})
+
+    def run_snapshot() -> None:
+        for attribute_path, value in updates:
+            node.update_attribute(attribute_path, value)
+            node.snapshot()
+
+    before = measure(run_deepcopy)
+    after = measure(run_snapshot)
+    report(f"consistent view per update ({len(updates)} updates)", before, after, len(updates), "update")
+
+
+if __name__ == "__main__":
+    main()
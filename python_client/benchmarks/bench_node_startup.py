@@ -0,0 +1,77 @@
+"""
+Benchmark the startup (creating the MatterNode objects) of a large fabric, eager vs lazy clusters.
+
+Run with: python -m benchmarks.bench_node_startup
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from chip.clusters import Objects as Clusters
+from matter_server.client.models.node import MatterNode
+from matter_server.common.helpers.util import dataclass_from_dict
+from matter_server.common.models import MatterNodeData
+
+from .common import make_fabric, report, report_single
+
+NODE_COUNT = 500
+REPEAT = 3
+
+
+def run_startup(lazy: bool) -> None:
+    """Create the nodes of the fabric, print the duration and RSS growth (in KiB)."""
+    node_data = [dataclass_from_dict(MatterNodeData, x) for x in make_fabric(NODE_COUNT)]
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    nodes = [MatterNode(x, lazy) for x in node_data]
+    duration = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # what a consumer typically touches: the device info and the OnOff state of each light
+    start = time.perf_counter()
+    for node in nodes:
+        for endpoint in node.endpoints.values():
+            _ = endpoint.device_info
+            endpoint.get_attribute_value(None, Clusters.OnOff.Attributes.OnOff)
+    access = time.perf_counter() - start
+    print(duration, rss_after - rss_before, access)
+
+
+def run_child(lazy: bool) -> list[float]:
+    """Return the median (duration, rss growth, access duration) of the startup, each in a fresh interpreter."""
+    runs = [
+        [
+            float(x)
+            for x in subprocess.run(  # noqa: S603
+                [sys.executable, "-m", "benchmarks.bench_node_startup", "lazy" if lazy else "eager"],
+                capture_output=True,
+                check=True,
+                cwd=Path(__file__).parent.parent,
+                text=True,
+            ).stdout.split()
+        ]
+        for _ in range(REPEAT)
+    ]
+    return [statistics.median(column) for column in zip(*runs, strict=True)]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    eager, eager_rss, eager_access = run_child(lazy=False)
+    lazy, lazy_rss, lazy_access = run_child(lazy=True)
+    report(f"create MatterNode objects ({NODE_COUNT} nodes)", eager, lazy, NODE_COUNT, "node")
+    print(f"  rss growth: {eager_rss / 1024:.1f} MiB -> {lazy_rss / 1024:.1f} MiB")
+    report_single("access device info and OnOff of all endpoints (eager)", eager_access, NODE_COUNT, "node")
+    report_single("access device info and OnOff of all endpoints (lazy, first access)", lazy_access, NODE_COUNT, "node")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_startup(lazy=sys.argv[1] == "lazy")
+    else:
+        main()
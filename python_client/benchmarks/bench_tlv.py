@@ -0,0 +1,91 @@
+"""
+Benchmark the TLV readers and writer on realistic, multi-kilobyte attribute payloads.
+
+Run with: python -m benchmarks.bench_tlv
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from chip import tlv
+from chip.clusters import Objects as Clusters
+
+from .common import make_raw_value, measure, report, report_single
+
+if TYPE_CHECKING:
+    from chip.clusters.ClusterObjects import ClusterAttributeDescriptor
+
+# attribute and number of list entries
+PAYLOADS: tuple[tuple[type[ClusterAttributeDescriptor], int], ...] = (
+    (Clusters.AccessControl.Attributes.Acl, 16),
+    (Clusters.ThreadNetworkDiagnostics.Attributes.NeighborTable, 64),
+    (Clusters.ThreadNetworkDiagnostics.Attributes.RouteTable, 64),
+    (Clusters.Descriptor.Attributes.PartsList, 500),
+    (Clusters.OperationalCredentials.Attributes.NOCs, 5),
+)
+
+
+def make_payload(attribute: type[ClusterAttributeDescriptor], list_length: int) -> bytes:
+    """Create the TLV encoding of an attribute value with the given number of list entries."""
+    raw = make_raw_value(attribute.attribute_type.Type, tlv=True, list_length=list_length)
+    return bytes(attribute.ToTLV(None, attribute.FromTagDictOrRawValue(raw)))
+
+
+def encode_raw(value: Any) -> bytes:
+    """Encode a decoded TLV value (tag dicts, lists and scalars) with TLVWriter.put."""
+    writer = tlv.TLVWriter()  # type: ignore[no-untyped-call]
+    writer.put(None, value)  # type: ignore[no-untyped-call]
+    return bytes(writer.encoding)
+
+
+def make_cluster_payload(cluster: type[Clusters.Cluster], list_length: int) -> bytes:
+    """Create the TLV encoding of a struct holding all (non-global) attributes of a cluster."""
+    values = {
+        field.Tag: make_raw_value(field.Type, tlv=True, list_length=list_length)
+        for field in cluster.descriptor.Fields
+        if field.Tag <= tlv.UINT8_MAX
+    }
+    return encode_raw(values)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for attribute, list_length in PAYLOADS:
+        payload = make_payload(attribute, list_length)
+        report_single(
+            f"TLVReader.get {attribute.__qualname__} ({len(payload)} bytes)",
+            measure(lambda payload=payload: tlv.TLVReader(payload).get(), number=20),  # type: ignore[misc,no-untyped-call]
+            list_length,
+            "entry",
+        )
+
+    for attribute, list_length in PAYLOADS:
+        payload = make_payload(attribute, list_length)
+        raw = tlv.TLVReader(payload).get()["Any"]  # type: ignore[no-untyped-call]
+        value = attribute.FromTLV(payload)
+        report_single(
+            f"TLVWriter.put {attribute.__qualname__} ({len(payload)} bytes)",
+            measure(lambda raw=raw: encode_raw(raw), number=20),  # type: ignore[misc]
+            list_length,
+            "entry",
+        )
+        report_single(
+            f"ToTLV {attribute.__qualname__} ({len(payload)} bytes)",
+            measure(lambda attribute=attribute, value=value: attribute.ToTLV(None, value), number=20),  # type: ignore[misc]
+            list_length,
+            "entry",
+        )
+
+    # decode a single field of a large struct, the other fields are skipped (not decoded)
+    cluster = Clusters.ThreadNetworkDiagnostics
+    payload = make_cluster_payload(cluster, 64)
+    report(
+        f"TLVToDict {cluster.__qualname__} ({len(payload)} bytes), all fields vs partitionId only",
+        measure(lambda: cluster.descriptor.TLVToDict(payload), number=20),
+        measure(lambda: cluster.descriptor.TLVToDict(payload, ["partitionId"]), number=20),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark the throughput of MatterNode.update_attribute (the attribute_updated event path).
+
+Run with: python -m benchmarks.bench_update_attribute
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from chip.clusters.ClusterObjects import ALL_ATTRIBUTES, ALL_CLUSTERS
+from matter_server.client.models import node as node_module
+from matter_server.client.models.node import MatterNode, get_object_params
+from matter_server.common.helpers.util import dataclass_from_dict, parse_value
+from matter_server.common.models import MatterNodeData
+
+from .common import make_attribute_updates, make_node_data, measure, report
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+BRIDGED_ENDPOINTS = 16
+
+
+def uncached_parse_attribute(cluster_id: int, attribute_id: int, attribute_value: Any) -> Any:
+    """Parse a raw attribute value, looking up name, type and default on every call."""
+    if (
+        cluster_id not in ALL_CLUSTERS
+        or cluster_id not in ALL_ATTRIBUTES
+        or attribute_id not in ALL_ATTRIBUTES[cluster_id]
+    ):
+        return None
+    cluster_class = ALL_CLUSTERS[cluster_id]
+    attribute_class = ALL_ATTRIBUTES[cluster_id][attribute_id]
+    attribute_name, attribute_type = get_object_params(cluster_class.descriptor, attribute_id)
+    attribute_value = parse_value(attribute_name, attribute_value, attribute_type, attribute_class().value)
+    return cluster_class, attribute_name, attribute_value
+
+
+@contextmanager
+def uncached_entries() -> Iterator[None]:
+    """Temporarily parse the attribute values without the cached attribute entries."""
+    parse_attribute = node_module._parse_attribute
+    node_module._parse_attribute = uncached_parse_attribute
+    try:
+        yield
+    finally:
+        node_module._parse_attribute = parse_attribute
+
+
+def main() -> None:
+    """Run the benchmark."""
+    node = MatterNode(dataclass_from_dict(MatterNodeData, make_node_data(1, bridged_endpoints=BRIDGED_ENDPOINTS)))
+    updates = [tuple(x["data"][1:]) for x in make_attribute_updates(1, bridged_endpoints=BRIDGED_ENDPOINTS)] * 100
+
+    def run() -> None:
+        for attribute_path, value in updates:
+            node.update_attribute(attribute_path, value)
+
+    with uncached_entries():
+        before = measure(run)
+    after = measure(run)
+    report(f"MatterNode.update_attribute ({len(updates)} updates)", before, after, len(updates), "update")
+    print(f"  throughput: {len(updates) / before:,.0f} -> {len(updates) / after:,.0f} updates/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Shared helpers for the benchmarks: timing and a synthetic (but realistic) fabric."""
+
+from __future__ import annotations
+
+import base64
+from enum import Enum
+import statistics
+import timeit
+import typing
+from typing import TYPE_CHECKING, Any
+
+from chip.clusters import Objects as Clusters
+from chip.clusters.ClusterObjects import ALL_ATTRIBUTES, ClusterObject
+from chip.clusters.Types import Nullable
+from chip.tlv import float32, uint
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# clusters on the root endpoint (0) of every node
+ROOT_CLUSTERS: tuple[type[Clusters.Cluster], ...] = (
+    Clusters.Descriptor,
+    Clusters.BasicInformation,
+    Clusters.AccessControl,
+    Clusters.GeneralCommissioning,
+    Clusters.NetworkCommissioning,
+    Clusters.OperationalCredentials,
+    Clusters.GeneralDiagnostics,
+    Clusters.ThreadNetworkDiagnostics,
+)
+# clusters on each (bridged) light endpoint
+LIGHT_CLUSTERS: tuple[type[Clusters.Cluster], ...] = (
+    Clusters.Descriptor,
+    Clusters.BridgedDeviceBasicInformation,
+    Clusters.Identify,
+    Clusters.OnOff,
+    Clusters.LevelControl,
+    Clusters.ColorControl,
+    Clusters.ElectricalPowerMeasurement,
+)
+LIST_LENGTH = 3
+DEVICE_TYPE_ROOT_NODE = 0x0016
+DEVICE_TYPE_AGGREGATOR = 0x000E
+DEVICE_TYPE_BRIDGED_NODE = 0x0013
+DEVICE_TYPE_EXTENDED_COLOR_LIGHT = 0x010D
+
+
+def make_raw_value(value_type: Any, depth: int = 0, tlv: bool = False, list_length: int = LIST_LENGTH) -> Any:
+    """
+    Create a raw value for a type annotation of a cluster object.
+
+    By default the value is in the (json) wire format, with tlv=True the value is
+    in the format of decoded TLV (integer tags, raw bytes).
+    """
+    # pylint: disable=too-many-return-statements
+    origin = typing.get_origin(value_type)
+    if origin is typing.Union:
+        sub_types = [x for x in typing.get_args(value_type) if x not in (type(None), Nullable)]
+        return make_raw_value(sub_types[0], depth, tlv, list_length) if sub_types else None
+    if origin is list:
+        if depth > 2:
+            return []
+        (item_type,) = typing.get_args(value_type)
+        return [make_raw_value(item_type, depth + 1, tlv, list_length) for _ in range(list_length)]
+    if isinstance(value_type, type) and issubclass(value_type, ClusterObject):
+        # structs are keyed by their TLV tag (stringified in the wire format)
+        return {
+            (field.Tag if tlv else str(field.Tag)): make_raw_value(field.Type, depth + 1, tlv, list_length)
+            for field in value_type.descriptor.Fields
+        }
+    if isinstance(value_type, type) and issubclass(value_type, Enum):
+        member = next(iter(value_type), None)
+        return 0 if member is None else member.value
+    if value_type is bool:
+        return True
+    if value_type in (float, float32):
+        return value_type(21.5) if tlv else 21.5
+    if value_type is str:
+        return "benchmark"
+    if value_type is bytes:
+        return bytes(range(16)) if tlv else base64.b64encode(bytes(range(16))).decode()
+    if value_type in (int, uint):
+        return value_type(42) if tlv else 42
+    return None
+
+
+def make_cluster_attributes(endpoint_id: int, cluster: type[Clusters.Cluster]) -> dict[str, Any]:
+    """Create raw values for all (standard) attributes of a cluster on an endpoint."""
+    return {
+        f"{endpoint_id}/{cluster.id}/{attribute_id}": make_raw_value(attribute.attribute_type.Type)
+        for attribute_id, attribute in ALL_ATTRIBUTES[cluster.id].items()
+    }
+
+
+def make_descriptor(
+    endpoint_id: int,
+    device_types: list[int],
+    clusters: tuple[type[Clusters.Cluster], ...],
+    parts: list[int],
+) -> dict[str, Any]:
+    """Create the raw Descriptor cluster attributes of an endpoint."""
+    attributes = make_cluster_attributes(endpoint_id, Clusters.Descriptor)
+    prefix = f"{endpoint_id}/{Clusters.Descriptor.id}"
+    attributes[f"{prefix}/0"] = [{"0": device_type, "1": 1} for device_type in device_types]
+    attributes[f"{prefix}/1"] = [cluster.id for cluster in clusters]
+    attributes[f"{prefix}/3"] = parts
+    return attributes
+
+
+def make_node_data(node_id: int, bridged_endpoints: int = 4) -> dict[str, Any]:
+    """
+    Create the raw data of a node, as sent by the server in the start_listening dump.
+
+    The node is a bridge (root endpoint, aggregator endpoint 1) with a number of bridged
+    extended color lights, which also measure power.
+    """
+    light_ids = list(range(2, 2 + bridged_endpoints))
+    attributes: dict[str, Any] = {}
+    for cluster in ROOT_CLUSTERS:
+        attributes.update(make_cluster_attributes(0, cluster))
+    attributes.update(make_descriptor(0, [DEVICE_TYPE_ROOT_NODE], ROOT_CLUSTERS, [1, *light_ids]))
+    attributes.update(make_descriptor(1, [DEVICE_TYPE_AGGREGATOR], (Clusters.Descriptor,), light_ids))
+    for endpoint_id in light_ids:
+        for cluster in LIGHT_CLUSTERS:
+            attributes.update(make_cluster_attributes(endpoint_id, cluster))
+        attributes.update(
+            make_descriptor(
+                endpoint_id,
+                [DEVICE_TYPE_BRIDGED_NODE, DEVICE_TYPE_EXTENDED_COLOR_LIGHT],
+                LIGHT_CLUSTERS,
+                [],
+            )
+        )
+    return {
+        "node_id": node_id,
+        "date_commissioned": "2024-01-01T00:00:00",
+        "last_interview": "2024-01-01T00:00:00",
+        "interview_version": 6,
+        "available": True,
+        "is_bridge": True,
+        "attributes": attributes,
+        "attribute_subscriptions": [],
+    }
+
+
+def make_fabric(node_count: int, bridged_endpoints: int = 4) -> list[dict[str, Any]]:
+    """Create the raw data of all nodes of a fabric."""
+    return [make_node_data(node_id, bridged_endpoints) for node_id in range(1, node_count + 1)]
+
+
+def make_attribute_updates(node_count: int, bridged_endpoints: int = 4) -> list[dict[str, Any]]:
+    """Create a stream of raw attribute_updated event messages for a fabric."""
+    paths = (
+        (Clusters.OnOff.id, 0, True),
+        (Clusters.LevelControl.id, 0, 128),
+        (Clusters.ColorControl.id, 0, 200),
+        (Clusters.ColorControl.id, 1, 100),
+        (Clusters.ElectricalPowerMeasurement.id, 8, 1500),
+    )
+    return [
+        {
+            "event": "attribute_updated",
+            "data": [node_id, f"{endpoint_id}/{cluster_id}/{attribute_id}", value],
+        }
+        for node_id in range(1, node_count + 1)
+        for endpoint_id in range(2, 2 + bridged_endpoints)
+        for cluster_id, attribute_id, value in paths
+    ]
+
+
+def measure(func: Callable[[], Any], number: int = 1, repeat: int = 5) -> float:
+    """Return the median duration (in seconds) of a single call of func."""
+    return statistics.median(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report_single(title: str, duration: float, unit_count: int = 1, unit: str = "op") -> None:
+    """Print a single measurement."""
+    print(f"{title}")
+    print(f"  {duration * 1000:10.3f} ms ({duration / unit_count * 1e6:8.2f} us/{unit})")
+
+
+def report(title: str, before: float, after: float, unit_count: int = 1, unit: str = "op") -> None:
+    """Print a before/after comparison of two measurements."""
+    print(f"{title}")
+    print(f"  before: {before * 1000:10.3f} ms ({before / unit_count * 1e6:8.2f} us/{unit})")
+    print(f"  after:  {after * 1000:10.3f} ms ({after / unit_count * 1e6:8.2f} us/{unit})")
+    print(f"  speedup: {before / after:.1f}x")
@@ -6,3 +6,18 @@ class classproperty(property):
 
     def __get__(self, obj, owner):
         return classmethod(self.fget).__get__(None, owner)()
+
+
+class cached_classproperty(classproperty):
+    """classproperty that only computes its value once per class (on first access)."""
+
+    def __init__(self, fget=None, fset=None, fdel=None, doc=None):
+        super().__init__(fget, fset, fdel, doc)
+        self._values = {}
+
+    def __get__(self, obj, owner):
+        try:
+            return self._values[owner]
+        except KeyError:
+            value = self._values[owner] = super().__get__(obj, owner)
+            return value
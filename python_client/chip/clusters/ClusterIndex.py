@@ -0,0 +1,201 @@
+"""
+Lookups of cluster/attribute/event/command ids, names and types in the static cluster index.
+
+The index (cluster_defs/_index.py) is generated from the cluster definitions at build time,
+so these lookups do not import the (lazily imported) cluster modules. The real classes are
+only imported when a typed object is requested (e.g. ClusterInfo.cluster_class).
+"""
+
+import typing
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# flags of a field type, in addition to its (element) type name
+FLAG_LIST = 1
+FLAG_NULLABLE = 2
+FLAG_OPTIONAL = 4
+
+_index = None
+_clusterIdsByName: Optional[Dict[str, int]] = None
+
+
+def _GetIndex():
+    global _index
+    if _index is None:
+        from .cluster_defs import _index
+    return _index
+
+
+class FieldInfo(NamedTuple):
+    tag: int
+    label: str
+    type: str
+    flags: int
+
+    @property
+    def is_list(self) -> bool:
+        return bool(self.flags & FLAG_LIST)
+
+    @property
+    def nullable(self) -> bool:
+        return bool(self.flags & FLAG_NULLABLE)
+
+    @property
+    def optional(self) -> bool:
+        return bool(self.flags & FLAG_OPTIONAL)
+
+
+class AttributeInfo(NamedTuple):
+    cluster_id: int
+    attribute_id: int
+    name: str
+    label: str
+    type: str
+    flags: int
+
+    @property
+    def field(self) -> FieldInfo:
+        return FieldInfo(self.attribute_id, self.label, self.type, self.flags)
+
+    @property
+    def attribute_class(self):
+        from .ClusterObjects import ALL_ATTRIBUTES
+
+        return ALL_ATTRIBUTES[self.cluster_id][self.attribute_id]
+
+
+class EventInfo(NamedTuple):
+    cluster_id: int
+    event_id: int
+    name: str
+    fields: List[FieldInfo]
+
+    @property
+    def event_class(self):
+        from .ClusterObjects import ALL_EVENTS
+
+        return ALL_EVENTS[self.cluster_id][self.event_id]
+
+
+class CommandInfo(NamedTuple):
+    cluster_id: int
+    command_id: int
+    name: str
+    is_client: bool
+    fields: List[FieldInfo]
+
+    @property
+    def command_class(self):
+        from .ClusterObjects import ALL_ACCEPTED_COMMANDS, ALL_GENERATED_COMMANDS
+
+        registry = ALL_ACCEPTED_COMMANDS if self.is_client else ALL_GENERATED_COMMANDS
+        return registry[self.cluster_id][self.command_id]
+
+
+class ClusterInfo(NamedTuple):
+    id: int
+    name: str
+
+    @property
+    def attributes(self) -> Dict[int, AttributeInfo]:
+        return {
+            attributeId: AttributeInfo(self.id, attributeId, *entry)
+            for attributeId, entry in _GetIndex().CLUSTERS[self.id][1].items()
+        }
+
+    @property
+    def events(self) -> Dict[int, EventInfo]:
+        return {eventId: GetEvent(self.id, eventId) for eventId in _GetIndex().CLUSTERS[self.id][2]}
+
+    @property
+    def cluster_class(self):
+        from .ClusterObjects import ALL_CLUSTERS
+
+        return ALL_CLUSTERS[self.id]
+
+
+def _Fields(entries) -> List[FieldInfo]:
+    return [FieldInfo(tag, *entry) for tag, entry in entries.items()]
+
+
+def GetCluster(clusterId: int) -> Optional[ClusterInfo]:
+    """Return the cluster with the given id, None if it is unknown."""
+    entry = _GetIndex().CLUSTERS.get(clusterId)
+    if entry is None:
+        return None
+    return ClusterInfo(clusterId, entry[0])
+
+
+def GetClusterByName(name: str) -> Optional[ClusterInfo]:
+    """Return the cluster with the given (class) name, None if it is unknown."""
+    global _clusterIdsByName
+    if _clusterIdsByName is None:
+        _clusterIdsByName = {entry[0]: clusterId for clusterId, entry in _GetIndex().CLUSTERS.items()}
+    clusterId = _clusterIdsByName.get(name)
+    if clusterId is None:
+        return None
+    return ClusterInfo(clusterId, name)
+
+
+def GetAttribute(clusterId: int, attributeId: int) -> Optional[AttributeInfo]:
+    """Return the (standard) attribute with the given ids, None if it is unknown."""
+    entry = _GetIndex().CLUSTERS.get(clusterId)
+    if entry is None or (attribute := entry[1].get(attributeId)) is None:
+        return None
+    return AttributeInfo(clusterId, attributeId, *attribute)
+
+
+def GetEvent(clusterId: int, eventId: int) -> Optional[EventInfo]:
+    """Return the event with the given ids, None if it is unknown."""
+    entry = _GetIndex().CLUSTERS.get(clusterId)
+    if entry is None or (event := entry[2].get(eventId)) is None:
+        return None
+    return EventInfo(clusterId, eventId, event[0], _Fields(event[1]))
+
+
+def GetCommand(clusterId: int, commandId: int, isClient: bool = True) -> Optional[CommandInfo]:
+    """Return the accepted (client) or generated (server) command with the given ids, None if it is unknown."""
+    entry = _GetIndex().CLUSTERS.get(clusterId)
+    if entry is None or (command := entry[3 if isClient else 4].get(commandId)) is None:
+        return None
+    return CommandInfo(clusterId, commandId, command[0], isClient, _Fields(command[1]))
+
+
+def GetStructFields(name: str) -> Optional[List[FieldInfo]]:
+    """Return the fields of the struct with the given qualified name (e.g. 'Descriptor.Structs.DeviceTypeStruct')."""
+    entry = _GetIndex().STRUCTS.get(name)
+    if entry is None:
+        return None
+    return _Fields(entry)
+
+
+def GetEnumValues(name: str) -> Optional[Dict[str, int]]:
+    """Return the members of the enum/bitmap with the given qualified name (e.g. 'OnOff.Enums.StartUpOnOffEnum')."""
+    return _GetIndex().ENUMS.get(name)
+
+
+def ResolveAttributePath(path: str) -> Optional[Tuple[int, ClusterInfo, AttributeInfo]]:
+    """Resolve an 'endpoint/cluster/attribute' path, None if it is not a concrete path of a known attribute."""
+    try:
+        endpointId, clusterId, attributeId = map(int, path.split("/"))
+    except ValueError:
+        return None
+    entry = _GetIndex().CLUSTERS.get(clusterId)
+    if entry is None or (attribute := entry[1].get(attributeId)) is None:
+        return None
+    return endpointId, ClusterInfo(clusterId, entry[0]), AttributeInfo(clusterId, attributeId, *attribute)
+
+
+def ResolveType(typeName: str) -> typing.Any:
+    """Return the (real) class of a type name in the index, importing the cluster module defining it."""
+    from ..tlv import float32, uint
+
+    builtin = {"uint": uint, "int": int, "bool": bool, "str": str, "bytes": bytes, "float32": float32, "float": float}
+    if typeName in builtin:
+        return builtin[typeName]
+    from . import cluster_defs
+
+    clusterName, *path = typeName.split(".")
+    value = getattr(cluster_defs, clusterName)
+    for name in path:
+        value = getattr(value, name)
+    return value
@@ -6,7 +6,7 @@ custom_clusters.py build upon.
 
 import enum
 import typing
-from dataclasses import asdict, dataclass, field, make_dataclass
+from dataclasses import asdict, dataclass, field, fields, make_dataclass
 from typing import Any, ClassVar, Dict, List, Mapping, Union
 
 from .. import ChipUtility
@@ -93,20 +93,28 @@ class ClusterObjectFieldDescriptor:
 @dataclass
 class ClusterObjectDescriptor:
     Fields: List[ClusterObjectFieldDescriptor]
+    # lookup tables, built once from Fields (first field wins on duplicates)
+    _fieldsByTag: Dict[int, ClusterObjectFieldDescriptor] = field(
+        init=False, repr=False, compare=False
+    )
+    _fieldsByLabel: Dict[str, ClusterObjectFieldDescriptor] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._fieldsByTag = {}
+        self._fieldsByLabel = {}
+        for _field in self.Fields:
+            self._fieldsByTag.setdefault(_field.Tag, _field)
+            self._fieldsByLabel.setdefault(_field.Label, _field)
 
     def GetFieldByTag(self, tag: int) -> typing.Optional[ClusterObjectFieldDescriptor]:
-        for _field in self.Fields:
-            if _field.Tag == tag:
-                return _field
-        return None
+        return self._fieldsByTag.get(tag)
 
     def GetFieldByLabel(
         self, label: str
     ) -> typing.Optional[ClusterObjectFieldDescriptor]:
-        for _field in self.Fields:
-            if _field.Label == label:
-                return _field
-        return None
+        return self._fieldsByLabel.get(label)
 
     def _ConvertNonArray(self, debugPath: str, elementType, value: Any) -> Any:
         if not issubclass(elementType, ClusterObject):
@@ -161,8 +169,41 @@ class ClusterObjectDescriptor:
             )
         return ret
 
-    def TLVToDict(self, tlvBuf: bytes) -> Dict[str, Any]:
-        tlvData = tlv.TLVReader(tlvBuf).get().get("Any", {})
+    def TLVToDict(
+        self, tlvBuf: bytes, fields: typing.Optional[typing.Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """Decode a TLV encoded struct into a dict keyed by field label.
+
+        When fields (labels) is given, only those fields are decoded: all other
+        fields are skipped without decoding their values and reading stops as
+        soon as all requested fields have been seen.
+        """
+        if fields is None:
+            tlvData = tlv.TLVReader(tlvBuf).get().get("Any", {})
+            return self.TagDictToLabelDict("", tlvData)
+
+        wantedTags = set()
+        for label in fields:
+            descriptor = self.GetFieldByLabel(label)
+            if descriptor is None:
+                raise ValueError(f"Unknown field {label}")
+            wantedTags.add(descriptor.Tag)
+
+        tlvData = {}
+        reader = tlv.TLVStreamReader(tlvBuf)
+        element = reader.read()
+        if element is None or element.tag is not None or element.type != tlv.TLV_TYPE_STRUCTURE:
+            return {}
+        while wantedTags and (element := reader.read()) is not None:
+            if element.type == tlv.TLVEndOfContainer:
+                break
+            isContainer = element.type in (tlv.TLV_TYPE_STRUCTURE, tlv.TLV_TYPE_ARRAY)
+            if element.tag not in wantedTags:
+                if isContainer:
+                    reader.skip()
+                continue
+            wantedTags.discard(element.tag)
+            tlvData[element.tag] = reader.readContainer() if isContainer else element.value
         return self.TagDictToLabelDict("", tlvData)
 
     def DictToTLVWithWriter(
@@ -182,9 +223,217 @@ class ClusterObjectDescriptor:
         return bytes(tlvwriter.encoding)
 
 
+# Compiled TLV encoders/decoders
+#
+# The descriptor methods above interpret the field list (and its type annotations)
+# on every call. The functions below resolve the field types once per class into
+# specialized closures. They only handle well-formed values: for any other value they
+# raise a TypeError or ValueError and the callers fall back to the interpreted path,
+# which produces the (descriptive) error or result. Other exceptions are bugs and
+# are not caught.
+
+# value type -> TLVWriter method, for the types generated for cluster objects
+_TLV_PUTTERS = {
+    tlv.uint: tlv.TLVWriter.putUnsignedInt,
+    int: tlv.TLVWriter.putSignedInt,
+    bool: tlv.TLVWriter.putBool,
+    tlv.float32: tlv.TLVWriter.putFloat,
+    float: tlv.TLVWriter.putDouble,
+    str: tlv.TLVWriter.putString,
+    bytes: tlv.TLVWriter.putBytes,
+}
+
+
+def _ResolveFieldType(fieldType):
+    """Return (elementType, isList, nullable, optional) of a field type annotation."""
+    nullable = GetUnionUnderlyingType(fieldType, Nullable) is not None
+    optional = GetUnionUnderlyingType(fieldType, type(None)) is not None
+    if typing.get_origin(fieldType) == typing.Union:
+        elementType = GetUnionUnderlyingType(fieldType)
+        if elementType is None:
+            raise ValueError(f"Field type {fieldType} has no valid underlying data model type")
+    else:
+        elementType = fieldType
+    isList = typing.get_origin(elementType) == list
+    if isList:
+        (elementType,) = typing.get_args(elementType)
+    return elementType, isList, nullable, optional
+
+
+def _IsClusterObjectType(elementType) -> bool:
+    return isinstance(elementType, type) and issubclass(elementType, ClusterObject)
+
+
+def _CompileElementEncoder(elementType):
+    """Return encode(writer, tag, value) for a single (non list) value."""
+    if _IsClusterObjectType(elementType):
+
+        def encodeStruct(writer, tag, val):
+            elementType._tlv_encoder(writer, tag, val)
+
+        return encodeStruct
+
+    put = _TLV_PUTTERS.get(elementType)
+    if put is None:
+        if isinstance(elementType, type) and issubclass(elementType, enum.Enum):
+            put = tlv.TLVWriter.putUnsignedInt
+        else:
+            put = tlv.TLVWriter.put
+
+    def encodeValue(writer, tag, val):
+        if type(val) is not elementType:
+            val = elementType(val)
+        put(writer, tag, val)
+
+    return encodeValue
+
+
+def _CompileFieldEncoder(fieldType):
+    """Return encode(writer, tag, value) for a field, see ClusterObjectFieldDescriptor.PutFieldToTLV."""
+    elementType, isList, nullable, optional = _ResolveFieldType(fieldType)
+    encodeElement = _CompileElementEncoder(elementType)
+
+    def encodeField(writer, tag, val):
+        if val is None:
+            if not optional:
+                raise ValueError("Field is not optional")
+        elif isinstance(val, Nullable):
+            if not nullable:
+                raise ValueError("Field is not nullable")
+            writer.putNull(tag)
+        elif isList:
+            if type(val) is not list:
+                raise ValueError("List expected")
+            writer.startArray(tag)
+            for item in val:
+                encodeElement(writer, None, item)
+            writer.endContainer()
+        elif isinstance(val, list):
+            raise ValueError("Unexpected list")
+        else:
+            encodeElement(writer, tag, val)
+
+    return encodeField
+
+
+def _CompileStructEncoder(cls):
+    """Return encode(writer, tag, value) for a ClusterObject (instance or dict keyed by label)."""
+    fieldNames = {_field.name for _field in fields(cls)}
+    fieldEncoders = [
+        (
+            _field.Label if _field.Label in fieldNames else None,
+            _field.Label,
+            _field.Tag,
+            _CompileFieldEncoder(_field.Type),
+        )
+        for _field in cls.descriptor.Fields
+    ]
+
+    def encodeStruct(writer, tag, val):
+        if isinstance(val, cls):
+            writer.startStructure(tag)
+            for attrName, _, fieldTag, encodeField in fieldEncoders:
+                encodeField(
+                    writer,
+                    fieldTag,
+                    None if attrName is None else getattr(val, attrName),
+                )
+        elif isinstance(val, dict):
+            writer.startStructure(tag)
+            for _, label, fieldTag, encodeField in fieldEncoders:
+                encodeField(writer, fieldTag, val.get(label))
+        else:
+            raise ValueError(f"Struct {cls.__name__} expected")
+        writer.endContainer()
+
+    return encodeStruct
+
+
+def _CompileElementDecoder(elementType):
+    """Return decode(value) for a single (non list) decoded TLV value."""
+    if _IsClusterObjectType(elementType):
+
+        def decodeStruct(val):
+            if not isinstance(val, Mapping):
+                raise ValueError("Struct expected")
+            return elementType._tlv_decoder(val)
+
+        return decodeStruct
+
+    if issubclass(elementType, enum.Enum):
+        return elementType
+
+    def decodeValue(val):
+        if not isinstance(val, elementType):
+            raise ValueError(f"{elementType} expected")
+        return val
+
+    return decodeValue
+
+
+def _CompileFieldDecoder(fieldType):
+    """Return decode(value) for a field, see ClusterObjectDescriptor.TagDictToLabelDict."""
+    elementType, isList, nullable, _ = _ResolveFieldType(fieldType)
+    decodeElement = _CompileElementDecoder(elementType)
+
+    def decodeField(val):
+        if val is None:
+            if not nullable:
+                raise ValueError("Field is not nullable")
+            return NullValue
+        if isList:
+            if type(val) is not list:
+                raise ValueError("List expected")
+            return [decodeElement(item) for item in val]
+        return decodeElement(val)
+
+    return decodeField
+
+
+def _CompileStructDecoder(cls):
+    """Return decode(tagDict) creating an instance of a ClusterObject, see ClusterObject.FromDict."""
+    fieldNames = {_field.name for _field in fields(cls) if _field.init}
+    fieldDecoders = {
+        tag: (
+            _field.Label if _field.Label in fieldNames else None,
+            _CompileFieldDecoder(_field.Type),
+        )
+        for tag, _field in cls.descriptor._fieldsByTag.items()
+    }
+
+    def decodeStruct(tagDict):
+        if not isinstance(tagDict, Mapping):
+            raise ValueError(f"Struct {cls.__name__} expected")
+        kwargs = {}
+        for tag, val in tagDict.items():
+            fieldDecoder = fieldDecoders.get(tag)
+            if fieldDecoder is None:
+                continue
+            attrName, decodeField = fieldDecoder
+            val = decodeField(val)
+            if attrName is not None:
+                kwargs[attrName] = val
+        return cls(**kwargs)
+
+    return decodeStruct
+
+
 class ClusterObject:
+    def __init_subclass__(cls, *args, **kwargs) -> None:
+        super().__init_subclass__(*args, **kwargs)
+        # descriptors are static, so build them only once per class (on first access)
+        descriptor = cls.__dict__.get("descriptor")
+        if type(descriptor) is ChipUtility.classproperty:
+            cls.descriptor = ChipUtility.cached_classproperty(descriptor.fget)
+
     def ToTLV(self):
-        return self.descriptor.DictToTLV(asdict(self))
+        try:
+            writer = tlv.TLVWriter(bytearray())
+            self._tlv_encoder(writer, None, self)
+            return bytes(writer.encoding)
+        except (TypeError, ValueError):
+            # the interpreted path raises the descriptive error (or handles the odd value)
+            return self.descriptor.DictToTLV(asdict(self))
 
     @classmethod
     def FromDict(cls, data: dict):
@@ -194,19 +443,95 @@ class ClusterObject:
 
     @classmethod
     def FromTLV(cls, data: bytes):
-        return cls.FromDict(data=cls.descriptor.TLVToDict(data))
+        tlvData = tlv.TLVReader(data).get().get("Any", {})
+        try:
+            return cls._tlv_decoder(tlvData)
+        except (TypeError, ValueError):
+            return cls.FromDict(data=cls.descriptor.TagDictToLabelDict("", tlvData))
+
+    @ChipUtility.cached_classproperty
+    def _tlv_encoder(cls):
+        return _CompileStructEncoder(cls)
+
+    @ChipUtility.cached_classproperty
+    def _tlv_decoder(cls):
+        return _CompileStructDecoder(cls)
 
     @ChipUtility.classproperty
     def descriptor(cls):
         raise NotImplementedError()
 
 
+_allClusterModulesImported = False
+
+
+def _ImportClusterModule(clusterId) -> bool:
+    """Import the generated module defining the cluster, returns False if there is nothing (new) to import."""
+    from . import cluster_defs
+
+    name = cluster_defs.CLUSTER_MODULES.get(clusterId)
+    if name is None or name in cluster_defs.__dict__:
+        return False
+    getattr(cluster_defs, name)
+    return True
+
+
+def _ImportAllClusterModules() -> None:
+    global _allClusterModulesImported
+    if not _allClusterModulesImported:
+        from . import cluster_defs
+
+        cluster_defs.import_all()
+        _allClusterModulesImported = True
+
+
+class _ClusterRegistry(dict):
+    """Registry keyed by cluster id, filled as the (lazily imported) cluster modules are imported.
+
+    A lookup of a cluster id that is not registered yet imports the module defining that cluster,
+    iterating the registry imports all cluster modules.
+    """
+
+    def __missing__(self, key):
+        if _ImportClusterModule(key):
+            return self[key]
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or (_ImportClusterModule(key) and dict.__contains__(self, key))
+
+    def get(self, key, default=None):
+        if key in self:
+            return dict.__getitem__(self, key)
+        return default
+
+    def __iter__(self):
+        _ImportAllClusterModules()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        _ImportAllClusterModules()
+        return dict.__len__(self)
+
+    def keys(self):
+        _ImportAllClusterModules()
+        return dict.keys(self)
+
+    def values(self):
+        _ImportAllClusterModules()
+        return dict.values(self)
+
+    def items(self):
+        _ImportAllClusterModules()
+        return dict.items(self)
+
+
 # Global registration dictionaries populated via __init_subclass__
-ALL_CLUSTERS: typing.Dict = {}
-ALL_ATTRIBUTES: typing.Dict = {}
-ALL_ACCEPTED_COMMANDS: typing.Dict = {}
-ALL_GENERATED_COMMANDS: typing.Dict = {}
-ALL_EVENTS: typing.Dict = {}
+ALL_CLUSTERS: typing.Dict = _ClusterRegistry()
+ALL_ATTRIBUTES: typing.Dict = _ClusterRegistry()
+ALL_ACCEPTED_COMMANDS: typing.Dict = _ClusterRegistry()
+ALL_GENERATED_COMMANDS: typing.Dict = _ClusterRegistry()
+ALL_EVENTS: typing.Dict = _ClusterRegistry()
 
 
 class ClusterCommand(ClusterObject):
@@ -214,13 +539,9 @@ class ClusterCommand(ClusterObject):
         super().__init_subclass__(*args, **kwargs)
         try:
             if cls.is_client:
-                if cls.cluster_id not in ALL_ACCEPTED_COMMANDS:
-                    ALL_ACCEPTED_COMMANDS[cls.cluster_id] = {}
-                ALL_ACCEPTED_COMMANDS[cls.cluster_id][cls.command_id] = cls
+                ALL_ACCEPTED_COMMANDS.setdefault(cls.cluster_id, {})[cls.command_id] = cls
             else:
-                if cls.cluster_id not in ALL_GENERATED_COMMANDS:
-                    ALL_GENERATED_COMMANDS[cls.cluster_id] = {}
-                ALL_GENERATED_COMMANDS[cls.cluster_id][cls.command_id] = cls
+                ALL_GENERATED_COMMANDS.setdefault(cls.cluster_id, {})[cls.command_id] = cls
         except NotImplementedError:
             # handle case where the ClusterAttribute class is not (fully) subclassed
             # and accessing the id property throws a NotImplementedError.
@@ -261,35 +582,41 @@ class Cluster(ClusterObject):
 class ClusterAttributeDescriptor:
     def __init_subclass__(cls, *args, **kwargs) -> None:
         super().__init_subclass__(*args, **kwargs)
+        # the attribute type is static, so build it only once per class (on first access)
+        attribute_type = cls.__dict__.get("attribute_type")
+        if type(attribute_type) is ChipUtility.classproperty:
+            cls.attribute_type = ChipUtility.cached_classproperty(attribute_type.fget)
         if cls.standard_attribute:
-            if cls.cluster_id not in ALL_ATTRIBUTES:
-                ALL_ATTRIBUTES[cls.cluster_id] = {}
-            ALL_ATTRIBUTES[cls.cluster_id][cls.attribute_id] = cls
+            ALL_ATTRIBUTES.setdefault(cls.cluster_id, {})[cls.attribute_id] = cls
 
     @classmethod
     def ToTLV(cls, tag: Union[int, None], value):
-        writer = tlv.TLVWriter()
-        wrapped_value = cls._cluster_object(Value=value)
-        cls.attribute_type.PutFieldToTLV(
-            tag, asdict(wrapped_value)["Value"], writer, ""
-        )
-        return writer.encoding
+        try:
+            writer = tlv.TLVWriter()
+            cls._tlv_encoder(writer, tag, value)
+            return writer.encoding
+        except (TypeError, ValueError):
+            # the interpreted path raises the descriptive error (or handles the odd value)
+            writer = tlv.TLVWriter()
+            wrapped_value = cls._cluster_object(Value=value)
+            cls.attribute_type.PutFieldToTLV(
+                tag, asdict(wrapped_value)["Value"], writer, ""
+            )
+            return writer.encoding
 
     @classmethod
     def FromTLV(cls, tlvBuffer: bytes):
-        obj_class = cls._cluster_object
-        return obj_class.FromDict(
-            obj_class.descriptor.TagDictToLabelDict(
-                "", {0: tlv.TLVReader(tlvBuffer).get().get("Any", {})}
-            )
-        ).Value
+        return cls.FromTagDictOrRawValue(tlv.TLVReader(tlvBuffer).get().get("Any", {}))
 
     @classmethod
     def FromTagDictOrRawValue(cls, val: Any):
-        obj_class = cls._cluster_object
-        return obj_class.FromDict(
-            obj_class.descriptor.TagDictToLabelDict("", {0: val})
-        ).Value
+        try:
+            return cls._tlv_decoder(val)
+        except (TypeError, ValueError):
+            obj_class = cls._cluster_object
+            return obj_class.FromDict(
+                obj_class.descriptor.TagDictToLabelDict("", {0: val})
+            ).Value
 
     @ChipUtility.classproperty
     def cluster_id(cls) -> int:
@@ -311,8 +638,17 @@ class ClusterAttributeDescriptor:
     def standard_attribute(cls) -> bool:
         return True
 
-    @ChipUtility.classproperty
+    @ChipUtility.cached_classproperty
+    def _tlv_encoder(cls):
+        return _CompileFieldEncoder(cls.attribute_type.Type)
+
+    @ChipUtility.cached_classproperty
+    def _tlv_decoder(cls):
+        return _CompileFieldDecoder(cls.attribute_type.Type)
+
+    @ChipUtility.cached_classproperty
     def _cluster_object(cls) -> ClusterObject:
+        # make_dataclass compiles code, so the wrapper class is only created once per attribute
         return make_dataclass(
             "InternalClass",
             [
@@ -338,9 +674,7 @@ class ClusterAttributeDescriptor:
 class ClusterEvent(ClusterObject):
     def __init_subclass__(cls, *args, **kwargs) -> None:
         super().__init_subclass__(*args, **kwargs)
-        if cls.cluster_id not in ALL_EVENTS:
-            ALL_EVENTS[cls.cluster_id] = {}
-        ALL_EVENTS[cls.cluster_id][cls.event_id] = cls
+        ALL_EVENTS.setdefault(cls.cluster_id, {})[cls.event_id] = cls
 
     @ChipUtility.classproperty
     def cluster_id(cls) -> int:
@@ -2,10 +2,12 @@
  Cluster object definitions.
  This file is auto-generated, DO NOT edit.
  Users can import chip.clusters.Objects to get all cluster definitions.
+ The cluster classes are imported lazily, on first access.
 """
 
-# Re-export all cluster classes from per-cluster files
-from chip.clusters.cluster_defs import *  # noqa: F401,F403
+import typing
+
+from chip.clusters import cluster_defs
 
 # Also re-export base classes and primitive types for backward compatibility
 from chip.clusters.ClusterObjects import (  # noqa: F401
@@ -20,6 +22,10 @@ from chip.clusters.ClusterObjects import (  # noqa: F401
 from chip.clusters.Types import NullValue, Nullable  # noqa: F401
 from chip.tlv import float32, uint  # noqa: F401
 
+if typing.TYPE_CHECKING:
+    # Re-export all cluster classes from per-cluster files
+    from chip.clusters.cluster_defs import *  # noqa: F401,F403
+
 __all__ = [
     "Cluster",
     "ClusterAttributeDescriptor",
@@ -178,3 +184,15 @@ __all__ = [
     "WindowCovering",
     "ZoneManagement",
 ]
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in cluster_defs.__all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(cluster_defs, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,150 +1,307 @@
-"""Auto-generated cluster imports (DO NOT edit)."""
+"""Auto-generated cluster imports (DO NOT edit).
 
-from .Globals import Globals
-from .AccessControl import AccessControl
-from .AccountLogin import AccountLogin
-from .Actions import Actions
-from .ActivatedCarbonFilterMonitoring import ActivatedCarbonFilterMonitoring
-from .AdministratorCommissioning import AdministratorCommissioning
-from .AirQuality import AirQuality
-from .AmbientContextSensing import AmbientContextSensing
-from .ApplicationBasic import ApplicationBasic
-from .ApplicationLauncher import ApplicationLauncher
-from .AudioOutput import AudioOutput
-from .BasicInformation import BasicInformation
-from .Binding import Binding
-from .BooleanState import BooleanState
-from .BooleanStateConfiguration import BooleanStateConfiguration
-from .BridgedDeviceBasicInformation import BridgedDeviceBasicInformation
-from .CameraAvSettingsUserLevelManagement import CameraAvSettingsUserLevelManagement
-from .CameraAvStreamManagement import CameraAvStreamManagement
-from .CarbonDioxideConcentrationMeasurement import CarbonDioxideConcentrationMeasurement
-from .CarbonMonoxideConcentrationMeasurement import CarbonMonoxideConcentrationMeasurement
-from .Channel import Channel
-from .Chime import Chime
-from .ClosureControl import ClosureControl
-from .ClosureDimension import ClosureDimension
-from .ColorControl import ColorControl
-from .CommissionerControl import CommissionerControl
-from .CommodityMetering import CommodityMetering
-from .CommodityPrice import CommodityPrice
-from .CommodityTariff import CommodityTariff
-from .ContentAppObserver import ContentAppObserver
-from .ContentControl import ContentControl
-from .ContentLauncher import ContentLauncher
-from .Descriptor import Descriptor
-from .DeviceEnergyManagement import DeviceEnergyManagement
-from .DeviceEnergyManagementMode import DeviceEnergyManagementMode
-from .DiagnosticLogs import DiagnosticLogs
-from .DishwasherAlarm import DishwasherAlarm
-from .DishwasherMode import DishwasherMode
-from .DoorLock import DoorLock
-from .DraftElectricalMeasurementCluster import DraftElectricalMeasurementCluster
-from .EcosystemInformation import EcosystemInformation
-from .ElectricalEnergyMeasurement import ElectricalEnergyMeasurement
-from .ElectricalGridConditions import ElectricalGridConditions
-from .ElectricalPowerMeasurement import ElectricalPowerMeasurement
-from .EnergyEvse import EnergyEvse
-from .EnergyEvseMode import EnergyEvseMode
-from .EnergyPreference import EnergyPreference
-from .EthernetNetworkDiagnostics import EthernetNetworkDiagnostics
-from .EveCluster import EveCluster
-from .FanControl import FanControl
-from .FixedLabel import FixedLabel
-from .FlowMeasurement import FlowMeasurement
-from .FormaldehydeConcentrationMeasurement import FormaldehydeConcentrationMeasurement
-from .GeneralCommissioning import GeneralCommissioning
-from .GeneralDiagnostics import GeneralDiagnostics
-from .GroupKeyManagement import GroupKeyManagement
-from .Groupcast import Groupcast
-from .Groups import Groups
-from .HeimanCluster import HeimanCluster
-from .HepaFilterMonitoring import HepaFilterMonitoring
-from .IcdManagement import IcdManagement
-from .Identify import Identify
-from .IlluminanceMeasurement import IlluminanceMeasurement
-from .InovelliCluster import InovelliCluster
-from .JointFabricAdministrator import JointFabricAdministrator
-from .JointFabricDatastore import JointFabricDatastore
-from .KeypadInput import KeypadInput
-from .LaundryDryerControls import LaundryDryerControls
-from .LaundryWasherControls import LaundryWasherControls
-from .LaundryWasherMode import LaundryWasherMode
-from .LevelControl import LevelControl
-from .LocalizationConfiguration import LocalizationConfiguration
-from .LowPower import LowPower
-from .MediaInput import MediaInput
-from .MediaPlayback import MediaPlayback
-from .Messages import Messages
-from .MeterIdentification import MeterIdentification
-from .MicrowaveOvenControl import MicrowaveOvenControl
-from .MicrowaveOvenMode import MicrowaveOvenMode
-from .ModeSelect import ModeSelect
-from .NeoCluster import NeoCluster
-from .NetworkCommissioning import NetworkCommissioning
-from .NitrogenDioxideConcentrationMeasurement import NitrogenDioxideConcentrationMeasurement
-from .OccupancySensing import OccupancySensing
-from .OnOff import OnOff
-from .OperationalCredentials import OperationalCredentials
-from .OperationalState import OperationalState
-from .OtaSoftwareUpdateProvider import OtaSoftwareUpdateProvider
-from .OtaSoftwareUpdateRequestor import OtaSoftwareUpdateRequestor
-from .OvenCavityOperationalState import OvenCavityOperationalState
-from .OvenMode import OvenMode
-from .OzoneConcentrationMeasurement import OzoneConcentrationMeasurement
-from .Pm10ConcentrationMeasurement import Pm10ConcentrationMeasurement
-from .Pm1ConcentrationMeasurement import Pm1ConcentrationMeasurement
-from .Pm25ConcentrationMeasurement import Pm25ConcentrationMeasurement
-from .PowerSource import PowerSource
-from .PowerSourceConfiguration import PowerSourceConfiguration
-from .PowerTopology import PowerTopology
-from .PressureMeasurement import PressureMeasurement
-from .PumpConfigurationAndControl import PumpConfigurationAndControl
-from .PushAvStreamTransport import PushAvStreamTransport
-from .RadonConcentrationMeasurement import RadonConcentrationMeasurement
-from .RefrigeratorAlarm import RefrigeratorAlarm
-from .RefrigeratorAndTemperatureControlledCabinetMode import RefrigeratorAndTemperatureControlledCabinetMode
-from .RelativeHumidityMeasurement import RelativeHumidityMeasurement
-from .RvcCleanMode import RvcCleanMode
-from .RvcOperationalState import RvcOperationalState
-from .RvcRunMode import RvcRunMode
-from .ScenesManagement import ScenesManagement
-from .ServiceArea import ServiceArea
-from .SmokeCoAlarm import SmokeCoAlarm
-from .SoftwareDiagnostics import SoftwareDiagnostics
-from .SoilMeasurement import SoilMeasurement
-from .Switch import Switch
-from .TargetNavigator import TargetNavigator
-from .TclDehumidifierCluster import TclDehumidifierCluster
-from .TemperatureAlarm import TemperatureAlarm
-from .TemperatureControl import TemperatureControl
-from .TemperatureMeasurement import TemperatureMeasurement
-from .Thermostat import Thermostat
-from .ThermostatUserInterfaceConfiguration import ThermostatUserInterfaceConfiguration
-from .ThirdRealityMeteringCluster import ThirdRealityMeteringCluster
-from .ThreadBorderRouterManagement import ThreadBorderRouterManagement
-from .ThreadNetworkDiagnostics import ThreadNetworkDiagnostics
-from .ThreadNetworkDirectory import ThreadNetworkDirectory
-from .TimeFormatLocalization import TimeFormatLocalization
-from .TimeSynchronization import TimeSynchronization
-from .TlsCertificateManagement import TlsCertificateManagement
-from .TlsClientManagement import TlsClientManagement
-from .TotalVolatileOrganicCompoundsConcentrationMeasurement import TotalVolatileOrganicCompoundsConcentrationMeasurement
-from .UnitLocalization import UnitLocalization
-from .UserLabel import UserLabel
-from .ValveConfigurationAndControl import ValveConfigurationAndControl
-from .WagoCluster import WagoCluster
-from .WakeOnLan import WakeOnLan
-from .WaterHeaterManagement import WaterHeaterManagement
-from .WaterHeaterMode import WaterHeaterMode
-from .WaterTankLevelMonitoring import WaterTankLevelMonitoring
-from .WebRtcTransportDefinitions import WebRtcTransportDefinitions
-from .WebRtcTransportProvider import WebRtcTransportProvider
-from .WebRtcTransportRequestor import WebRtcTransportRequestor
-from .WiFiNetworkDiagnostics import WiFiNetworkDiagnostics
-from .WiFiNetworkManagement import WiFiNetworkManagement
-from .WindowCovering import WindowCovering
-from .ZoneManagement import ZoneManagement
+The cluster modules are imported lazily: on first access of a cluster class here
+(or in chip.clusters.Objects) or on lookup of its id in the ALL_* registries.
+"""
+
+import importlib
+import sys
+import types
+import typing
+
+if typing.TYPE_CHECKING:
+    from .Globals import Globals
+    from .AccessControl import AccessControl
+    from .AccountLogin import AccountLogin
+    from .Actions import Actions
+    from .ActivatedCarbonFilterMonitoring import ActivatedCarbonFilterMonitoring
+    from .AdministratorCommissioning import AdministratorCommissioning
+    from .AirQuality import AirQuality
+    from .AmbientContextSensing import AmbientContextSensing
+    from .ApplicationBasic import ApplicationBasic
+    from .ApplicationLauncher import ApplicationLauncher
+    from .AudioOutput import AudioOutput
+    from .BasicInformation import BasicInformation
+    from .Binding import Binding
+    from .BooleanState import BooleanState
+    from .BooleanStateConfiguration import BooleanStateConfiguration
+    from .BridgedDeviceBasicInformation import BridgedDeviceBasicInformation
+    from .CameraAvSettingsUserLevelManagement import CameraAvSettingsUserLevelManagement
+    from .CameraAvStreamManagement import CameraAvStreamManagement
+    from .CarbonDioxideConcentrationMeasurement import CarbonDioxideConcentrationMeasurement
+    from .CarbonMonoxideConcentrationMeasurement import CarbonMonoxideConcentrationMeasurement
+    from .Channel import Channel
+    from .Chime import Chime
+    from .ClosureControl import ClosureControl
+    from .ClosureDimension import ClosureDimension
+    from .ColorControl import ColorControl
+    from .CommissionerControl import CommissionerControl
+    from .CommodityMetering import CommodityMetering
+    from .CommodityPrice import CommodityPrice
+    from .CommodityTariff import CommodityTariff
+    from .ContentAppObserver import ContentAppObserver
+    from .ContentControl import ContentControl
+    from .ContentLauncher import ContentLauncher
+    from .Descriptor import Descriptor
+    from .DeviceEnergyManagement import DeviceEnergyManagement
+    from .DeviceEnergyManagementMode import DeviceEnergyManagementMode
+    from .DiagnosticLogs import DiagnosticLogs
+    from .DishwasherAlarm import DishwasherAlarm
+    from .DishwasherMode import DishwasherMode
+    from .DoorLock import DoorLock
+    from .DraftElectricalMeasurementCluster import DraftElectricalMeasurementCluster
+    from .EcosystemInformation import EcosystemInformation
+    from .ElectricalEnergyMeasurement import ElectricalEnergyMeasurement
+    from .ElectricalGridConditions import ElectricalGridConditions
+    from .ElectricalPowerMeasurement import ElectricalPowerMeasurement
+    from .EnergyEvse import EnergyEvse
+    from .EnergyEvseMode import EnergyEvseMode
+    from .EnergyPreference import EnergyPreference
+    from .EthernetNetworkDiagnostics import EthernetNetworkDiagnostics
+    from .EveCluster import EveCluster
+    from .FanControl import FanControl
+    from .FixedLabel import FixedLabel
+    from .FlowMeasurement import FlowMeasurement
+    from .FormaldehydeConcentrationMeasurement import FormaldehydeConcentrationMeasurement
+    from .GeneralCommissioning import GeneralCommissioning
+    from .GeneralDiagnostics import GeneralDiagnostics
+    from .GroupKeyManagement import GroupKeyManagement
+    from .Groupcast import Groupcast
+    from .Groups import Groups
+    from .HeimanCluster import HeimanCluster
+    from .HepaFilterMonitoring import HepaFilterMonitoring
+    from .IcdManagement import IcdManagement
+    from .Identify import Identify
+    from .IlluminanceMeasurement import IlluminanceMeasurement
+    from .InovelliCluster import InovelliCluster
+    from .JointFabricAdministrator import JointFabricAdministrator
+    from .JointFabricDatastore import JointFabricDatastore
+    from .KeypadInput import KeypadInput
+    from .LaundryDryerControls import LaundryDryerControls
+    from .LaundryWasherControls import LaundryWasherControls
+    from .LaundryWasherMode import LaundryWasherMode
+    from .LevelControl import LevelControl
+    from .LocalizationConfiguration import LocalizationConfiguration
+    from .LowPower import LowPower
+    from .MediaInput import MediaInput
+    from .MediaPlayback import MediaPlayback
+    from .Messages import Messages
+    from .MeterIdentification import MeterIdentification
+    from .MicrowaveOvenControl import MicrowaveOvenControl
+    from .MicrowaveOvenMode import MicrowaveOvenMode
+    from .ModeSelect import ModeSelect
+    from .NeoCluster import NeoCluster
+    from .NetworkCommissioning import NetworkCommissioning
+    from .NitrogenDioxideConcentrationMeasurement import NitrogenDioxideConcentrationMeasurement
+    from .OccupancySensing import OccupancySensing
+    from .OnOff import OnOff
+    from .OperationalCredentials import OperationalCredentials
+    from .OperationalState import OperationalState
+    from .OtaSoftwareUpdateProvider import OtaSoftwareUpdateProvider
+    from .OtaSoftwareUpdateRequestor import OtaSoftwareUpdateRequestor
+    from .OvenCavityOperationalState import OvenCavityOperationalState
+    from .OvenMode import OvenMode
+    from .OzoneConcentrationMeasurement import OzoneConcentrationMeasurement
+    from .Pm10ConcentrationMeasurement import Pm10ConcentrationMeasurement
+    from .Pm1ConcentrationMeasurement import Pm1ConcentrationMeasurement
+    from .Pm25ConcentrationMeasurement import Pm25ConcentrationMeasurement
+    from .PowerSource import PowerSource
+    from .PowerSourceConfiguration import PowerSourceConfiguration
+    from .PowerTopology import PowerTopology
+    from .PressureMeasurement import PressureMeasurement
+    from .PumpConfigurationAndControl import PumpConfigurationAndControl
+    from .PushAvStreamTransport import PushAvStreamTransport
+    from .RadonConcentrationMeasurement import RadonConcentrationMeasurement
+    from .RefrigeratorAlarm import RefrigeratorAlarm
+    from .RefrigeratorAndTemperatureControlledCabinetMode import RefrigeratorAndTemperatureControlledCabinetMode
+    from .RelativeHumidityMeasurement import RelativeHumidityMeasurement
+    from .RvcCleanMode import RvcCleanMode
+    from .RvcOperationalState import RvcOperationalState
+    from .RvcRunMode import RvcRunMode
+    from .ScenesManagement import ScenesManagement
+    from .ServiceArea import ServiceArea
+    from .SmokeCoAlarm import SmokeCoAlarm
+    from .SoftwareDiagnostics import SoftwareDiagnostics
+    from .SoilMeasurement import SoilMeasurement
+    from .Switch import Switch
+    from .TargetNavigator import TargetNavigator
+    from .TclDehumidifierCluster import TclDehumidifierCluster
+    from .TemperatureAlarm import TemperatureAlarm
+    from .TemperatureControl import TemperatureControl
+    from .TemperatureMeasurement import TemperatureMeasurement
+    from .Thermostat import Thermostat
+    from .ThermostatUserInterfaceConfiguration import ThermostatUserInterfaceConfiguration
+    from .ThirdRealityMeteringCluster import ThirdRealityMeteringCluster
+    from .ThreadBorderRouterManagement import ThreadBorderRouterManagement
+    from .ThreadNetworkDiagnostics import ThreadNetworkDiagnostics
+    from .ThreadNetworkDirectory import ThreadNetworkDirectory
+    from .TimeFormatLocalization import TimeFormatLocalization
+    from .TimeSynchronization import TimeSynchronization
+    from .TlsCertificateManagement import TlsCertificateManagement
+    from .TlsClientManagement import TlsClientManagement
+    from .TotalVolatileOrganicCompoundsConcentrationMeasurement import TotalVolatileOrganicCompoundsConcentrationMeasurement
+    from .UnitLocalization import UnitLocalization
+    from .UserLabel import UserLabel
+    from .ValveConfigurationAndControl import ValveConfigurationAndControl
+    from .WagoCluster import WagoCluster
+    from .WakeOnLan import WakeOnLan
+    from .WaterHeaterManagement import WaterHeaterManagement
+    from .WaterHeaterMode import WaterHeaterMode
+    from .WaterTankLevelMonitoring import WaterTankLevelMonitoring
+    from .WebRtcTransportDefinitions import WebRtcTransportDefinitions
+    from .WebRtcTransportProvider import WebRtcTransportProvider
+    from .WebRtcTransportRequestor import WebRtcTransportRequestor
+    from .WiFiNetworkDiagnostics import WiFiNetworkDiagnostics
+    from .WiFiNetworkManagement import WiFiNetworkManagement
+    from .WindowCovering import WindowCovering
+    from .ZoneManagement import ZoneManagement
+
+# cluster id -> name of the module (and class) defining the cluster
+CLUSTER_MODULES: typing.Dict[int, str] = {
+    0x00000003: "Identify",
+    0x00000004: "Groups",
+    0x00000006: "OnOff",
+    0x00000008: "LevelControl",
+    0x0000001D: "Descriptor",
+    0x0000001E: "Binding",
+    0x0000001F: "AccessControl",
+    0x00000025: "Actions",
+    0x00000028: "BasicInformation",
+    0x00000029: "OtaSoftwareUpdateProvider",
+    0x0000002A: "OtaSoftwareUpdateRequestor",
+    0x0000002B: "LocalizationConfiguration",
+    0x0000002C: "TimeFormatLocalization",
+    0x0000002D: "UnitLocalization",
+    0x0000002E: "PowerSourceConfiguration",
+    0x0000002F: "PowerSource",
+    0x00000030: "GeneralCommissioning",
+    0x00000031: "NetworkCommissioning",
+    0x00000032: "DiagnosticLogs",
+    0x00000033: "GeneralDiagnostics",
+    0x00000034: "SoftwareDiagnostics",
+    0x00000035: "ThreadNetworkDiagnostics",
+    0x00000036: "WiFiNetworkDiagnostics",
+    0x00000037: "EthernetNetworkDiagnostics",
+    0x00000038: "TimeSynchronization",
+    0x00000039: "BridgedDeviceBasicInformation",
+    0x0000003B: "Switch",
+    0x0000003C: "AdministratorCommissioning",
+    0x0000003E: "OperationalCredentials",
+    0x0000003F: "GroupKeyManagement",
+    0x00000040: "FixedLabel",
+    0x00000041: "UserLabel",
+    0x00000045: "BooleanState",
+    0x00000046: "IcdManagement",
+    0x00000048: "OvenCavityOperationalState",
+    0x00000049: "OvenMode",
+    0x0000004A: "LaundryDryerControls",
+    0x00000050: "ModeSelect",
+    0x00000051: "LaundryWasherMode",
+    0x00000052: "RefrigeratorAndTemperatureControlledCabinetMode",
+    0x00000053: "LaundryWasherControls",
+    0x00000054: "RvcRunMode",
+    0x00000055: "RvcCleanMode",
+    0x00000056: "TemperatureControl",
+    0x00000057: "RefrigeratorAlarm",
+    0x00000059: "DishwasherMode",
+    0x0000005B: "AirQuality",
+    0x0000005C: "SmokeCoAlarm",
+    0x0000005D: "DishwasherAlarm",
+    0x0000005E: "MicrowaveOvenMode",
+    0x0000005F: "MicrowaveOvenControl",
+    0x00000060: "OperationalState",
+    0x00000061: "RvcOperationalState",
+    0x00000062: "ScenesManagement",
+    0x00000064: "TemperatureAlarm",
+    0x00000065: "Groupcast",
+    0x00000071: "HepaFilterMonitoring",
+    0x00000072: "ActivatedCarbonFilterMonitoring",
+    0x00000079: "WaterTankLevelMonitoring",
+    0x00000080: "BooleanStateConfiguration",
+    0x00000081: "ValveConfigurationAndControl",
+    0x00000090: "ElectricalPowerMeasurement",
+    0x00000091: "ElectricalEnergyMeasurement",
+    0x00000094: "WaterHeaterManagement",
+    0x00000095: "CommodityPrice",
+    0x00000097: "Messages",
+    0x00000098: "DeviceEnergyManagement",
+    0x00000099: "EnergyEvse",
+    0x0000009B: "EnergyPreference",
+    0x0000009C: "PowerTopology",
+    0x0000009D: "EnergyEvseMode",
+    0x0000009E: "WaterHeaterMode",
+    0x0000009F: "DeviceEnergyManagementMode",
+    0x000000A0: "ElectricalGridConditions",
+    0x00000101: "DoorLock",
+    0x00000102: "WindowCovering",
+    0x00000104: "ClosureControl",
+    0x00000105: "ClosureDimension",
+    0x00000150: "ServiceArea",
+    0x00000200: "PumpConfigurationAndControl",
+    0x00000201: "Thermostat",
+    0x00000202: "FanControl",
+    0x00000204: "ThermostatUserInterfaceConfiguration",
+    0x00000300: "ColorControl",
+    0x00000400: "IlluminanceMeasurement",
+    0x00000402: "TemperatureMeasurement",
+    0x00000403: "PressureMeasurement",
+    0x00000404: "FlowMeasurement",
+    0x00000405: "RelativeHumidityMeasurement",
+    0x00000406: "OccupancySensing",
+    0x0000040C: "CarbonMonoxideConcentrationMeasurement",
+    0x0000040D: "CarbonDioxideConcentrationMeasurement",
+    0x00000413: "NitrogenDioxideConcentrationMeasurement",
+    0x00000415: "OzoneConcentrationMeasurement",
+    0x0000042A: "Pm25ConcentrationMeasurement",
+    0x0000042B: "FormaldehydeConcentrationMeasurement",
+    0x0000042C: "Pm1ConcentrationMeasurement",
+    0x0000042D: "Pm10ConcentrationMeasurement",
+    0x0000042E: "TotalVolatileOrganicCompoundsConcentrationMeasurement",
+    0x0000042F: "RadonConcentrationMeasurement",
+    0x00000430: "SoilMeasurement",
+    0x00000431: "AmbientContextSensing",
+    0x00000451: "WiFiNetworkManagement",
+    0x00000452: "ThreadBorderRouterManagement",
+    0x00000453: "ThreadNetworkDirectory",
+    0x00000503: "WakeOnLan",
+    0x00000504: "Channel",
+    0x00000505: "TargetNavigator",
+    0x00000506: "MediaPlayback",
+    0x00000507: "MediaInput",
+    0x00000508: "LowPower",
+    0x00000509: "KeypadInput",
+    0x0000050A: "ContentLauncher",
+    0x0000050B: "AudioOutput",
+    0x0000050C: "ApplicationLauncher",
+    0x0000050D: "ApplicationBasic",
+    0x0000050E: "AccountLogin",
+    0x0000050F: "ContentControl",
+    0x00000510: "ContentAppObserver",
+    0x00000550: "ZoneManagement",
+    0x00000551: "CameraAvStreamManagement",
+    0x00000552: "CameraAvSettingsUserLevelManagement",
+    0x00000553: "WebRtcTransportProvider",
+    0x00000554: "WebRtcTransportRequestor",
+    0x00000555: "PushAvStreamTransport",
+    0x00000556: "Chime",
+    0x00000700: "CommodityTariff",
+    0x00000750: "EcosystemInformation",
+    0x00000751: "CommissionerControl",
+    0x00000752: "JointFabricDatastore",
+    0x00000753: "JointFabricAdministrator",
+    0x00000801: "TlsCertificateManagement",
+    0x00000802: "TlsClientManagement",
+    0x00000B04: "DraftElectricalMeasurementCluster",
+    0x00000B06: "MeterIdentification",
+    0x00000B07: "CommodityMetering",
+    0x120BFC01: "HeimanCluster",
+    0x122FFC31: "InovelliCluster",
+    0x125DFC11: "NeoCluster",
+    0x130AFC01: "EveCluster",
+    0x130DFC02: "ThirdRealityMeteringCluster",
+    0x1334FC03: "TclDehumidifierCluster",
+    0x1534FC00: "WagoCluster",
+}
 
 __all__ = [
     "Globals",
@@ -294,3 +451,32 @@ __all__ = [
     "ZoneManagement",
 ]
 
+
+class _LazyClusterDefs(types.ModuleType):
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        # importing a cluster module binds the module on this package, bind its cluster class instead
+        if name in __all__ and isinstance(value, types.ModuleType) and value.__name__ == f"{self.__name__}.{name}":
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def import_all() -> None:
+    """Import all cluster modules at once (eager loading)."""
+    for name in __all__:
+        if name not in globals():
+            __getattr__(name)
+
+
+sys.modules[__name__].__class__ = _LazyClusterDefs
@@ -0,0 +1,4759 @@
+"""
+Static index of the generated cluster definitions (auto-generated, DO NOT edit).
+
+Generated by scripts/generate_cluster_index.py, use chip.clusters.ClusterIndex to query it.
+"""
+
+# cluster id -> (name, attributes, events, accepted commands, generated commands)
+#   attributes: attribute id -> (name, label, type, flags)
+#   events/commands: id -> (name, {tag: (label, type, flags)})
+
+CLUSTERS = {
+    0x00000003: (
+        'Identify',
+        {
+            0x00000000: ('IdentifyTime', 'identifyTime', 'uint', 0),
+            0x00000001: ('IdentifyType', 'identifyType', 'Identify.Enums.IdentifyTypeEnum', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('Identify', {0x0: ('identifyTime', 'uint', 0)}),
+            0x00000040: ('TriggerEffect', {0x0: ('effectIdentifier', 'Identify.Enums.EffectIdentifierEnum', 0), 0x1: ('effectVariant', 'Identify.Enums.EffectVariantEnum', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000004: (
+        'Groups',
+        {
+            0x00000000: ('NameSupport', 'nameSupport', 'Groups.Bitmaps.NameSupportBitmap', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('AddGroup', {0x0: ('groupID', 'uint', 0), 0x1: ('groupName', 'str', 0)}),
+            0x00000001: ('ViewGroup', {0x0: ('groupID', 'uint', 0)}),
+            0x00000002: ('GetGroupMembership', {0x0: ('groupList', 'uint', 1)}),
+            0x00000003: ('RemoveGroup', {0x0: ('groupID', 'uint', 0)}),
+            0x00000004: ('RemoveAllGroups', {}),
+            0x00000005: ('AddGroupIfIdentifying', {0x0: ('groupID', 'uint', 0), 0x1: ('groupName', 'str', 0)}),
+        },
+        {
+            0x00000000: ('AddGroupResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('groupID', 'uint', 0)}),
+            0x00000001: ('ViewGroupResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('groupID', 'uint', 0), 0x2: ('groupName', 'str', 0)}),
+            0x00000002: ('GetGroupMembershipResponse', {0x0: ('capacity', 'uint', 2), 0x1: ('groupList', 'uint', 1)}),
+            0x00000003: ('RemoveGroupResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('groupID', 'uint', 0)}),
+        },
+    ),
+    0x00000006: (
+        'OnOff',
+        {
+            0x00000000: ('OnOff', 'onOff', 'bool', 0),
+            0x00004000: ('GlobalSceneControl', 'globalSceneControl', 'bool', 4),
+            0x00004001: ('OnTime', 'onTime', 'uint', 4),
+            0x00004002: ('OffWaitTime', 'offWaitTime', 'uint', 4),
+            0x00004003: ('StartUpOnOff', 'startUpOnOff', 'OnOff.Enums.StartUpOnOffEnum', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('Off', {}),
+            0x00000001: ('On', {}),
+            0x00000002: ('Toggle', {}),
+            0x00000040: ('OffWithEffect', {0x0: ('effectIdentifier', 'OnOff.Enums.EffectIdentifierEnum', 0), 0x1: ('effectVariant', 'Globals.Enums.enum8', 0)}),
+            0x00000041: ('OnWithRecallGlobalScene', {}),
+            0x00000042: ('OnWithTimedOff', {0x0: ('onOffControl', 'OnOff.Bitmaps.OnOffControlBitmap', 0), 0x1: ('onTime', 'uint', 0), 0x2: ('offWaitTime', 'uint', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000008: (
+        'LevelControl',
+        {
+            0x00000000: ('CurrentLevel', 'currentLevel', 'uint', 2),
+            0x00000001: ('RemainingTime', 'remainingTime', 'uint', 4),
+            0x00000002: ('MinLevel', 'minLevel', 'uint', 4),
+            0x00000003: ('MaxLevel', 'maxLevel', 'uint', 4),
+            0x00000004: ('CurrentFrequency', 'currentFrequency', 'uint', 4),
+            0x00000005: ('MinFrequency', 'minFrequency', 'uint', 4),
+            0x00000006: ('MaxFrequency', 'maxFrequency', 'uint', 4),
+            0x0000000F: ('Options', 'options', 'LevelControl.Bitmaps.OptionsBitmap', 0),
+            0x00000010: ('OnOffTransitionTime', 'onOffTransitionTime', 'uint', 4),
+            0x00000011: ('OnLevel', 'onLevel', 'uint', 2),
+            0x00000012: ('OnTransitionTime', 'onTransitionTime', 'uint', 6),
+            0x00000013: ('OffTransitionTime', 'offTransitionTime', 'uint', 6),
+            0x00000014: ('DefaultMoveRate', 'defaultMoveRate', 'uint', 6),
+            0x00004000: ('StartUpCurrentLevel', 'startUpCurrentLevel', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('MoveToLevel', {0x0: ('level', 'uint', 0), 0x1: ('transitionTime', 'uint', 2), 0x2: ('optionsMask', 'LevelControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'LevelControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000001: ('Move', {0x0: ('moveMode', 'LevelControl.Enums.MoveModeEnum', 0), 0x1: ('rate', 'uint', 2), 0x2: ('optionsMask', 'LevelControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'LevelControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000002: ('Step', {0x0: ('stepMode', 'LevelControl.Enums.StepModeEnum', 0), 0x1: ('stepSize', 'uint', 0), 0x2: ('transitionTime', 'uint', 2), 0x3: ('optionsMask', 'LevelControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'LevelControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000003: ('Stop', {0x0: ('optionsMask', 'LevelControl.Bitmaps.OptionsBitmap', 0), 0x1: ('optionsOverride', 'LevelControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000004: ('MoveToLevelWithOnOff', {0x0: ('level', 'uint', 0), 0x1: ('transitionTime', 'uint', 2), 0x2: ('optionsMask', 'LevelControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'LevelControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000005: ('MoveWithOnOff', {0x0: ('moveMode', 'LevelControl.Enums.MoveModeEnum', 0), 0x1: ('rate', 'uint', 2), 0x2: ('optionsMask', 'LevelControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'LevelControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000006: ('StepWithOnOff', {0x0: ('stepMode', 'LevelControl.Enums.StepModeEnum', 0), 0x1: ('stepSize', 'uint', 0), 0x2: ('transitionTime', 'uint', 2), 0x3: ('optionsMask', 'LevelControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'LevelControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000007: ('StopWithOnOff', {0x0: ('optionsMask', 'LevelControl.Bitmaps.OptionsBitmap', 0), 0x1: ('optionsOverride', 'LevelControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000008: ('MoveToClosestFrequency', {0x0: ('frequency', 'uint', 0)}),
+        },
+        {
+        },
+    ),
+    0x0000001D: (
+        'Descriptor',
+        {
+            0x00000000: ('DeviceTypeList', 'deviceTypeList', 'Descriptor.Structs.DeviceTypeStruct', 1),
+            0x00000001: ('ServerList', 'serverList', 'uint', 1),
+            0x00000002: ('ClientList', 'clientList', 'uint', 1),
+            0x00000003: ('PartsList', 'partsList', 'uint', 1),
+            0x00000004: ('TagList', 'tagList', 'Globals.Structs.semtag', 5),
+            0x00000005: ('EndpointUniqueID', 'endpointUniqueID', 'str', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000001E: (
+        'Binding',
+        {
+            0x00000000: ('Binding', 'binding', 'Binding.Structs.TargetStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000001F: (
+        'AccessControl',
+        {
+            0x00000000: ('Acl', 'acl', 'AccessControl.Structs.AccessControlEntryStruct', 1),
+            0x00000001: ('Extension', 'extension', 'AccessControl.Structs.AccessControlExtensionStruct', 5),
+            0x00000002: ('SubjectsPerAccessControlEntry', 'subjectsPerAccessControlEntry', 'uint', 0),
+            0x00000003: ('TargetsPerAccessControlEntry', 'targetsPerAccessControlEntry', 'uint', 0),
+            0x00000004: ('AccessControlEntriesPerFabric', 'accessControlEntriesPerFabric', 'uint', 0),
+            0x00000005: ('CommissioningARL', 'commissioningARL', 'AccessControl.Structs.CommissioningAccessRestrictionEntryStruct', 5),
+            0x00000006: ('Arl', 'arl', 'AccessControl.Structs.AccessRestrictionEntryStruct', 5),
+            0x00000007: ('AuxiliaryAcl', 'auxiliaryAcl', 'AccessControl.Structs.AccessControlEntryStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('AccessControlEntryChanged', {0x1: ('adminNodeID', 'uint', 2), 0x2: ('adminPasscodeID', 'uint', 2), 0x3: ('changeType', 'AccessControl.Enums.ChangeTypeEnum', 0), 0x4: ('latestValue', 'AccessControl.Structs.AccessControlEntryStruct', 2), 0xFE: ('fabricIndex', 'uint', 0)}),
+            0x00000001: ('AccessControlExtensionChanged', {0x1: ('adminNodeID', 'uint', 2), 0x2: ('adminPasscodeID', 'uint', 2), 0x3: ('changeType', 'AccessControl.Enums.ChangeTypeEnum', 0), 0x4: ('latestValue', 'AccessControl.Structs.AccessControlExtensionStruct', 2), 0xFE: ('fabricIndex', 'uint', 0)}),
+            0x00000002: ('FabricRestrictionReviewUpdate', {0x0: ('token', 'uint', 0), 0x1: ('instruction', 'str', 4), 0x2: ('ARLRequestFlowUrl', 'str', 4), 0xFE: ('fabricIndex', 'uint', 0)}),
+            0x00000003: ('AuxiliaryAccessUpdated', {0x0: ('adminNodeID', 'uint', 2), 0xFE: ('fabricIndex', 'uint', 0)}),
+        },
+        {
+            0x00000000: ('ReviewFabricRestrictions', {0x0: ('arl', 'AccessControl.Structs.CommissioningAccessRestrictionEntryStruct', 1)}),
+        },
+        {
+            0x00000001: ('ReviewFabricRestrictionsResponse', {0x0: ('token', 'uint', 0)}),
+        },
+    ),
+    0x00000025: (
+        'Actions',
+        {
+            0x00000000: ('ActionList', 'actionList', 'Actions.Structs.ActionStruct', 1),
+            0x00000001: ('EndpointLists', 'endpointLists', 'Actions.Structs.EndpointListStruct', 1),
+            0x00000002: ('SetupURL', 'setupURL', 'str', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('StateChanged', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 0), 0x2: ('newState', 'Actions.Enums.ActionStateEnum', 0)}),
+            0x00000001: ('ActionFailed', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 0), 0x2: ('newState', 'Actions.Enums.ActionStateEnum', 0), 0x3: ('error', 'Actions.Enums.ActionErrorEnum', 0)}),
+        },
+        {
+            0x00000000: ('InstantAction', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4)}),
+            0x00000001: ('InstantActionWithTransition', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4), 0x2: ('transitionTime', 'uint', 0)}),
+            0x00000002: ('StartAction', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4)}),
+            0x00000003: ('StartActionWithDuration', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4), 0x2: ('duration', 'uint', 0)}),
+            0x00000004: ('StopAction', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4)}),
+            0x00000005: ('PauseAction', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4)}),
+            0x00000006: ('PauseActionWithDuration', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4), 0x2: ('duration', 'uint', 0)}),
+            0x00000007: ('ResumeAction', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4)}),
+            0x00000008: ('EnableAction', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4)}),
+            0x00000009: ('EnableActionWithDuration', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4), 0x2: ('duration', 'uint', 0)}),
+            0x0000000A: ('DisableAction', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4)}),
+            0x0000000B: ('DisableActionWithDuration', {0x0: ('actionID', 'uint', 0), 0x1: ('invokeID', 'uint', 4), 0x2: ('duration', 'uint', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000028: (
+        'BasicInformation',
+        {
+            0x00000000: ('DataModelRevision', 'dataModelRevision', 'uint', 0),
+            0x00000001: ('VendorName', 'vendorName', 'str', 0),
+            0x00000002: ('VendorID', 'vendorID', 'uint', 0),
+            0x00000003: ('ProductName', 'productName', 'str', 0),
+            0x00000004: ('ProductID', 'productID', 'uint', 0),
+            0x00000005: ('NodeLabel', 'nodeLabel', 'str', 0),
+            0x00000006: ('Location', 'location', 'str', 0),
+            0x00000007: ('HardwareVersion', 'hardwareVersion', 'uint', 0),
+            0x00000008: ('HardwareVersionString', 'hardwareVersionString', 'str', 0),
+            0x00000009: ('SoftwareVersion', 'softwareVersion', 'uint', 0),
+            0x0000000A: ('SoftwareVersionString', 'softwareVersionString', 'str', 0),
+            0x0000000B: ('ManufacturingDate', 'manufacturingDate', 'str', 4),
+            0x0000000C: ('PartNumber', 'partNumber', 'str', 4),
+            0x0000000D: ('ProductURL', 'productURL', 'str', 4),
+            0x0000000E: ('ProductLabel', 'productLabel', 'str', 4),
+            0x0000000F: ('SerialNumber', 'serialNumber', 'str', 4),
+            0x00000010: ('LocalConfigDisabled', 'localConfigDisabled', 'bool', 4),
+            0x00000011: ('Reachable', 'reachable', 'bool', 4),
+            0x00000012: ('UniqueID', 'uniqueID', 'str', 4),
+            0x00000013: ('CapabilityMinima', 'capabilityMinima', 'BasicInformation.Structs.CapabilityMinimaStruct', 0),
+            0x00000014: ('ProductAppearance', 'productAppearance', 'BasicInformation.Structs.ProductAppearanceStruct', 4),
+            0x00000015: ('SpecificationVersion', 'specificationVersion', 'uint', 4),
+            0x00000016: ('MaxPathsPerInvoke', 'maxPathsPerInvoke', 'uint', 4),
+            0x00000018: ('ConfigurationVersion', 'configurationVersion', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('StartUp', {0x0: ('softwareVersion', 'uint', 0)}),
+            0x00000001: ('ShutDown', {}),
+            0x00000002: ('Leave', {0x0: ('fabricIndex', 'uint', 0)}),
+            0x00000003: ('ReachableChanged', {0x0: ('reachableNewValue', 'bool', 0)}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000029: (
+        'OtaSoftwareUpdateProvider',
+        {
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('QueryImage', {0x0: ('vendorID', 'uint', 0), 0x1: ('productID', 'uint', 0), 0x2: ('softwareVersion', 'uint', 0), 0x3: ('protocolsSupported', 'OtaSoftwareUpdateProvider.Enums.DownloadProtocolEnum', 1), 0x4: ('hardwareVersion', 'uint', 4), 0x5: ('location', 'str', 4), 0x6: ('requestorCanConsent', 'bool', 4), 0x7: ('metadataForProvider', 'bytes', 4)}),
+            0x00000002: ('ApplyUpdateRequest', {0x0: ('updateToken', 'bytes', 0), 0x1: ('newVersion', 'uint', 0)}),
+            0x00000004: ('NotifyUpdateApplied', {0x0: ('updateToken', 'bytes', 0), 0x1: ('softwareVersion', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('QueryImageResponse', {0x0: ('status', 'OtaSoftwareUpdateProvider.Enums.StatusEnum', 0), 0x1: ('delayedActionTime', 'uint', 4), 0x2: ('imageURI', 'str', 4), 0x3: ('softwareVersion', 'uint', 4), 0x4: ('softwareVersionString', 'str', 4), 0x5: ('updateToken', 'bytes', 4), 0x6: ('userConsentNeeded', 'bool', 4), 0x7: ('metadataForRequestor', 'bytes', 4)}),
+            0x00000003: ('ApplyUpdateResponse', {0x0: ('action', 'OtaSoftwareUpdateProvider.Enums.ApplyUpdateActionEnum', 0), 0x1: ('delayedActionTime', 'uint', 0)}),
+        },
+    ),
+    0x0000002A: (
+        'OtaSoftwareUpdateRequestor',
+        {
+            0x00000000: ('DefaultOTAProviders', 'defaultOTAProviders', 'OtaSoftwareUpdateRequestor.Structs.ProviderLocation', 1),
+            0x00000001: ('UpdatePossible', 'updatePossible', 'bool', 0),
+            0x00000002: ('UpdateState', 'updateState', 'OtaSoftwareUpdateRequestor.Enums.UpdateStateEnum', 0),
+            0x00000003: ('UpdateStateProgress', 'updateStateProgress', 'uint', 2),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('StateTransition', {0x0: ('previousState', 'OtaSoftwareUpdateRequestor.Enums.UpdateStateEnum', 0), 0x1: ('newState', 'OtaSoftwareUpdateRequestor.Enums.UpdateStateEnum', 0), 0x2: ('reason', 'OtaSoftwareUpdateRequestor.Enums.ChangeReasonEnum', 0), 0x3: ('targetSoftwareVersion', 'uint', 2)}),
+            0x00000001: ('VersionApplied', {0x0: ('softwareVersion', 'uint', 0), 0x1: ('productID', 'uint', 0)}),
+            0x00000002: ('DownloadError', {0x0: ('softwareVersion', 'uint', 0), 0x1: ('bytesDownloaded', 'uint', 0), 0x2: ('progressPercent', 'uint', 2), 0x3: ('platformCode', 'int', 2)}),
+        },
+        {
+            0x00000000: ('AnnounceOTAProvider', {0x0: ('providerNodeID', 'uint', 0), 0x1: ('vendorID', 'uint', 0), 0x2: ('announcementReason', 'OtaSoftwareUpdateRequestor.Enums.AnnouncementReasonEnum', 0), 0x3: ('metadataForNode', 'bytes', 4), 0x4: ('endpoint', 'uint', 0)}),
+        },
+        {
+        },
+    ),
+    0x0000002B: (
+        'LocalizationConfiguration',
+        {
+            0x00000000: ('ActiveLocale', 'activeLocale', 'str', 0),
+            0x00000001: ('SupportedLocales', 'supportedLocales', 'str', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000002C: (
+        'TimeFormatLocalization',
+        {
+            0x00000000: ('HourFormat', 'hourFormat', 'TimeFormatLocalization.Enums.HourFormatEnum', 0),
+            0x00000001: ('ActiveCalendarType', 'activeCalendarType', 'TimeFormatLocalization.Enums.CalendarTypeEnum', 4),
+            0x00000002: ('SupportedCalendarTypes', 'supportedCalendarTypes', 'TimeFormatLocalization.Enums.CalendarTypeEnum', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000002D: (
+        'UnitLocalization',
+        {
+            0x00000000: ('TemperatureUnit', 'temperatureUnit', 'UnitLocalization.Enums.TempUnitEnum', 4),
+            0x00000001: ('SupportedTemperatureUnits', 'supportedTemperatureUnits', 'UnitLocalization.Enums.TempUnitEnum', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000002E: (
+        'PowerSourceConfiguration',
+        {
+            0x00000000: ('Sources', 'sources', 'uint', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000002F: (
+        'PowerSource',
+        {
+            0x00000000: ('Status', 'status', 'PowerSource.Enums.PowerSourceStatusEnum', 0),
+            0x00000001: ('Order', 'order', 'uint', 0),
+            0x00000002: ('Description', 'description', 'str', 0),
+            0x00000003: ('WiredAssessedInputVoltage', 'wiredAssessedInputVoltage', 'uint', 6),
+            0x00000004: ('WiredAssessedInputFrequency', 'wiredAssessedInputFrequency', 'uint', 6),
+            0x00000005: ('WiredCurrentType', 'wiredCurrentType', 'PowerSource.Enums.WiredCurrentTypeEnum', 4),
+            0x00000006: ('WiredAssessedCurrent', 'wiredAssessedCurrent', 'uint', 6),
+            0x00000007: ('WiredNominalVoltage', 'wiredNominalVoltage', 'uint', 4),
+            0x00000008: ('WiredMaximumCurrent', 'wiredMaximumCurrent', 'uint', 4),
+            0x00000009: ('WiredPresent', 'wiredPresent', 'bool', 4),
+            0x0000000A: ('ActiveWiredFaults', 'activeWiredFaults', 'PowerSource.Enums.WiredFaultEnum', 5),
+            0x0000000B: ('BatVoltage', 'batVoltage', 'uint', 6),
+            0x0000000C: ('BatPercentRemaining', 'batPercentRemaining', 'uint', 6),
+            0x0000000D: ('BatTimeRemaining', 'batTimeRemaining', 'uint', 6),
+            0x0000000E: ('BatChargeLevel', 'batChargeLevel', 'PowerSource.Enums.BatChargeLevelEnum', 4),
+            0x0000000F: ('BatReplacementNeeded', 'batReplacementNeeded', 'bool', 4),
+            0x00000010: ('BatReplaceability', 'batReplaceability', 'PowerSource.Enums.BatReplaceabilityEnum', 4),
+            0x00000011: ('BatPresent', 'batPresent', 'bool', 4),
+            0x00000012: ('ActiveBatFaults', 'activeBatFaults', 'PowerSource.Enums.BatFaultEnum', 5),
+            0x00000013: ('BatReplacementDescription', 'batReplacementDescription', 'str', 4),
+            0x00000014: ('BatCommonDesignation', 'batCommonDesignation', 'PowerSource.Enums.BatCommonDesignationEnum', 4),
+            0x00000015: ('BatANSIDesignation', 'batANSIDesignation', 'str', 4),
+            0x00000016: ('BatIECDesignation', 'batIECDesignation', 'str', 4),
+            0x00000017: ('BatApprovedChemistry', 'batApprovedChemistry', 'PowerSource.Enums.BatApprovedChemistryEnum', 4),
+            0x00000018: ('BatCapacity', 'batCapacity', 'uint', 4),
+            0x00000019: ('BatQuantity', 'batQuantity', 'uint', 4),
+            0x0000001A: ('BatChargeState', 'batChargeState', 'PowerSource.Enums.BatChargeStateEnum', 4),
+            0x0000001B: ('BatTimeToFullCharge', 'batTimeToFullCharge', 'uint', 6),
+            0x0000001C: ('BatFunctionalWhileCharging', 'batFunctionalWhileCharging', 'bool', 4),
+            0x0000001D: ('BatChargingCurrent', 'batChargingCurrent', 'uint', 6),
+            0x0000001E: ('ActiveBatChargeFaults', 'activeBatChargeFaults', 'PowerSource.Enums.BatChargeFaultEnum', 5),
+            0x0000001F: ('EndpointList', 'endpointList', 'uint', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('WiredFaultChange', {0x0: ('current', 'PowerSource.Enums.WiredFaultEnum', 1), 0x1: ('previous', 'PowerSource.Enums.WiredFaultEnum', 1)}),
+            0x00000001: ('BatFaultChange', {0x0: ('current', 'PowerSource.Enums.BatFaultEnum', 1), 0x1: ('previous', 'PowerSource.Enums.BatFaultEnum', 1)}),
+            0x00000002: ('BatChargeFaultChange', {0x0: ('current', 'PowerSource.Enums.BatChargeFaultEnum', 1), 0x1: ('previous', 'PowerSource.Enums.BatChargeFaultEnum', 1)}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000030: (
+        'GeneralCommissioning',
+        {
+            0x00000000: ('Breadcrumb', 'breadcrumb', 'uint', 0),
+            0x00000001: ('BasicCommissioningInfo', 'basicCommissioningInfo', 'GeneralCommissioning.Structs.BasicCommissioningInfo', 0),
+            0x00000002: ('RegulatoryConfig', 'regulatoryConfig', 'GeneralCommissioning.Enums.RegulatoryLocationTypeEnum', 0),
+            0x00000003: ('LocationCapability', 'locationCapability', 'GeneralCommissioning.Enums.RegulatoryLocationTypeEnum', 0),
+            0x00000004: ('SupportsConcurrentConnection', 'supportsConcurrentConnection', 'bool', 0),
+            0x00000005: ('TCAcceptedVersion', 'TCAcceptedVersion', 'uint', 4),
+            0x00000006: ('TCMinRequiredVersion', 'TCMinRequiredVersion', 'uint', 4),
+            0x00000007: ('TCAcknowledgements', 'TCAcknowledgements', 'Globals.Bitmaps.map16', 4),
+            0x00000008: ('TCAcknowledgementsRequired', 'TCAcknowledgementsRequired', 'bool', 4),
+            0x00000009: ('TCUpdateDeadline', 'TCUpdateDeadline', 'uint', 6),
+            0x0000000A: ('RecoveryIdentifier', 'recoveryIdentifier', 'bytes', 4),
+            0x0000000B: ('NetworkRecoveryReason', 'networkRecoveryReason', 'GeneralCommissioning.Enums.NetworkRecoveryReasonEnum', 6),
+            0x0000000C: ('IsCommissioningWithoutPower', 'isCommissioningWithoutPower', 'bool', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ArmFailSafe', {0x0: ('expiryLengthSeconds', 'uint', 0), 0x1: ('breadcrumb', 'uint', 0)}),
+            0x00000002: ('SetRegulatoryConfig', {0x0: ('newRegulatoryConfig', 'GeneralCommissioning.Enums.RegulatoryLocationTypeEnum', 0), 0x1: ('countryCode', 'str', 0), 0x2: ('breadcrumb', 'uint', 0)}),
+            0x00000004: ('CommissioningComplete', {}),
+            0x00000006: ('SetTCAcknowledgements', {0x0: ('TCVersion', 'uint', 0), 0x1: ('TCUserResponse', 'Globals.Bitmaps.map16', 0)}),
+        },
+        {
+            0x00000001: ('ArmFailSafeResponse', {0x0: ('errorCode', 'GeneralCommissioning.Enums.CommissioningErrorEnum', 0), 0x1: ('debugText', 'str', 0)}),
+            0x00000003: ('SetRegulatoryConfigResponse', {0x0: ('errorCode', 'GeneralCommissioning.Enums.CommissioningErrorEnum', 0), 0x1: ('debugText', 'str', 0)}),
+            0x00000005: ('CommissioningCompleteResponse', {0x0: ('errorCode', 'GeneralCommissioning.Enums.CommissioningErrorEnum', 0), 0x1: ('debugText', 'str', 0)}),
+            0x00000007: ('SetTCAcknowledgementsResponse', {0x0: ('errorCode', 'GeneralCommissioning.Enums.CommissioningErrorEnum', 0)}),
+        },
+    ),
+    0x00000031: (
+        'NetworkCommissioning',
+        {
+            0x00000000: ('MaxNetworks', 'maxNetworks', 'uint', 0),
+            0x00000001: ('Networks', 'networks', 'NetworkCommissioning.Structs.NetworkInfoStruct', 1),
+            0x00000002: ('ScanMaxTimeSeconds', 'scanMaxTimeSeconds', 'uint', 4),
+            0x00000003: ('ConnectMaxTimeSeconds', 'connectMaxTimeSeconds', 'uint', 4),
+            0x00000004: ('InterfaceEnabled', 'interfaceEnabled', 'bool', 0),
+            0x00000005: ('LastNetworkingStatus', 'lastNetworkingStatus', 'NetworkCommissioning.Enums.NetworkCommissioningStatusEnum', 2),
+            0x00000006: ('LastNetworkID', 'lastNetworkID', 'bytes', 2),
+            0x00000007: ('LastConnectErrorValue', 'lastConnectErrorValue', 'int', 2),
+            0x00000008: ('SupportedWiFiBands', 'supportedWiFiBands', 'NetworkCommissioning.Enums.WiFiBandEnum', 5),
+            0x00000009: ('SupportedThreadFeatures', 'supportedThreadFeatures', 'NetworkCommissioning.Bitmaps.ThreadCapabilitiesBitmap', 4),
+            0x0000000A: ('ThreadVersion', 'threadVersion', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ScanNetworks', {0x0: ('ssid', 'bytes', 6), 0x1: ('breadcrumb', 'uint', 4)}),
+            0x00000002: ('AddOrUpdateWiFiNetwork', {0x0: ('ssid', 'bytes', 0), 0x1: ('credentials', 'bytes', 0), 0x2: ('breadcrumb', 'uint', 4)}),
+            0x00000003: ('AddOrUpdateThreadNetwork', {0x0: ('operationalDataset', 'bytes', 0), 0x1: ('breadcrumb', 'uint', 4)}),
+            0x00000004: ('RemoveNetwork', {0x0: ('networkID', 'bytes', 0), 0x1: ('breadcrumb', 'uint', 4)}),
+            0x00000006: ('ConnectNetwork', {0x0: ('networkID', 'bytes', 0), 0x1: ('breadcrumb', 'uint', 4)}),
+            0x00000008: ('ReorderNetwork', {0x0: ('networkID', 'bytes', 0), 0x1: ('networkIndex', 'uint', 0), 0x2: ('breadcrumb', 'uint', 4)}),
+        },
+        {
+            0x00000001: ('ScanNetworksResponse', {0x0: ('networkingStatus', 'NetworkCommissioning.Enums.NetworkCommissioningStatusEnum', 0), 0x1: ('debugText', 'str', 4), 0x2: ('wiFiScanResults', 'NetworkCommissioning.Structs.WiFiInterfaceScanResultStruct', 5), 0x3: ('threadScanResults', 'NetworkCommissioning.Structs.ThreadInterfaceScanResultStruct', 5)}),
+            0x00000005: ('NetworkConfigResponse', {0x0: ('networkingStatus', 'NetworkCommissioning.Enums.NetworkCommissioningStatusEnum', 0), 0x1: ('debugText', 'str', 4), 0x2: ('networkIndex', 'uint', 4)}),
+            0x00000007: ('ConnectNetworkResponse', {0x0: ('networkingStatus', 'NetworkCommissioning.Enums.NetworkCommissioningStatusEnum', 0), 0x1: ('debugText', 'str', 4), 0x2: ('errorValue', 'int', 2)}),
+        },
+    ),
+    0x00000032: (
+        'DiagnosticLogs',
+        {
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('RetrieveLogsRequest', {0x0: ('intent', 'DiagnosticLogs.Enums.IntentEnum', 0), 0x1: ('requestedProtocol', 'DiagnosticLogs.Enums.TransferProtocolEnum', 0), 0x2: ('transferFileDesignator', 'str', 4)}),
+        },
+        {
+            0x00000001: ('RetrieveLogsResponse', {0x0: ('status', 'DiagnosticLogs.Enums.StatusEnum', 0), 0x1: ('logContent', 'bytes', 0), 0x2: ('UTCTimeStamp', 'uint', 4), 0x3: ('timeSinceBoot', 'uint', 4)}),
+        },
+    ),
+    0x00000033: (
+        'GeneralDiagnostics',
+        {
+            0x00000000: ('NetworkInterfaces', 'networkInterfaces', 'GeneralDiagnostics.Structs.NetworkInterface', 1),
+            0x00000001: ('RebootCount', 'rebootCount', 'uint', 0),
+            0x00000002: ('UpTime', 'upTime', 'uint', 0),
+            0x00000003: ('TotalOperationalHours', 'totalOperationalHours', 'uint', 4),
+            0x00000004: ('BootReason', 'bootReason', 'GeneralDiagnostics.Enums.BootReasonEnum', 4),
+            0x00000005: ('ActiveHardwareFaults', 'activeHardwareFaults', 'GeneralDiagnostics.Enums.HardwareFaultEnum', 5),
+            0x00000006: ('ActiveRadioFaults', 'activeRadioFaults', 'GeneralDiagnostics.Enums.RadioFaultEnum', 5),
+            0x00000007: ('ActiveNetworkFaults', 'activeNetworkFaults', 'GeneralDiagnostics.Enums.NetworkFaultEnum', 5),
+            0x00000008: ('TestEventTriggersEnabled', 'testEventTriggersEnabled', 'bool', 0),
+            0x00000009: ('DoNotUse', 'doNotUse', 'uint', 4),
+            0x0000000A: ('DeviceLoadStatus', 'deviceLoadStatus', 'GeneralDiagnostics.Structs.DeviceLoadStruct', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('HardwareFaultChange', {0x0: ('current', 'GeneralDiagnostics.Enums.HardwareFaultEnum', 1), 0x1: ('previous', 'GeneralDiagnostics.Enums.HardwareFaultEnum', 1)}),
+            0x00000001: ('RadioFaultChange', {0x0: ('current', 'GeneralDiagnostics.Enums.RadioFaultEnum', 1), 0x1: ('previous', 'GeneralDiagnostics.Enums.RadioFaultEnum', 1)}),
+            0x00000002: ('NetworkFaultChange', {0x0: ('current', 'GeneralDiagnostics.Enums.NetworkFaultEnum', 1), 0x1: ('previous', 'GeneralDiagnostics.Enums.NetworkFaultEnum', 1)}),
+            0x00000003: ('BootReason', {0x0: ('bootReason', 'GeneralDiagnostics.Enums.BootReasonEnum', 0)}),
+        },
+        {
+            0x00000000: ('TestEventTrigger', {0x0: ('enableKey', 'bytes', 0), 0x1: ('eventTrigger', 'uint', 0)}),
+            0x00000001: ('TimeSnapshot', {}),
+            0x00000003: ('PayloadTestRequest', {0x0: ('enableKey', 'bytes', 0), 0x1: ('value', 'uint', 0), 0x2: ('count', 'uint', 0)}),
+        },
+        {
+            0x00000002: ('TimeSnapshotResponse', {0x0: ('systemTimeMs', 'uint', 0), 0x1: ('posixTimeMs', 'uint', 2)}),
+            0x00000004: ('PayloadTestResponse', {0x0: ('payload', 'bytes', 0)}),
+        },
+    ),
+    0x00000034: (
+        'SoftwareDiagnostics',
+        {
+            0x00000000: ('ThreadMetrics', 'threadMetrics', 'SoftwareDiagnostics.Structs.ThreadMetricsStruct', 5),
+            0x00000001: ('CurrentHeapFree', 'currentHeapFree', 'uint', 4),
+            0x00000002: ('CurrentHeapUsed', 'currentHeapUsed', 'uint', 4),
+            0x00000003: ('CurrentHeapHighWatermark', 'currentHeapHighWatermark', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('SoftwareFault', {0x0: ('id', 'uint', 0), 0x1: ('name', 'str', 4), 0x2: ('faultRecording', 'bytes', 4)}),
+        },
+        {
+            0x00000000: ('ResetWatermarks', {}),
+        },
+        {
+        },
+    ),
+    0x00000035: (
+        'ThreadNetworkDiagnostics',
+        {
+            0x00000000: ('Channel', 'channel', 'uint', 2),
+            0x00000001: ('RoutingRole', 'routingRole', 'ThreadNetworkDiagnostics.Enums.RoutingRoleEnum', 2),
+            0x00000002: ('NetworkName', 'networkName', 'str', 2),
+            0x00000003: ('PanId', 'panId', 'uint', 2),
+            0x00000004: ('ExtendedPanId', 'extendedPanId', 'uint', 2),
+            0x00000005: ('MeshLocalPrefix', 'meshLocalPrefix', 'bytes', 2),
+            0x00000006: ('OverrunCount', 'overrunCount', 'uint', 4),
+            0x00000007: ('NeighborTable', 'neighborTable', 'ThreadNetworkDiagnostics.Structs.NeighborTableStruct', 1),
+            0x00000008: ('RouteTable', 'routeTable', 'ThreadNetworkDiagnostics.Structs.RouteTableStruct', 1),
+            0x00000009: ('PartitionId', 'partitionId', 'uint', 2),
+            0x0000000A: ('Weighting', 'weighting', 'uint', 2),
+            0x0000000B: ('DataVersion', 'dataVersion', 'uint', 2),
+            0x0000000C: ('StableDataVersion', 'stableDataVersion', 'uint', 2),
+            0x0000000D: ('LeaderRouterId', 'leaderRouterId', 'uint', 2),
+            0x0000000E: ('DetachedRoleCount', 'detachedRoleCount', 'uint', 4),
+            0x0000000F: ('ChildRoleCount', 'childRoleCount', 'uint', 4),
+            0x00000010: ('RouterRoleCount', 'routerRoleCount', 'uint', 4),
+            0x00000011: ('LeaderRoleCount', 'leaderRoleCount', 'uint', 4),
+            0x00000012: ('AttachAttemptCount', 'attachAttemptCount', 'uint', 4),
+            0x00000013: ('PartitionIdChangeCount', 'partitionIdChangeCount', 'uint', 4),
+            0x00000014: ('BetterPartitionAttachAttemptCount', 'betterPartitionAttachAttemptCount', 'uint', 4),
+            0x00000015: ('ParentChangeCount', 'parentChangeCount', 'uint', 4),
+            0x00000016: ('TxTotalCount', 'txTotalCount', 'uint', 4),
+            0x00000017: ('TxUnicastCount', 'txUnicastCount', 'uint', 4),
+            0x00000018: ('TxBroadcastCount', 'txBroadcastCount', 'uint', 4),
+            0x00000019: ('TxAckRequestedCount', 'txAckRequestedCount', 'uint', 4),
+            0x0000001A: ('TxAckedCount', 'txAckedCount', 'uint', 4),
+            0x0000001B: ('TxNoAckRequestedCount', 'txNoAckRequestedCount', 'uint', 4),
+            0x0000001C: ('TxDataCount', 'txDataCount', 'uint', 4),
+            0x0000001D: ('TxDataPollCount', 'txDataPollCount', 'uint', 4),
+            0x0000001E: ('TxBeaconCount', 'txBeaconCount', 'uint', 4),
+            0x0000001F: ('TxBeaconRequestCount', 'txBeaconRequestCount', 'uint', 4),
+            0x00000020: ('TxOtherCount', 'txOtherCount', 'uint', 4),
+            0x00000021: ('TxRetryCount', 'txRetryCount', 'uint', 4),
+            0x00000022: ('TxDirectMaxRetryExpiryCount', 'txDirectMaxRetryExpiryCount', 'uint', 4),
+            0x00000023: ('TxIndirectMaxRetryExpiryCount', 'txIndirectMaxRetryExpiryCount', 'uint', 4),
+            0x00000024: ('TxErrCcaCount', 'txErrCcaCount', 'uint', 4),
+            0x00000025: ('TxErrAbortCount', 'txErrAbortCount', 'uint', 4),
+            0x00000026: ('TxErrBusyChannelCount', 'txErrBusyChannelCount', 'uint', 4),
+            0x00000027: ('RxTotalCount', 'rxTotalCount', 'uint', 4),
+            0x00000028: ('RxUnicastCount', 'rxUnicastCount', 'uint', 4),
+            0x00000029: ('RxBroadcastCount', 'rxBroadcastCount', 'uint', 4),
+            0x0000002A: ('RxDataCount', 'rxDataCount', 'uint', 4),
+            0x0000002B: ('RxDataPollCount', 'rxDataPollCount', 'uint', 4),
+            0x0000002C: ('RxBeaconCount', 'rxBeaconCount', 'uint', 4),
+            0x0000002D: ('RxBeaconRequestCount', 'rxBeaconRequestCount', 'uint', 4),
+            0x0000002E: ('RxOtherCount', 'rxOtherCount', 'uint', 4),
+            0x0000002F: ('RxAddressFilteredCount', 'rxAddressFilteredCount', 'uint', 4),
+            0x00000030: ('RxDestAddrFilteredCount', 'rxDestAddrFilteredCount', 'uint', 4),
+            0x00000031: ('RxDuplicatedCount', 'rxDuplicatedCount', 'uint', 4),
+            0x00000032: ('RxErrNoFrameCount', 'rxErrNoFrameCount', 'uint', 4),
+            0x00000033: ('RxErrUnknownNeighborCount', 'rxErrUnknownNeighborCount', 'uint', 4),
+            0x00000034: ('RxErrInvalidSrcAddrCount', 'rxErrInvalidSrcAddrCount', 'uint', 4),
+            0x00000035: ('RxErrSecCount', 'rxErrSecCount', 'uint', 4),
+            0x00000036: ('RxErrFcsCount', 'rxErrFcsCount', 'uint', 4),
+            0x00000037: ('RxErrOtherCount', 'rxErrOtherCount', 'uint', 4),
+            0x00000038: ('ActiveTimestamp', 'activeTimestamp', 'uint', 6),
+            0x00000039: ('PendingTimestamp', 'pendingTimestamp', 'uint', 6),
+            0x0000003A: ('Delay', 'delay', 'uint', 6),
+            0x0000003B: ('SecurityPolicy', 'securityPolicy', 'ThreadNetworkDiagnostics.Structs.SecurityPolicy', 2),
+            0x0000003C: ('ChannelPage0Mask', 'channelPage0Mask', 'bytes', 2),
+            0x0000003D: ('OperationalDatasetComponents', 'operationalDatasetComponents', 'ThreadNetworkDiagnostics.Structs.OperationalDatasetComponents', 2),
+            0x0000003E: ('ActiveNetworkFaultsList', 'activeNetworkFaultsList', 'ThreadNetworkDiagnostics.Enums.NetworkFaultEnum', 1),
+            0x0000003F: ('ExtAddress', 'extAddress', 'uint', 6),
+            0x00000040: ('Rloc16', 'rloc16', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('ConnectionStatus', {0x0: ('connectionStatus', 'ThreadNetworkDiagnostics.Enums.ConnectionStatusEnum', 0)}),
+            0x00000001: ('NetworkFaultChange', {0x0: ('current', 'ThreadNetworkDiagnostics.Enums.NetworkFaultEnum', 1), 0x1: ('previous', 'ThreadNetworkDiagnostics.Enums.NetworkFaultEnum', 1)}),
+        },
+        {
+            0x00000000: ('ResetCounts', {}),
+        },
+        {
+        },
+    ),
+    0x00000036: (
+        'WiFiNetworkDiagnostics',
+        {
+            0x00000000: ('Bssid', 'bssid', 'bytes', 2),
+            0x00000001: ('SecurityType', 'securityType', 'WiFiNetworkDiagnostics.Enums.SecurityTypeEnum', 2),
+            0x00000002: ('WiFiVersion', 'wiFiVersion', 'WiFiNetworkDiagnostics.Enums.WiFiVersionEnum', 2),
+            0x00000003: ('ChannelNumber', 'channelNumber', 'uint', 2),
+            0x00000004: ('Rssi', 'rssi', 'int', 2),
+            0x00000005: ('BeaconLostCount', 'beaconLostCount', 'uint', 6),
+            0x00000006: ('BeaconRxCount', 'beaconRxCount', 'uint', 6),
+            0x00000007: ('PacketMulticastRxCount', 'packetMulticastRxCount', 'uint', 6),
+            0x00000008: ('PacketMulticastTxCount', 'packetMulticastTxCount', 'uint', 6),
+            0x00000009: ('PacketUnicastRxCount', 'packetUnicastRxCount', 'uint', 6),
+            0x0000000A: ('PacketUnicastTxCount', 'packetUnicastTxCount', 'uint', 6),
+            0x0000000B: ('CurrentMaxRate', 'currentMaxRate', 'uint', 6),
+            0x0000000C: ('OverrunCount', 'overrunCount', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('Disconnection', {0x0: ('reasonCode', 'uint', 0)}),
+            0x00000001: ('AssociationFailure', {0x0: ('associationFailureCause', 'WiFiNetworkDiagnostics.Enums.AssociationFailureCauseEnum', 0), 0x1: ('status', 'uint', 0)}),
+            0x00000002: ('ConnectionStatus', {0x0: ('connectionStatus', 'WiFiNetworkDiagnostics.Enums.ConnectionStatusEnum', 0)}),
+        },
+        {
+            0x00000000: ('ResetCounts', {}),
+        },
+        {
+        },
+    ),
+    0x00000037: (
+        'EthernetNetworkDiagnostics',
+        {
+            0x00000000: ('PHYRate', 'PHYRate', 'EthernetNetworkDiagnostics.Enums.PHYRateEnum', 6),
+            0x00000001: ('FullDuplex', 'fullDuplex', 'bool', 6),
+            0x00000002: ('PacketRxCount', 'packetRxCount', 'uint', 4),
+            0x00000003: ('PacketTxCount', 'packetTxCount', 'uint', 4),
+            0x00000004: ('TxErrCount', 'txErrCount', 'uint', 4),
+            0x00000005: ('CollisionCount', 'collisionCount', 'uint', 4),
+            0x00000006: ('OverrunCount', 'overrunCount', 'uint', 4),
+            0x00000007: ('CarrierDetect', 'carrierDetect', 'bool', 6),
+            0x00000008: ('TimeSinceReset', 'timeSinceReset', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ResetCounts', {}),
+        },
+        {
+        },
+    ),
+    0x00000038: (
+        'TimeSynchronization',
+        {
+            0x00000000: ('UTCTime', 'UTCTime', 'uint', 2),
+            0x00000001: ('Granularity', 'granularity', 'TimeSynchronization.Enums.GranularityEnum', 0),
+            0x00000002: ('TimeSource', 'timeSource', 'TimeSynchronization.Enums.TimeSourceEnum', 4),
+            0x00000003: ('TrustedTimeSource', 'trustedTimeSource', 'TimeSynchronization.Structs.TrustedTimeSourceStruct', 6),
+            0x00000004: ('DefaultNTP', 'defaultNTP', 'str', 6),
+            0x00000005: ('TimeZone', 'timeZone', 'TimeSynchronization.Structs.TimeZoneStruct', 5),
+            0x00000006: ('DSTOffset', 'DSTOffset', 'TimeSynchronization.Structs.DSTOffsetStruct', 5),
+            0x00000007: ('LocalTime', 'localTime', 'uint', 6),
+            0x00000008: ('TimeZoneDatabase', 'timeZoneDatabase', 'TimeSynchronization.Enums.TimeZoneDatabaseEnum', 4),
+            0x00000009: ('NTPServerAvailable', 'NTPServerAvailable', 'bool', 4),
+            0x0000000A: ('TimeZoneListMaxSize', 'timeZoneListMaxSize', 'uint', 4),
+            0x0000000B: ('DSTOffsetListMaxSize', 'DSTOffsetListMaxSize', 'uint', 4),
+            0x0000000C: ('SupportsDNSResolve', 'supportsDNSResolve', 'bool', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('DSTTableEmpty', {}),
+            0x00000001: ('DSTStatus', {0x0: ('DSTOffsetActive', 'bool', 0)}),
+            0x00000002: ('TimeZoneStatus', {0x0: ('offset', 'int', 0), 0x1: ('name', 'str', 4)}),
+            0x00000003: ('TimeFailure', {}),
+            0x00000004: ('MissingTrustedTimeSource', {}),
+        },
+        {
+            0x00000000: ('SetUTCTime', {0x0: ('UTCTime', 'uint', 0), 0x1: ('granularity', 'TimeSynchronization.Enums.GranularityEnum', 0), 0x2: ('timeSource', 'TimeSynchronization.Enums.TimeSourceEnum', 4)}),
+            0x00000001: ('SetTrustedTimeSource', {0x0: ('trustedTimeSource', 'TimeSynchronization.Structs.FabricScopedTrustedTimeSourceStruct', 2)}),
+            0x00000002: ('SetTimeZone', {0x0: ('timeZone', 'TimeSynchronization.Structs.TimeZoneStruct', 1)}),
+            0x00000004: ('SetDSTOffset', {0x0: ('DSTOffset', 'TimeSynchronization.Structs.DSTOffsetStruct', 1)}),
+            0x00000005: ('SetDefaultNTP', {0x0: ('defaultNTP', 'str', 2)}),
+        },
+        {
+            0x00000003: ('SetTimeZoneResponse', {0x0: ('DSTOffsetRequired', 'bool', 0)}),
+        },
+    ),
+    0x00000039: (
+        'BridgedDeviceBasicInformation',
+        {
+            0x00000000: ('DataModelRevision', 'dataModelRevision', 'uint', 0),
+            0x00000001: ('VendorName', 'vendorName', 'str', 0),
+            0x00000002: ('VendorID', 'vendorID', 'uint', 0),
+            0x00000003: ('ProductName', 'productName', 'str', 0),
+            0x00000004: ('ProductID', 'productID', 'uint', 0),
+            0x00000005: ('NodeLabel', 'nodeLabel', 'str', 0),
+            0x00000006: ('Location', 'location', 'str', 0),
+            0x00000007: ('HardwareVersion', 'hardwareVersion', 'uint', 0),
+            0x00000008: ('HardwareVersionString', 'hardwareVersionString', 'str', 0),
+            0x00000009: ('SoftwareVersion', 'softwareVersion', 'uint', 0),
+            0x0000000A: ('SoftwareVersionString', 'softwareVersionString', 'str', 0),
+            0x0000000B: ('ManufacturingDate', 'manufacturingDate', 'str', 4),
+            0x0000000C: ('PartNumber', 'partNumber', 'str', 4),
+            0x0000000D: ('ProductURL', 'productURL', 'str', 4),
+            0x0000000E: ('ProductLabel', 'productLabel', 'str', 4),
+            0x0000000F: ('SerialNumber', 'serialNumber', 'str', 4),
+            0x00000010: ('LocalConfigDisabled', 'localConfigDisabled', 'bool', 4),
+            0x00000011: ('Reachable', 'reachable', 'bool', 4),
+            0x00000012: ('UniqueID', 'uniqueID', 'str', 4),
+            0x00000013: ('CapabilityMinima', 'capabilityMinima', 'BridgedDeviceBasicInformation.Structs.CapabilityMinimaStruct', 0),
+            0x00000014: ('ProductAppearance', 'productAppearance', 'BridgedDeviceBasicInformation.Structs.ProductAppearanceStruct', 4),
+            0x00000015: ('SpecificationVersion', 'specificationVersion', 'uint', 4),
+            0x00000016: ('MaxPathsPerInvoke', 'maxPathsPerInvoke', 'uint', 4),
+            0x00000018: ('ConfigurationVersion', 'configurationVersion', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('StartUp', {0x0: ('softwareVersion', 'uint', 0)}),
+            0x00000001: ('ShutDown', {}),
+            0x00000002: ('Leave', {0x0: ('fabricIndex', 'uint', 4)}),
+            0x00000003: ('ReachableChanged', {0x0: ('reachableNewValue', 'bool', 0)}),
+            0x00000080: ('ActiveChanged', {0x0: ('promisedActiveDuration', 'uint', 0)}),
+        },
+        {
+            0x00000080: ('KeepActive', {0x0: ('stayActiveDuration', 'uint', 0), 0x1: ('timeoutMs', 'uint', 0)}),
+        },
+        {
+        },
+    ),
+    0x0000003B: (
+        'Switch',
+        {
+            0x00000000: ('NumberOfPositions', 'numberOfPositions', 'uint', 0),
+            0x00000001: ('CurrentPosition', 'currentPosition', 'uint', 0),
+            0x00000002: ('MultiPressMax', 'multiPressMax', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('SwitchLatched', {0x0: ('newPosition', 'uint', 0)}),
+            0x00000001: ('InitialPress', {0x0: ('newPosition', 'uint', 0)}),
+            0x00000002: ('LongPress', {0x0: ('newPosition', 'uint', 0)}),
+            0x00000003: ('ShortRelease', {0x0: ('previousPosition', 'uint', 0)}),
+            0x00000004: ('LongRelease', {0x0: ('previousPosition', 'uint', 0)}),
+            0x00000005: ('MultiPressOngoing', {0x0: ('newPosition', 'uint', 0), 0x1: ('currentNumberOfPressesCounted', 'uint', 0)}),
+            0x00000006: ('MultiPressComplete', {0x0: ('previousPosition', 'uint', 0), 0x1: ('totalNumberOfPressesCounted', 'uint', 0)}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000003C: (
+        'AdministratorCommissioning',
+        {
+            0x00000000: ('WindowStatus', 'windowStatus', 'AdministratorCommissioning.Enums.CommissioningWindowStatusEnum', 0),
+            0x00000001: ('AdminFabricIndex', 'adminFabricIndex', 'uint', 2),
+            0x00000002: ('AdminVendorId', 'adminVendorId', 'uint', 2),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('OpenCommissioningWindow', {0x0: ('commissioningTimeout', 'uint', 0), 0x1: ('PAKEPasscodeVerifier', 'bytes', 0), 0x2: ('discriminator', 'uint', 0), 0x3: ('iterations', 'uint', 0), 0x4: ('salt', 'bytes', 0)}),
+            0x00000001: ('OpenBasicCommissioningWindow', {0x0: ('commissioningTimeout', 'uint', 0)}),
+            0x00000002: ('RevokeCommissioning', {}),
+        },
+        {
+        },
+    ),
+    0x0000003E: (
+        'OperationalCredentials',
+        {
+            0x00000000: ('NOCs', 'NOCs', 'OperationalCredentials.Structs.NOCStruct', 1),
+            0x00000001: ('Fabrics', 'fabrics', 'OperationalCredentials.Structs.FabricDescriptorStruct', 1),
+            0x00000002: ('SupportedFabrics', 'supportedFabrics', 'uint', 0),
+            0x00000003: ('CommissionedFabrics', 'commissionedFabrics', 'uint', 0),
+            0x00000004: ('TrustedRootCertificates', 'trustedRootCertificates', 'bytes', 1),
+            0x00000005: ('CurrentFabricIndex', 'currentFabricIndex', 'uint', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('AttestationRequest', {0x0: ('attestationNonce', 'bytes', 0)}),
+            0x00000002: ('CertificateChainRequest', {0x0: ('certificateType', 'OperationalCredentials.Enums.CertificateChainTypeEnum', 0)}),
+            0x00000004: ('CSRRequest', {0x0: ('CSRNonce', 'bytes', 0), 0x1: ('isForUpdateNOC', 'bool', 4)}),
+            0x00000006: ('AddNOC', {0x0: ('NOCValue', 'bytes', 0), 0x1: ('ICACValue', 'bytes', 4), 0x2: ('IPKValue', 'bytes', 0), 0x3: ('caseAdminSubject', 'uint', 0), 0x4: ('adminVendorId', 'uint', 0)}),
+            0x00000007: ('UpdateNOC', {0x0: ('NOCValue', 'bytes', 0), 0x1: ('ICACValue', 'bytes', 4)}),
+            0x00000009: ('UpdateFabricLabel', {0x0: ('label', 'str', 0)}),
+            0x0000000A: ('RemoveFabric', {0x0: ('fabricIndex', 'uint', 0)}),
+            0x0000000B: ('AddTrustedRootCertificate', {0x0: ('rootCACertificate', 'bytes', 0)}),
+            0x0000000C: ('SetVIDVerificationStatement', {0x0: ('vendorID', 'uint', 4), 0x1: ('VIDVerificationStatement', 'bytes', 4), 0x2: ('vvsc', 'bytes', 4)}),
+            0x0000000D: ('SignVIDVerificationRequest', {0x0: ('fabricIndex', 'uint', 0), 0x1: ('clientChallenge', 'bytes', 0)}),
+        },
+        {
+            0x00000001: ('AttestationResponse', {0x0: ('attestationElements', 'bytes', 0), 0x1: ('attestationSignature', 'bytes', 0)}),
+            0x00000003: ('CertificateChainResponse', {0x0: ('certificate', 'bytes', 0)}),
+            0x00000005: ('CSRResponse', {0x0: ('NOCSRElements', 'bytes', 0), 0x1: ('attestationSignature', 'bytes', 0)}),
+            0x00000008: ('NOCResponse', {0x0: ('statusCode', 'OperationalCredentials.Enums.NodeOperationalCertStatusEnum', 0), 0x1: ('fabricIndex', 'uint', 4), 0x2: ('debugText', 'str', 4)}),
+            0x0000000E: ('SignVIDVerificationResponse', {0x0: ('fabricIndex', 'uint', 0), 0x1: ('fabricBindingVersion', 'uint', 0), 0x2: ('signature', 'bytes', 0)}),
+        },
+    ),
+    0x0000003F: (
+        'GroupKeyManagement',
+        {
+            0x00000000: ('GroupKeyMap', 'groupKeyMap', 'GroupKeyManagement.Structs.GroupKeyMapStruct', 1),
+            0x00000001: ('GroupTable', 'groupTable', 'GroupKeyManagement.Structs.GroupInfoMapStruct', 1),
+            0x00000002: ('MaxGroupsPerFabric', 'maxGroupsPerFabric', 'uint', 0),
+            0x00000003: ('MaxGroupKeysPerFabric', 'maxGroupKeysPerFabric', 'uint', 0),
+            0x00000004: ('GroupcastAdoption', 'groupcastAdoption', 'GroupKeyManagement.Structs.GroupcastAdoptionStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('KeySetWrite', {0x0: ('groupKeySet', 'GroupKeyManagement.Structs.GroupKeySetStruct', 0)}),
+            0x00000001: ('KeySetRead', {0x0: ('groupKeySetID', 'uint', 0)}),
+            0x00000003: ('KeySetRemove', {0x0: ('groupKeySetID', 'uint', 0)}),
+            0x00000004: ('KeySetReadAllIndices', {0x0: ('doNotUse', 'uint', 4)}),
+        },
+        {
+            0x00000002: ('KeySetReadResponse', {0x0: ('groupKeySet', 'GroupKeyManagement.Structs.GroupKeySetStruct', 0)}),
+            0x00000005: ('KeySetReadAllIndicesResponse', {0x0: ('groupKeySetIDs', 'uint', 1)}),
+        },
+    ),
+    0x00000040: (
+        'FixedLabel',
+        {
+            0x00000000: ('LabelList', 'labelList', 'FixedLabel.Structs.LabelStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000041: (
+        'UserLabel',
+        {
+            0x00000000: ('LabelList', 'labelList', 'UserLabel.Structs.LabelStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000045: (
+        'BooleanState',
+        {
+            0x00000000: ('StateValue', 'stateValue', 'bool', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('StateChange', {0x0: ('stateValue', 'bool', 0)}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000046: (
+        'IcdManagement',
+        {
+            0x00000000: ('IdleModeDuration', 'idleModeDuration', 'uint', 0),
+            0x00000001: ('ActiveModeDuration', 'activeModeDuration', 'uint', 0),
+            0x00000002: ('ActiveModeThreshold', 'activeModeThreshold', 'uint', 0),
+            0x00000003: ('RegisteredClients', 'registeredClients', 'IcdManagement.Structs.MonitoringRegistrationStruct', 5),
+            0x00000004: ('ICDCounter', 'ICDCounter', 'uint', 4),
+            0x00000005: ('ClientsSupportedPerFabric', 'clientsSupportedPerFabric', 'uint', 4),
+            0x00000006: ('UserActiveModeTriggerHint', 'userActiveModeTriggerHint', 'IcdManagement.Bitmaps.UserActiveModeTriggerBitmap', 4),
+            0x00000007: ('UserActiveModeTriggerInstruction', 'userActiveModeTriggerInstruction', 'str', 4),
+            0x00000008: ('OperatingMode', 'operatingMode', 'IcdManagement.Enums.OperatingModeEnum', 4),
+            0x00000009: ('MaximumCheckInBackOff', 'maximumCheckInBackoff', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('RegisterClient', {0x0: ('checkInNodeID', 'uint', 0), 0x1: ('monitoredSubject', 'uint', 0), 0x2: ('key', 'bytes', 0), 0x3: ('verificationKey', 'bytes', 4), 0x4: ('clientType', 'IcdManagement.Enums.ClientTypeEnum', 0)}),
+            0x00000002: ('UnregisterClient', {0x0: ('checkInNodeID', 'uint', 0), 0x1: ('verificationKey', 'bytes', 4)}),
+            0x00000003: ('StayActiveRequest', {0x0: ('stayActiveDuration', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('RegisterClientResponse', {0x0: ('ICDCounter', 'uint', 0)}),
+            0x00000004: ('StayActiveResponse', {0x0: ('promisedActiveDuration', 'uint', 0)}),
+        },
+    ),
+    0x00000048: (
+        'OvenCavityOperationalState',
+        {
+            0x00000000: ('PhaseList', 'phaseList', 'str', 3),
+            0x00000001: ('CurrentPhase', 'currentPhase', 'uint', 2),
+            0x00000002: ('CountdownTime', 'countdownTime', 'uint', 6),
+            0x00000003: ('OperationalStateList', 'operationalStateList', 'OvenCavityOperationalState.Structs.OperationalStateStruct', 1),
+            0x00000004: ('OperationalState', 'operationalState', 'OvenCavityOperationalState.Enums.OperationalStateEnum', 0),
+            0x00000005: ('OperationalError', 'operationalError', 'OvenCavityOperationalState.Structs.ErrorStateStruct', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('OperationalError', {0x0: ('errorState', 'OvenCavityOperationalState.Structs.ErrorStateStruct', 0)}),
+            0x00000001: ('OperationCompletion', {0x0: ('completionErrorCode', 'Globals.Enums.enum8', 0), 0x1: ('totalOperationalTime', 'uint', 6), 0x2: ('pausedTime', 'uint', 6)}),
+        },
+        {
+            0x00000000: ('Pause', {}),
+            0x00000001: ('Stop', {}),
+            0x00000002: ('Start', {}),
+            0x00000003: ('Resume', {}),
+        },
+        {
+            0x00000004: ('OperationalCommandResponse', {0x0: ('commandResponseState', 'OvenCavityOperationalState.Structs.ErrorStateStruct', 0)}),
+        },
+    ),
+    0x00000049: (
+        'OvenMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'OvenMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'OvenMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x0000004A: (
+        'LaundryDryerControls',
+        {
+            0x00000000: ('SupportedDrynessLevels', 'supportedDrynessLevels', 'LaundryDryerControls.Enums.DrynessLevelEnum', 1),
+            0x00000001: ('SelectedDrynessLevel', 'selectedDrynessLevel', 'LaundryDryerControls.Enums.DrynessLevelEnum', 2),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000050: (
+        'ModeSelect',
+        {
+            0x00000000: ('Description', 'description', 'str', 0),
+            0x00000001: ('StandardNamespace', 'standardNamespace', 'Globals.Enums.namespace', 2),
+            0x00000002: ('SupportedModes', 'supportedModes', 'ModeSelect.Structs.ModeOptionStruct', 1),
+            0x00000003: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000004: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000005: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000051: (
+        'LaundryWasherMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'LaundryWasherMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'LaundryWasherMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x00000052: (
+        'RefrigeratorAndTemperatureControlledCabinetMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'RefrigeratorAndTemperatureControlledCabinetMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'RefrigeratorAndTemperatureControlledCabinetMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x00000053: (
+        'LaundryWasherControls',
+        {
+            0x00000000: ('SpinSpeeds', 'spinSpeeds', 'str', 5),
+            0x00000001: ('SpinSpeedCurrent', 'spinSpeedCurrent', 'uint', 6),
+            0x00000002: ('NumberOfRinses', 'numberOfRinses', 'LaundryWasherControls.Enums.NumberOfRinsesEnum', 4),
+            0x00000003: ('SupportedRinses', 'supportedRinses', 'LaundryWasherControls.Enums.NumberOfRinsesEnum', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000054: (
+        'RvcRunMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'RvcRunMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'RvcRunMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x00000055: (
+        'RvcCleanMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'RvcCleanMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'RvcCleanMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x00000056: (
+        'TemperatureControl',
+        {
+            0x00000000: ('TemperatureSetpoint', 'temperatureSetpoint', 'int', 4),
+            0x00000001: ('MinTemperature', 'minTemperature', 'int', 4),
+            0x00000002: ('MaxTemperature', 'maxTemperature', 'int', 4),
+            0x00000003: ('Step', 'step', 'int', 4),
+            0x00000004: ('SelectedTemperatureLevel', 'selectedTemperatureLevel', 'uint', 4),
+            0x00000005: ('SupportedTemperatureLevels', 'supportedTemperatureLevels', 'str', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('SetTemperature', {0x0: ('targetTemperature', 'int', 4), 0x1: ('targetTemperatureLevel', 'uint', 4)}),
+        },
+        {
+        },
+    ),
+    0x00000057: (
+        'RefrigeratorAlarm',
+        {
+            0x00000000: ('Mask', 'mask', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 0),
+            0x00000001: ('Latch', 'latch', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 4),
+            0x00000002: ('State', 'state', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 0),
+            0x00000003: ('Supported', 'supported', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('Notify', {0x0: ('active', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 0), 0x1: ('inactive', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 0), 0x2: ('state', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 0), 0x3: ('mask', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 0)}),
+        },
+        {
+            0x00000000: ('Reset', {0x0: ('alarms', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 0)}),
+            0x00000001: ('ModifyEnabledAlarms', {0x0: ('mask', 'RefrigeratorAlarm.Bitmaps.AlarmBitmap', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000059: (
+        'DishwasherMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'DishwasherMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'DishwasherMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x0000005B: (
+        'AirQuality',
+        {
+            0x00000000: ('AirQuality', 'airQuality', 'AirQuality.Enums.AirQualityEnum', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000005C: (
+        'SmokeCoAlarm',
+        {
+            0x00000000: ('ExpressedState', 'expressedState', 'SmokeCoAlarm.Enums.ExpressedStateEnum', 0),
+            0x00000001: ('SmokeState', 'smokeState', 'SmokeCoAlarm.Enums.AlarmStateEnum', 4),
+            0x00000002: ('COState', 'COState', 'SmokeCoAlarm.Enums.AlarmStateEnum', 4),
+            0x00000003: ('BatteryAlert', 'batteryAlert', 'SmokeCoAlarm.Enums.AlarmStateEnum', 0),
+            0x00000004: ('DeviceMuted', 'deviceMuted', 'SmokeCoAlarm.Enums.MuteStateEnum', 4),
+            0x00000005: ('TestInProgress', 'testInProgress', 'bool', 0),
+            0x00000006: ('HardwareFaultAlert', 'hardwareFaultAlert', 'bool', 0),
+            0x00000007: ('EndOfServiceAlert', 'endOfServiceAlert', 'SmokeCoAlarm.Enums.EndOfServiceEnum', 0),
+            0x00000008: ('InterconnectSmokeAlarm', 'interconnectSmokeAlarm', 'SmokeCoAlarm.Enums.AlarmStateEnum', 4),
+            0x00000009: ('InterconnectCOAlarm', 'interconnectCOAlarm', 'SmokeCoAlarm.Enums.AlarmStateEnum', 4),
+            0x0000000A: ('ContaminationState', 'contaminationState', 'SmokeCoAlarm.Enums.ContaminationStateEnum', 4),
+            0x0000000B: ('SmokeSensitivityLevel', 'smokeSensitivityLevel', 'SmokeCoAlarm.Enums.SensitivityEnum', 4),
+            0x0000000C: ('ExpiryDate', 'expiryDate', 'uint', 4),
+            0x0000000D: ('Unmounted', 'unmounted', 'bool', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('SmokeAlarm', {0x0: ('alarmSeverityLevel', 'SmokeCoAlarm.Enums.AlarmStateEnum', 0)}),
+            0x00000001: ('COAlarm', {0x0: ('alarmSeverityLevel', 'SmokeCoAlarm.Enums.AlarmStateEnum', 0)}),
+            0x00000002: ('LowBattery', {0x0: ('alarmSeverityLevel', 'SmokeCoAlarm.Enums.AlarmStateEnum', 0)}),
+            0x00000003: ('HardwareFault', {}),
+            0x00000004: ('EndOfService', {}),
+            0x00000005: ('SelfTestComplete', {}),
+            0x00000006: ('AlarmMuted', {}),
+            0x00000007: ('MuteEnded', {}),
+            0x00000008: ('InterconnectSmokeAlarm', {0x0: ('alarmSeverityLevel', 'SmokeCoAlarm.Enums.AlarmStateEnum', 0)}),
+            0x00000009: ('InterconnectCOAlarm', {0x0: ('alarmSeverityLevel', 'SmokeCoAlarm.Enums.AlarmStateEnum', 0)}),
+            0x0000000A: ('AllClear', {}),
+        },
+        {
+            0x00000000: ('SelfTestRequest', {}),
+        },
+        {
+        },
+    ),
+    0x0000005D: (
+        'DishwasherAlarm',
+        {
+            0x00000000: ('Mask', 'mask', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 0),
+            0x00000001: ('Latch', 'latch', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 4),
+            0x00000002: ('State', 'state', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 0),
+            0x00000003: ('Supported', 'supported', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('Notify', {0x0: ('active', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 0), 0x1: ('inactive', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 0), 0x2: ('state', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 0), 0x3: ('mask', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 0)}),
+        },
+        {
+            0x00000000: ('Reset', {0x0: ('alarms', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 0)}),
+            0x00000001: ('ModifyEnabledAlarms', {0x0: ('mask', 'DishwasherAlarm.Bitmaps.AlarmBitmap', 0)}),
+        },
+        {
+        },
+    ),
+    0x0000005E: (
+        'MicrowaveOvenMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'MicrowaveOvenMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'MicrowaveOvenMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x0000005F: (
+        'MicrowaveOvenControl',
+        {
+            0x00000000: ('CookTime', 'cookTime', 'uint', 0),
+            0x00000001: ('MaxCookTime', 'maxCookTime', 'uint', 0),
+            0x00000002: ('PowerSetting', 'powerSetting', 'uint', 4),
+            0x00000003: ('MinPower', 'minPower', 'uint', 4),
+            0x00000004: ('MaxPower', 'maxPower', 'uint', 4),
+            0x00000005: ('PowerStep', 'powerStep', 'uint', 4),
+            0x00000006: ('SupportedWatts', 'supportedWatts', 'uint', 5),
+            0x00000007: ('SelectedWattIndex', 'selectedWattIndex', 'uint', 4),
+            0x00000008: ('WattRating', 'wattRating', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('SetCookingParameters', {0x0: ('cookMode', 'uint', 4), 0x1: ('cookTime', 'uint', 4), 0x2: ('powerSetting', 'uint', 4), 0x3: ('wattSettingIndex', 'uint', 4), 0x4: ('startAfterSetting', 'bool', 4)}),
+            0x00000001: ('AddMoreTime', {0x0: ('timeToAdd', 'uint', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000060: (
+        'OperationalState',
+        {
+            0x00000000: ('PhaseList', 'phaseList', 'str', 3),
+            0x00000001: ('CurrentPhase', 'currentPhase', 'uint', 2),
+            0x00000002: ('CountdownTime', 'countdownTime', 'uint', 6),
+            0x00000003: ('OperationalStateList', 'operationalStateList', 'OperationalState.Structs.OperationalStateStruct', 1),
+            0x00000004: ('OperationalState', 'operationalState', 'OperationalState.Enums.OperationalStateEnum', 0),
+            0x00000005: ('OperationalError', 'operationalError', 'OperationalState.Structs.ErrorStateStruct', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('OperationalError', {0x0: ('errorState', 'OperationalState.Structs.ErrorStateStruct', 0)}),
+            0x00000001: ('OperationCompletion', {0x0: ('completionErrorCode', 'Globals.Enums.enum8', 0), 0x1: ('totalOperationalTime', 'uint', 6), 0x2: ('pausedTime', 'uint', 6)}),
+        },
+        {
+            0x00000000: ('Pause', {}),
+            0x00000001: ('Stop', {}),
+            0x00000002: ('Start', {}),
+            0x00000003: ('Resume', {}),
+        },
+        {
+            0x00000004: ('OperationalCommandResponse', {0x0: ('commandResponseState', 'OperationalState.Structs.ErrorStateStruct', 0)}),
+        },
+    ),
+    0x00000061: (
+        'RvcOperationalState',
+        {
+            0x00000000: ('PhaseList', 'phaseList', 'str', 3),
+            0x00000001: ('CurrentPhase', 'currentPhase', 'uint', 2),
+            0x00000002: ('CountdownTime', 'countdownTime', 'uint', 6),
+            0x00000003: ('OperationalStateList', 'operationalStateList', 'RvcOperationalState.Structs.OperationalStateStruct', 1),
+            0x00000004: ('OperationalState', 'operationalState', 'RvcOperationalState.Enums.OperationalStateEnum', 0),
+            0x00000005: ('OperationalError', 'operationalError', 'RvcOperationalState.Structs.ErrorStateStruct', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('OperationalError', {0x0: ('errorState', 'RvcOperationalState.Structs.ErrorStateStruct', 0)}),
+            0x00000001: ('OperationCompletion', {0x0: ('completionErrorCode', 'Globals.Enums.enum8', 0), 0x1: ('totalOperationalTime', 'uint', 6), 0x2: ('pausedTime', 'uint', 6)}),
+        },
+        {
+            0x00000000: ('Pause', {}),
+            0x00000001: ('Stop', {}),
+            0x00000002: ('Start', {}),
+            0x00000003: ('Resume', {}),
+            0x00000080: ('GoHome', {}),
+        },
+        {
+            0x00000004: ('OperationalCommandResponse', {0x0: ('commandResponseState', 'RvcOperationalState.Structs.ErrorStateStruct', 0)}),
+        },
+    ),
+    0x00000062: (
+        'ScenesManagement',
+        {
+            0x00000000: ('DoNotUse', 'doNotUse', 'uint', 4),
+            0x00000001: ('SceneTableSize', 'sceneTableSize', 'uint', 0),
+            0x00000002: ('FabricSceneInfo', 'fabricSceneInfo', 'ScenesManagement.Structs.SceneInfoStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('AddScene', {0x0: ('groupID', 'uint', 0), 0x1: ('sceneID', 'uint', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('sceneName', 'str', 0), 0x4: ('extensionFieldSetStructs', 'ScenesManagement.Structs.ExtensionFieldSetStruct', 1)}),
+            0x00000001: ('ViewScene', {0x0: ('groupID', 'uint', 0), 0x1: ('sceneID', 'uint', 0)}),
+            0x00000002: ('RemoveScene', {0x0: ('groupID', 'uint', 0), 0x1: ('sceneID', 'uint', 0)}),
+            0x00000003: ('RemoveAllScenes', {0x0: ('groupID', 'uint', 0)}),
+            0x00000004: ('StoreScene', {0x0: ('groupID', 'uint', 0), 0x1: ('sceneID', 'uint', 0)}),
+            0x00000005: ('RecallScene', {0x0: ('groupID', 'uint', 0), 0x1: ('sceneID', 'uint', 0), 0x2: ('transitionTime', 'uint', 6)}),
+            0x00000006: ('GetSceneMembership', {0x0: ('groupID', 'uint', 0)}),
+            0x00000040: ('CopyScene', {0x0: ('mode', 'ScenesManagement.Bitmaps.CopyModeBitmap', 0), 0x1: ('groupIdentifierFrom', 'uint', 0), 0x2: ('sceneIdentifierFrom', 'uint', 0), 0x3: ('groupIdentifierTo', 'uint', 0), 0x4: ('sceneIdentifierTo', 'uint', 0)}),
+        },
+        {
+            0x00000000: ('AddSceneResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('groupID', 'uint', 0), 0x2: ('sceneID', 'uint', 0)}),
+            0x00000001: ('ViewSceneResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('groupID', 'uint', 0), 0x2: ('sceneID', 'uint', 0), 0x3: ('transitionTime', 'uint', 4), 0x4: ('sceneName', 'str', 4), 0x5: ('extensionFieldSetStructs', 'ScenesManagement.Structs.ExtensionFieldSetStruct', 5)}),
+            0x00000002: ('RemoveSceneResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('groupID', 'uint', 0), 0x2: ('sceneID', 'uint', 0)}),
+            0x00000003: ('RemoveAllScenesResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('groupID', 'uint', 0)}),
+            0x00000004: ('StoreSceneResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('groupID', 'uint', 0), 0x2: ('sceneID', 'uint', 0)}),
+            0x00000006: ('GetSceneMembershipResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('capacity', 'uint', 2), 0x2: ('groupID', 'uint', 0), 0x3: ('sceneList', 'uint', 5)}),
+            0x00000040: ('CopySceneResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('groupIdentifierFrom', 'uint', 0), 0x2: ('sceneIdentifierFrom', 'uint', 0)}),
+        },
+    ),
+    0x00000064: (
+        'TemperatureAlarm',
+        {
+            0x00000000: ('Mask', 'mask', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 0),
+            0x00000001: ('Latch', 'latch', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 4),
+            0x00000002: ('State', 'state', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 0),
+            0x00000003: ('Supported', 'supported', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 0),
+            0x00000080: ('CriticalOverTemperatureThreshold', 'criticalOverTemperatureThreshold', 'int', 4),
+            0x00000081: ('MajorOverTemperatureThreshold', 'majorOverTemperatureThreshold', 'int', 4),
+            0x00000082: ('MinorOverTemperatureThreshold', 'minorOverTemperatureThreshold', 'int', 4),
+            0x00000083: ('MinorUnderTemperatureThreshold', 'minorUnderTemperatureThreshold', 'int', 4),
+            0x00000084: ('MajorUnderTemperatureThreshold', 'majorUnderTemperatureThreshold', 'int', 4),
+            0x00000085: ('CriticalUnderTemperatureThreshold', 'criticalUnderTemperatureThreshold', 'int', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('Notify', {0x0: ('active', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 0), 0x1: ('inactive', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 0), 0x2: ('state', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 0), 0x3: ('mask', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 0)}),
+        },
+        {
+            0x00000000: ('Reset', {0x0: ('alarms', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 0)}),
+            0x00000001: ('ModifyEnabledAlarms', {0x0: ('mask', 'TemperatureAlarm.Bitmaps.AlarmBitmap', 0)}),
+            0x00000080: ('SetTemperatureAlarmThresholds', {0x0: ('criticalOverTemperatureThreshold', 'int', 4), 0x1: ('majorOverTemperatureThreshold', 'int', 4), 0x2: ('minorOverTemperatureThreshold', 'int', 4), 0x3: ('minorUnderTemperatureThreshold', 'int', 4), 0x4: ('majorUnderTemperatureThreshold', 'int', 4), 0x5: ('criticalUnderTemperatureThreshold', 'int', 4)}),
+        },
+        {
+        },
+    ),
+    0x00000065: (
+        'Groupcast',
+        {
+            0x00000000: ('Membership', 'membership', 'Groupcast.Structs.MembershipStruct', 5),
+            0x00000001: ('MaxMembershipCount', 'maxMembershipCount', 'uint', 4),
+            0x00000002: ('MaxMcastAddrCount', 'maxMcastAddrCount', 'uint', 4),
+            0x00000003: ('UsedMcastAddrCount', 'usedMcastAddrCount', 'uint', 4),
+            0x00000004: ('FabricUnderTest', 'fabricUnderTest', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('GroupcastTesting', {0x0: ('sourceIPAddress', 'bytes', 4), 0x1: ('destinationIPAddress', 'bytes', 4), 0x2: ('groupID', 'uint', 4), 0x3: ('endpointID', 'uint', 4), 0x4: ('clusterID', 'uint', 4), 0x5: ('elementID', 'uint', 4), 0x6: ('accessAllowed', 'bool', 4), 0x7: ('groupcastTestResult', 'Groupcast.Enums.GroupcastTestResultEnum', 0), 0xFE: ('fabricIndex', 'uint', 0)}),
+        },
+        {
+            0x00000000: ('JoinGroup', {0x0: ('groupID', 'uint', 0), 0x1: ('endpoints', 'uint', 1), 0x2: ('keySetID', 'uint', 0), 0x3: ('key', 'bytes', 4), 0x4: ('useAuxiliaryAcl', 'bool', 4), 0x5: ('replaceEndpoints', 'bool', 4), 0x6: ('mcastAddrPolicy', 'Groupcast.Enums.MulticastAddrPolicyEnum', 4)}),
+            0x00000001: ('LeaveGroup', {0x0: ('groupID', 'uint', 0), 0x1: ('endpoints', 'uint', 5)}),
+            0x00000003: ('UpdateGroupKey', {0x0: ('groupID', 'uint', 0), 0x1: ('keySetID', 'uint', 0), 0x2: ('key', 'bytes', 4)}),
+            0x00000004: ('ConfigureAuxiliaryAcl', {0x0: ('groupID', 'uint', 0), 0x1: ('useAuxiliaryAcl', 'bool', 0)}),
+            0x00000005: ('GroupcastTesting', {0x0: ('testOperation', 'Groupcast.Enums.GroupcastTestingEnum', 0), 0x1: ('durationSeconds', 'uint', 4)}),
+        },
+        {
+            0x00000002: ('LeaveGroupResponse', {0x0: ('groupID', 'uint', 0), 0x1: ('endpoints', 'uint', 1)}),
+        },
+    ),
+    0x00000071: (
+        'HepaFilterMonitoring',
+        {
+            0x00000000: ('Condition', 'condition', 'uint', 4),
+            0x00000001: ('DegradationDirection', 'degradationDirection', 'HepaFilterMonitoring.Enums.DegradationDirectionEnum', 4),
+            0x00000002: ('ChangeIndication', 'changeIndication', 'HepaFilterMonitoring.Enums.ChangeIndicationEnum', 0),
+            0x00000003: ('InPlaceIndicator', 'inPlaceIndicator', 'bool', 4),
+            0x00000004: ('LastChangedTime', 'lastChangedTime', 'uint', 6),
+            0x00000005: ('ReplacementProductList', 'replacementProductList', 'HepaFilterMonitoring.Structs.ReplacementProductStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ResetCondition', {}),
+        },
+        {
+        },
+    ),
+    0x00000072: (
+        'ActivatedCarbonFilterMonitoring',
+        {
+            0x00000000: ('Condition', 'condition', 'uint', 4),
+            0x00000001: ('DegradationDirection', 'degradationDirection', 'ActivatedCarbonFilterMonitoring.Enums.DegradationDirectionEnum', 4),
+            0x00000002: ('ChangeIndication', 'changeIndication', 'ActivatedCarbonFilterMonitoring.Enums.ChangeIndicationEnum', 0),
+            0x00000003: ('InPlaceIndicator', 'inPlaceIndicator', 'bool', 4),
+            0x00000004: ('LastChangedTime', 'lastChangedTime', 'uint', 6),
+            0x00000005: ('ReplacementProductList', 'replacementProductList', 'ActivatedCarbonFilterMonitoring.Structs.ReplacementProductStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ResetCondition', {}),
+        },
+        {
+        },
+    ),
+    0x00000079: (
+        'WaterTankLevelMonitoring',
+        {
+            0x00000000: ('Condition', 'condition', 'uint', 4),
+            0x00000001: ('DegradationDirection', 'degradationDirection', 'WaterTankLevelMonitoring.Enums.DegradationDirectionEnum', 4),
+            0x00000002: ('ChangeIndication', 'changeIndication', 'WaterTankLevelMonitoring.Enums.ChangeIndicationEnum', 0),
+            0x00000003: ('InPlaceIndicator', 'inPlaceIndicator', 'bool', 4),
+            0x00000004: ('LastChangedTime', 'lastChangedTime', 'uint', 6),
+            0x00000005: ('ReplacementProductList', 'replacementProductList', 'WaterTankLevelMonitoring.Structs.ReplacementProductStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ResetCondition', {}),
+        },
+        {
+        },
+    ),
+    0x00000080: (
+        'BooleanStateConfiguration',
+        {
+            0x00000000: ('CurrentSensitivityLevel', 'currentSensitivityLevel', 'uint', 4),
+            0x00000001: ('SupportedSensitivityLevels', 'supportedSensitivityLevels', 'uint', 4),
+            0x00000002: ('DefaultSensitivityLevel', 'defaultSensitivityLevel', 'uint', 4),
+            0x00000003: ('AlarmsActive', 'alarmsActive', 'BooleanStateConfiguration.Bitmaps.AlarmModeBitmap', 4),
+            0x00000004: ('AlarmsSuppressed', 'alarmsSuppressed', 'BooleanStateConfiguration.Bitmaps.AlarmModeBitmap', 4),
+            0x00000005: ('AlarmsEnabled', 'alarmsEnabled', 'BooleanStateConfiguration.Bitmaps.AlarmModeBitmap', 4),
+            0x00000006: ('AlarmsSupported', 'alarmsSupported', 'BooleanStateConfiguration.Bitmaps.AlarmModeBitmap', 4),
+            0x00000007: ('SensorFault', 'sensorFault', 'BooleanStateConfiguration.Bitmaps.SensorFaultBitmap', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('AlarmsStateChanged', {0x0: ('alarmsActive', 'BooleanStateConfiguration.Bitmaps.AlarmModeBitmap', 0), 0x1: ('alarmsSuppressed', 'BooleanStateConfiguration.Bitmaps.AlarmModeBitmap', 4)}),
+            0x00000001: ('SensorFault', {0x0: ('sensorFault', 'BooleanStateConfiguration.Bitmaps.SensorFaultBitmap', 0)}),
+        },
+        {
+            0x00000000: ('SuppressAlarm', {0x0: ('alarmsToSuppress', 'BooleanStateConfiguration.Bitmaps.AlarmModeBitmap', 0)}),
+            0x00000001: ('EnableDisableAlarm', {0x0: ('alarmsToEnableDisable', 'BooleanStateConfiguration.Bitmaps.AlarmModeBitmap', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000081: (
+        'ValveConfigurationAndControl',
+        {
+            0x00000000: ('OpenDuration', 'openDuration', 'uint', 2),
+            0x00000001: ('DefaultOpenDuration', 'defaultOpenDuration', 'uint', 2),
+            0x00000002: ('AutoCloseTime', 'autoCloseTime', 'uint', 6),
+            0x00000003: ('RemainingDuration', 'remainingDuration', 'uint', 2),
+            0x00000004: ('CurrentState', 'currentState', 'ValveConfigurationAndControl.Enums.ValveStateEnum', 2),
+            0x00000005: ('TargetState', 'targetState', 'ValveConfigurationAndControl.Enums.ValveStateEnum', 2),
+            0x00000006: ('CurrentLevel', 'currentLevel', 'uint', 6),
+            0x00000007: ('TargetLevel', 'targetLevel', 'uint', 6),
+            0x00000008: ('DefaultOpenLevel', 'defaultOpenLevel', 'uint', 4),
+            0x00000009: ('ValveFault', 'valveFault', 'ValveConfigurationAndControl.Bitmaps.ValveFaultBitmap', 4),
+            0x0000000A: ('LevelStep', 'levelStep', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('ValveStateChanged', {0x0: ('valveState', 'ValveConfigurationAndControl.Enums.ValveStateEnum', 0), 0x1: ('valveLevel', 'uint', 4)}),
+            0x00000001: ('ValveFault', {0x0: ('valveFault', 'ValveConfigurationAndControl.Bitmaps.ValveFaultBitmap', 0)}),
+        },
+        {
+            0x00000000: ('Open', {0x0: ('openDuration', 'uint', 6), 0x1: ('targetLevel', 'uint', 4)}),
+            0x00000001: ('Close', {}),
+        },
+        {
+        },
+    ),
+    0x00000090: (
+        'ElectricalPowerMeasurement',
+        {
+            0x00000000: ('PowerMode', 'powerMode', 'ElectricalPowerMeasurement.Enums.PowerModeEnum', 0),
+            0x00000001: ('NumberOfMeasurementTypes', 'numberOfMeasurementTypes', 'uint', 0),
+            0x00000002: ('Accuracy', 'accuracy', 'Globals.Structs.MeasurementAccuracyStruct', 1),
+            0x00000003: ('Ranges', 'ranges', 'ElectricalPowerMeasurement.Structs.MeasurementRangeStruct', 5),
+            0x00000004: ('Voltage', 'voltage', 'int', 6),
+            0x00000005: ('ActiveCurrent', 'activeCurrent', 'int', 6),
+            0x00000006: ('ReactiveCurrent', 'reactiveCurrent', 'int', 6),
+            0x00000007: ('ApparentCurrent', 'apparentCurrent', 'int', 6),
+            0x00000008: ('ActivePower', 'activePower', 'int', 2),
+            0x00000009: ('ReactivePower', 'reactivePower', 'int', 6),
+            0x0000000A: ('ApparentPower', 'apparentPower', 'int', 6),
+            0x0000000B: ('RMSVoltage', 'RMSVoltage', 'int', 6),
+            0x0000000C: ('RMSCurrent', 'RMSCurrent', 'int', 6),
+            0x0000000D: ('RMSPower', 'RMSPower', 'int', 6),
+            0x0000000E: ('Frequency', 'frequency', 'int', 6),
+            0x0000000F: ('HarmonicCurrents', 'harmonicCurrents', 'ElectricalPowerMeasurement.Structs.HarmonicMeasurementStruct', 7),
+            0x00000010: ('HarmonicPhases', 'harmonicPhases', 'ElectricalPowerMeasurement.Structs.HarmonicMeasurementStruct', 7),
+            0x00000011: ('PowerFactor', 'powerFactor', 'int', 6),
+            0x00000012: ('NeutralCurrent', 'neutralCurrent', 'int', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('MeasurementPeriodRanges', {0x0: ('ranges', 'ElectricalPowerMeasurement.Structs.MeasurementRangeStruct', 1)}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000091: (
+        'ElectricalEnergyMeasurement',
+        {
+            0x00000000: ('Accuracy', 'accuracy', 'Globals.Structs.MeasurementAccuracyStruct', 0),
+            0x00000001: ('CumulativeEnergyImported', 'cumulativeEnergyImported', 'ElectricalEnergyMeasurement.Structs.EnergyMeasurementStruct', 6),
+            0x00000002: ('CumulativeEnergyExported', 'cumulativeEnergyExported', 'ElectricalEnergyMeasurement.Structs.EnergyMeasurementStruct', 6),
+            0x00000003: ('PeriodicEnergyImported', 'periodicEnergyImported', 'ElectricalEnergyMeasurement.Structs.EnergyMeasurementStruct', 6),
+            0x00000004: ('PeriodicEnergyExported', 'periodicEnergyExported', 'ElectricalEnergyMeasurement.Structs.EnergyMeasurementStruct', 6),
+            0x00000005: ('CumulativeEnergyReset', 'cumulativeEnergyReset', 'ElectricalEnergyMeasurement.Structs.CumulativeEnergyResetStruct', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('CumulativeEnergyMeasured', {0x0: ('energyImported', 'ElectricalEnergyMeasurement.Structs.EnergyMeasurementStruct', 4), 0x1: ('energyExported', 'ElectricalEnergyMeasurement.Structs.EnergyMeasurementStruct', 4)}),
+            0x00000001: ('PeriodicEnergyMeasured', {0x0: ('energyImported', 'ElectricalEnergyMeasurement.Structs.EnergyMeasurementStruct', 4), 0x1: ('energyExported', 'ElectricalEnergyMeasurement.Structs.EnergyMeasurementStruct', 4)}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000094: (
+        'WaterHeaterManagement',
+        {
+            0x00000000: ('HeaterTypes', 'heaterTypes', 'WaterHeaterManagement.Bitmaps.WaterHeaterHeatSourceBitmap', 0),
+            0x00000001: ('HeatDemand', 'heatDemand', 'WaterHeaterManagement.Bitmaps.WaterHeaterHeatSourceBitmap', 0),
+            0x00000002: ('TankVolume', 'tankVolume', 'uint', 4),
+            0x00000003: ('EstimatedHeatRequired', 'estimatedHeatRequired', 'int', 4),
+            0x00000004: ('TankPercentage', 'tankPercentage', 'uint', 4),
+            0x00000005: ('BoostState', 'boostState', 'WaterHeaterManagement.Enums.BoostStateEnum', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('BoostStarted', {0x0: ('boostInfo', 'WaterHeaterManagement.Structs.WaterHeaterBoostInfoStruct', 0)}),
+            0x00000001: ('BoostEnded', {}),
+        },
+        {
+            0x00000000: ('Boost', {0x0: ('boostInfo', 'WaterHeaterManagement.Structs.WaterHeaterBoostInfoStruct', 0)}),
+            0x00000001: ('CancelBoost', {}),
+        },
+        {
+        },
+    ),
+    0x00000095: (
+        'CommodityPrice',
+        {
+            0x00000000: ('TariffUnit', 'tariffUnit', 'Globals.Enums.TariffUnitEnum', 0),
+            0x00000001: ('Currency', 'currency', 'Globals.Structs.currency', 2),
+            0x00000002: ('CurrentPrice', 'currentPrice', 'CommodityPrice.Structs.CommodityPriceStruct', 2),
+            0x00000003: ('PriceForecast', 'priceForecast', 'CommodityPrice.Structs.CommodityPriceStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('PriceChange', {0x0: ('currentPrice', 'CommodityPrice.Structs.CommodityPriceStruct', 2)}),
+        },
+        {
+            0x00000000: ('GetDetailedPriceRequest', {0x0: ('details', 'CommodityPrice.Bitmaps.CommodityPriceDetailBitmap', 0)}),
+            0x00000002: ('GetDetailedForecastRequest', {0x0: ('details', 'CommodityPrice.Bitmaps.CommodityPriceDetailBitmap', 0)}),
+        },
+        {
+            0x00000001: ('GetDetailedPriceResponse', {0x0: ('currentPrice', 'CommodityPrice.Structs.CommodityPriceStruct', 2)}),
+            0x00000003: ('GetDetailedForecastResponse', {0x0: ('priceForecast', 'CommodityPrice.Structs.CommodityPriceStruct', 1)}),
+        },
+    ),
+    0x00000097: (
+        'Messages',
+        {
+            0x00000000: ('Messages', 'messages', 'Messages.Structs.MessageStruct', 1),
+            0x00000001: ('ActiveMessageIDs', 'activeMessageIDs', 'bytes', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('MessageQueued', {0x0: ('messageID', 'bytes', 0), 0xFE: ('fabricIndex', 'uint', 0)}),
+            0x00000001: ('MessagePresented', {0x0: ('messageID', 'bytes', 0), 0xFE: ('fabricIndex', 'uint', 0)}),
+            0x00000002: ('MessageComplete', {0x0: ('messageID', 'bytes', 0), 0x1: ('responseID', 'uint', 6), 0x2: ('reply', 'str', 6), 0x3: ('futureMessagesPreference', 'Messages.Enums.FutureMessagePreferenceEnum', 2), 0xFE: ('fabricIndex', 'uint', 0)}),
+        },
+        {
+            0x00000000: ('PresentMessagesRequest', {0x0: ('messageID', 'bytes', 0), 0x1: ('priority', 'Messages.Enums.MessagePriorityEnum', 0), 0x2: ('messageControl', 'Messages.Bitmaps.MessageControlBitmap', 0), 0x3: ('startTime', 'uint', 2), 0x4: ('duration', 'uint', 2), 0x5: ('messageText', 'str', 0), 0x6: ('responses', 'Messages.Structs.MessageResponseOptionStruct', 5)}),
+            0x00000001: ('CancelMessagesRequest', {0x0: ('messageIDs', 'bytes', 1)}),
+        },
+        {
+        },
+    ),
+    0x00000098: (
+        'DeviceEnergyManagement',
+        {
+            0x00000000: ('ESAType', 'ESAType', 'DeviceEnergyManagement.Enums.ESATypeEnum', 0),
+            0x00000001: ('ESACanGenerate', 'ESACanGenerate', 'bool', 0),
+            0x00000002: ('ESAState', 'ESAState', 'DeviceEnergyManagement.Enums.ESAStateEnum', 0),
+            0x00000003: ('AbsMinPower', 'absMinPower', 'int', 0),
+            0x00000004: ('AbsMaxPower', 'absMaxPower', 'int', 0),
+            0x00000005: ('PowerAdjustmentCapability', 'powerAdjustmentCapability', 'DeviceEnergyManagement.Structs.PowerAdjustCapabilityStruct', 6),
+            0x00000006: ('Forecast', 'forecast', 'DeviceEnergyManagement.Structs.ForecastStruct', 6),
+            0x00000007: ('OptOutState', 'optOutState', 'DeviceEnergyManagement.Enums.OptOutStateEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('PowerAdjustStart', {}),
+            0x00000001: ('PowerAdjustEnd', {0x0: ('cause', 'DeviceEnergyManagement.Enums.CauseEnum', 0), 0x1: ('duration', 'uint', 0), 0x2: ('energyUse', 'int', 0)}),
+            0x00000002: ('Paused', {}),
+            0x00000003: ('Resumed', {0x0: ('cause', 'DeviceEnergyManagement.Enums.CauseEnum', 0)}),
+        },
+        {
+            0x00000000: ('PowerAdjustRequest', {0x0: ('power', 'int', 0), 0x1: ('duration', 'uint', 0), 0x2: ('cause', 'DeviceEnergyManagement.Enums.AdjustmentCauseEnum', 0)}),
+            0x00000001: ('CancelPowerAdjustRequest', {}),
+            0x00000002: ('StartTimeAdjustRequest', {0x0: ('requestedStartTime', 'uint', 0), 0x1: ('cause', 'DeviceEnergyManagement.Enums.AdjustmentCauseEnum', 0)}),
+            0x00000003: ('PauseRequest', {0x0: ('duration', 'uint', 0), 0x1: ('cause', 'DeviceEnergyManagement.Enums.AdjustmentCauseEnum', 0)}),
+            0x00000004: ('ResumeRequest', {}),
+            0x00000005: ('ModifyForecastRequest', {0x0: ('forecastID', 'uint', 0), 0x1: ('slotAdjustments', 'DeviceEnergyManagement.Structs.SlotAdjustmentStruct', 1), 0x2: ('cause', 'DeviceEnergyManagement.Enums.AdjustmentCauseEnum', 0)}),
+            0x00000006: ('RequestConstraintBasedForecast', {0x0: ('constraints', 'DeviceEnergyManagement.Structs.ConstraintsStruct', 1), 0x1: ('cause', 'DeviceEnergyManagement.Enums.AdjustmentCauseEnum', 0)}),
+            0x00000007: ('CancelRequest', {}),
+        },
+        {
+        },
+    ),
+    0x00000099: (
+        'EnergyEvse',
+        {
+            0x00000000: ('State', 'state', 'EnergyEvse.Enums.StateEnum', 2),
+            0x00000001: ('SupplyState', 'supplyState', 'EnergyEvse.Enums.SupplyStateEnum', 0),
+            0x00000002: ('FaultState', 'faultState', 'EnergyEvse.Enums.FaultStateEnum', 0),
+            0x00000003: ('ChargingEnabledUntil', 'chargingEnabledUntil', 'uint', 2),
+            0x00000004: ('DischargingEnabledUntil', 'dischargingEnabledUntil', 'uint', 6),
+            0x00000005: ('CircuitCapacity', 'circuitCapacity', 'int', 0),
+            0x00000006: ('MinimumChargeCurrent', 'minimumChargeCurrent', 'int', 0),
+            0x00000007: ('MaximumChargeCurrent', 'maximumChargeCurrent', 'int', 0),
+            0x00000008: ('MaximumDischargeCurrent', 'maximumDischargeCurrent', 'int', 4),
+            0x00000009: ('UserMaximumChargeCurrent', 'userMaximumChargeCurrent', 'int', 4),
+            0x0000000A: ('RandomizationDelayWindow', 'randomizationDelayWindow', 'uint', 4),
+            0x00000023: ('NextChargeStartTime', 'nextChargeStartTime', 'uint', 6),
+            0x00000024: ('NextChargeTargetTime', 'nextChargeTargetTime', 'uint', 6),
+            0x00000025: ('NextChargeRequiredEnergy', 'nextChargeRequiredEnergy', 'int', 6),
+            0x00000026: ('NextChargeTargetSoC', 'nextChargeTargetSoC', 'uint', 6),
+            0x00000027: ('ApproximateEVEfficiency', 'approximateEVEfficiency', 'uint', 6),
+            0x00000030: ('StateOfCharge', 'stateOfCharge', 'uint', 6),
+            0x00000031: ('BatteryCapacity', 'batteryCapacity', 'int', 6),
+            0x00000032: ('VehicleID', 'vehicleID', 'str', 6),
+            0x00000040: ('SessionID', 'sessionID', 'uint', 2),
+            0x00000041: ('SessionDuration', 'sessionDuration', 'uint', 2),
+            0x00000042: ('SessionEnergyCharged', 'sessionEnergyCharged', 'int', 2),
+            0x00000043: ('SessionEnergyDischarged', 'sessionEnergyDischarged', 'int', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('EVConnected', {0x0: ('sessionID', 'uint', 0)}),
+            0x00000001: ('EVNotDetected', {0x0: ('sessionID', 'uint', 0), 0x1: ('state', 'EnergyEvse.Enums.StateEnum', 0), 0x2: ('sessionDuration', 'uint', 0), 0x3: ('sessionEnergyCharged', 'int', 0), 0x4: ('sessionEnergyDischarged', 'int', 4)}),
+            0x00000002: ('EnergyTransferStarted', {0x0: ('sessionID', 'uint', 0), 0x1: ('state', 'EnergyEvse.Enums.StateEnum', 0), 0x2: ('maximumCurrent', 'int', 0), 0x3: ('maximumDischargeCurrent', 'int', 4)}),
+            0x00000003: ('EnergyTransferStopped', {0x0: ('sessionID', 'uint', 0), 0x1: ('state', 'EnergyEvse.Enums.StateEnum', 0), 0x2: ('reason', 'EnergyEvse.Enums.EnergyTransferStoppedReasonEnum', 0), 0x4: ('energyTransferred', 'int', 0), 0x5: ('energyDischarged', 'int', 4)}),
+            0x00000004: ('Fault', {0x0: ('sessionID', 'uint', 2), 0x1: ('state', 'EnergyEvse.Enums.StateEnum', 0), 0x2: ('faultStatePreviousState', 'EnergyEvse.Enums.FaultStateEnum', 0), 0x4: ('faultStateCurrentState', 'EnergyEvse.Enums.FaultStateEnum', 0)}),
+            0x00000005: ('Rfid', {0x0: ('uid', 'bytes', 0)}),
+        },
+        {
+            0x00000001: ('Disable', {}),
+            0x00000002: ('EnableCharging', {0x0: ('chargingEnabledUntil', 'uint', 2), 0x1: ('minimumChargeCurrent', 'int', 0), 0x2: ('maximumChargeCurrent', 'int', 0)}),
+            0x00000003: ('EnableDischarging', {0x0: ('dischargingEnabledUntil', 'uint', 2), 0x1: ('maximumDischargeCurrent', 'int', 0)}),
+            0x00000004: ('StartDiagnostics', {}),
+            0x00000005: ('SetTargets', {0x0: ('chargingTargetSchedules', 'EnergyEvse.Structs.ChargingTargetScheduleStruct', 1)}),
+            0x00000006: ('GetTargets', {}),
+            0x00000007: ('ClearTargets', {}),
+        },
+        {
+            0x00000000: ('GetTargetsResponse', {0x0: ('chargingTargetSchedules', 'EnergyEvse.Structs.ChargingTargetScheduleStruct', 1)}),
+        },
+    ),
+    0x0000009B: (
+        'EnergyPreference',
+        {
+            0x00000000: ('EnergyBalances', 'energyBalances', 'EnergyPreference.Structs.BalanceStruct', 5),
+            0x00000001: ('CurrentEnergyBalance', 'currentEnergyBalance', 'uint', 4),
+            0x00000002: ('EnergyPriorities', 'energyPriorities', 'EnergyPreference.Enums.EnergyPriorityEnum', 5),
+            0x00000003: ('LowPowerModeSensitivities', 'lowPowerModeSensitivities', 'EnergyPreference.Structs.BalanceStruct', 5),
+            0x00000004: ('CurrentLowPowerModeSensitivity', 'currentLowPowerModeSensitivity', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000009C: (
+        'PowerTopology',
+        {
+            0x00000000: ('AvailableEndpoints', 'availableEndpoints', 'uint', 5),
+            0x00000001: ('ActiveEndpoints', 'activeEndpoints', 'uint', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000009D: (
+        'EnergyEvseMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'EnergyEvseMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'EnergyEvseMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x0000009E: (
+        'WaterHeaterMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'WaterHeaterMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'WaterHeaterMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x0000009F: (
+        'DeviceEnergyManagementMode',
+        {
+            0x00000000: ('SupportedModes', 'supportedModes', 'DeviceEnergyManagementMode.Structs.ModeOptionStruct', 1),
+            0x00000001: ('CurrentMode', 'currentMode', 'uint', 0),
+            0x00000002: ('StartUpMode', 'startUpMode', 'uint', 6),
+            0x00000003: ('OnMode', 'onMode', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeToMode', {0x0: ('newMode', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ChangeToModeResponse', {0x0: ('status', 'DeviceEnergyManagementMode.Enums.ModeChangeStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x000000A0: (
+        'ElectricalGridConditions',
+        {
+            0x00000000: ('LocalGenerationAvailable', 'localGenerationAvailable', 'bool', 2),
+            0x00000001: ('CurrentConditions', 'currentConditions', 'ElectricalGridConditions.Structs.ElectricalGridConditionsStruct', 2),
+            0x00000002: ('ForecastConditions', 'forecastConditions', 'ElectricalGridConditions.Structs.ElectricalGridConditionsStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('CurrentConditionsChanged', {0x0: ('currentConditions', 'ElectricalGridConditions.Structs.ElectricalGridConditionsStruct', 2)}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000101: (
+        'DoorLock',
+        {
+            0x00000000: ('LockState', 'lockState', 'DoorLock.Enums.DlLockState', 2),
+            0x00000001: ('LockType', 'lockType', 'DoorLock.Enums.DlLockType', 0),
+            0x00000002: ('ActuatorEnabled', 'actuatorEnabled', 'bool', 0),
+            0x00000003: ('DoorState', 'doorState', 'DoorLock.Enums.DoorStateEnum', 6),
+            0x00000004: ('DoorOpenEvents', 'doorOpenEvents', 'uint', 4),
+            0x00000005: ('DoorClosedEvents', 'doorClosedEvents', 'uint', 4),
+            0x00000006: ('OpenPeriod', 'openPeriod', 'uint', 4),
+            0x00000011: ('NumberOfTotalUsersSupported', 'numberOfTotalUsersSupported', 'uint', 4),
+            0x00000012: ('NumberOfPINUsersSupported', 'numberOfPINUsersSupported', 'uint', 4),
+            0x00000013: ('NumberOfRFIDUsersSupported', 'numberOfRFIDUsersSupported', 'uint', 4),
+            0x00000014: ('NumberOfWeekDaySchedulesSupportedPerUser', 'numberOfWeekDaySchedulesSupportedPerUser', 'uint', 4),
+            0x00000015: ('NumberOfYearDaySchedulesSupportedPerUser', 'numberOfYearDaySchedulesSupportedPerUser', 'uint', 4),
+            0x00000016: ('NumberOfHolidaySchedulesSupported', 'numberOfHolidaySchedulesSupported', 'uint', 4),
+            0x00000017: ('MaxPINCodeLength', 'maxPINCodeLength', 'uint', 4),
+            0x00000018: ('MinPINCodeLength', 'minPINCodeLength', 'uint', 4),
+            0x00000019: ('MaxRFIDCodeLength', 'maxRFIDCodeLength', 'uint', 4),
+            0x0000001A: ('MinRFIDCodeLength', 'minRFIDCodeLength', 'uint', 4),
+            0x0000001B: ('CredentialRulesSupport', 'credentialRulesSupport', 'DoorLock.Bitmaps.CredentialRulesBitmap', 4),
+            0x0000001C: ('NumberOfCredentialsSupportedPerUser', 'numberOfCredentialsSupportedPerUser', 'uint', 4),
+            0x00000021: ('Language', 'language', 'str', 4),
+            0x00000022: ('LEDSettings', 'LEDSettings', 'DoorLock.Enums.LEDSettingEnum', 4),
+            0x00000023: ('AutoRelockTime', 'autoRelockTime', 'uint', 4),
+            0x00000024: ('SoundVolume', 'soundVolume', 'DoorLock.Enums.SoundVolumeEnum', 4),
+            0x00000025: ('OperatingMode', 'operatingMode', 'DoorLock.Enums.OperatingModeEnum', 0),
+            0x00000026: ('SupportedOperatingModes', 'supportedOperatingModes', 'DoorLock.Bitmaps.OperatingModesBitmap', 0),
+            0x00000027: ('DefaultConfigurationRegister', 'defaultConfigurationRegister', 'DoorLock.Bitmaps.ConfigurationRegisterBitmap', 4),
+            0x00000028: ('EnableLocalProgramming', 'enableLocalProgramming', 'bool', 4),
+            0x00000029: ('EnableOneTouchLocking', 'enableOneTouchLocking', 'bool', 4),
+            0x0000002A: ('EnableInsideStatusLED', 'enableInsideStatusLED', 'bool', 4),
+            0x0000002B: ('EnablePrivacyModeButton', 'enablePrivacyModeButton', 'bool', 4),
+            0x0000002C: ('LocalProgrammingFeatures', 'localProgrammingFeatures', 'DoorLock.Bitmaps.LocalProgrammingFeaturesBitmap', 4),
+            0x00000030: ('WrongCodeEntryLimit', 'wrongCodeEntryLimit', 'uint', 4),
+            0x00000031: ('UserCodeTemporaryDisableTime', 'userCodeTemporaryDisableTime', 'uint', 4),
+            0x00000032: ('SendPINOverTheAir', 'sendPINOverTheAir', 'bool', 4),
+            0x00000033: ('RequirePINforRemoteOperation', 'requirePINforRemoteOperation', 'bool', 4),
+            0x00000034: ('SecurityLevel', 'securityLevel', 'uint', 4),
+            0x00000035: ('ExpiringUserTimeout', 'expiringUserTimeout', 'uint', 4),
+            0x00000080: ('AliroReaderVerificationKey', 'aliroReaderVerificationKey', 'bytes', 6),
+            0x00000081: ('AliroReaderGroupIdentifier', 'aliroReaderGroupIdentifier', 'bytes', 6),
+            0x00000082: ('AliroReaderGroupSubIdentifier', 'aliroReaderGroupSubIdentifier', 'bytes', 4),
+            0x00000083: ('AliroExpeditedTransactionSupportedProtocolVersions', 'aliroExpeditedTransactionSupportedProtocolVersions', 'bytes', 5),
+            0x00000084: ('AliroGroupResolvingKey', 'aliroGroupResolvingKey', 'bytes', 6),
+            0x00000085: ('AliroSupportedBLEUWBProtocolVersions', 'aliroSupportedBLEUWBProtocolVersions', 'bytes', 5),
+            0x00000086: ('AliroBLEAdvertisingVersion', 'aliroBLEAdvertisingVersion', 'uint', 4),
+            0x00000087: ('NumberOfAliroCredentialIssuerKeysSupported', 'numberOfAliroCredentialIssuerKeysSupported', 'uint', 4),
+            0x00000088: ('NumberOfAliroEndpointKeysSupported', 'numberOfAliroEndpointKeysSupported', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('DoorLockAlarm', {0x0: ('alarmCode', 'DoorLock.Enums.AlarmCodeEnum', 0)}),
+            0x00000001: ('DoorStateChange', {0x0: ('doorState', 'DoorLock.Enums.DoorStateEnum', 0)}),
+            0x00000002: ('LockOperation', {0x0: ('lockOperationType', 'DoorLock.Enums.LockOperationTypeEnum', 0), 0x1: ('operationSource', 'DoorLock.Enums.OperationSourceEnum', 0), 0x2: ('userIndex', 'uint', 2), 0x3: ('fabricIndex', 'uint', 2), 0x4: ('sourceNode', 'uint', 2), 0x5: ('credentials', 'DoorLock.Structs.CredentialStruct', 7)}),
+            0x00000003: ('LockOperationError', {0x0: ('lockOperationType', 'DoorLock.Enums.LockOperationTypeEnum', 0), 0x1: ('operationSource', 'DoorLock.Enums.OperationSourceEnum', 0), 0x2: ('operationError', 'DoorLock.Enums.OperationErrorEnum', 0), 0x3: ('userIndex', 'uint', 2), 0x4: ('fabricIndex', 'uint', 2), 0x5: ('sourceNode', 'uint', 2), 0x6: ('credentials', 'DoorLock.Structs.CredentialStruct', 7)}),
+            0x00000004: ('LockUserChange', {0x0: ('lockDataType', 'DoorLock.Enums.LockDataTypeEnum', 0), 0x1: ('dataOperationType', 'DoorLock.Enums.DataOperationTypeEnum', 0), 0x2: ('operationSource', 'DoorLock.Enums.OperationSourceEnum', 0), 0x3: ('userIndex', 'uint', 2), 0x4: ('fabricIndex', 'uint', 2), 0x5: ('sourceNode', 'uint', 2), 0x6: ('dataIndex', 'uint', 2)}),
+        },
+        {
+            0x00000000: ('LockDoor', {0x0: ('PINCode', 'bytes', 4)}),
+            0x00000001: ('UnlockDoor', {0x0: ('PINCode', 'bytes', 4)}),
+            0x00000002: ('Toggle', {}),
+            0x00000003: ('UnlockWithTimeout', {0x0: ('timeout', 'uint', 0), 0x1: ('PINCode', 'bytes', 4)}),
+            0x0000000B: ('SetWeekDaySchedule', {0x0: ('weekDayIndex', 'uint', 0), 0x1: ('userIndex', 'uint', 0), 0x2: ('daysMask', 'DoorLock.Bitmaps.DaysMaskBitmap', 0), 0x3: ('startHour', 'uint', 0), 0x4: ('startMinute', 'uint', 0), 0x5: ('endHour', 'uint', 0), 0x6: ('endMinute', 'uint', 0)}),
+            0x0000000C: ('GetWeekDaySchedule', {0x0: ('weekDayIndex', 'uint', 0), 0x1: ('userIndex', 'uint', 0)}),
+            0x0000000D: ('ClearWeekDaySchedule', {0x0: ('weekDayIndex', 'uint', 0), 0x1: ('userIndex', 'uint', 0)}),
+            0x0000000E: ('SetYearDaySchedule', {0x0: ('yearDayIndex', 'uint', 0), 0x1: ('userIndex', 'uint', 0), 0x2: ('localStartTime', 'uint', 0), 0x3: ('localEndTime', 'uint', 0)}),
+            0x0000000F: ('GetYearDaySchedule', {0x0: ('yearDayIndex', 'uint', 0), 0x1: ('userIndex', 'uint', 0)}),
+            0x00000010: ('ClearYearDaySchedule', {0x0: ('yearDayIndex', 'uint', 0), 0x1: ('userIndex', 'uint', 0)}),
+            0x00000011: ('SetHolidaySchedule', {0x0: ('holidayIndex', 'uint', 0), 0x1: ('localStartTime', 'uint', 0), 0x2: ('localEndTime', 'uint', 0), 0x3: ('operatingMode', 'DoorLock.Enums.OperatingModeEnum', 0)}),
+            0x00000012: ('GetHolidaySchedule', {0x0: ('holidayIndex', 'uint', 0)}),
+            0x00000013: ('ClearHolidaySchedule', {0x0: ('holidayIndex', 'uint', 0)}),
+            0x0000001A: ('SetUser', {0x0: ('operationType', 'DoorLock.Enums.DataOperationTypeEnum', 0), 0x1: ('userIndex', 'uint', 0), 0x2: ('userName', 'str', 2), 0x3: ('userUniqueID', 'uint', 2), 0x4: ('userStatus', 'DoorLock.Enums.UserStatusEnum', 2), 0x5: ('userType', 'DoorLock.Enums.UserTypeEnum', 2), 0x6: ('credentialRule', 'DoorLock.Enums.CredentialRuleEnum', 2)}),
+            0x0000001B: ('GetUser', {0x0: ('userIndex', 'uint', 0)}),
+            0x0000001D: ('ClearUser', {0x0: ('userIndex', 'uint', 0)}),
+            0x00000022: ('SetCredential', {0x0: ('operationType', 'DoorLock.Enums.DataOperationTypeEnum', 0), 0x1: ('credential', 'DoorLock.Structs.CredentialStruct', 0), 0x2: ('credentialData', 'bytes', 0), 0x3: ('userIndex', 'uint', 2), 0x4: ('userStatus', 'DoorLock.Enums.UserStatusEnum', 2), 0x5: ('userType', 'DoorLock.Enums.UserTypeEnum', 2)}),
+            0x00000024: ('GetCredentialStatus', {0x0: ('credential', 'DoorLock.Structs.CredentialStruct', 0)}),
+            0x00000026: ('ClearCredential', {0x0: ('credential', 'DoorLock.Structs.CredentialStruct', 2)}),
+            0x00000027: ('UnboltDoor', {0x0: ('PINCode', 'bytes', 4)}),
+            0x00000028: ('SetAliroReaderConfig', {0x0: ('signingKey', 'bytes', 0), 0x1: ('verificationKey', 'bytes', 0), 0x2: ('groupIdentifier', 'bytes', 0), 0x3: ('groupResolvingKey', 'bytes', 4)}),
+            0x00000029: ('ClearAliroReaderConfig', {}),
+        },
+        {
+            0x0000000C: ('GetWeekDayScheduleResponse', {0x0: ('weekDayIndex', 'uint', 0), 0x1: ('userIndex', 'uint', 0), 0x2: ('status', 'Globals.Enums.status', 0), 0x3: ('daysMask', 'DoorLock.Bitmaps.DaysMaskBitmap', 4), 0x4: ('startHour', 'uint', 4), 0x5: ('startMinute', 'uint', 4), 0x6: ('endHour', 'uint', 4), 0x7: ('endMinute', 'uint', 4)}),
+            0x0000000F: ('GetYearDayScheduleResponse', {0x0: ('yearDayIndex', 'uint', 0), 0x1: ('userIndex', 'uint', 0), 0x2: ('status', 'Globals.Enums.status', 0), 0x3: ('localStartTime', 'uint', 4), 0x4: ('localEndTime', 'uint', 4)}),
+            0x00000012: ('GetHolidayScheduleResponse', {0x0: ('holidayIndex', 'uint', 0), 0x1: ('status', 'Globals.Enums.status', 0), 0x2: ('localStartTime', 'uint', 6), 0x3: ('localEndTime', 'uint', 6), 0x4: ('operatingMode', 'DoorLock.Enums.OperatingModeEnum', 6)}),
+            0x0000001C: ('GetUserResponse', {0x0: ('userIndex', 'uint', 0), 0x1: ('userName', 'str', 2), 0x2: ('userUniqueID', 'uint', 2), 0x3: ('userStatus', 'DoorLock.Enums.UserStatusEnum', 2), 0x4: ('userType', 'DoorLock.Enums.UserTypeEnum', 2), 0x5: ('credentialRule', 'DoorLock.Enums.CredentialRuleEnum', 2), 0x6: ('credentials', 'DoorLock.Structs.CredentialStruct', 3), 0x7: ('creatorFabricIndex', 'uint', 2), 0x8: ('lastModifiedFabricIndex', 'uint', 2), 0x9: ('nextUserIndex', 'uint', 2)}),
+            0x00000023: ('SetCredentialResponse', {0x0: ('status', 'Globals.Enums.status', 0), 0x1: ('userIndex', 'uint', 2), 0x2: ('nextCredentialIndex', 'uint', 6)}),
+            0x00000025: ('GetCredentialStatusResponse', {0x0: ('credentialExists', 'bool', 0), 0x1: ('userIndex', 'uint', 2), 0x2: ('creatorFabricIndex', 'uint', 2), 0x3: ('lastModifiedFabricIndex', 'uint', 2), 0x4: ('nextCredentialIndex', 'uint', 6), 0x5: ('credentialData', 'bytes', 6)}),
+        },
+    ),
+    0x00000102: (
+        'WindowCovering',
+        {
+            0x00000000: ('Type', 'type', 'WindowCovering.Enums.Type', 0),
+            0x00000005: ('NumberOfActuationsLift', 'numberOfActuationsLift', 'uint', 4),
+            0x00000006: ('NumberOfActuationsTilt', 'numberOfActuationsTilt', 'uint', 4),
+            0x00000007: ('ConfigStatus', 'configStatus', 'WindowCovering.Bitmaps.ConfigStatus', 0),
+            0x00000008: ('CurrentPositionLiftPercentage', 'currentPositionLiftPercentage', 'uint', 6),
+            0x00000009: ('CurrentPositionTiltPercentage', 'currentPositionTiltPercentage', 'uint', 6),
+            0x0000000A: ('OperationalStatus', 'operationalStatus', 'WindowCovering.Bitmaps.OperationalStatus', 0),
+            0x0000000B: ('TargetPositionLiftPercent100ths', 'targetPositionLiftPercent100ths', 'uint', 6),
+            0x0000000C: ('TargetPositionTiltPercent100ths', 'targetPositionTiltPercent100ths', 'uint', 6),
+            0x0000000D: ('EndProductType', 'endProductType', 'WindowCovering.Enums.EndProductType', 0),
+            0x0000000E: ('CurrentPositionLiftPercent100ths', 'currentPositionLiftPercent100ths', 'uint', 6),
+            0x0000000F: ('CurrentPositionTiltPercent100ths', 'currentPositionTiltPercent100ths', 'uint', 6),
+            0x00000017: ('Mode', 'mode', 'WindowCovering.Bitmaps.Mode', 0),
+            0x0000001A: ('SafetyStatus', 'safetyStatus', 'WindowCovering.Bitmaps.SafetyStatus', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+            0x15340001: ('WagoTravelTimeUp', 'wagoTravelTimeUp', 'uint', 4),
+            0x15340002: ('WagoTravelTimeDown', 'wagoTravelTimeDown', 'uint', 4),
+            0x15340003: ('WagoSlatRotationTime', 'wagoSlatRotationTime', 'uint', 4),
+        },
+        {
+        },
+        {
+            0x00000000: ('UpOrOpen', {}),
+            0x00000001: ('DownOrClose', {}),
+            0x00000002: ('StopMotion', {}),
+            0x00000005: ('GoToLiftPercentage', {0x0: ('liftPercent100thsValue', 'uint', 0), 0x1: ('ignored', 'uint', 4)}),
+            0x00000008: ('GoToTiltPercentage', {0x0: ('tiltPercent100thsValue', 'uint', 0), 0x1: ('ignored', 'uint', 4)}),
+        },
+        {
+        },
+    ),
+    0x00000104: (
+        'ClosureControl',
+        {
+            0x00000000: ('CountdownTime', 'countdownTime', 'uint', 6),
+            0x00000001: ('MainState', 'mainState', 'ClosureControl.Enums.MainStateEnum', 0),
+            0x00000002: ('CurrentErrorList', 'currentErrorList', 'ClosureControl.Enums.ClosureErrorEnum', 1),
+            0x00000003: ('OverallCurrentState', 'overallCurrentState', 'ClosureControl.Structs.OverallCurrentStateStruct', 2),
+            0x00000004: ('OverallTargetState', 'overallTargetState', 'ClosureControl.Structs.OverallTargetStateStruct', 2),
+            0x00000005: ('LatchControlModes', 'latchControlModes', 'ClosureControl.Bitmaps.LatchControlModesBitmap', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('OperationalError', {0x0: ('errorState', 'ClosureControl.Enums.ClosureErrorEnum', 1)}),
+            0x00000001: ('MovementCompleted', {}),
+            0x00000002: ('EngageStateChanged', {0x0: ('engageValue', 'bool', 0)}),
+            0x00000003: ('SecureStateChanged', {0x0: ('secureValue', 'bool', 0)}),
+        },
+        {
+            0x00000000: ('Stop', {}),
+            0x00000001: ('MoveTo', {0x0: ('position', 'ClosureControl.Enums.TargetPositionEnum', 4), 0x1: ('latch', 'bool', 4), 0x2: ('speed', 'Globals.Enums.ThreeLevelAutoEnum', 4)}),
+            0x00000002: ('Calibrate', {}),
+        },
+        {
+        },
+    ),
+    0x00000105: (
+        'ClosureDimension',
+        {
+            0x00000000: ('CurrentState', 'currentState', 'ClosureDimension.Structs.DimensionStateStruct', 2),
+            0x00000001: ('TargetState', 'targetState', 'ClosureDimension.Structs.DimensionStateStruct', 2),
+            0x00000002: ('Resolution', 'resolution', 'uint', 4),
+            0x00000003: ('StepValue', 'stepValue', 'uint', 4),
+            0x00000004: ('Unit', 'unit', 'ClosureDimension.Enums.ClosureUnitEnum', 4),
+            0x00000005: ('UnitRange', 'unitRange', 'ClosureDimension.Structs.UnitRangeStruct', 6),
+            0x00000006: ('LimitRange', 'limitRange', 'ClosureDimension.Structs.RangePercent100thsStruct', 4),
+            0x00000007: ('TranslationDirection', 'translationDirection', 'ClosureDimension.Enums.TranslationDirectionEnum', 4),
+            0x00000008: ('RotationAxis', 'rotationAxis', 'ClosureDimension.Enums.RotationAxisEnum', 4),
+            0x00000009: ('Overflow', 'overflow', 'ClosureDimension.Enums.OverflowEnum', 4),
+            0x0000000A: ('ModulationType', 'modulationType', 'ClosureDimension.Enums.ModulationTypeEnum', 4),
+            0x0000000B: ('LatchControlModes', 'latchControlModes', 'ClosureDimension.Bitmaps.LatchControlModesBitmap', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('SetTarget', {0x0: ('position', 'uint', 4), 0x1: ('latch', 'bool', 4), 0x2: ('speed', 'Globals.Enums.ThreeLevelAutoEnum', 4)}),
+            0x00000001: ('Step', {0x0: ('direction', 'ClosureDimension.Enums.StepDirectionEnum', 0), 0x1: ('numberOfSteps', 'uint', 0), 0x2: ('speed', 'Globals.Enums.ThreeLevelAutoEnum', 4)}),
+        },
+        {
+        },
+    ),
+    0x00000150: (
+        'ServiceArea',
+        {
+            0x00000000: ('SupportedAreas', 'supportedAreas', 'ServiceArea.Structs.AreaStruct', 1),
+            0x00000001: ('SupportedMaps', 'supportedMaps', 'ServiceArea.Structs.MapStruct', 5),
+            0x00000002: ('SelectedAreas', 'selectedAreas', 'uint', 1),
+            0x00000003: ('CurrentArea', 'currentArea', 'uint', 6),
+            0x00000004: ('EstimatedEndTime', 'estimatedEndTime', 'uint', 6),
+            0x00000005: ('Progress', 'progress', 'ServiceArea.Structs.ProgressStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('SelectAreas', {0x0: ('newAreas', 'uint', 1)}),
+            0x00000002: ('SkipArea', {0x0: ('skippedArea', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('SelectAreasResponse', {0x0: ('status', 'ServiceArea.Enums.SelectAreasStatus', 0), 0x1: ('statusText', 'str', 0)}),
+            0x00000003: ('SkipAreaResponse', {0x0: ('status', 'ServiceArea.Enums.SkipAreaStatus', 0), 0x1: ('statusText', 'str', 0)}),
+        },
+    ),
+    0x00000200: (
+        'PumpConfigurationAndControl',
+        {
+            0x00000000: ('MaxPressure', 'maxPressure', 'int', 2),
+            0x00000001: ('MaxSpeed', 'maxSpeed', 'uint', 2),
+            0x00000002: ('MaxFlow', 'maxFlow', 'uint', 2),
+            0x00000003: ('MinConstPressure', 'minConstPressure', 'int', 6),
+            0x00000004: ('MaxConstPressure', 'maxConstPressure', 'int', 6),
+            0x00000005: ('MinCompPressure', 'minCompPressure', 'int', 6),
+            0x00000006: ('MaxCompPressure', 'maxCompPressure', 'int', 6),
+            0x00000007: ('MinConstSpeed', 'minConstSpeed', 'uint', 6),
+            0x00000008: ('MaxConstSpeed', 'maxConstSpeed', 'uint', 6),
+            0x00000009: ('MinConstFlow', 'minConstFlow', 'uint', 6),
+            0x0000000A: ('MaxConstFlow', 'maxConstFlow', 'uint', 6),
+            0x0000000B: ('MinConstTemp', 'minConstTemp', 'int', 6),
+            0x0000000C: ('MaxConstTemp', 'maxConstTemp', 'int', 6),
+            0x00000010: ('PumpStatus', 'pumpStatus', 'PumpConfigurationAndControl.Bitmaps.PumpStatusBitmap', 4),
+            0x00000011: ('EffectiveOperationMode', 'effectiveOperationMode', 'PumpConfigurationAndControl.Enums.OperationModeEnum', 0),
+            0x00000012: ('EffectiveControlMode', 'effectiveControlMode', 'PumpConfigurationAndControl.Enums.ControlModeEnum', 0),
+            0x00000013: ('Capacity', 'capacity', 'int', 2),
+            0x00000014: ('Speed', 'speed', 'uint', 6),
+            0x00000015: ('LifetimeRunningHours', 'lifetimeRunningHours', 'uint', 6),
+            0x00000016: ('Power', 'power', 'uint', 6),
+            0x00000017: ('LifetimeEnergyConsumed', 'lifetimeEnergyConsumed', 'uint', 6),
+            0x00000020: ('OperationMode', 'operationMode', 'PumpConfigurationAndControl.Enums.OperationModeEnum', 0),
+            0x00000021: ('ControlMode', 'controlMode', 'PumpConfigurationAndControl.Enums.ControlModeEnum', 4),
+            0x00000022: ('AlarmMask', 'alarmMask', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('SupplyVoltageLow', {}),
+            0x00000001: ('SupplyVoltageHigh', {}),
+            0x00000002: ('PowerMissingPhase', {}),
+            0x00000003: ('SystemPressureLow', {}),
+            0x00000004: ('SystemPressureHigh', {}),
+            0x00000005: ('DryRunning', {}),
+            0x00000006: ('MotorTemperatureHigh', {}),
+            0x00000007: ('PumpMotorFatalFailure', {}),
+            0x00000008: ('ElectronicTemperatureHigh', {}),
+            0x00000009: ('PumpBlocked', {}),
+            0x0000000A: ('SensorFailure', {}),
+            0x0000000B: ('ElectronicNonFatalFailure', {}),
+            0x0000000C: ('ElectronicFatalFailure', {}),
+            0x0000000D: ('GeneralFault', {}),
+            0x0000000E: ('Leakage', {}),
+            0x0000000F: ('AirDetection', {}),
+            0x00000010: ('TurbineOperation', {}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000201: (
+        'Thermostat',
+        {
+            0x00000000: ('LocalTemperature', 'localTemperature', 'int', 2),
+            0x00000001: ('OutdoorTemperature', 'outdoorTemperature', 'int', 6),
+            0x00000002: ('Occupancy', 'occupancy', 'Thermostat.Bitmaps.OccupancyBitmap', 4),
+            0x00000003: ('AbsMinHeatSetpointLimit', 'absMinHeatSetpointLimit', 'int', 4),
+            0x00000004: ('AbsMaxHeatSetpointLimit', 'absMaxHeatSetpointLimit', 'int', 4),
+            0x00000005: ('AbsMinCoolSetpointLimit', 'absMinCoolSetpointLimit', 'int', 4),
+            0x00000006: ('AbsMaxCoolSetpointLimit', 'absMaxCoolSetpointLimit', 'int', 4),
+            0x00000007: ('PICoolingDemand', 'PICoolingDemand', 'uint', 4),
+            0x00000008: ('PIHeatingDemand', 'PIHeatingDemand', 'uint', 4),
+            0x00000009: ('HVACSystemTypeConfiguration', 'HVACSystemTypeConfiguration', 'uint', 4),
+            0x00000010: ('LocalTemperatureCalibration', 'localTemperatureCalibration', 'int', 4),
+            0x00000011: ('OccupiedCoolingSetpoint', 'occupiedCoolingSetpoint', 'int', 4),
+            0x00000012: ('OccupiedHeatingSetpoint', 'occupiedHeatingSetpoint', 'int', 4),
+            0x00000013: ('UnoccupiedCoolingSetpoint', 'unoccupiedCoolingSetpoint', 'int', 4),
+            0x00000014: ('UnoccupiedHeatingSetpoint', 'unoccupiedHeatingSetpoint', 'int', 4),
+            0x00000015: ('MinHeatSetpointLimit', 'minHeatSetpointLimit', 'int', 4),
+            0x00000016: ('MaxHeatSetpointLimit', 'maxHeatSetpointLimit', 'int', 4),
+            0x00000017: ('MinCoolSetpointLimit', 'minCoolSetpointLimit', 'int', 4),
+            0x00000018: ('MaxCoolSetpointLimit', 'maxCoolSetpointLimit', 'int', 4),
+            0x00000019: ('MinSetpointDeadBand', 'minSetpointDeadBand', 'int', 4),
+            0x0000001A: ('RemoteSensing', 'remoteSensing', 'Thermostat.Bitmaps.RemoteSensingBitmap', 4),
+            0x0000001B: ('ControlSequenceOfOperation', 'controlSequenceOfOperation', 'Thermostat.Enums.ControlSequenceOfOperationEnum', 0),
+            0x0000001C: ('SystemMode', 'systemMode', 'Thermostat.Enums.SystemModeEnum', 0),
+            0x0000001E: ('ThermostatRunningMode', 'thermostatRunningMode', 'Thermostat.Enums.ThermostatRunningModeEnum', 4),
+            0x00000023: ('TemperatureSetpointHold', 'temperatureSetpointHold', 'Thermostat.Enums.TemperatureSetpointHoldEnum', 4),
+            0x00000024: ('TemperatureSetpointHoldDuration', 'temperatureSetpointHoldDuration', 'uint', 6),
+            0x00000025: ('ThermostatProgrammingOperationMode', 'thermostatProgrammingOperationMode', 'uint', 4),
+            0x00000029: ('ThermostatRunningState', 'thermostatRunningState', 'Thermostat.Bitmaps.RelayStateBitmap', 4),
+            0x00000030: ('SetpointChangeSource', 'setpointChangeSource', 'Thermostat.Enums.SetpointChangeSourceEnum', 4),
+            0x00000031: ('SetpointChangeAmount', 'setpointChangeAmount', 'int', 6),
+            0x00000032: ('SetpointChangeSourceTimestamp', 'setpointChangeSourceTimestamp', 'uint', 4),
+            0x00000034: ('OccupiedSetback', 'occupiedSetback', 'uint', 4),
+            0x00000035: ('OccupiedSetbackMin', 'occupiedSetbackMin', 'uint', 4),
+            0x00000036: ('OccupiedSetbackMax', 'occupiedSetbackMax', 'uint', 4),
+            0x00000037: ('UnoccupiedSetback', 'unoccupiedSetback', 'uint', 4),
+            0x00000038: ('UnoccupiedSetbackMin', 'unoccupiedSetbackMin', 'uint', 4),
+            0x00000039: ('UnoccupiedSetbackMax', 'unoccupiedSetbackMax', 'uint', 4),
+            0x0000003A: ('EmergencyHeatDelta', 'emergencyHeatDelta', 'uint', 4),
+            0x00000040: ('ACType', 'ACType', 'Thermostat.Enums.ACTypeEnum', 4),
+            0x00000041: ('ACCapacity', 'ACCapacity', 'uint', 4),
+            0x00000042: ('ACRefrigerantType', 'ACRefrigerantType', 'Thermostat.Enums.ACRefrigerantTypeEnum', 4),
+            0x00000043: ('ACCompressorType', 'ACCompressorType', 'Thermostat.Enums.ACCompressorTypeEnum', 4),
+            0x00000044: ('ACErrorCode', 'ACErrorCode', 'Thermostat.Bitmaps.ACErrorCodeBitmap', 4),
+            0x00000045: ('ACLouverPosition', 'ACLouverPosition', 'Thermostat.Enums.ACLouverPositionEnum', 4),
+            0x00000046: ('ACCoilTemperature', 'ACCoilTemperature', 'int', 6),
+            0x00000047: ('ACCapacityformat', 'ACCapacityformat', 'Thermostat.Enums.ACCapacityFormatEnum', 4),
+            0x00000048: ('PresetTypes', 'presetTypes', 'Thermostat.Structs.PresetTypeStruct', 5),
+            0x00000049: ('ScheduleTypes', 'scheduleTypes', 'Thermostat.Structs.ScheduleTypeStruct', 5),
+            0x0000004A: ('NumberOfPresets', 'numberOfPresets', 'uint', 4),
+            0x0000004B: ('NumberOfSchedules', 'numberOfSchedules', 'uint', 4),
+            0x0000004C: ('NumberOfScheduleTransitions', 'numberOfScheduleTransitions', 'uint', 4),
+            0x0000004D: ('NumberOfScheduleTransitionPerDay', 'numberOfScheduleTransitionPerDay', 'uint', 6),
+            0x0000004E: ('ActivePresetHandle', 'activePresetHandle', 'bytes', 6),
+            0x0000004F: ('ActiveScheduleHandle', 'activeScheduleHandle', 'bytes', 6),
+            0x00000050: ('Presets', 'presets', 'Thermostat.Structs.PresetStruct', 5),
+            0x00000051: ('Schedules', 'schedules', 'Thermostat.Structs.ScheduleStruct', 5),
+            0x00000052: ('SetpointHoldExpiryTimestamp', 'setpointHoldExpiryTimestamp', 'uint', 6),
+            0x00000053: ('MaxThermostatSuggestions', 'maxThermostatSuggestions', 'uint', 4),
+            0x00000054: ('ThermostatSuggestions', 'thermostatSuggestions', 'Thermostat.Structs.ThermostatSuggestionStruct', 5),
+            0x00000055: ('CurrentThermostatSuggestion', 'currentThermostatSuggestion', 'Thermostat.Structs.ThermostatSuggestionStruct', 6),
+            0x00000056: ('ThermostatSuggestionNotFollowingReason', 'thermostatSuggestionNotFollowingReason', 'Thermostat.Bitmaps.ThermostatSuggestionNotFollowingReasonBitmap', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('SystemModeChange', {0x0: ('previousSystemMode', 'Thermostat.Enums.SystemModeEnum', 4), 0x1: ('currentSystemMode', 'Thermostat.Enums.SystemModeEnum', 0)}),
+            0x00000001: ('LocalTemperatureChange', {0x0: ('currentLocalTemperature', 'int', 2)}),
+            0x00000002: ('OccupancyChange', {0x0: ('previousOccupancy', 'Thermostat.Bitmaps.OccupancyBitmap', 4), 0x1: ('currentOccupancy', 'Thermostat.Bitmaps.OccupancyBitmap', 0)}),
+            0x00000003: ('SetpointChange', {0x0: ('systemMode', 'Thermostat.Enums.SystemModeEnum', 0), 0x1: ('occupancy', 'Thermostat.Bitmaps.OccupancyBitmap', 4), 0x2: ('previousSetpoint', 'int', 4), 0x3: ('currentSetpoint', 'int', 0)}),
+            0x00000004: ('RunningStateChange', {0x0: ('previousRunningState', 'Thermostat.Bitmaps.RelayStateBitmap', 4), 0x1: ('currentRunningState', 'Thermostat.Bitmaps.RelayStateBitmap', 0)}),
+            0x00000005: ('RunningModeChange', {0x0: ('previousRunningMode', 'Thermostat.Enums.ThermostatRunningModeEnum', 4), 0x1: ('currentRunningMode', 'Thermostat.Enums.ThermostatRunningModeEnum', 0)}),
+            0x00000006: ('ActiveScheduleChange', {0x0: ('previousScheduleHandle', 'bytes', 6), 0x1: ('currentScheduleHandle', 'bytes', 2)}),
+            0x00000007: ('ActivePresetChange', {0x0: ('previousPresetHandle', 'bytes', 6), 0x1: ('currentPresetHandle', 'bytes', 2)}),
+        },
+        {
+            0x00000000: ('SetpointRaiseLower', {0x0: ('mode', 'Thermostat.Enums.SetpointRaiseLowerModeEnum', 0), 0x1: ('amount', 'int', 0)}),
+            0x00000005: ('SetActiveScheduleRequest', {0x0: ('scheduleHandle', 'bytes', 0)}),
+            0x00000006: ('SetActivePresetRequest', {0x0: ('presetHandle', 'bytes', 2)}),
+            0x00000007: ('AddThermostatSuggestion', {0x0: ('presetHandle', 'bytes', 0), 0x1: ('effectiveTime', 'uint', 2), 0x2: ('expirationInMinutes', 'uint', 0)}),
+            0x00000008: ('RemoveThermostatSuggestion', {0x0: ('uniqueID', 'uint', 0)}),
+            0x000000FE: ('AtomicRequest', {0x0: ('requestType', 'Globals.Enums.enum8', 0), 0x1: ('attributeRequests', 'uint', 1), 0x2: ('timeout', 'uint', 4)}),
+        },
+        {
+            0x00000002: ('AddThermostatSuggestionResponse', {0x0: ('uniqueID', 'uint', 0)}),
+            0x000000FD: ('AtomicResponse', {0x0: ('statusCode', 'Globals.Enums.status', 0), 0x1: ('attributeStatus', 'Globals.Structs.struct', 1), 0x2: ('timeout', 'uint', 4)}),
+        },
+    ),
+    0x00000202: (
+        'FanControl',
+        {
+            0x00000000: ('FanMode', 'fanMode', 'FanControl.Enums.FanModeEnum', 0),
+            0x00000001: ('FanModeSequence', 'fanModeSequence', 'FanControl.Enums.FanModeSequenceEnum', 0),
+            0x00000002: ('PercentSetting', 'percentSetting', 'uint', 2),
+            0x00000003: ('PercentCurrent', 'percentCurrent', 'uint', 0),
+            0x00000004: ('SpeedMax', 'speedMax', 'uint', 4),
+            0x00000005: ('SpeedSetting', 'speedSetting', 'uint', 6),
+            0x00000006: ('SpeedCurrent', 'speedCurrent', 'uint', 4),
+            0x00000007: ('RockSupport', 'rockSupport', 'FanControl.Bitmaps.RockBitmap', 4),
+            0x00000008: ('RockSetting', 'rockSetting', 'FanControl.Bitmaps.RockBitmap', 4),
+            0x00000009: ('WindSupport', 'windSupport', 'FanControl.Bitmaps.WindBitmap', 4),
+            0x0000000A: ('WindSetting', 'windSetting', 'FanControl.Bitmaps.WindBitmap', 4),
+            0x0000000B: ('AirflowDirection', 'airflowDirection', 'FanControl.Enums.AirflowDirectionEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('Step', {0x0: ('direction', 'FanControl.Enums.StepDirectionEnum', 0), 0x1: ('wrap', 'bool', 4), 0x2: ('lowestOff', 'bool', 4)}),
+        },
+        {
+        },
+    ),
+    0x00000204: (
+        'ThermostatUserInterfaceConfiguration',
+        {
+            0x00000000: ('TemperatureDisplayMode', 'temperatureDisplayMode', 'ThermostatUserInterfaceConfiguration.Enums.TemperatureDisplayModeEnum', 0),
+            0x00000001: ('KeypadLockout', 'keypadLockout', 'ThermostatUserInterfaceConfiguration.Enums.KeypadLockoutEnum', 0),
+            0x00000002: ('ScheduleProgrammingVisibility', 'scheduleProgrammingVisibility', 'ThermostatUserInterfaceConfiguration.Enums.ScheduleProgrammingVisibilityEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000300: (
+        'ColorControl',
+        {
+            0x00000000: ('CurrentHue', 'currentHue', 'uint', 4),
+            0x00000001: ('CurrentSaturation', 'currentSaturation', 'uint', 4),
+            0x00000002: ('RemainingTime', 'remainingTime', 'uint', 4),
+            0x00000003: ('CurrentX', 'currentX', 'uint', 4),
+            0x00000004: ('CurrentY', 'currentY', 'uint', 4),
+            0x00000005: ('DriftCompensation', 'driftCompensation', 'ColorControl.Enums.DriftCompensationEnum', 4),
+            0x00000006: ('CompensationText', 'compensationText', 'str', 4),
+            0x00000007: ('ColorTemperatureMireds', 'colorTemperatureMireds', 'uint', 4),
+            0x00000008: ('ColorMode', 'colorMode', 'ColorControl.Enums.ColorModeEnum', 0),
+            0x0000000F: ('Options', 'options', 'ColorControl.Bitmaps.OptionsBitmap', 0),
+            0x00000010: ('NumberOfPrimaries', 'numberOfPrimaries', 'uint', 2),
+            0x00000011: ('Primary1X', 'primary1X', 'uint', 4),
+            0x00000012: ('Primary1Y', 'primary1Y', 'uint', 4),
+            0x00000013: ('Primary1Intensity', 'primary1Intensity', 'uint', 6),
+            0x00000015: ('Primary2X', 'primary2X', 'uint', 4),
+            0x00000016: ('Primary2Y', 'primary2Y', 'uint', 4),
+            0x00000017: ('Primary2Intensity', 'primary2Intensity', 'uint', 6),
+            0x00000019: ('Primary3X', 'primary3X', 'uint', 4),
+            0x0000001A: ('Primary3Y', 'primary3Y', 'uint', 4),
+            0x0000001B: ('Primary3Intensity', 'primary3Intensity', 'uint', 6),
+            0x00000020: ('Primary4X', 'primary4X', 'uint', 4),
+            0x00000021: ('Primary4Y', 'primary4Y', 'uint', 4),
+            0x00000022: ('Primary4Intensity', 'primary4Intensity', 'uint', 6),
+            0x00000024: ('Primary5X', 'primary5X', 'uint', 4),
+            0x00000025: ('Primary5Y', 'primary5Y', 'uint', 4),
+            0x00000026: ('Primary5Intensity', 'primary5Intensity', 'uint', 6),
+            0x00000028: ('Primary6X', 'primary6X', 'uint', 4),
+            0x00000029: ('Primary6Y', 'primary6Y', 'uint', 4),
+            0x0000002A: ('Primary6Intensity', 'primary6Intensity', 'uint', 6),
+            0x00000030: ('WhitePointX', 'whitePointX', 'uint', 4),
+            0x00000031: ('WhitePointY', 'whitePointY', 'uint', 4),
+            0x00000032: ('ColorPointRX', 'colorPointRX', 'uint', 4),
+            0x00000033: ('ColorPointRY', 'colorPointRY', 'uint', 4),
+            0x00000034: ('ColorPointRIntensity', 'colorPointRIntensity', 'uint', 6),
+            0x00000036: ('ColorPointGX', 'colorPointGX', 'uint', 4),
+            0x00000037: ('ColorPointGY', 'colorPointGY', 'uint', 4),
+            0x00000038: ('ColorPointGIntensity', 'colorPointGIntensity', 'uint', 6),
+            0x0000003A: ('ColorPointBX', 'colorPointBX', 'uint', 4),
+            0x0000003B: ('ColorPointBY', 'colorPointBY', 'uint', 4),
+            0x0000003C: ('ColorPointBIntensity', 'colorPointBIntensity', 'uint', 6),
+            0x00004000: ('EnhancedCurrentHue', 'enhancedCurrentHue', 'uint', 4),
+            0x00004001: ('EnhancedColorMode', 'enhancedColorMode', 'ColorControl.Enums.EnhancedColorModeEnum', 0),
+            0x00004002: ('ColorLoopActive', 'colorLoopActive', 'Globals.Enums.enum8', 4),
+            0x00004003: ('ColorLoopDirection', 'colorLoopDirection', 'ColorControl.Enums.ColorLoopDirectionEnum', 4),
+            0x00004004: ('ColorLoopTime', 'colorLoopTime', 'uint', 4),
+            0x00004005: ('ColorLoopStartEnhancedHue', 'colorLoopStartEnhancedHue', 'uint', 4),
+            0x00004006: ('ColorLoopStoredEnhancedHue', 'colorLoopStoredEnhancedHue', 'uint', 4),
+            0x0000400A: ('ColorCapabilities', 'colorCapabilities', 'ColorControl.Bitmaps.ColorCapabilitiesBitmap', 0),
+            0x0000400B: ('ColorTempPhysicalMinMireds', 'colorTempPhysicalMinMireds', 'uint', 4),
+            0x0000400C: ('ColorTempPhysicalMaxMireds', 'colorTempPhysicalMaxMireds', 'uint', 4),
+            0x0000400D: ('CoupleColorTempToLevelMinMireds', 'coupleColorTempToLevelMinMireds', 'uint', 4),
+            0x00004010: ('StartUpColorTemperatureMireds', 'startUpColorTemperatureMireds', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('MoveToHue', {0x0: ('hue', 'uint', 0), 0x1: ('direction', 'ColorControl.Enums.DirectionEnum', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000001: ('MoveHue', {0x0: ('moveMode', 'ColorControl.Enums.MoveModeEnum', 0), 0x1: ('rate', 'uint', 0), 0x2: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000002: ('StepHue', {0x0: ('stepMode', 'ColorControl.Enums.StepModeEnum', 0), 0x1: ('stepSize', 'uint', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000003: ('MoveToSaturation', {0x0: ('saturation', 'uint', 0), 0x1: ('transitionTime', 'uint', 0), 0x2: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000004: ('MoveSaturation', {0x0: ('moveMode', 'ColorControl.Enums.MoveModeEnum', 0), 0x1: ('rate', 'uint', 0), 0x2: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000005: ('StepSaturation', {0x0: ('stepMode', 'ColorControl.Enums.StepModeEnum', 0), 0x1: ('stepSize', 'uint', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000006: ('MoveToHueAndSaturation', {0x0: ('hue', 'uint', 0), 0x1: ('saturation', 'uint', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000007: ('MoveToColor', {0x0: ('colorX', 'uint', 0), 0x1: ('colorY', 'uint', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000008: ('MoveColor', {0x0: ('rateX', 'int', 0), 0x1: ('rateY', 'int', 0), 0x2: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000009: ('StepColor', {0x0: ('stepX', 'int', 0), 0x1: ('stepY', 'int', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x0000000A: ('MoveToColorTemperature', {0x0: ('colorTemperatureMireds', 'uint', 0), 0x1: ('transitionTime', 'uint', 0), 0x2: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000040: ('EnhancedMoveToHue', {0x0: ('enhancedHue', 'uint', 0), 0x1: ('direction', 'ColorControl.Enums.DirectionEnum', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000041: ('EnhancedMoveHue', {0x0: ('moveMode', 'ColorControl.Enums.MoveModeEnum', 0), 0x1: ('rate', 'uint', 0), 0x2: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x3: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000042: ('EnhancedStepHue', {0x0: ('stepMode', 'ColorControl.Enums.StepModeEnum', 0), 0x1: ('stepSize', 'uint', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000043: ('EnhancedMoveToHueAndSaturation', {0x0: ('enhancedHue', 'uint', 0), 0x1: ('saturation', 'uint', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x4: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000044: ('ColorLoopSet', {0x0: ('updateFlags', 'ColorControl.Bitmaps.UpdateFlagsBitmap', 0), 0x1: ('action', 'ColorControl.Enums.ColorLoopActionEnum', 0), 0x2: ('direction', 'ColorControl.Enums.ColorLoopDirectionEnum', 0), 0x3: ('time', 'uint', 0), 0x4: ('startHue', 'uint', 0), 0x5: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x6: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x00000047: ('StopMoveStep', {0x0: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x1: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x0000004B: ('MoveColorTemperature', {0x0: ('moveMode', 'ColorControl.Enums.MoveModeEnum', 0), 0x1: ('rate', 'uint', 0), 0x2: ('colorTemperatureMinimumMireds', 'uint', 0), 0x3: ('colorTemperatureMaximumMireds', 'uint', 0), 0x4: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x5: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+            0x0000004C: ('StepColorTemperature', {0x0: ('stepMode', 'ColorControl.Enums.StepModeEnum', 0), 0x1: ('stepSize', 'uint', 0), 0x2: ('transitionTime', 'uint', 0), 0x3: ('colorTemperatureMinimumMireds', 'uint', 0), 0x4: ('colorTemperatureMaximumMireds', 'uint', 0), 0x5: ('optionsMask', 'ColorControl.Bitmaps.OptionsBitmap', 0), 0x6: ('optionsOverride', 'ColorControl.Bitmaps.OptionsBitmap', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000400: (
+        'IlluminanceMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'uint', 2),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'uint', 2),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'uint', 2),
+            0x00000003: ('Tolerance', 'tolerance', 'uint', 4),
+            0x00000004: ('LightSensorType', 'lightSensorType', 'uint', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000402: (
+        'TemperatureMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'int', 2),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'int', 2),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'int', 2),
+            0x00000003: ('Tolerance', 'tolerance', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000403: (
+        'PressureMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'int', 2),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'int', 2),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'int', 2),
+            0x00000003: ('Tolerance', 'tolerance', 'uint', 4),
+            0x00000010: ('ScaledValue', 'scaledValue', 'int', 6),
+            0x00000011: ('MinScaledValue', 'minScaledValue', 'int', 6),
+            0x00000012: ('MaxScaledValue', 'maxScaledValue', 'int', 6),
+            0x00000013: ('ScaledTolerance', 'scaledTolerance', 'uint', 4),
+            0x00000014: ('Scale', 'scale', 'int', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000404: (
+        'FlowMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'uint', 2),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'uint', 2),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'uint', 2),
+            0x00000003: ('Tolerance', 'tolerance', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000405: (
+        'RelativeHumidityMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'uint', 2),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'uint', 2),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'uint', 2),
+            0x00000003: ('Tolerance', 'tolerance', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000406: (
+        'OccupancySensing',
+        {
+            0x00000000: ('Occupancy', 'occupancy', 'OccupancySensing.Bitmaps.OccupancyBitmap', 0),
+            0x00000001: ('OccupancySensorType', 'occupancySensorType', 'OccupancySensing.Enums.OccupancySensorTypeEnum', 0),
+            0x00000002: ('OccupancySensorTypeBitmap', 'occupancySensorTypeBitmap', 'OccupancySensing.Bitmaps.OccupancySensorTypeBitmap', 0),
+            0x00000003: ('HoldTime', 'holdTime', 'uint', 4),
+            0x00000004: ('HoldTimeLimits', 'holdTimeLimits', 'OccupancySensing.Structs.HoldTimeLimitsStruct', 4),
+            0x00000010: ('PIROccupiedToUnoccupiedDelay', 'PIROccupiedToUnoccupiedDelay', 'uint', 4),
+            0x00000011: ('PIRUnoccupiedToOccupiedDelay', 'PIRUnoccupiedToOccupiedDelay', 'uint', 4),
+            0x00000012: ('PIRUnoccupiedToOccupiedThreshold', 'PIRUnoccupiedToOccupiedThreshold', 'uint', 4),
+            0x00000020: ('UltrasonicOccupiedToUnoccupiedDelay', 'ultrasonicOccupiedToUnoccupiedDelay', 'uint', 4),
+            0x00000021: ('UltrasonicUnoccupiedToOccupiedDelay', 'ultrasonicUnoccupiedToOccupiedDelay', 'uint', 4),
+            0x00000022: ('UltrasonicUnoccupiedToOccupiedThreshold', 'ultrasonicUnoccupiedToOccupiedThreshold', 'uint', 4),
+            0x00000030: ('PhysicalContactOccupiedToUnoccupiedDelay', 'physicalContactOccupiedToUnoccupiedDelay', 'uint', 4),
+            0x00000031: ('PhysicalContactUnoccupiedToOccupiedDelay', 'physicalContactUnoccupiedToOccupiedDelay', 'uint', 4),
+            0x00000032: ('PhysicalContactUnoccupiedToOccupiedThreshold', 'physicalContactUnoccupiedToOccupiedThreshold', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('OccupancyChanged', {0x0: ('occupancy', 'OccupancySensing.Bitmaps.OccupancyBitmap', 0)}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000040C: (
+        'CarbonMonoxideConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'CarbonMonoxideConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'CarbonMonoxideConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'CarbonMonoxideConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000040D: (
+        'CarbonDioxideConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'CarbonDioxideConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'CarbonDioxideConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'CarbonDioxideConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000413: (
+        'NitrogenDioxideConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'NitrogenDioxideConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'NitrogenDioxideConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'NitrogenDioxideConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000415: (
+        'OzoneConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'OzoneConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'OzoneConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'OzoneConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000042A: (
+        'Pm25ConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'Pm25ConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'Pm25ConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'Pm25ConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000042B: (
+        'FormaldehydeConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'FormaldehydeConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'FormaldehydeConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'FormaldehydeConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000042C: (
+        'Pm1ConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'Pm1ConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'Pm1ConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'Pm1ConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000042D: (
+        'Pm10ConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'Pm10ConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'Pm10ConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'Pm10ConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000042E: (
+        'TotalVolatileOrganicCompoundsConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'TotalVolatileOrganicCompoundsConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'TotalVolatileOrganicCompoundsConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'TotalVolatileOrganicCompoundsConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000042F: (
+        'RadonConcentrationMeasurement',
+        {
+            0x00000000: ('MeasuredValue', 'measuredValue', 'float32', 6),
+            0x00000001: ('MinMeasuredValue', 'minMeasuredValue', 'float32', 6),
+            0x00000002: ('MaxMeasuredValue', 'maxMeasuredValue', 'float32', 6),
+            0x00000003: ('PeakMeasuredValue', 'peakMeasuredValue', 'float32', 6),
+            0x00000004: ('PeakMeasuredValueWindow', 'peakMeasuredValueWindow', 'uint', 4),
+            0x00000005: ('AverageMeasuredValue', 'averageMeasuredValue', 'float32', 6),
+            0x00000006: ('AverageMeasuredValueWindow', 'averageMeasuredValueWindow', 'uint', 4),
+            0x00000007: ('Uncertainty', 'uncertainty', 'float32', 4),
+            0x00000008: ('MeasurementUnit', 'measurementUnit', 'RadonConcentrationMeasurement.Enums.MeasurementUnitEnum', 4),
+            0x00000009: ('MeasurementMedium', 'measurementMedium', 'RadonConcentrationMeasurement.Enums.MeasurementMediumEnum', 0),
+            0x0000000A: ('LevelValue', 'levelValue', 'RadonConcentrationMeasurement.Enums.LevelValueEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000430: (
+        'SoilMeasurement',
+        {
+            0x00000000: ('SoilMoistureMeasurementLimits', 'soilMoistureMeasurementLimits', 'Globals.Structs.MeasurementAccuracyStruct', 0),
+            0x00000001: ('SoilMoistureMeasuredValue', 'soilMoistureMeasuredValue', 'uint', 2),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000431: (
+        'AmbientContextSensing',
+        {
+            0x00000000: ('HumanActivityDetected', 'humanActivityDetected', 'bool', 4),
+            0x00000001: ('ObjectIdentified', 'objectIdentified', 'bool', 4),
+            0x00000002: ('AudioContextDetected', 'audioContextDetected', 'bool', 4),
+            0x00000003: ('AmbientContextType', 'ambientContextType', 'AmbientContextSensing.Structs.AmbientContextTypeStruct', 5),
+            0x00000004: ('AmbientContextTypeSupported', 'ambientContextTypeSupported', 'ModeSelect.Structs.SemanticTagStruct', 5),
+            0x00000005: ('ObjectCountReached', 'objectCountReached', 'bool', 4),
+            0x00000006: ('ObjectCountConfig', 'objectCountConfig', 'AmbientContextSensing.Structs.ObjectCountConfigStruct', 4),
+            0x00000007: ('ObjectCount', 'objectCount', 'uint', 4),
+            0x00000008: ('SimultaneousDetectionLimit', 'simultaneousDetectionLimit', 'uint', 4),
+            0x00000009: ('HoldTime', 'holdTime', 'uint', 4),
+            0x0000000A: ('HoldTimeLimits', 'holdTimeLimits', 'AmbientContextSensing.Structs.HoldTimeLimitsStruct', 4),
+            0x0000000B: ('PredictedActivity', 'predictedActivity', 'AmbientContextSensing.Structs.PredictedActivityStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('AmbientContextDetectStarted', {0x0: ('ambientContextDetected', 'AmbientContextSensing.Structs.AmbientContextTypeStruct', 4), 0x1: ('objectCountReached', 'bool', 4), 0x2: ('objectCount', 'uint', 4)}),
+            0x00000001: ('AmbientContextDetectEnded', {0x0: ('eventStartTime', 'uint', 4)}),
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000451: (
+        'WiFiNetworkManagement',
+        {
+            0x00000000: ('Ssid', 'ssid', 'bytes', 2),
+            0x00000001: ('PassphraseSurrogate', 'passphraseSurrogate', 'uint', 2),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('NetworkPassphraseRequest', {}),
+        },
+        {
+            0x00000001: ('NetworkPassphraseResponse', {0x0: ('passphrase', 'bytes', 0)}),
+        },
+    ),
+    0x00000452: (
+        'ThreadBorderRouterManagement',
+        {
+            0x00000000: ('BorderRouterName', 'borderRouterName', 'str', 0),
+            0x00000001: ('BorderAgentID', 'borderAgentID', 'bytes', 0),
+            0x00000002: ('ThreadVersion', 'threadVersion', 'uint', 0),
+            0x00000003: ('InterfaceEnabled', 'interfaceEnabled', 'bool', 0),
+            0x00000004: ('ActiveDatasetTimestamp', 'activeDatasetTimestamp', 'uint', 2),
+            0x00000005: ('PendingDatasetTimestamp', 'pendingDatasetTimestamp', 'uint', 2),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('GetActiveDatasetRequest', {}),
+            0x00000001: ('GetPendingDatasetRequest', {}),
+            0x00000003: ('SetActiveDatasetRequest', {0x0: ('activeDataset', 'bytes', 0), 0x1: ('breadcrumb', 'uint', 4)}),
+            0x00000004: ('SetPendingDatasetRequest', {0x0: ('pendingDataset', 'bytes', 0)}),
+        },
+        {
+            0x00000002: ('DatasetResponse', {0x0: ('dataset', 'bytes', 0)}),
+        },
+    ),
+    0x00000453: (
+        'ThreadNetworkDirectory',
+        {
+            0x00000000: ('PreferredExtendedPanID', 'preferredExtendedPanID', 'bytes', 2),
+            0x00000001: ('ThreadNetworks', 'threadNetworks', 'ThreadNetworkDirectory.Structs.ThreadNetworkStruct', 1),
+            0x00000002: ('ThreadNetworkTableSize', 'threadNetworkTableSize', 'uint', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('AddNetwork', {0x0: ('operationalDataset', 'bytes', 0)}),
+            0x00000001: ('RemoveNetwork', {0x0: ('extendedPanId', 'bytes', 0)}),
+            0x00000002: ('GetOperationalDataset', {0x0: ('extendedPanId', 'bytes', 0)}),
+        },
+        {
+            0x00000003: ('OperationalDatasetResponse', {0x0: ('operationalDataset', 'bytes', 0)}),
+        },
+    ),
+    0x00000503: (
+        'WakeOnLan',
+        {
+            0x00000000: ('MACAddress', 'MACAddress', 'str', 4),
+            0x00000001: ('LinkLocalAddress', 'linkLocalAddress', 'bytes', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000504: (
+        'Channel',
+        {
+            0x00000000: ('ChannelList', 'channelList', 'Channel.Structs.ChannelInfoStruct', 5),
+            0x00000001: ('Lineup', 'lineup', 'Channel.Structs.LineupInfoStruct', 6),
+            0x00000002: ('CurrentChannel', 'currentChannel', 'Channel.Structs.ChannelInfoStruct', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ChangeChannel', {0x0: ('match', 'str', 0)}),
+            0x00000002: ('ChangeChannelByNumber', {0x0: ('majorNumber', 'uint', 0), 0x1: ('minorNumber', 'uint', 0)}),
+            0x00000003: ('SkipChannel', {0x0: ('count', 'int', 0)}),
+            0x00000004: ('GetProgramGuide', {0x0: ('startTime', 'uint', 0), 0x1: ('endTime', 'uint', 0), 0x2: ('channelList', 'Channel.Structs.ChannelInfoStruct', 5), 0x3: ('pageToken', 'Channel.Structs.PageTokenStruct', 6), 0x5: ('recordingFlag', 'Channel.Bitmaps.RecordingFlagBitmap', 6), 0x6: ('externalIDList', 'ContentLauncher.Structs.AdditionalInfoStruct', 5), 0x7: ('data', 'bytes', 4)}),
+            0x00000006: ('RecordProgram', {0x0: ('programIdentifier', 'str', 0), 0x1: ('shouldRecordSeries', 'bool', 0), 0x2: ('externalIDList', 'ContentLauncher.Structs.AdditionalInfoStruct', 5), 0x3: ('data', 'bytes', 4)}),
+            0x00000007: ('CancelRecordProgram', {0x0: ('programIdentifier', 'str', 0), 0x1: ('shouldRecordSeries', 'bool', 0), 0x2: ('externalIDList', 'ContentLauncher.Structs.AdditionalInfoStruct', 5), 0x3: ('data', 'bytes', 4)}),
+        },
+        {
+            0x00000001: ('ChangeChannelResponse', {0x0: ('status', 'Channel.Enums.StatusEnum', 0), 0x1: ('data', 'str', 4)}),
+            0x00000005: ('ProgramGuideResponse', {0x0: ('paging', 'Channel.Structs.ChannelPagingStruct', 0), 0x1: ('programList', 'Channel.Structs.ProgramStruct', 1)}),
+        },
+    ),
+    0x00000505: (
+        'TargetNavigator',
+        {
+            0x00000000: ('TargetList', 'targetList', 'TargetNavigator.Structs.TargetInfoStruct', 1),
+            0x00000001: ('CurrentTarget', 'currentTarget', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('TargetUpdated', {0x0: ('targetList', 'TargetNavigator.Structs.TargetInfoStruct', 5), 0x1: ('currentTarget', 'uint', 4), 0x2: ('data', 'bytes', 4)}),
+        },
+        {
+            0x00000000: ('NavigateTarget', {0x0: ('target', 'uint', 0), 0x1: ('data', 'str', 4)}),
+        },
+        {
+            0x00000001: ('NavigateTargetResponse', {0x0: ('status', 'TargetNavigator.Enums.StatusEnum', 0), 0x1: ('data', 'str', 4)}),
+        },
+    ),
+    0x00000506: (
+        'MediaPlayback',
+        {
+            0x00000000: ('CurrentState', 'currentState', 'MediaPlayback.Enums.PlaybackStateEnum', 0),
+            0x00000001: ('StartTime', 'startTime', 'uint', 6),
+            0x00000002: ('Duration', 'duration', 'uint', 6),
+            0x00000003: ('SampledPosition', 'sampledPosition', 'MediaPlayback.Structs.PlaybackPositionStruct', 6),
+            0x00000004: ('PlaybackSpeed', 'playbackSpeed', 'float32', 4),
+            0x00000005: ('SeekRangeEnd', 'seekRangeEnd', 'uint', 6),
+            0x00000006: ('SeekRangeStart', 'seekRangeStart', 'uint', 6),
+            0x00000007: ('ActiveAudioTrack', 'activeAudioTrack', 'MediaPlayback.Structs.TrackStruct', 6),
+            0x00000008: ('AvailableAudioTracks', 'availableAudioTracks', 'MediaPlayback.Structs.TrackStruct', 7),
+            0x00000009: ('ActiveTextTrack', 'activeTextTrack', 'MediaPlayback.Structs.TrackStruct', 6),
+            0x0000000A: ('AvailableTextTracks', 'availableTextTracks', 'MediaPlayback.Structs.TrackStruct', 7),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('StateChanged', {0x0: ('currentState', 'MediaPlayback.Enums.PlaybackStateEnum', 0), 0x1: ('startTime', 'uint', 4), 0x2: ('duration', 'uint', 4), 0x3: ('sampledPosition', 'MediaPlayback.Structs.PlaybackPositionStruct', 4), 0x4: ('playbackSpeed', 'float32', 4), 0x5: ('seekRangeEnd', 'uint', 4), 0x6: ('seekRangeStart', 'uint', 4), 0x7: ('data', 'bytes', 4), 0x8: ('audioAdvanceUnmuted', 'bool', 4)}),
+        },
+        {
+            0x00000000: ('Play', {}),
+            0x00000001: ('Pause', {}),
+            0x00000002: ('Stop', {}),
+            0x00000003: ('StartOver', {}),
+            0x00000004: ('Previous', {}),
+            0x00000005: ('Next', {}),
+            0x00000006: ('Rewind', {0x0: ('audioAdvanceUnmuted', 'bool', 4)}),
+            0x00000007: ('FastForward', {0x0: ('audioAdvanceUnmuted', 'bool', 4)}),
+            0x00000008: ('SkipForward', {0x0: ('deltaPositionMilliseconds', 'uint', 0)}),
+            0x00000009: ('SkipBackward', {0x0: ('deltaPositionMilliseconds', 'uint', 0)}),
+            0x0000000B: ('Seek', {0x0: ('position', 'uint', 0)}),
+            0x0000000C: ('ActivateAudioTrack', {0x0: ('trackID', 'str', 0), 0x1: ('audioOutputIndex', 'uint', 6)}),
+            0x0000000D: ('ActivateTextTrack', {0x0: ('trackID', 'str', 0)}),
+            0x0000000E: ('DeactivateTextTrack', {}),
+        },
+        {
+            0x0000000A: ('PlaybackResponse', {0x0: ('status', 'MediaPlayback.Enums.StatusEnum', 0), 0x1: ('data', 'str', 4)}),
+        },
+    ),
+    0x00000507: (
+        'MediaInput',
+        {
+            0x00000000: ('InputList', 'inputList', 'MediaInput.Structs.InputInfoStruct', 1),
+            0x00000001: ('CurrentInput', 'currentInput', 'uint', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('SelectInput', {0x0: ('index', 'uint', 0)}),
+            0x00000001: ('ShowInputStatus', {}),
+            0x00000002: ('HideInputStatus', {}),
+            0x00000003: ('RenameInput', {0x0: ('index', 'uint', 0), 0x1: ('name', 'str', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000508: (
+        'LowPower',
+        {
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('Sleep', {}),
+        },
+        {
+        },
+    ),
+    0x00000509: (
+        'KeypadInput',
+        {
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('SendKey', {0x0: ('keyCode', 'KeypadInput.Enums.CECKeyCodeEnum', 0)}),
+        },
+        {
+            0x00000001: ('SendKeyResponse', {0x0: ('status', 'KeypadInput.Enums.StatusEnum', 0)}),
+        },
+    ),
+    0x0000050A: (
+        'ContentLauncher',
+        {
+            0x00000000: ('AcceptHeader', 'acceptHeader', 'str', 5),
+            0x00000001: ('SupportedStreamingProtocols', 'supportedStreamingProtocols', 'ContentLauncher.Bitmaps.SupportedProtocolsBitmap', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('LaunchContent', {0x0: ('search', 'ContentLauncher.Structs.ContentSearchStruct', 0), 0x1: ('autoPlay', 'bool', 0), 0x2: ('data', 'str', 4), 0x3: ('playbackPreferences', 'ContentLauncher.Structs.PlaybackPreferencesStruct', 4), 0x4: ('useCurrentContext', 'bool', 4)}),
+            0x00000001: ('LaunchURL', {0x0: ('contentURL', 'str', 0), 0x1: ('displayString', 'str', 4), 0x2: ('brandingInformation', 'ContentLauncher.Structs.BrandingInformationStruct', 4), 0x3: ('playbackPreferences', 'ContentLauncher.Structs.PlaybackPreferencesStruct', 4)}),
+        },
+        {
+            0x00000002: ('LauncherResponse', {0x0: ('status', 'ContentLauncher.Enums.StatusEnum', 0), 0x1: ('data', 'str', 4)}),
+        },
+    ),
+    0x0000050B: (
+        'AudioOutput',
+        {
+            0x00000000: ('OutputList', 'outputList', 'AudioOutput.Structs.OutputInfoStruct', 1),
+            0x00000001: ('CurrentOutput', 'currentOutput', 'uint', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('SelectOutput', {0x0: ('index', 'uint', 0)}),
+            0x00000001: ('RenameOutput', {0x0: ('index', 'uint', 0), 0x1: ('name', 'str', 0)}),
+        },
+        {
+        },
+    ),
+    0x0000050C: (
+        'ApplicationLauncher',
+        {
+            0x00000000: ('CatalogList', 'catalogList', 'uint', 5),
+            0x00000001: ('CurrentApp', 'currentApp', 'ApplicationLauncher.Structs.ApplicationEPStruct', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('LaunchApp', {0x0: ('application', 'ApplicationLauncher.Structs.ApplicationStruct', 4), 0x1: ('data', 'bytes', 4)}),
+            0x00000001: ('StopApp', {0x0: ('application', 'ApplicationLauncher.Structs.ApplicationStruct', 4)}),
+            0x00000002: ('HideApp', {0x0: ('application', 'ApplicationLauncher.Structs.ApplicationStruct', 4)}),
+        },
+        {
+            0x00000003: ('LauncherResponse', {0x0: ('status', 'ApplicationLauncher.Enums.StatusEnum', 0), 0x1: ('data', 'bytes', 4)}),
+        },
+    ),
+    0x0000050D: (
+        'ApplicationBasic',
+        {
+            0x00000000: ('VendorName', 'vendorName', 'str', 4),
+            0x00000001: ('VendorID', 'vendorID', 'uint', 4),
+            0x00000002: ('ApplicationName', 'applicationName', 'str', 0),
+            0x00000003: ('ProductID', 'productID', 'uint', 4),
+            0x00000004: ('Application', 'application', 'ApplicationBasic.Structs.ApplicationStruct', 0),
+            0x00000005: ('Status', 'status', 'ApplicationBasic.Enums.ApplicationStatusEnum', 0),
+            0x00000006: ('ApplicationVersion', 'applicationVersion', 'str', 0),
+            0x00000007: ('AllowedVendorList', 'allowedVendorList', 'uint', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x0000050E: (
+        'AccountLogin',
+        {
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('LoggedOut', {0x0: ('node', 'uint', 4)}),
+        },
+        {
+            0x00000000: ('GetSetupPIN', {0x0: ('tempAccountIdentifier', 'str', 0)}),
+            0x00000002: ('Login', {0x0: ('tempAccountIdentifier', 'str', 0), 0x1: ('setupPIN', 'str', 0), 0x2: ('node', 'uint', 4)}),
+            0x00000003: ('Logout', {0x0: ('node', 'uint', 4)}),
+        },
+        {
+            0x00000001: ('GetSetupPINResponse', {0x0: ('setupPIN', 'str', 0)}),
+        },
+    ),
+    0x0000050F: (
+        'ContentControl',
+        {
+            0x00000000: ('Enabled', 'enabled', 'bool', 0),
+            0x00000001: ('OnDemandRatings', 'onDemandRatings', 'ContentControl.Structs.RatingNameStruct', 5),
+            0x00000002: ('OnDemandRatingThreshold', 'onDemandRatingThreshold', 'str', 4),
+            0x00000003: ('ScheduledContentRatings', 'scheduledContentRatings', 'ContentControl.Structs.RatingNameStruct', 5),
+            0x00000004: ('ScheduledContentRatingThreshold', 'scheduledContentRatingThreshold', 'str', 4),
+            0x00000005: ('ScreenDailyTime', 'screenDailyTime', 'uint', 4),
+            0x00000006: ('RemainingScreenTime', 'remainingScreenTime', 'uint', 4),
+            0x00000007: ('BlockUnrated', 'blockUnrated', 'bool', 4),
+            0x00000008: ('BlockChannelList', 'blockChannelList', 'ContentControl.Structs.BlockChannelStruct', 5),
+            0x00000009: ('BlockApplicationList', 'blockApplicationList', 'ContentControl.Structs.AppInfoStruct', 5),
+            0x0000000A: ('BlockContentTimeWindow', 'blockContentTimeWindow', 'ContentControl.Structs.TimeWindowStruct', 5),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('RemainingScreenTimeExpired', {}),
+            0x00000001: ('EnteringBlockContentTimeWindow', {}),
+        },
+        {
+            0x00000000: ('UpdatePIN', {0x0: ('oldPIN', 'str', 0), 0x1: ('newPIN', 'str', 0)}),
+            0x00000001: ('ResetPIN', {}),
+            0x00000003: ('Enable', {}),
+            0x00000004: ('Disable', {}),
+            0x00000005: ('AddBonusTime', {0x0: ('PINCode', 'str', 4), 0x1: ('bonusTime', 'uint', 0)}),
+            0x00000006: ('SetScreenDailyTime', {0x0: ('screenTime', 'uint', 0)}),
+            0x00000007: ('BlockUnratedContent', {}),
+            0x00000008: ('UnblockUnratedContent', {}),
+            0x00000009: ('SetOnDemandRatingThreshold', {0x0: ('rating', 'str', 0)}),
+            0x0000000A: ('SetScheduledContentRatingThreshold', {0x0: ('rating', 'str', 0)}),
+            0x0000000B: ('AddBlockChannels', {0x0: ('channels', 'ContentControl.Structs.BlockChannelStruct', 1)}),
+            0x0000000C: ('RemoveBlockChannels', {0x0: ('channelIndexes', 'uint', 1)}),
+            0x0000000D: ('AddBlockApplications', {0x0: ('applications', 'ContentControl.Structs.AppInfoStruct', 1)}),
+            0x0000000E: ('RemoveBlockApplications', {0x0: ('applications', 'ContentControl.Structs.AppInfoStruct', 1)}),
+            0x0000000F: ('SetBlockContentTimeWindow', {0x0: ('timeWindow', 'ContentControl.Structs.TimeWindowStruct', 0)}),
+            0x00000010: ('RemoveBlockContentTimeWindow', {0x0: ('timeWindowIndexes', 'uint', 1)}),
+        },
+        {
+            0x00000002: ('ResetPINResponse', {0x0: ('PINCode', 'str', 0)}),
+        },
+    ),
+    0x00000510: (
+        'ContentAppObserver',
+        {
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ContentAppMessage', {0x0: ('data', 'str', 0), 0x1: ('encodingHint', 'str', 4)}),
+        },
+        {
+            0x00000001: ('ContentAppMessageResponse', {0x0: ('status', 'ContentAppObserver.Enums.StatusEnum', 0), 0x1: ('data', 'str', 4), 0x2: ('encodingHint', 'str', 4)}),
+        },
+    ),
+    0x00000550: (
+        'ZoneManagement',
+        {
+            0x00000000: ('MaxUserDefinedZones', 'maxUserDefinedZones', 'uint', 4),
+            0x00000001: ('MaxZones', 'maxZones', 'uint', 0),
+            0x00000002: ('Zones', 'zones', 'ZoneManagement.Structs.ZoneInformationStruct', 1),
+            0x00000003: ('Triggers', 'triggers', 'ZoneManagement.Structs.ZoneTriggerControlStruct', 1),
+            0x00000004: ('SensitivityMax', 'sensitivityMax', 'uint', 0),
+            0x00000005: ('Sensitivity', 'sensitivity', 'uint', 4),
+            0x00000006: ('TwoDCartesianMax', 'twoDCartesianMax', 'ZoneManagement.Structs.TwoDCartesianVertexStruct', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('ZoneTriggered', {0x0: ('zone', 'uint', 0), 0x1: ('reason', 'ZoneManagement.Enums.ZoneEventTriggeredReasonEnum', 0)}),
+            0x00000001: ('ZoneStopped', {0x0: ('zone', 'uint', 0), 0x1: ('reason', 'ZoneManagement.Enums.ZoneEventStoppedReasonEnum', 0)}),
+        },
+        {
+            0x00000000: ('CreateTwoDCartesianZone', {0x0: ('zone', 'ZoneManagement.Structs.TwoDCartesianZoneStruct', 0)}),
+            0x00000002: ('UpdateTwoDCartesianZone', {0x0: ('zoneID', 'uint', 0), 0x1: ('zone', 'ZoneManagement.Structs.TwoDCartesianZoneStruct', 0)}),
+            0x00000003: ('RemoveZone', {0x0: ('zoneID', 'uint', 0)}),
+            0x00000004: ('CreateOrUpdateTrigger', {0x0: ('trigger', 'ZoneManagement.Structs.ZoneTriggerControlStruct', 0)}),
+            0x00000005: ('RemoveTrigger', {0x0: ('zoneID', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('CreateTwoDCartesianZoneResponse', {0x0: ('zoneID', 'uint', 0)}),
+        },
+    ),
+    0x00000551: (
+        'CameraAvStreamManagement',
+        {
+            0x00000000: ('MaxConcurrentEncoders', 'maxConcurrentEncoders', 'uint', 4),
+            0x00000001: ('MaxEncodedPixelRate', 'maxEncodedPixelRate', 'uint', 4),
+            0x00000002: ('VideoSensorParams', 'videoSensorParams', 'CameraAvStreamManagement.Structs.VideoSensorParamsStruct', 4),
+            0x00000003: ('NightVisionUsesInfrared', 'nightVisionUsesInfrared', 'bool', 4),
+            0x00000004: ('MinViewportResolution', 'minViewportResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 4),
+            0x00000005: ('RateDistortionTradeOffPoints', 'rateDistortionTradeOffPoints', 'CameraAvStreamManagement.Structs.RateDistortionTradeOffPointsStruct', 5),
+            0x00000006: ('MaxContentBufferSize', 'maxContentBufferSize', 'uint', 0),
+            0x00000007: ('MicrophoneCapabilities', 'microphoneCapabilities', 'CameraAvStreamManagement.Structs.AudioCapabilitiesStruct', 4),
+            0x00000008: ('SpeakerCapabilities', 'speakerCapabilities', 'CameraAvStreamManagement.Structs.AudioCapabilitiesStruct', 4),
+            0x00000009: ('TwoWayTalkSupport', 'twoWayTalkSupport', 'CameraAvStreamManagement.Enums.TwoWayTalkSupportTypeEnum', 4),
+            0x0000000A: ('SnapshotCapabilities', 'snapshotCapabilities', 'CameraAvStreamManagement.Structs.SnapshotCapabilitiesStruct', 5),
+            0x0000000B: ('MaxNetworkBandwidth', 'maxNetworkBandwidth', 'uint', 0),
+            0x0000000C: ('CurrentFrameRate', 'currentFrameRate', 'uint', 4),
+            0x0000000D: ('HdrModeEnabled', 'hdrModeEnabled', 'bool', 4),
+            0x0000000E: ('SupportedStreamUsages', 'supportedStreamUsages', 'Globals.Enums.StreamUsageEnum', 1),
+            0x0000000F: ('AllocatedVideoStreams', 'allocatedVideoStreams', 'CameraAvStreamManagement.Structs.VideoStreamStruct', 5),
+            0x00000010: ('AllocatedAudioStreams', 'allocatedAudioStreams', 'CameraAvStreamManagement.Structs.AudioStreamStruct', 5),
+            0x00000011: ('AllocatedSnapshotStreams', 'allocatedSnapshotStreams', 'CameraAvStreamManagement.Structs.SnapshotStreamStruct', 5),
+            0x00000012: ('StreamUsagePriorities', 'streamUsagePriorities', 'Globals.Enums.StreamUsageEnum', 1),
+            0x00000013: ('SoftRecordingPrivacyModeEnabled', 'softRecordingPrivacyModeEnabled', 'bool', 4),
+            0x00000014: ('SoftLivestreamPrivacyModeEnabled', 'softLivestreamPrivacyModeEnabled', 'bool', 4),
+            0x00000015: ('HardPrivacyModeOn', 'hardPrivacyModeOn', 'bool', 4),
+            0x00000016: ('NightVision', 'nightVision', 'CameraAvStreamManagement.Enums.TriStateAutoEnum', 4),
+            0x00000017: ('NightVisionIllum', 'nightVisionIllum', 'CameraAvStreamManagement.Enums.TriStateAutoEnum', 4),
+            0x00000018: ('Viewport', 'viewport', 'Globals.Structs.ViewportStruct', 4),
+            0x00000019: ('SpeakerMuted', 'speakerMuted', 'bool', 4),
+            0x0000001A: ('SpeakerVolumeLevel', 'speakerVolumeLevel', 'uint', 4),
+            0x0000001B: ('SpeakerMaxLevel', 'speakerMaxLevel', 'uint', 4),
+            0x0000001C: ('SpeakerMinLevel', 'speakerMinLevel', 'uint', 4),
+            0x0000001D: ('MicrophoneMuted', 'microphoneMuted', 'bool', 4),
+            0x0000001E: ('MicrophoneVolumeLevel', 'microphoneVolumeLevel', 'uint', 4),
+            0x0000001F: ('MicrophoneMaxLevel', 'microphoneMaxLevel', 'uint', 4),
+            0x00000020: ('MicrophoneMinLevel', 'microphoneMinLevel', 'uint', 4),
+            0x00000021: ('MicrophoneAgcEnabled', 'microphoneAgcEnabled', 'bool', 4),
+            0x00000022: ('ImageRotation', 'imageRotation', 'uint', 4),
+            0x00000023: ('ImageFlipHorizontal', 'imageFlipHorizontal', 'bool', 4),
+            0x00000024: ('ImageFlipVertical', 'imageFlipVertical', 'bool', 4),
+            0x00000025: ('LocalVideoRecordingEnabled', 'localVideoRecordingEnabled', 'bool', 4),
+            0x00000026: ('LocalSnapshotRecordingEnabled', 'localSnapshotRecordingEnabled', 'bool', 4),
+            0x00000027: ('StatusLightEnabled', 'statusLightEnabled', 'bool', 4),
+            0x00000028: ('StatusLightBrightness', 'statusLightBrightness', 'Globals.Enums.ThreeLevelAutoEnum', 4),
+            0x00000029: ('ImageRotationDiscreteAngles', 'imageRotationDiscreteAngles', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('AudioStreamAllocate', {0x0: ('streamUsage', 'Globals.Enums.StreamUsageEnum', 0), 0x1: ('audioCodec', 'CameraAvStreamManagement.Enums.AudioCodecEnum', 0), 0x2: ('channelCount', 'uint', 0), 0x3: ('sampleRate', 'uint', 0), 0x4: ('bitRate', 'uint', 0), 0x5: ('bitDepth', 'uint', 0)}),
+            0x00000002: ('AudioStreamDeallocate', {0x0: ('audioStreamID', 'uint', 0)}),
+            0x00000003: ('VideoStreamAllocate', {0x0: ('streamUsage', 'Globals.Enums.StreamUsageEnum', 0), 0x1: ('videoCodec', 'CameraAvStreamManagement.Enums.VideoCodecEnum', 0), 0x2: ('minFrameRate', 'uint', 0), 0x3: ('maxFrameRate', 'uint', 0), 0x4: ('minResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x5: ('maxResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x6: ('minBitRate', 'uint', 0), 0x7: ('maxBitRate', 'uint', 0), 0x8: ('keyFrameInterval', 'uint', 0), 0x9: ('watermarkEnabled', 'bool', 4), 0xA: ('osdEnabled', 'bool', 4)}),
+            0x00000005: ('VideoStreamModify', {0x0: ('videoStreamID', 'uint', 0), 0x1: ('watermarkEnabled', 'bool', 4), 0x2: ('osdEnabled', 'bool', 4)}),
+            0x00000006: ('VideoStreamDeallocate', {0x0: ('videoStreamID', 'uint', 0)}),
+            0x00000007: ('SnapshotStreamAllocate', {0x0: ('imageCodec', 'CameraAvStreamManagement.Enums.ImageCodecEnum', 0), 0x1: ('maxFrameRate', 'uint', 0), 0x2: ('minResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x3: ('maxResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x4: ('quality', 'uint', 0), 0x5: ('watermarkEnabled', 'bool', 4), 0x6: ('osdEnabled', 'bool', 4)}),
+            0x00000009: ('SnapshotStreamModify', {0x0: ('snapshotStreamID', 'uint', 0), 0x1: ('watermarkEnabled', 'bool', 4), 0x2: ('osdEnabled', 'bool', 4)}),
+            0x0000000A: ('SnapshotStreamDeallocate', {0x0: ('snapshotStreamID', 'uint', 0)}),
+            0x0000000B: ('SetStreamPriorities', {0x0: ('streamPriorities', 'Globals.Enums.StreamUsageEnum', 1)}),
+            0x0000000C: ('CaptureSnapshot', {0x0: ('snapshotStreamID', 'uint', 2), 0x1: ('requestedResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0)}),
+        },
+        {
+            0x00000001: ('AudioStreamAllocateResponse', {0x0: ('audioStreamID', 'uint', 0)}),
+            0x00000004: ('VideoStreamAllocateResponse', {0x0: ('videoStreamID', 'uint', 0)}),
+            0x00000008: ('SnapshotStreamAllocateResponse', {0x0: ('snapshotStreamID', 'uint', 0)}),
+            0x0000000D: ('CaptureSnapshotResponse', {0x0: ('data', 'bytes', 0), 0x1: ('imageCodec', 'CameraAvStreamManagement.Enums.ImageCodecEnum', 0), 0x2: ('resolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0)}),
+        },
+    ),
+    0x00000552: (
+        'CameraAvSettingsUserLevelManagement',
+        {
+            0x00000000: ('MptzPosition', 'mptzPosition', 'CameraAvSettingsUserLevelManagement.Structs.MPTZStruct', 4),
+            0x00000001: ('MaxPresets', 'maxPresets', 'uint', 4),
+            0x00000002: ('MptzPresets', 'mptzPresets', 'CameraAvSettingsUserLevelManagement.Structs.MPTZPresetStruct', 5),
+            0x00000003: ('DptzStreams', 'dptzStreams', 'CameraAvSettingsUserLevelManagement.Structs.DPTZStruct', 5),
+            0x00000004: ('ZoomMax', 'zoomMax', 'uint', 4),
+            0x00000005: ('TiltMin', 'tiltMin', 'int', 4),
+            0x00000006: ('TiltMax', 'tiltMax', 'int', 4),
+            0x00000007: ('PanMin', 'panMin', 'int', 4),
+            0x00000008: ('PanMax', 'panMax', 'int', 4),
+            0x00000009: ('MovementState', 'movementState', 'CameraAvSettingsUserLevelManagement.Enums.PhysicalMovementEnum', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('MptzSetPosition', {0x0: ('pan', 'int', 4), 0x1: ('tilt', 'int', 4), 0x2: ('zoom', 'uint', 4)}),
+            0x00000001: ('MptzRelativeMove', {0x0: ('panDelta', 'int', 4), 0x1: ('tiltDelta', 'int', 4), 0x2: ('zoomDelta', 'int', 4)}),
+            0x00000002: ('MptzMoveToPreset', {0x0: ('presetID', 'uint', 0)}),
+            0x00000003: ('MptzSavePreset', {0x0: ('presetID', 'uint', 4), 0x1: ('name', 'str', 0)}),
+            0x00000004: ('MptzRemovePreset', {0x0: ('presetID', 'uint', 0)}),
+            0x00000005: ('DptzSetViewport', {0x0: ('videoStreamID', 'uint', 0), 0x1: ('viewport', 'Globals.Structs.ViewportStruct', 0)}),
+            0x00000006: ('DptzRelativeMove', {0x0: ('videoStreamID', 'uint', 0), 0x1: ('deltaX', 'int', 4), 0x2: ('deltaY', 'int', 4), 0x3: ('zoomDelta', 'int', 4)}),
+        },
+        {
+        },
+    ),
+    0x00000553: (
+        'WebRtcTransportProvider',
+        {
+            0x00000000: ('CurrentSessions', 'currentSessions', 'WebRtcTransportDefinitions.Structs.WebRTCSessionStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('SolicitOffer', {0x0: ('streamUsage', 'Globals.Enums.StreamUsageEnum', 0), 0x1: ('originatingEndpointID', 'uint', 0), 0x2: ('videoStreamID', 'uint', 6), 0x3: ('audioStreamID', 'uint', 6), 0x4: ('iceServers', 'WebRtcTransportDefinitions.Structs.ICEServerStruct', 5), 0x5: ('iceTransportPolicy', 'str', 4), 0x6: ('metadataEnabled', 'bool', 4), 0x8: ('videoStreams', 'uint', 5), 0x9: ('audioStreams', 'uint', 5)}),
+            0x00000002: ('ProvideOffer', {0x0: ('webRtcSessionID', 'uint', 2), 0x1: ('sdp', 'str', 0), 0x2: ('streamUsage', 'Globals.Enums.StreamUsageEnum', 4), 0x3: ('originatingEndpointID', 'uint', 4), 0x4: ('videoStreamID', 'uint', 6), 0x5: ('audioStreamID', 'uint', 6), 0x6: ('iceServers', 'WebRtcTransportDefinitions.Structs.ICEServerStruct', 5), 0x7: ('iceTransportPolicy', 'str', 4), 0x8: ('metadataEnabled', 'bool', 4), 0xA: ('videoStreams', 'uint', 5), 0xB: ('audioStreams', 'uint', 5)}),
+            0x00000004: ('ProvideAnswer', {0x0: ('webRtcSessionID', 'uint', 0), 0x1: ('sdp', 'str', 0)}),
+            0x00000005: ('ProvideIceCandidates', {0x0: ('webRtcSessionID', 'uint', 0), 0x1: ('iceCandidates', 'WebRtcTransportDefinitions.Structs.ICECandidateStruct', 1)}),
+            0x00000006: ('EndSession', {0x0: ('webRtcSessionID', 'uint', 0), 0x1: ('reason', 'WebRtcTransportDefinitions.Enums.WebRTCEndReasonEnum', 0)}),
+        },
+        {
+            0x00000001: ('SolicitOfferResponse', {0x0: ('webRtcSessionID', 'uint', 0), 0x1: ('deferredOffer', 'bool', 0), 0x2: ('videoStreamID', 'uint', 6), 0x3: ('audioStreamID', 'uint', 6)}),
+            0x00000003: ('ProvideOfferResponse', {0x0: ('webRtcSessionID', 'uint', 0), 0x1: ('videoStreamID', 'uint', 6), 0x2: ('audioStreamID', 'uint', 6)}),
+        },
+    ),
+    0x00000554: (
+        'WebRtcTransportRequestor',
+        {
+            0x00000000: ('CurrentSessions', 'currentSessions', 'WebRtcTransportDefinitions.Structs.WebRTCSessionStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('Offer', {0x0: ('webRtcSessionID', 'uint', 0), 0x1: ('sdp', 'str', 0), 0x2: ('iceServers', 'WebRtcTransportDefinitions.Structs.ICEServerStruct', 5), 0x3: ('iceTransportPolicy', 'str', 4)}),
+            0x00000001: ('Answer', {0x0: ('webRtcSessionID', 'uint', 0), 0x1: ('sdp', 'str', 0)}),
+            0x00000002: ('IceCandidates', {0x0: ('webRtcSessionID', 'uint', 0), 0x1: ('iceCandidates', 'WebRtcTransportDefinitions.Structs.ICECandidateStruct', 1)}),
+            0x00000003: ('End', {0x0: ('webRtcSessionID', 'uint', 0), 0x1: ('reason', 'WebRtcTransportDefinitions.Enums.WebRTCEndReasonEnum', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000555: (
+        'PushAvStreamTransport',
+        {
+            0x00000000: ('SupportedFormats', 'supportedFormats', 'PushAvStreamTransport.Structs.SupportedFormatStruct', 1),
+            0x00000001: ('CurrentConnections', 'currentConnections', 'PushAvStreamTransport.Structs.TransportConfigurationStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('PushTransportBegin', {0x0: ('connectionID', 'uint', 0), 0x1: ('triggerType', 'PushAvStreamTransport.Enums.TransportTriggerTypeEnum', 0), 0x2: ('activationReason', 'PushAvStreamTransport.Enums.TriggerActivationReasonEnum', 4), 0x3: ('containerType', 'PushAvStreamTransport.Enums.ContainerFormatEnum', 4), 0x4: ('cmafSessionNumber', 'uint', 4)}),
+            0x00000001: ('PushTransportEnd', {0x0: ('connectionID', 'uint', 0), 0x1: ('containerType', 'PushAvStreamTransport.Enums.ContainerFormatEnum', 4), 0x2: ('cmafSessionNumber', 'uint', 4)}),
+        },
+        {
+            0x00000000: ('AllocatePushTransport', {0x0: ('transportOptions', 'PushAvStreamTransport.Structs.TransportOptionsStruct', 0)}),
+            0x00000002: ('DeallocatePushTransport', {0x0: ('connectionID', 'uint', 0)}),
+            0x00000003: ('ModifyPushTransport', {0x0: ('connectionID', 'uint', 0), 0x1: ('transportOptions', 'PushAvStreamTransport.Structs.TransportOptionsStruct', 0)}),
+            0x00000004: ('SetTransportStatus', {0x0: ('connectionID', 'uint', 2), 0x1: ('transportStatus', 'PushAvStreamTransport.Enums.TransportStatusEnum', 0)}),
+            0x00000005: ('ManuallyTriggerTransport', {0x0: ('connectionID', 'uint', 0), 0x1: ('activationReason', 'PushAvStreamTransport.Enums.TriggerActivationReasonEnum', 0), 0x2: ('timeControl', 'PushAvStreamTransport.Structs.TransportMotionTriggerTimeControlStruct', 4), 0x3: ('userDefined', 'bytes', 4)}),
+            0x00000006: ('FindTransport', {0x0: ('connectionID', 'uint', 2)}),
+        },
+        {
+            0x00000001: ('AllocatePushTransportResponse', {0x0: ('transportConfiguration', 'PushAvStreamTransport.Structs.TransportConfigurationStruct', 0)}),
+            0x00000007: ('FindTransportResponse', {0x0: ('transportConfigurations', 'PushAvStreamTransport.Structs.TransportConfigurationStruct', 1)}),
+        },
+    ),
+    0x00000556: (
+        'Chime',
+        {
+            0x00000000: ('InstalledChimeSounds', 'installedChimeSounds', 'Chime.Structs.ChimeSoundStruct', 1),
+            0x00000001: ('SelectedChime', 'selectedChime', 'uint', 0),
+            0x00000002: ('Enabled', 'enabled', 'bool', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('ChimeStartedPlaying', {0x0: ('chimeID', 'uint', 0)}),
+        },
+        {
+            0x00000000: ('PlayChimeSound', {0x0: ('chimeID', 'uint', 4)}),
+        },
+        {
+        },
+    ),
+    0x00000700: (
+        'CommodityTariff',
+        {
+            0x00000000: ('TariffInfo', 'tariffInfo', 'CommodityTariff.Structs.TariffInformationStruct', 2),
+            0x00000001: ('TariffUnit', 'tariffUnit', 'Globals.Enums.TariffUnitEnum', 2),
+            0x00000002: ('StartDate', 'startDate', 'uint', 2),
+            0x00000003: ('DayEntries', 'dayEntries', 'CommodityTariff.Structs.DayEntryStruct', 3),
+            0x00000004: ('DayPatterns', 'dayPatterns', 'CommodityTariff.Structs.DayPatternStruct', 3),
+            0x00000005: ('CalendarPeriods', 'calendarPeriods', 'CommodityTariff.Structs.CalendarPeriodStruct', 3),
+            0x00000006: ('IndividualDays', 'individualDays', 'CommodityTariff.Structs.DayStruct', 3),
+            0x00000007: ('CurrentDay', 'currentDay', 'CommodityTariff.Structs.DayStruct', 2),
+            0x00000008: ('NextDay', 'nextDay', 'CommodityTariff.Structs.DayStruct', 2),
+            0x00000009: ('CurrentDayEntry', 'currentDayEntry', 'CommodityTariff.Structs.DayEntryStruct', 2),
+            0x0000000A: ('CurrentDayEntryDate', 'currentDayEntryDate', 'uint', 2),
+            0x0000000B: ('NextDayEntry', 'nextDayEntry', 'CommodityTariff.Structs.DayEntryStruct', 2),
+            0x0000000C: ('NextDayEntryDate', 'nextDayEntryDate', 'uint', 2),
+            0x0000000D: ('TariffComponents', 'tariffComponents', 'CommodityTariff.Structs.TariffComponentStruct', 3),
+            0x0000000E: ('TariffPeriods', 'tariffPeriods', 'CommodityTariff.Structs.TariffPeriodStruct', 3),
+            0x0000000F: ('CurrentTariffComponents', 'currentTariffComponents', 'CommodityTariff.Structs.TariffComponentStruct', 3),
+            0x00000010: ('NextTariffComponents', 'nextTariffComponents', 'CommodityTariff.Structs.TariffComponentStruct', 3),
+            0x00000011: ('DefaultRandomizationOffset', 'defaultRandomizationOffset', 'int', 6),
+            0x00000012: ('DefaultRandomizationType', 'defaultRandomizationType', 'CommodityTariff.Enums.DayEntryRandomizationTypeEnum', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('GetTariffComponent', {0x0: ('tariffComponentID', 'uint', 0)}),
+            0x00000001: ('GetDayEntry', {0x0: ('dayEntryID', 'uint', 0)}),
+        },
+        {
+            0x00000000: ('GetTariffComponentResponse', {0x0: ('label', 'str', 2), 0x1: ('dayEntryIDs', 'uint', 1), 0x2: ('tariffComponent', 'CommodityTariff.Structs.TariffComponentStruct', 0)}),
+            0x00000001: ('GetDayEntryResponse', {0x0: ('dayEntry', 'CommodityTariff.Structs.DayEntryStruct', 0)}),
+        },
+    ),
+    0x00000750: (
+        'EcosystemInformation',
+        {
+            0x00000000: ('DeviceDirectory', 'deviceDirectory', 'EcosystemInformation.Structs.EcosystemDeviceStruct', 1),
+            0x00000001: ('LocationDirectory', 'locationDirectory', 'EcosystemInformation.Structs.EcosystemLocationStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000751: (
+        'CommissionerControl',
+        {
+            0x00000000: ('SupportedDeviceCategories', 'supportedDeviceCategories', 'CommissionerControl.Bitmaps.SupportedDeviceCategoryBitmap', 0),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+            0x00000000: ('CommissioningRequestResult', {0x0: ('requestID', 'uint', 0), 0x1: ('clientNodeID', 'uint', 0), 0x2: ('statusCode', 'Globals.Enums.status', 0), 0xFE: ('fabricIndex', 'uint', 0)}),
+        },
+        {
+            0x00000000: ('RequestCommissioningApproval', {0x0: ('requestID', 'uint', 0), 0x1: ('vendorID', 'uint', 0), 0x2: ('productID', 'uint', 0), 0x3: ('label', 'str', 4)}),
+            0x00000001: ('CommissionNode', {0x0: ('requestID', 'uint', 0), 0x1: ('responseTimeoutSeconds', 'uint', 0)}),
+        },
+        {
+            0x00000002: ('ReverseOpenCommissioningWindow', {0x0: ('commissioningTimeout', 'uint', 0), 0x1: ('PAKEPasscodeVerifier', 'bytes', 0), 0x2: ('discriminator', 'uint', 0), 0x3: ('iterations', 'uint', 0), 0x4: ('salt', 'bytes', 0)}),
+        },
+    ),
+    0x00000752: (
+        'JointFabricDatastore',
+        {
+            0x00000000: ('AnchorRootCA', 'anchorRootCa', 'bytes', 0),
+            0x00000001: ('AnchorNodeID', 'anchorNodeID', 'uint', 0),
+            0x00000002: ('AnchorVendorID', 'anchorVendorID', 'uint', 0),
+            0x00000003: ('FriendlyName', 'friendlyName', 'str', 0),
+            0x00000004: ('GroupKeySetList', 'groupKeySetList', 'JointFabricDatastore.Structs.DatastoreGroupKeySetStruct', 1),
+            0x00000005: ('GroupList', 'groupList', 'JointFabricDatastore.Structs.DatastoreGroupInformationEntryStruct', 1),
+            0x00000006: ('NodeList', 'nodeList', 'JointFabricDatastore.Structs.DatastoreNodeInformationEntryStruct', 1),
+            0x00000007: ('AdminList', 'adminList', 'JointFabricDatastore.Structs.DatastoreAdministratorInformationEntryStruct', 1),
+            0x00000008: ('Status', 'status', 'JointFabricDatastore.Structs.DatastoreStatusEntryStruct', 0),
+            0x00000009: ('EndpointGroupIDList', 'endpointGroupIDList', 'JointFabricDatastore.Structs.DatastoreEndpointGroupIDEntryStruct', 1),
+            0x0000000A: ('EndpointBindingList', 'endpointBindingList', 'JointFabricDatastore.Structs.DatastoreEndpointBindingEntryStruct', 1),
+            0x0000000B: ('NodeKeySetList', 'nodeKeySetList', 'JointFabricDatastore.Structs.DatastoreNodeKeySetEntryStruct', 1),
+            0x0000000C: ('NodeACLList', 'nodeAclList', 'JointFabricDatastore.Structs.DatastoreACLEntryStruct', 1),
+            0x0000000D: ('NodeEndpointList', 'nodeEndpointList', 'JointFabricDatastore.Structs.DatastoreEndpointEntryStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('AddKeySet', {0x0: ('groupKeySet', 'JointFabricDatastore.Structs.DatastoreGroupKeySetStruct', 0)}),
+            0x00000001: ('UpdateKeySet', {0x0: ('groupKeySet', 'JointFabricDatastore.Structs.DatastoreGroupKeySetStruct', 0)}),
+            0x00000002: ('RemoveKeySet', {0x0: ('groupKeySetID', 'uint', 0)}),
+            0x00000003: ('AddGroup', {0x0: ('groupID', 'uint', 0), 0x1: ('friendlyName', 'str', 0), 0x2: ('groupKeySetID', 'uint', 2), 0x3: ('groupCat', 'uint', 2), 0x4: ('groupCatVersion', 'uint', 2), 0x5: ('groupPermission', 'JointFabricDatastore.Enums.DatastoreAccessControlEntryPrivilegeEnum', 0)}),
+            0x00000004: ('UpdateGroup', {0x0: ('groupID', 'uint', 0), 0x1: ('friendlyName', 'str', 2), 0x2: ('groupKeySetID', 'uint', 2), 0x3: ('groupCat', 'uint', 2), 0x4: ('groupCatVersion', 'uint', 2), 0x5: ('groupPermission', 'JointFabricDatastore.Enums.DatastoreAccessControlEntryPrivilegeEnum', 2)}),
+            0x00000005: ('RemoveGroup', {0x0: ('groupID', 'uint', 0)}),
+            0x00000006: ('AddAdmin', {0x0: ('nodeID', 'uint', 0), 0x1: ('friendlyName', 'str', 0), 0x2: ('vendorID', 'uint', 0), 0x3: ('icac', 'bytes', 0)}),
+            0x00000007: ('UpdateAdmin', {0x0: ('nodeID', 'uint', 0), 0x1: ('friendlyName', 'str', 4), 0x2: ('icac', 'bytes', 4)}),
+            0x00000008: ('RemoveAdmin', {0x0: ('nodeID', 'uint', 0)}),
+            0x00000009: ('AddPendingNode', {0x0: ('nodeID', 'uint', 0), 0x1: ('friendlyName', 'str', 0)}),
+            0x0000000A: ('RefreshNode', {0x0: ('nodeID', 'uint', 0)}),
+            0x0000000B: ('UpdateNode', {0x0: ('nodeID', 'uint', 0), 0x1: ('friendlyName', 'str', 0)}),
+            0x0000000C: ('RemoveNode', {0x0: ('nodeID', 'uint', 0)}),
+            0x0000000D: ('UpdateEndpointForNode', {0x0: ('endpointID', 'uint', 0), 0x1: ('nodeID', 'uint', 0), 0x2: ('friendlyName', 'str', 0)}),
+            0x0000000E: ('AddGroupIDToEndpointForNode', {0x0: ('nodeID', 'uint', 0), 0x1: ('endpointID', 'uint', 0), 0x2: ('groupID', 'uint', 0)}),
+            0x0000000F: ('RemoveGroupIDFromEndpointForNode', {0x0: ('nodeID', 'uint', 0), 0x1: ('endpointID', 'uint', 0), 0x2: ('groupID', 'uint', 0)}),
+            0x00000010: ('AddBindingToEndpointForNode', {0x0: ('nodeID', 'uint', 0), 0x1: ('endpointID', 'uint', 0), 0x2: ('binding', 'JointFabricDatastore.Structs.DatastoreBindingTargetStruct', 0)}),
+            0x00000011: ('RemoveBindingFromEndpointForNode', {0x0: ('listID', 'uint', 0), 0x1: ('endpointID', 'uint', 0), 0x2: ('nodeID', 'uint', 0)}),
+            0x00000012: ('AddACLToNode', {0x0: ('nodeID', 'uint', 0), 0x1: ('aclEntry', 'JointFabricDatastore.Structs.DatastoreAccessControlEntryStruct', 0)}),
+            0x00000013: ('RemoveACLFromNode', {0x0: ('listID', 'uint', 0), 0x1: ('nodeID', 'uint', 0)}),
+        },
+        {
+        },
+    ),
+    0x00000753: (
+        'JointFabricAdministrator',
+        {
+            0x00000000: ('AdministratorFabricIndex', 'administratorFabricIndex', 'uint', 2),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ICACCSRRequest', {}),
+            0x00000002: ('AddICAC', {0x0: ('ICACValue', 'bytes', 0)}),
+            0x00000004: ('OpenJointCommissioningWindow', {0x0: ('commissioningTimeout', 'uint', 0), 0x1: ('PAKEPasscodeVerifier', 'bytes', 0), 0x2: ('discriminator', 'uint', 0), 0x3: ('iterations', 'uint', 0), 0x4: ('salt', 'bytes', 0)}),
+            0x00000005: ('TransferAnchorRequest', {}),
+            0x00000007: ('TransferAnchorComplete', {}),
+            0x00000008: ('AnnounceJointFabricAdministrator', {0x0: ('endpointID', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ICACCSRResponse', {0x0: ('statusCode', 'JointFabricAdministrator.Enums.ICACCSRResponseStatusCodeEnum', 0), 0x1: ('icaccsr', 'bytes', 4)}),
+            0x00000003: ('ICACResponse', {0x0: ('statusCode', 'JointFabricAdministrator.Enums.ICACResponseStatusEnum', 0)}),
+            0x00000006: ('TransferAnchorResponse', {0x0: ('statusCode', 'JointFabricAdministrator.Enums.TransferAnchorResponseStatusEnum', 0)}),
+        },
+    ),
+    0x00000801: (
+        'TlsCertificateManagement',
+        {
+            0x00000000: ('MaxRootCertificates', 'maxRootCertificates', 'uint', 0),
+            0x00000001: ('ProvisionedRootCertificates', 'provisionedRootCertificates', 'TlsCertificateManagement.Structs.TLSCertStruct', 1),
+            0x00000002: ('MaxClientCertificates', 'maxClientCertificates', 'uint', 0),
+            0x00000003: ('ProvisionedClientCertificates', 'provisionedClientCertificates', 'TlsCertificateManagement.Structs.TLSClientCertificateDetailStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ProvisionRootCertificate', {0x0: ('certificate', 'bytes', 0), 0x1: ('caid', 'uint', 2)}),
+            0x00000002: ('FindRootCertificate', {0x0: ('caid', 'uint', 2)}),
+            0x00000004: ('LookupRootCertificate', {0x0: ('fingerprint', 'bytes', 0)}),
+            0x00000006: ('RemoveRootCertificate', {0x0: ('caid', 'uint', 0)}),
+            0x00000007: ('ClientCSR', {0x0: ('nonce', 'bytes', 0), 0x1: ('ccdid', 'uint', 2)}),
+            0x00000009: ('ProvisionClientCertificate', {0x0: ('ccdid', 'uint', 0), 0x1: ('clientCertificate', 'bytes', 0), 0x2: ('intermediateCertificates', 'bytes', 1)}),
+            0x0000000A: ('FindClientCertificate', {0x0: ('ccdid', 'uint', 2)}),
+            0x0000000C: ('LookupClientCertificate', {0x0: ('fingerprint', 'bytes', 0)}),
+            0x0000000E: ('RemoveClientCertificate', {0x0: ('ccdid', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ProvisionRootCertificateResponse', {0x0: ('caid', 'uint', 0)}),
+            0x00000003: ('FindRootCertificateResponse', {0x0: ('certificateDetails', 'TlsCertificateManagement.Structs.TLSCertStruct', 1)}),
+            0x00000005: ('LookupRootCertificateResponse', {0x0: ('caid', 'uint', 0)}),
+            0x00000008: ('ClientCSRResponse', {0x0: ('ccdid', 'uint', 0), 0x1: ('CSR', 'bytes', 0), 0x2: ('nonceSignature', 'bytes', 0)}),
+            0x0000000B: ('FindClientCertificateResponse', {0x0: ('certificateDetails', 'TlsCertificateManagement.Structs.TLSClientCertificateDetailStruct', 1)}),
+            0x0000000D: ('LookupClientCertificateResponse', {0x0: ('ccdid', 'uint', 0)}),
+        },
+    ),
+    0x00000802: (
+        'TlsClientManagement',
+        {
+            0x00000000: ('MaxProvisioned', 'maxProvisioned', 'uint', 0),
+            0x00000001: ('ProvisionedEndpoints', 'provisionedEndpoints', 'TlsClientManagement.Structs.TLSEndpointStruct', 1),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('ProvisionEndpoint', {0x0: ('hostname', 'bytes', 0), 0x1: ('port', 'uint', 0), 0x2: ('caid', 'uint', 0), 0x3: ('ccdid', 'uint', 2), 0x4: ('endpointID', 'uint', 2)}),
+            0x00000002: ('FindEndpoint', {0x0: ('endpointID', 'uint', 0)}),
+            0x00000004: ('RemoveEndpoint', {0x0: ('endpointID', 'uint', 0)}),
+        },
+        {
+            0x00000001: ('ProvisionEndpointResponse', {0x0: ('endpointID', 'uint', 0)}),
+            0x00000003: ('FindEndpointResponse', {0x0: ('endpoint', 'TlsClientManagement.Structs.TLSEndpointStruct', 0)}),
+        },
+    ),
+    0x00000B04: (
+        'DraftElectricalMeasurementCluster',
+        {
+            0x00000505: ('RmsVoltage', 'rmsVoltage', 'uint', 4),
+            0x00000508: ('RmsCurrent', 'rmsCurrent', 'uint', 4),
+            0x0000050B: ('ActivePower', 'activePower', 'uint', 4),
+            0x00000600: ('AcVoltageMultiplier', 'acVoltageMultiplier', 'uint', 4),
+            0x00000601: ('AcVoltageDivisor', 'acVoltageDivisor', 'uint', 4),
+            0x00000602: ('AcCurrentMultiplier', 'acCurrentMultiplier', 'uint', 4),
+            0x00000603: ('AcCurrentDivisor', 'acCurrentDivisor', 'uint', 4),
+            0x00000604: ('AcPowerMultiplier', 'acPowerMultiplier', 'uint', 4),
+            0x00000605: ('AcPowerDivisor', 'acPowerDivisor', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000B06: (
+        'MeterIdentification',
+        {
+            0x00000000: ('MeterType', 'meterType', 'MeterIdentification.Enums.MeterTypeEnum', 2),
+            0x00000001: ('PointOfDelivery', 'pointOfDelivery', 'str', 2),
+            0x00000002: ('MeterSerialNumber', 'meterSerialNumber', 'str', 2),
+            0x00000003: ('ProtocolVersion', 'protocolVersion', 'str', 6),
+            0x00000004: ('PowerThreshold', 'powerThreshold', 'Globals.Structs.PowerThresholdStruct', 6),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x00000B07: (
+        'CommodityMetering',
+        {
+            0x00000000: ('MeteredQuantity', 'meteredQuantity', 'CommodityMetering.Structs.MeteredQuantityStruct', 3),
+            0x00000001: ('MeteredQuantityTimestamp', 'meteredQuantityTimestamp', 'uint', 2),
+            0x00000002: ('TariffUnit', 'tariffUnit', 'Globals.Enums.TariffUnitEnum', 2),
+            0x00000003: ('MaximumMeteredQuantities', 'maximumMeteredQuantities', 'uint', 2),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x120BFC01: (
+        'HeimanCluster',
+        {
+            0x00000010: ('TamperAlarm', 'tamperAlarm', 'uint', 4),
+            0x00000011: ('PreheatingState', 'preheatingState', 'uint', 4),
+            0x00000012: ('NoDisturbingState', 'noDisturbingState', 'uint', 4),
+            0x00000013: ('SensorType', 'sensorType', 'uint', 4),
+            0x00000014: ('SirenActive', 'sirenActive', 'uint', 4),
+            0x00000015: ('AlarmMute', 'alarmMute', 'uint', 4),
+            0x00000016: ('LowPowerMode', 'lowPowerMode', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+            0x00000000: ('MutingSensor', {0x0: ('mutingTime', 'uint', 4)}),
+        },
+        {
+        },
+    ),
+    0x122FFC31: (
+        'InovelliCluster',
+        {
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+            0x122F0061: ('LEDIndicatorIntensityOn', 'ledIndicatorIntensityOn', 'uint', 4),
+            0x122F0062: ('LEDIndicatorIntensityOff', 'ledIndicatorIntensityOff', 'uint', 4),
+            0x122F0106: ('ClearNotificationWithConfigDoubleTap', 'clearNotificationWithConfigDoubleTap', 'bool', 4),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x125DFC11: (
+        'NeoCluster',
+        {
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+            0x125D0021: ('WattAccumulated', 'wattAccumulated', 'uint', 4),
+            0x125D0022: ('Current', 'current', 'uint', 4),
+            0x125D0023: ('Watt', 'watt', 'uint', 4),
+            0x125D0024: ('Voltage', 'voltage', 'uint', 4),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x130AFC01: (
+        'EveCluster',
+        {
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+            0x130A0000: ('GetConfig', 'getConfig', 'bytes', 4),
+            0x130A0001: ('SetConfig', 'setConfig', 'bytes', 4),
+            0x130A0002: ('LoggingMetadata', 'loggingMetadata', 'bytes', 4),
+            0x130A0003: ('LoggingData', 'loggingData', 'bytes', 4),
+            0x130A0006: ('TimesOpened', 'timesOpened', 'uint', 4),
+            0x130A0007: ('LastEventTime', 'lastEventTime', 'uint', 4),
+            0x130A0008: ('Voltage', 'voltage', 'float32', 4),
+            0x130A0009: ('Current', 'current', 'float32', 4),
+            0x130A000A: ('Watt', 'watt', 'float32', 4),
+            0x130A000B: ('WattAccumulated', 'wattAccumulated', 'float32', 4),
+            0x130A000C: ('StatusFault', 'statusFault', 'uint', 4),
+            0x130A000D: ('MotionSensitivity', 'motionSensitivity', 'uint', 4),
+            0x130A000E: ('WattAccumulatedControlPoint', 'wattAccumulatedControlPoint', 'uint', 4),
+            0x130A0010: ('ObstructionDetected', 'obstructionDetected', 'bool', 4),
+            0x130A0011: ('ChildLock', 'childLock', 'bool', 4),
+            0x130A0012: ('Rloc16', 'rloc16', 'uint', 4),
+            0x130A0013: ('Altitude', 'altitude', 'float32', 4),
+            0x130A0014: ('Pressure', 'pressure', 'float32', 4),
+            0x130A0015: ('WeatherTrend', 'weatherTrend', 'uint', 4),
+            0x130A0017: ('WindowOpenMode', 'windowOpenMode', 'bool', 4),
+            0x130A0018: ('ValvePosition', 'valvePosition', 'uint', 4),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x130DFC02: (
+        'ThirdRealityMeteringCluster',
+        {
+            0x00000000: ('CurrentSummationDelivered', 'currentSummationDelivered', 'uint', 4),
+            0x00000301: ('Multiplier', 'multiplier', 'uint', 4),
+            0x00000302: ('Divisor', 'divisor', 'uint', 4),
+            0x00000400: ('InstantaneousDemand', 'instantaneousDemand', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x1334FC03: (
+        'TclDehumidifierCluster',
+        {
+            0x00000000: ('Mode', 'mode', 'uint', 4),
+            0x00000001: ('TargetHumidity', 'targetHumidity', 'uint', 4),
+            0x00000002: ('CurrentHumidity', 'currentHumidity', 'uint', 4),
+            0x00000003: ('WaterBucketFull', 'waterBucketFull', 'bool', 4),
+            0x00000004: ('FilterAlert', 'filterAlert', 'bool', 4),
+            0x00000005: ('ErrorCodes', 'errorCodes', 'str', 4),
+            0x00000006: ('FeatureSet', 'featureSet', 'str', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+    0x1534FC00: (
+        'WagoCluster',
+        {
+            0x00000000: ('DirectlyConnected', 'directlyConnected', 'bool', 4),
+            0x00000001: ('SwitchType', 'switchType', 'uint', 4),
+            0x0000FFF8: ('GeneratedCommandList', 'generatedCommandList', 'uint', 1),
+            0x0000FFF9: ('AcceptedCommandList', 'acceptedCommandList', 'uint', 1),
+            0x0000FFFB: ('AttributeList', 'attributeList', 'uint', 1),
+            0x0000FFFC: ('FeatureMap', 'featureMap', 'uint', 0),
+            0x0000FFFD: ('ClusterRevision', 'clusterRevision', 'uint', 0),
+        },
+        {
+        },
+        {
+        },
+        {
+        },
+    ),
+}
+
+# qualified struct name -> {tag: (label, type, flags)}
+STRUCTS = {
+    'Globals.Structs.AtomicAttributeStatusStruct': {0x0: ('attributeID', 'uint', 0), 0x1: ('statusCode', 'Globals.Enums.status', 0)},
+    'Globals.Structs.MeasurementAccuracyRangeStruct': {0x0: ('rangeMin', 'int', 0), 0x1: ('rangeMax', 'int', 0), 0x2: ('percentMax', 'uint', 4), 0x3: ('percentMin', 'uint', 4), 0x4: ('percentTypical', 'uint', 4), 0x5: ('fixedMax', 'uint', 4), 0x6: ('fixedMin', 'uint', 4), 0x7: ('fixedTypical', 'uint', 4)},
+    'Globals.Structs.MeasurementAccuracyStruct': {0x0: ('measurementType', 'Globals.Enums.MeasurementTypeEnum', 0), 0x1: ('measured', 'bool', 0), 0x2: ('minMeasuredValue', 'int', 0), 0x3: ('maxMeasuredValue', 'int', 0), 0x4: ('accuracyRanges', 'Globals.Structs.MeasurementAccuracyRangeStruct', 1)},
+    'Globals.Structs.PowerThresholdStruct': {0x0: ('powerThreshold', 'int', 4), 0x1: ('apparentPowerThreshold', 'int', 4), 0x2: ('powerThresholdSource', 'Globals.Enums.PowerThresholdSourceEnum', 2)},
+    'Globals.Structs.ViewportStruct': {0x0: ('x1', 'uint', 0), 0x1: ('y1', 'uint', 0), 0x2: ('x2', 'uint', 0), 0x3: ('y2', 'uint', 0)},
+    'Globals.Structs.currency': {0x0: ('currency', 'uint', 0), 0x1: ('decimalPoints', 'uint', 0)},
+    'Globals.Structs.locationdesc': {0x0: ('locationName', 'str', 0), 0x1: ('floorNumber', 'int', 2), 0x2: ('areaType', 'uint', 2)},
+    'Globals.Structs.price': {0x0: ('amount', 'int', 0), 0x1: ('currency', 'Globals.Structs.currency', 0)},
+    'Globals.Structs.semtag': {0x0: ('mfgCode', 'uint', 2), 0x1: ('namespaceID', 'Globals.Enums.namespace', 0), 0x2: ('tag', 'uint', 0), 0x3: ('label', 'str', 6)},
+    'Globals.Structs.struct': {},
+    'AccessControl.Structs.AccessControlTargetStruct': {0x0: ('cluster', 'uint', 2), 0x1: ('endpoint', 'uint', 2), 0x2: ('deviceType', 'uint', 2)},
+    'AccessControl.Structs.AccessControlEntryStruct': {0x1: ('privilege', 'AccessControl.Enums.AccessControlEntryPrivilegeEnum', 0), 0x2: ('authMode', 'AccessControl.Enums.AccessControlEntryAuthModeEnum', 0), 0x3: ('subjects', 'uint', 3), 0x4: ('targets', 'AccessControl.Structs.AccessControlTargetStruct', 3), 0x5: ('auxiliaryType', 'AccessControl.Enums.AccessControlAuxiliaryTypeEnum', 4), 0xFE: ('fabricIndex', 'uint', 0)},
+    'AccessControl.Structs.AccessControlExtensionStruct': {0x1: ('data', 'bytes', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'AccessControl.Structs.AccessRestrictionStruct': {0x0: ('type', 'AccessControl.Enums.AccessRestrictionTypeEnum', 0), 0x1: ('id', 'uint', 2)},
+    'AccessControl.Structs.AccessRestrictionEntryStruct': {0x0: ('endpoint', 'uint', 0), 0x1: ('cluster', 'uint', 0), 0x2: ('restrictions', 'AccessControl.Structs.AccessRestrictionStruct', 1), 0xFE: ('fabricIndex', 'uint', 0)},
+    'AccessControl.Structs.CommissioningAccessRestrictionEntryStruct': {0x0: ('endpoint', 'uint', 0), 0x1: ('cluster', 'uint', 0), 0x2: ('restrictions', 'AccessControl.Structs.AccessRestrictionStruct', 1)},
+    'Actions.Structs.ActionStruct': {0x0: ('actionID', 'uint', 0), 0x1: ('name', 'str', 0), 0x2: ('type', 'Actions.Enums.ActionTypeEnum', 0), 0x3: ('endpointListID', 'uint', 0), 0x4: ('supportedCommands', 'Actions.Bitmaps.CommandBits', 0), 0x5: ('state', 'Actions.Enums.ActionStateEnum', 0)},
+    'Actions.Structs.EndpointListStruct': {0x0: ('endpointListID', 'uint', 0), 0x1: ('name', 'str', 0), 0x2: ('type', 'Actions.Enums.EndpointListTypeEnum', 0), 0x3: ('endpoints', 'uint', 1)},
+    'ActivatedCarbonFilterMonitoring.Structs.ReplacementProductStruct': {0x0: ('productIdentifierType', 'ActivatedCarbonFilterMonitoring.Enums.ProductIdentifierTypeEnum', 0), 0x1: ('productIdentifierValue', 'str', 0)},
+    'AmbientContextSensing.Structs.HoldTimeLimitsStruct': {0x0: ('holdTimeMin', 'uint', 4), 0x1: ('holdTimeMax', 'uint', 4), 0x2: ('holdTimeDefault', 'uint', 4)},
+    'AmbientContextSensing.Structs.AmbientContextTypeStruct': {0x0: ('ambientContextSensed', 'ModeSelect.Structs.SemanticTagStruct', 5)},
+    'AmbientContextSensing.Structs.ObjectCountConfigStruct': {0x0: ('countingObject', 'ModeSelect.Structs.SemanticTagStruct', 4), 0x1: ('objectCountThreshold', 'uint', 4)},
+    'AmbientContextSensing.Structs.PredictedActivityStruct': {0x0: ('startTimestamp', 'uint', 4), 0x1: ('endTimestamp', 'uint', 4), 0x2: ('ambientContextType', 'ModeSelect.Structs.SemanticTagStruct', 5), 0x3: ('crowdDetected', 'bool', 4), 0x4: ('crowdCount', 'uint', 4), 0x5: ('confidence', 'uint', 4)},
+    'ApplicationBasic.Structs.ApplicationStruct': {0x0: ('catalogVendorID', 'uint', 0), 0x1: ('applicationID', 'str', 0)},
+    'ApplicationLauncher.Structs.ApplicationStruct': {0x0: ('catalogVendorID', 'uint', 0), 0x1: ('applicationID', 'str', 0)},
+    'ApplicationLauncher.Structs.ApplicationEPStruct': {0x0: ('application', 'ApplicationLauncher.Structs.ApplicationStruct', 0), 0x1: ('endpoint', 'uint', 4)},
+    'AudioOutput.Structs.OutputInfoStruct': {0x0: ('index', 'uint', 0), 0x1: ('outputType', 'AudioOutput.Enums.OutputTypeEnum', 0), 0x2: ('name', 'str', 0)},
+    'BasicInformation.Structs.ProductAppearanceStruct': {0x0: ('finish', 'BasicInformation.Enums.ProductFinishEnum', 0), 0x1: ('primaryColor', 'BasicInformation.Enums.ColorEnum', 2)},
+    'BasicInformation.Structs.CapabilityMinimaStruct': {0x0: ('caseSessionsPerFabric', 'uint', 0), 0x1: ('subscriptionsPerFabric', 'uint', 0), 0x2: ('simultaneousInvocationsSupported', 'uint', 4), 0x3: ('simultaneousWritesSupported', 'uint', 4), 0x4: ('readPathsSupported', 'uint', 4), 0x5: ('subscribePathsSupported', 'uint', 4)},
+    'Binding.Structs.TargetStruct': {0x1: ('node', 'uint', 4), 0x2: ('group', 'uint', 4), 0x3: ('endpoint', 'uint', 4), 0x4: ('cluster', 'uint', 4), 0xFE: ('fabricIndex', 'uint', 0)},
+    'BridgedDeviceBasicInformation.Structs.ProductAppearanceStruct': {0x0: ('finish', 'BridgedDeviceBasicInformation.Enums.ProductFinishEnum', 0), 0x1: ('primaryColor', 'BridgedDeviceBasicInformation.Enums.ColorEnum', 2)},
+    'BridgedDeviceBasicInformation.Structs.CapabilityMinimaStruct': {0x0: ('caseSessionsPerFabric', 'uint', 0), 0x1: ('subscriptionsPerFabric', 'uint', 0), 0x2: ('simultaneousInvocationsSupported', 'uint', 4), 0x3: ('simultaneousWritesSupported', 'uint', 4), 0x4: ('readPathsSupported', 'uint', 4), 0x5: ('subscribePathsSupported', 'uint', 4)},
+    'CameraAvSettingsUserLevelManagement.Structs.DPTZStruct': {0x0: ('videoStreamID', 'uint', 0), 0x1: ('viewport', 'Globals.Structs.ViewportStruct', 0)},
+    'CameraAvSettingsUserLevelManagement.Structs.MPTZStruct': {0x0: ('pan', 'int', 4), 0x1: ('tilt', 'int', 4), 0x2: ('zoom', 'uint', 4)},
+    'CameraAvSettingsUserLevelManagement.Structs.MPTZPresetStruct': {0x0: ('presetID', 'uint', 0), 0x1: ('name', 'str', 0), 0x2: ('settings', 'CameraAvSettingsUserLevelManagement.Structs.MPTZStruct', 0)},
+    'CameraAvStreamManagement.Structs.VideoSensorParamsStruct': {0x0: ('sensorWidth', 'uint', 0), 0x1: ('sensorHeight', 'uint', 0), 0x2: ('maxFps', 'uint', 0), 0x3: ('maxHdrfps', 'uint', 4)},
+    'CameraAvStreamManagement.Structs.VideoResolutionStruct': {0x0: ('width', 'uint', 0), 0x1: ('height', 'uint', 0)},
+    'CameraAvStreamManagement.Structs.RateDistortionTradeOffPointsStruct': {0x0: ('codec', 'CameraAvStreamManagement.Enums.VideoCodecEnum', 0), 0x1: ('resolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x2: ('minBitRate', 'uint', 0)},
+    'CameraAvStreamManagement.Structs.SnapshotCapabilitiesStruct': {0x0: ('resolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x1: ('maxFrameRate', 'uint', 0), 0x2: ('imageCodec', 'CameraAvStreamManagement.Enums.ImageCodecEnum', 0), 0x3: ('requiresEncodedPixels', 'bool', 0), 0x4: ('requiresHardwareEncoder', 'bool', 4)},
+    'CameraAvStreamManagement.Structs.AudioCapabilitiesStruct': {0x0: ('maxNumberOfChannels', 'uint', 0), 0x1: ('supportedCodecs', 'CameraAvStreamManagement.Enums.AudioCodecEnum', 1), 0x2: ('supportedSampleRates', 'uint', 1), 0x3: ('supportedBitDepths', 'uint', 1)},
+    'CameraAvStreamManagement.Structs.VideoStreamStruct': {0x0: ('videoStreamID', 'uint', 0), 0x1: ('streamUsage', 'Globals.Enums.StreamUsageEnum', 0), 0x2: ('videoCodec', 'CameraAvStreamManagement.Enums.VideoCodecEnum', 0), 0x3: ('minFrameRate', 'uint', 0), 0x4: ('maxFrameRate', 'uint', 0), 0x5: ('minResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x6: ('maxResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x7: ('minBitRate', 'uint', 0), 0x8: ('maxBitRate', 'uint', 0), 0x9: ('keyFrameInterval', 'uint', 0), 0xA: ('watermarkEnabled', 'bool', 4), 0xB: ('osdEnabled', 'bool', 4), 0xC: ('referenceCount', 'uint', 0)},
+    'CameraAvStreamManagement.Structs.AudioStreamStruct': {0x0: ('audioStreamID', 'uint', 0), 0x1: ('streamUsage', 'Globals.Enums.StreamUsageEnum', 0), 0x2: ('audioCodec', 'CameraAvStreamManagement.Enums.AudioCodecEnum', 0), 0x3: ('channelCount', 'uint', 0), 0x4: ('sampleRate', 'uint', 0), 0x5: ('bitRate', 'uint', 0), 0x6: ('bitDepth', 'uint', 0), 0x7: ('referenceCount', 'uint', 0)},
+    'CameraAvStreamManagement.Structs.SnapshotStreamStruct': {0x0: ('snapshotStreamID', 'uint', 0), 0x1: ('imageCodec', 'CameraAvStreamManagement.Enums.ImageCodecEnum', 0), 0x2: ('frameRate', 'uint', 0), 0x3: ('minResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x4: ('maxResolution', 'CameraAvStreamManagement.Structs.VideoResolutionStruct', 0), 0x5: ('quality', 'uint', 0), 0x6: ('referenceCount', 'uint', 0), 0x7: ('encodedPixels', 'bool', 0), 0x8: ('hardwareEncoder', 'bool', 0), 0x9: ('watermarkEnabled', 'bool', 4), 0xA: ('osdEnabled', 'bool', 4)},
+    'CameraAvStreamManagement.Structs.AVMetadataStruct': {0x1: ('UTCTime', 'uint', 2), 0x2: ('motionZonesActive', 'uint', 5), 0x3: ('blackAndWhiteActive', 'bool', 4), 0x4: ('userDefined', 'bytes', 4)},
+    'Channel.Structs.ChannelInfoStruct': {0x0: ('majorNumber', 'uint', 0), 0x1: ('minorNumber', 'uint', 0), 0x2: ('name', 'str', 4), 0x3: ('callSign', 'str', 4), 0x4: ('affiliateCallSign', 'str', 4), 0x5: ('identifier', 'str', 4), 0x6: ('type', 'Channel.Enums.ChannelTypeEnum', 4)},
+    'Channel.Structs.LineupInfoStruct': {0x0: ('operatorName', 'str', 0), 0x1: ('lineupName', 'str', 4), 0x2: ('postalCode', 'str', 4), 0x3: ('lineupInfoType', 'Channel.Enums.LineupInfoTypeEnum', 0)},
+    'Channel.Structs.ProgramStruct': {0x0: ('identifier', 'str', 0), 0x1: ('channel', 'Channel.Structs.ChannelInfoStruct', 0), 0x2: ('startTime', 'uint', 0), 0x3: ('endTime', 'uint', 0), 0x4: ('title', 'str', 0), 0x5: ('subtitle', 'str', 4), 0x6: ('description', 'str', 4), 0x7: ('audioLanguages', 'str', 5), 0x8: ('ratings', 'str', 5), 0x9: ('thumbnailUrl', 'str', 4), 0xA: ('posterArtUrl', 'str', 4), 0xB: ('dvbiUrl', 'str', 4), 0xC: ('releaseDate', 'str', 4), 0xD: ('parentalGuidanceText', 'str', 4), 0xE: ('recordingFlag', 'Channel.Bitmaps.RecordingFlagBitmap', 4), 0xF: ('seriesInfo', 'Channel.Structs.SeriesInfoStruct', 6), 0x10: ('categoryList', 'Channel.Structs.ProgramCategoryStruct', 5), 0x11: ('castList', 'Channel.Structs.ProgramCastStruct', 5), 0x12: ('externalIDList', 'ContentLauncher.Structs.AdditionalInfoStruct', 5)},
+    'Channel.Structs.ProgramCategoryStruct': {0x0: ('category', 'str', 0), 0x1: ('subCategory', 'str', 4)},
+    'Channel.Structs.SeriesInfoStruct': {0x0: ('season', 'str', 0), 0x1: ('episode', 'str', 0)},
+    'Channel.Structs.ProgramCastStruct': {0x0: ('name', 'str', 0), 0x1: ('role', 'str', 0)},
+    'Channel.Structs.PageTokenStruct': {0x0: ('limit', 'uint', 4), 0x1: ('after', 'str', 4), 0x2: ('before', 'str', 4)},
+    'Channel.Structs.ChannelPagingStruct': {0x0: ('previousToken', 'Channel.Structs.PageTokenStruct', 6), 0x1: ('nextToken', 'Channel.Structs.PageTokenStruct', 6)},
+    'Chime.Structs.ChimeSoundStruct': {0x0: ('chimeID', 'uint', 0), 0x1: ('name', 'str', 0)},
+    'ClosureControl.Structs.OverallCurrentStateStruct': {0x0: ('position', 'ClosureControl.Enums.CurrentPositionEnum', 6), 0x1: ('latch', 'bool', 6), 0x2: ('speed', 'Globals.Enums.ThreeLevelAutoEnum', 4), 0x3: ('secureState', 'bool', 2)},
+    'ClosureControl.Structs.OverallTargetStateStruct': {0x0: ('position', 'ClosureControl.Enums.TargetPositionEnum', 6), 0x1: ('latch', 'bool', 6), 0x2: ('speed', 'Globals.Enums.ThreeLevelAutoEnum', 4)},
+    'ClosureDimension.Structs.RangePercent100thsStruct': {0x0: ('min', 'uint', 0), 0x1: ('max', 'uint', 0)},
+    'ClosureDimension.Structs.UnitRangeStruct': {0x0: ('min', 'int', 0), 0x1: ('max', 'int', 0)},
+    'ClosureDimension.Structs.DimensionStateStruct': {0x0: ('position', 'uint', 6), 0x1: ('latch', 'bool', 6), 0x2: ('speed', 'Globals.Enums.ThreeLevelAutoEnum', 4)},
+    'CommodityMetering.Structs.MeteredQuantityStruct': {0x0: ('tariffComponentIDs', 'uint', 1), 0x1: ('quantity', 'int', 0)},
+    'CommodityPrice.Structs.CommodityPriceComponentStruct': {0x0: ('price', 'int', 0), 0x1: ('source', 'Globals.Enums.TariffPriceTypeEnum', 0), 0x2: ('description', 'str', 4), 0x3: ('tariffComponentID', 'uint', 4)},
+    'CommodityPrice.Structs.CommodityPriceStruct': {0x0: ('periodStart', 'uint', 0), 0x1: ('periodEnd', 'uint', 2), 0x2: ('price', 'int', 4), 0x3: ('priceLevel', 'int', 4), 0x4: ('description', 'str', 4), 0x5: ('components', 'CommodityPrice.Structs.CommodityPriceComponentStruct', 5)},
+    'CommodityTariff.Structs.AuxiliaryLoadSwitchSettingsStruct': {0x0: ('number', 'uint', 0), 0x1: ('requiredState', 'CommodityTariff.Enums.AuxiliaryLoadSettingEnum', 0)},
+    'CommodityTariff.Structs.AuxiliaryLoadSwitchesSettingsStruct': {0x0: ('switchStates', 'CommodityTariff.Structs.AuxiliaryLoadSwitchSettingsStruct', 1)},
+    'CommodityTariff.Structs.CalendarPeriodStruct': {0x0: ('startDate', 'uint', 2), 0x1: ('dayPatternIDs', 'uint', 1)},
+    'CommodityTariff.Structs.DayEntryStruct': {0x0: ('dayEntryID', 'uint', 0), 0x1: ('startTime', 'uint', 0), 0x2: ('duration', 'uint', 4), 0x3: ('randomizationOffset', 'int', 4), 0x4: ('randomizationType', 'CommodityTariff.Enums.DayEntryRandomizationTypeEnum', 4)},
+    'CommodityTariff.Structs.DayStruct': {0x0: ('date', 'uint', 0), 0x1: ('dayType', 'CommodityTariff.Enums.DayTypeEnum', 0), 0x2: ('dayEntryIDs', 'uint', 1)},
+    'CommodityTariff.Structs.DayPatternStruct': {0x0: ('dayPatternID', 'uint', 0), 0x1: ('daysOfWeek', 'CommodityTariff.Bitmaps.DayPatternDayOfWeekBitmap', 0), 0x2: ('dayEntryIDs', 'uint', 1)},
+    'CommodityTariff.Structs.PeakPeriodStruct': {0x0: ('severity', 'CommodityTariff.Enums.PeakPeriodSeverityEnum', 0), 0x1: ('peakPeriod', 'uint', 0)},
+    'CommodityTariff.Structs.TariffInformationStruct': {0x0: ('tariffLabel', 'str', 2), 0x1: ('providerName', 'str', 2), 0x2: ('currency', 'Globals.Structs.currency', 6), 0x3: ('blockMode', 'CommodityTariff.Enums.BlockModeEnum', 2)},
+    'CommodityTariff.Structs.TariffPriceStruct': {0x0: ('priceType', 'Globals.Enums.TariffPriceTypeEnum', 0), 0x1: ('price', 'int', 4), 0x2: ('priceLevel', 'int', 4)},
+    'CommodityTariff.Structs.TariffComponentStruct': {0x0: ('tariffComponentID', 'uint', 0), 0x1: ('price', 'CommodityTariff.Structs.TariffPriceStruct', 6), 0x2: ('friendlyCredit', 'bool', 4), 0x3: ('auxiliaryLoad', 'CommodityTariff.Structs.AuxiliaryLoadSwitchSettingsStruct', 4), 0x4: ('peakPeriod', 'CommodityTariff.Structs.PeakPeriodStruct', 4), 0x5: ('powerThreshold', 'Globals.Structs.PowerThresholdStruct', 4), 0x6: ('threshold', 'int', 2), 0x7: ('label', 'str', 6), 0x8: ('predicted', 'bool', 4)},
+    'CommodityTariff.Structs.TariffPeriodStruct': {0x0: ('label', 'str', 2), 0x1: ('dayEntryIDs', 'uint', 1), 0x2: ('tariffComponentIDs', 'uint', 1)},
+    'ContentControl.Structs.RatingNameStruct': {0x0: ('ratingName', 'str', 0), 0x1: ('ratingNameDesc', 'str', 4)},
+    'ContentControl.Structs.BlockChannelStruct': {0x0: ('blockChannelIndex', 'uint', 2), 0x1: ('majorNumber', 'uint', 0), 0x2: ('minorNumber', 'uint', 0), 0x3: ('identifier', 'str', 4)},
+    'ContentControl.Structs.AppInfoStruct': {0x0: ('catalogVendorID', 'uint', 0), 0x1: ('applicationID', 'str', 0)},
+    'ContentControl.Structs.TimeWindowStruct': {0x0: ('timeWindowIndex', 'uint', 2), 0x1: ('dayOfWeek', 'ContentControl.Bitmaps.DayOfWeekBitmap', 0), 0x2: ('timePeriod', 'ContentControl.Structs.TimePeriodStruct', 1)},
+    'ContentControl.Structs.TimePeriodStruct': {0x0: ('startHour', 'uint', 0), 0x1: ('startMinute', 'uint', 0), 0x2: ('endHour', 'uint', 0), 0x3: ('endMinute', 'uint', 0)},
+    'ContentLauncher.Structs.AdditionalInfoStruct': {0x0: ('name', 'str', 0), 0x1: ('value', 'str', 0)},
+    'ContentLauncher.Structs.ParameterStruct': {0x0: ('type', 'ContentLauncher.Enums.ParameterEnum', 0), 0x1: ('value', 'str', 0), 0x2: ('externalIDList', 'ContentLauncher.Structs.AdditionalInfoStruct', 5)},
+    'ContentLauncher.Structs.ContentSearchStruct': {0x0: ('parameterList', 'ContentLauncher.Structs.ParameterStruct', 1)},
+    'ContentLauncher.Structs.DimensionStruct': {0x0: ('width', 'float', 0), 0x1: ('height', 'float', 0), 0x2: ('metric', 'ContentLauncher.Enums.MetricTypeEnum', 0)},
+    'ContentLauncher.Structs.StyleInformationStruct': {0x0: ('imageURL', 'str', 4), 0x1: ('color', 'str', 4), 0x2: ('size', 'ContentLauncher.Structs.DimensionStruct', 4)},
+    'ContentLauncher.Structs.BrandingInformationStruct': {0x0: ('providerName', 'str', 0), 0x1: ('background', 'ContentLauncher.Structs.StyleInformationStruct', 4), 0x2: ('logo', 'ContentLauncher.Structs.StyleInformationStruct', 4), 0x3: ('progressBar', 'ContentLauncher.Structs.StyleInformationStruct', 4), 0x4: ('splash', 'ContentLauncher.Structs.StyleInformationStruct', 4), 0x5: ('waterMark', 'ContentLauncher.Structs.StyleInformationStruct', 4)},
+    'ContentLauncher.Structs.PlaybackPreferencesStruct': {0x0: ('playbackPosition', 'uint', 6), 0x1: ('textTrack', 'ContentLauncher.Structs.TrackPreferenceStruct', 6), 0x2: ('audioTracks', 'ContentLauncher.Structs.TrackPreferenceStruct', 7)},
+    'ContentLauncher.Structs.TrackPreferenceStruct': {0x0: ('languageCode', 'str', 0), 0x1: ('characteristics', 'MediaPlayback.Enums.CharacteristicEnum', 7), 0x2: ('audioOutputIndex', 'uint', 6)},
+    'Descriptor.Structs.DeviceTypeStruct': {0x0: ('deviceType', 'uint', 0), 0x1: ('revision', 'uint', 0)},
+    'DeviceEnergyManagement.Structs.CostStruct': {0x0: ('costType', 'DeviceEnergyManagement.Enums.CostTypeEnum', 0), 0x1: ('value', 'int', 0), 0x2: ('decimalPoints', 'uint', 0), 0x3: ('currency', 'uint', 4)},
+    'DeviceEnergyManagement.Structs.PowerAdjustStruct': {0x0: ('minPower', 'int', 0), 0x1: ('maxPower', 'int', 0), 0x2: ('minDuration', 'uint', 0), 0x3: ('maxDuration', 'uint', 0)},
+    'DeviceEnergyManagement.Structs.PowerAdjustCapabilityStruct': {0x0: ('powerAdjustCapability', 'DeviceEnergyManagement.Structs.PowerAdjustStruct', 3), 0x1: ('cause', 'DeviceEnergyManagement.Enums.PowerAdjustReasonEnum', 0)},
+    'DeviceEnergyManagement.Structs.ForecastStruct': {0x0: ('forecastID', 'uint', 0), 0x1: ('activeSlotNumber', 'uint', 2), 0x2: ('startTime', 'uint', 0), 0x3: ('endTime', 'uint', 0), 0x4: ('earliestStartTime', 'uint', 6), 0x5: ('latestEndTime', 'uint', 4), 0x6: ('isPausable', 'bool', 0), 0x7: ('slots', 'DeviceEnergyManagement.Structs.SlotStruct', 1), 0x8: ('forecastUpdateReason', 'DeviceEnergyManagement.Enums.ForecastUpdateReasonEnum', 0)},
+    'DeviceEnergyManagement.Structs.SlotStruct': {0x0: ('minDuration', 'uint', 0), 0x1: ('maxDuration', 'uint', 0), 0x2: ('defaultDuration', 'uint', 0), 0x3: ('elapsedSlotTime', 'uint', 0), 0x4: ('remainingSlotTime', 'uint', 0), 0x5: ('slotIsPausable', 'bool', 4), 0x6: ('minPauseDuration', 'uint', 4), 0x7: ('maxPauseDuration', 'uint', 4), 0x8: ('manufacturerESAState', 'uint', 4), 0x9: ('nominalPower', 'int', 4), 0xA: ('minPower', 'int', 4), 0xB: ('maxPower', 'int', 4), 0xC: ('nominalEnergy', 'int', 4), 0xD: ('costs', 'DeviceEnergyManagement.Structs.CostStruct', 5), 0xE: ('minPowerAdjustment', 'int', 4), 0xF: ('maxPowerAdjustment', 'int', 4), 0x10: ('minDurationAdjustment', 'uint', 4), 0x11: ('maxDurationAdjustment', 'uint', 4)},
+    'DeviceEnergyManagement.Structs.SlotAdjustmentStruct': {0x0: ('slotIndex', 'uint', 0), 0x1: ('nominalPower', 'int', 4), 0x2: ('duration', 'uint', 0)},
+    'DeviceEnergyManagement.Structs.ConstraintsStruct': {0x0: ('startTime', 'uint', 0), 0x1: ('duration', 'uint', 0), 0x2: ('nominalPower', 'int', 4), 0x3: ('maximumEnergy', 'int', 4), 0x4: ('loadControl', 'int', 4)},
+    'DeviceEnergyManagementMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'DeviceEnergyManagementMode.Structs.ModeTagStruct', 1)},
+    'DeviceEnergyManagementMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'DeviceEnergyManagementMode.Enums.ModeTag', 0)},
+    'DishwasherMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'DishwasherMode.Structs.ModeTagStruct', 1)},
+    'DishwasherMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'DishwasherMode.Enums.ModeTag', 0)},
+    'DoorLock.Structs.CredentialStruct': {0x0: ('credentialType', 'DoorLock.Enums.CredentialTypeEnum', 0), 0x1: ('credentialIndex', 'uint', 0)},
+    'EcosystemInformation.Structs.DeviceTypeStruct': {0x0: ('deviceType', 'uint', 0), 0x1: ('revision', 'uint', 0)},
+    'EcosystemInformation.Structs.EcosystemDeviceStruct': {0x0: ('deviceName', 'str', 4), 0x1: ('deviceNameLastEdit', 'uint', 4), 0x2: ('bridgedEndpoint', 'uint', 4), 0x3: ('originalEndpoint', 'uint', 4), 0x4: ('deviceTypes', 'EcosystemInformation.Structs.DeviceTypeStruct', 1), 0x5: ('uniqueLocationIDs', 'str', 1), 0x6: ('uniqueLocationIDsLastEdit', 'uint', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'EcosystemInformation.Structs.EcosystemLocationStruct': {0x0: ('uniqueLocationID', 'str', 0), 0x1: ('locationDescriptor', 'Globals.Structs.locationdesc', 0), 0x2: ('locationDescriptorLastEdit', 'uint', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'ElectricalEnergyMeasurement.Structs.EnergyMeasurementStruct': {0x0: ('energy', 'int', 0), 0x1: ('startTimestamp', 'uint', 4), 0x2: ('endTimestamp', 'uint', 4), 0x3: ('startSystime', 'uint', 4), 0x4: ('endSystime', 'uint', 4), 0x5: ('apparentEnergy', 'int', 4), 0x6: ('reactiveEnergy', 'int', 4)},
+    'ElectricalEnergyMeasurement.Structs.CumulativeEnergyResetStruct': {0x0: ('importedResetTimestamp', 'uint', 6), 0x1: ('exportedResetTimestamp', 'uint', 6), 0x2: ('importedResetSystime', 'uint', 6), 0x3: ('exportedResetSystime', 'uint', 6)},
+    'ElectricalGridConditions.Structs.ElectricalGridConditionsStruct': {0x0: ('periodStart', 'uint', 0), 0x1: ('periodEnd', 'uint', 2), 0x2: ('gridCarbonIntensity', 'int', 0), 0x3: ('gridCarbonLevel', 'ElectricalGridConditions.Enums.ThreeLevelEnum', 0), 0x4: ('localCarbonIntensity', 'int', 0), 0x5: ('localCarbonLevel', 'ElectricalGridConditions.Enums.ThreeLevelEnum', 0)},
+    'ElectricalPowerMeasurement.Structs.MeasurementRangeStruct': {0x0: ('measurementType', 'ElectricalPowerMeasurement.Enums.MeasurementTypeEnum', 0), 0x1: ('min', 'int', 0), 0x2: ('max', 'int', 0), 0x3: ('startTimestamp', 'uint', 4), 0x4: ('endTimestamp', 'uint', 4), 0x5: ('minTimestamp', 'uint', 4), 0x6: ('maxTimestamp', 'uint', 4), 0x7: ('startSystime', 'uint', 4), 0x8: ('endSystime', 'uint', 4), 0x9: ('minSystime', 'uint', 4), 0xA: ('maxSystime', 'uint', 4)},
+    'ElectricalPowerMeasurement.Structs.HarmonicMeasurementStruct': {0x0: ('order', 'uint', 0), 0x1: ('measurement', 'int', 2)},
+    'EnergyEvse.Structs.ChargingTargetStruct': {0x0: ('targetTimeMinutesPastMidnight', 'uint', 0), 0x1: ('targetSoC', 'uint', 4), 0x2: ('addedEnergy', 'int', 4)},
+    'EnergyEvse.Structs.ChargingTargetScheduleStruct': {0x0: ('dayOfWeekForSequence', 'EnergyEvse.Bitmaps.TargetDayOfWeekBitmap', 0), 0x1: ('chargingTargets', 'EnergyEvse.Structs.ChargingTargetStruct', 1)},
+    'EnergyEvseMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'EnergyEvseMode.Structs.ModeTagStruct', 1)},
+    'EnergyEvseMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'EnergyEvseMode.Enums.ModeTag', 0)},
+    'EnergyPreference.Structs.BalanceStruct': {0x0: ('step', 'uint', 0), 0x1: ('label', 'str', 4)},
+    'FixedLabel.Structs.LabelStruct': {0x0: ('label', 'str', 0), 0x1: ('value', 'str', 0)},
+    'GeneralCommissioning.Structs.BasicCommissioningInfo': {0x0: ('failSafeExpiryLengthSeconds', 'uint', 0), 0x1: ('maxCumulativeFailsafeSeconds', 'uint', 0)},
+    'GeneralDiagnostics.Structs.NetworkInterface': {0x0: ('name', 'str', 0), 0x1: ('isOperational', 'bool', 0), 0x2: ('offPremiseServicesReachableIPv4', 'bool', 2), 0x3: ('offPremiseServicesReachableIPv6', 'bool', 2), 0x4: ('hardwareAddress', 'bytes', 0), 0x5: ('IPv4Addresses', 'bytes', 1), 0x6: ('IPv6Addresses', 'bytes', 1), 0x7: ('type', 'GeneralDiagnostics.Enums.InterfaceTypeEnum', 0)},
+    'GeneralDiagnostics.Structs.DeviceLoadStruct': {0x0: ('currentSubscriptions', 'uint', 0), 0x1: ('currentSubscriptionsForFabric', 'uint', 0), 0x2: ('totalSubscriptionsEstablished', 'uint', 0), 0x3: ('totalInteractionModelMessagesSent', 'uint', 0), 0x4: ('totalInteractionModelMessagesReceived', 'uint', 0)},
+    'GroupKeyManagement.Structs.GroupKeyMapStruct': {0x1: ('groupID', 'uint', 0), 0x2: ('groupKeySetID', 'uint', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'GroupKeyManagement.Structs.GroupKeySetStruct': {0x0: ('groupKeySetID', 'uint', 0), 0x1: ('groupKeySecurityPolicy', 'GroupKeyManagement.Enums.GroupKeySecurityPolicyEnum', 0), 0x2: ('epochKey0', 'bytes', 2), 0x3: ('epochStartTime0', 'uint', 2), 0x4: ('epochKey1', 'bytes', 2), 0x5: ('epochStartTime1', 'uint', 2), 0x6: ('epochKey2', 'bytes', 2), 0x7: ('epochStartTime2', 'uint', 2), 0x8: ('groupKeyMulticastPolicy', 'GroupKeyManagement.Enums.GroupKeyMulticastPolicyEnum', 4), 0xFE: ('fabricIndex', 'uint', 4)},
+    'GroupKeyManagement.Structs.GroupInfoMapStruct': {0x1: ('groupID', 'uint', 0), 0x2: ('endpoints', 'uint', 1), 0x3: ('groupName', 'str', 4), 0xFE: ('fabricIndex', 'uint', 0)},
+    'GroupKeyManagement.Structs.GroupcastAdoptionStruct': {0x0: ('groupcastAdopted', 'bool', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'Groupcast.Structs.MembershipStruct': {0x0: ('groupID', 'uint', 0), 0x1: ('endpoints', 'uint', 5), 0x2: ('keySetID', 'uint', 0), 0x3: ('hasAuxiliaryAcl', 'bool', 4), 0x4: ('mcastAddrPolicy', 'Groupcast.Enums.MulticastAddrPolicyEnum', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'HepaFilterMonitoring.Structs.ReplacementProductStruct': {0x0: ('productIdentifierType', 'HepaFilterMonitoring.Enums.ProductIdentifierTypeEnum', 0), 0x1: ('productIdentifierValue', 'str', 0)},
+    'IcdManagement.Structs.MonitoringRegistrationStruct': {0x1: ('checkInNodeID', 'uint', 0), 0x2: ('monitoredSubject', 'uint', 0), 0x3: ('key', 'uint', 4), 0x4: ('clientType', 'IcdManagement.Enums.ClientTypeEnum', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'JointFabricDatastore.Structs.DatastoreStatusEntryStruct': {0x0: ('state', 'JointFabricDatastore.Enums.DatastoreStateEnum', 0), 0x1: ('updateTimestamp', 'uint', 0), 0x2: ('failureCode', 'Globals.Enums.status', 0)},
+    'JointFabricDatastore.Structs.DatastoreNodeKeySetEntryStruct': {0x0: ('nodeID', 'uint', 0), 0x1: ('groupKeySetID', 'uint', 0), 0x2: ('statusEntry', 'JointFabricDatastore.Structs.DatastoreStatusEntryStruct', 0)},
+    'JointFabricDatastore.Structs.DatastoreGroupInformationEntryStruct': {0x0: ('groupID', 'uint', 0), 0x1: ('friendlyName', 'str', 0), 0x2: ('groupKeySetID', 'uint', 2), 0x3: ('groupCat', 'uint', 2), 0x4: ('groupCatVersion', 'uint', 2), 0x5: ('groupPermission', 'JointFabricDatastore.Enums.DatastoreAccessControlEntryPrivilegeEnum', 0)},
+    'JointFabricDatastore.Structs.DatastoreBindingTargetStruct': {0x1: ('node', 'uint', 4), 0x2: ('group', 'uint', 4), 0x3: ('endpoint', 'uint', 4), 0x4: ('cluster', 'uint', 4)},
+    'JointFabricDatastore.Structs.DatastoreEndpointBindingEntryStruct': {0x0: ('nodeID', 'uint', 0), 0x1: ('endpointID', 'uint', 0), 0x2: ('listID', 'uint', 0), 0x3: ('binding', 'JointFabricDatastore.Structs.DatastoreBindingTargetStruct', 0), 0x4: ('statusEntry', 'JointFabricDatastore.Structs.DatastoreStatusEntryStruct', 0)},
+    'JointFabricDatastore.Structs.DatastoreEndpointGroupIDEntryStruct': {0x0: ('nodeID', 'uint', 0), 0x1: ('endpointID', 'uint', 0), 0x2: ('groupID', 'uint', 0), 0x3: ('statusEntry', 'JointFabricDatastore.Structs.DatastoreStatusEntryStruct', 0)},
+    'JointFabricDatastore.Structs.DatastoreEndpointEntryStruct': {0x0: ('endpointID', 'uint', 0), 0x1: ('nodeID', 'uint', 0), 0x2: ('friendlyName', 'str', 0)},
+    'JointFabricDatastore.Structs.DatastoreAccessControlTargetStruct': {0x0: ('cluster', 'uint', 2), 0x1: ('endpoint', 'uint', 2), 0x2: ('deviceType', 'uint', 2)},
+    'JointFabricDatastore.Structs.DatastoreAccessControlEntryStruct': {0x1: ('privilege', 'JointFabricDatastore.Enums.DatastoreAccessControlEntryPrivilegeEnum', 0), 0x2: ('authMode', 'JointFabricDatastore.Enums.DatastoreAccessControlEntryAuthModeEnum', 0), 0x3: ('subjects', 'uint', 3), 0x4: ('targets', 'JointFabricDatastore.Structs.DatastoreAccessControlTargetStruct', 3)},
+    'JointFabricDatastore.Structs.DatastoreACLEntryStruct': {0x0: ('nodeID', 'uint', 0), 0x1: ('listID', 'uint', 0), 0x2: ('aclEntry', 'JointFabricDatastore.Structs.DatastoreAccessControlEntryStruct', 0), 0x3: ('statusEntry', 'JointFabricDatastore.Structs.DatastoreStatusEntryStruct', 0)},
+    'JointFabricDatastore.Structs.DatastoreNodeInformationEntryStruct': {0x0: ('nodeID', 'uint', 0), 0x1: ('friendlyName', 'str', 0), 0x2: ('commissioningStatusEntry', 'JointFabricDatastore.Structs.DatastoreStatusEntryStruct', 0)},
+    'JointFabricDatastore.Structs.DatastoreAdministratorInformationEntryStruct': {0x0: ('nodeID', 'uint', 0), 0x1: ('friendlyName', 'str', 0), 0x2: ('vendorID', 'uint', 0), 0x3: ('icac', 'bytes', 0)},
+    'JointFabricDatastore.Structs.DatastoreGroupKeySetStruct': {0x0: ('groupKeySetID', 'uint', 0), 0x1: ('groupKeySecurityPolicy', 'JointFabricDatastore.Enums.DatastoreGroupKeySecurityPolicyEnum', 0), 0x2: ('epochKey0', 'bytes', 2), 0x3: ('epochStartTime0', 'uint', 2), 0x4: ('epochKey1', 'bytes', 2), 0x5: ('epochStartTime1', 'uint', 2), 0x6: ('epochKey2', 'bytes', 2), 0x7: ('epochStartTime2', 'uint', 2), 0x8: ('groupKeyMulticastPolicy', 'JointFabricDatastore.Enums.DatastoreGroupKeyMulticastPolicyEnum', 4)},
+    'LaundryWasherMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'LaundryWasherMode.Structs.ModeTagStruct', 1)},
+    'LaundryWasherMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'LaundryWasherMode.Enums.ModeTag', 0)},
+    'MediaInput.Structs.InputInfoStruct': {0x0: ('index', 'uint', 0), 0x1: ('inputType', 'MediaInput.Enums.InputTypeEnum', 0), 0x2: ('name', 'str', 0), 0x3: ('description', 'str', 0)},
+    'MediaPlayback.Structs.PlaybackPositionStruct': {0x0: ('updatedAt', 'uint', 0), 0x1: ('position', 'uint', 2)},
+    'MediaPlayback.Structs.TrackStruct': {0x0: ('id', 'str', 0), 0x1: ('trackAttributes', 'MediaPlayback.Structs.TrackAttributesStruct', 0)},
+    'MediaPlayback.Structs.TrackAttributesStruct': {0x0: ('languageCode', 'str', 0), 0x1: ('characteristics', 'MediaPlayback.Enums.CharacteristicEnum', 7), 0x2: ('displayName', 'str', 6)},
+    'Messages.Structs.MessageStruct': {0x0: ('messageID', 'bytes', 0), 0x1: ('priority', 'Messages.Enums.MessagePriorityEnum', 0), 0x2: ('messageControl', 'Messages.Bitmaps.MessageControlBitmap', 0), 0x3: ('startTime', 'uint', 2), 0x4: ('duration', 'uint', 2), 0x5: ('messageText', 'str', 0), 0x6: ('responses', 'Messages.Structs.MessageResponseOptionStruct', 5), 0xFE: ('fabricIndex', 'uint', 0)},
+    'Messages.Structs.MessageResponseOptionStruct': {0x0: ('messageResponseID', 'uint', 0), 0x1: ('label', 'str', 0)},
+    'MicrowaveOvenMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'MicrowaveOvenMode.Enums.ModeTag', 0)},
+    'MicrowaveOvenMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'MicrowaveOvenMode.Structs.ModeTagStruct', 1)},
+    'ModeSelect.Structs.SemanticTagStruct': {0x0: ('mfgCode', 'uint', 0), 0x1: ('value', 'uint', 0)},
+    'ModeSelect.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('semanticTags', 'ModeSelect.Structs.SemanticTagStruct', 1)},
+    'NetworkCommissioning.Structs.NetworkInfoStruct': {0x0: ('networkID', 'bytes', 0), 0x1: ('connected', 'bool', 0)},
+    'NetworkCommissioning.Structs.WiFiInterfaceScanResultStruct': {0x0: ('security', 'NetworkCommissioning.Bitmaps.WiFiSecurityBitmap', 0), 0x1: ('ssid', 'bytes', 0), 0x2: ('bssid', 'bytes', 0), 0x3: ('channel', 'uint', 0), 0x4: ('wiFiBand', 'NetworkCommissioning.Enums.WiFiBandEnum', 4), 0x5: ('rssi', 'int', 4)},
+    'NetworkCommissioning.Structs.ThreadInterfaceScanResultStruct': {0x0: ('panId', 'uint', 0), 0x1: ('extendedPanId', 'uint', 0), 0x2: ('networkName', 'str', 0), 0x3: ('channel', 'uint', 0), 0x4: ('version', 'uint', 0), 0x5: ('extendedAddress', 'bytes', 0), 0x6: ('rssi', 'int', 0), 0x7: ('lqi', 'uint', 0)},
+    'OccupancySensing.Structs.HoldTimeLimitsStruct': {0x0: ('holdTimeMin', 'uint', 0), 0x1: ('holdTimeMax', 'uint', 0), 0x2: ('holdTimeDefault', 'uint', 0)},
+    'OperationalCredentials.Structs.NOCStruct': {0x1: ('noc', 'bytes', 0), 0x2: ('icac', 'bytes', 2), 0x3: ('vvsc', 'bytes', 4), 0xFE: ('fabricIndex', 'uint', 0)},
+    'OperationalCredentials.Structs.FabricDescriptorStruct': {0x1: ('rootPublicKey', 'bytes', 0), 0x2: ('vendorID', 'uint', 0), 0x3: ('fabricID', 'uint', 0), 0x4: ('nodeID', 'uint', 0), 0x5: ('label', 'str', 0), 0x6: ('VIDVerificationStatement', 'bytes', 4), 0xFE: ('fabricIndex', 'uint', 0)},
+    'OperationalState.Structs.OperationalStateStruct': {0x0: ('operationalStateID', 'OperationalState.Enums.OperationalStateEnum', 0), 0x1: ('operationalStateLabel', 'str', 4)},
+    'OperationalState.Structs.ErrorStateStruct': {0x0: ('errorStateID', 'OperationalState.Enums.ErrorStateEnum', 0), 0x1: ('errorStateLabel', 'str', 4), 0x2: ('errorStateDetails', 'str', 4)},
+    'OtaSoftwareUpdateRequestor.Structs.ProviderLocation': {0x1: ('providerNodeID', 'uint', 0), 0x2: ('endpoint', 'uint', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'OvenCavityOperationalState.Structs.OperationalStateStruct': {0x0: ('operationalStateID', 'OvenCavityOperationalState.Enums.OperationalStateEnum', 0), 0x1: ('operationalStateLabel', 'str', 4)},
+    'OvenCavityOperationalState.Structs.ErrorStateStruct': {0x0: ('errorStateID', 'OvenCavityOperationalState.Enums.ErrorStateEnum', 0), 0x1: ('errorStateLabel', 'str', 4), 0x2: ('errorStateDetails', 'str', 4)},
+    'OvenMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'OvenMode.Structs.ModeTagStruct', 1)},
+    'OvenMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'OvenMode.Enums.ModeTag', 0)},
+    'PushAvStreamTransport.Structs.SupportedFormatStruct': {0x0: ('containerFormat', 'PushAvStreamTransport.Enums.ContainerFormatEnum', 0), 0x1: ('ingestMethod', 'PushAvStreamTransport.Enums.IngestMethodsEnum', 0)},
+    'PushAvStreamTransport.Structs.VideoStreamStruct': {0x0: ('videoStreamName', 'str', 0), 0x1: ('videoStreamID', 'uint', 0)},
+    'PushAvStreamTransport.Structs.AudioStreamStruct': {0x0: ('audioStreamName', 'str', 0), 0x1: ('audioStreamID', 'uint', 0)},
+    'PushAvStreamTransport.Structs.CMAFContainerOptionsStruct': {0x0: ('cmafInterface', 'PushAvStreamTransport.Enums.CMAFInterfaceEnum', 0), 0x1: ('segmentDuration', 'uint', 0), 0x2: ('chunkDuration', 'uint', 0), 0x3: ('sessionGroup', 'uint', 4), 0x4: ('trackName', 'str', 4), 0x7: ('metadataEnabled', 'bool', 4)},
+    'PushAvStreamTransport.Structs.ContainerOptionsStruct': {0x0: ('containerType', 'PushAvStreamTransport.Enums.ContainerFormatEnum', 0), 0x1: ('cmafContainerOptions', 'PushAvStreamTransport.Structs.CMAFContainerOptionsStruct', 4)},
+    'PushAvStreamTransport.Structs.TransportZoneOptionsStruct': {0x0: ('zone', 'uint', 2), 0x1: ('sensitivity', 'uint', 4)},
+    'PushAvStreamTransport.Structs.TransportTriggerOptionsStruct': {0x0: ('triggerType', 'PushAvStreamTransport.Enums.TransportTriggerTypeEnum', 0), 0x1: ('motionZones', 'PushAvStreamTransport.Structs.TransportZoneOptionsStruct', 7), 0x2: ('motionSensitivity', 'uint', 6), 0x3: ('motionTimeControl', 'PushAvStreamTransport.Structs.TransportMotionTriggerTimeControlStruct', 4), 0x4: ('maxPreRollLen', 'uint', 4)},
+    'PushAvStreamTransport.Structs.TransportMotionTriggerTimeControlStruct': {0x0: ('initialDuration', 'uint', 0), 0x1: ('augmentationDuration', 'uint', 0), 0x2: ('maxDuration', 'uint', 0), 0x3: ('blindDuration', 'uint', 0)},
+    'PushAvStreamTransport.Structs.TransportOptionsStruct': {0x0: ('streamUsage', 'Globals.Enums.StreamUsageEnum', 0), 0x1: ('videoStreamID', 'uint', 6), 0x2: ('audioStreamID', 'uint', 6), 0x3: ('tlsEndpointID', 'uint', 0), 0x4: ('URL', 'str', 0), 0x5: ('triggerOptions', 'PushAvStreamTransport.Structs.TransportTriggerOptionsStruct', 0), 0x6: ('ingestMethod', 'PushAvStreamTransport.Enums.IngestMethodsEnum', 0), 0x7: ('containerOptions', 'PushAvStreamTransport.Structs.ContainerOptionsStruct', 0), 0x8: ('expiryTime', 'uint', 4), 0x9: ('videoStreams', 'PushAvStreamTransport.Structs.VideoStreamStruct', 5), 0xA: ('audioStreams', 'PushAvStreamTransport.Structs.AudioStreamStruct', 5)},
+    'PushAvStreamTransport.Structs.TransportConfigurationStruct': {0x0: ('connectionID', 'uint', 0), 0x1: ('transportStatus', 'PushAvStreamTransport.Enums.TransportStatusEnum', 0), 0x2: ('transportOptions', 'PushAvStreamTransport.Structs.TransportOptionsStruct', 4), 0xFE: ('fabricIndex', 'uint', 0)},
+    'RefrigeratorAndTemperatureControlledCabinetMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'RefrigeratorAndTemperatureControlledCabinetMode.Structs.ModeTagStruct', 1)},
+    'RefrigeratorAndTemperatureControlledCabinetMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'RefrigeratorAndTemperatureControlledCabinetMode.Enums.ModeTag', 0)},
+    'RvcCleanMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'RvcCleanMode.Structs.ModeTagStruct', 1)},
+    'RvcCleanMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'RvcCleanMode.Enums.ModeTag', 0)},
+    'RvcOperationalState.Structs.OperationalStateStruct': {0x0: ('operationalStateID', 'RvcOperationalState.Enums.OperationalStateEnum', 0), 0x1: ('operationalStateLabel', 'str', 4)},
+    'RvcOperationalState.Structs.ErrorStateStruct': {0x0: ('errorStateID', 'RvcOperationalState.Enums.ErrorStateEnum', 0), 0x1: ('errorStateLabel', 'str', 4), 0x2: ('errorStateDetails', 'str', 4)},
+    'RvcRunMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'RvcRunMode.Structs.ModeTagStruct', 1)},
+    'RvcRunMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'RvcRunMode.Enums.ModeTag', 0)},
+    'ScenesManagement.Structs.SceneInfoStruct': {0x0: ('sceneCount', 'uint', 0), 0x1: ('currentScene', 'uint', 0), 0x2: ('currentGroup', 'uint', 0), 0x3: ('sceneValid', 'bool', 0), 0x4: ('remainingCapacity', 'uint', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'ScenesManagement.Structs.AttributeValuePairStruct': {0x0: ('attributeID', 'uint', 0), 0x1: ('valueUnsigned8', 'uint', 4), 0x2: ('valueSigned8', 'int', 4), 0x3: ('valueUnsigned16', 'uint', 4), 0x4: ('valueSigned16', 'int', 4), 0x5: ('valueUnsigned32', 'uint', 4), 0x6: ('valueSigned32', 'int', 4), 0x7: ('valueUnsigned64', 'uint', 4), 0x8: ('valueSigned64', 'int', 4)},
+    'ScenesManagement.Structs.ExtensionFieldSetStruct': {0x0: ('clusterID', 'uint', 0), 0x1: ('attributeValueList', 'ScenesManagement.Structs.AttributeValuePairStruct', 1)},
+    'ScenesManagement.Structs.LogicalSceneTable': {0x0: ('sceneGroupID', 'uint', 0), 0x1: ('sceneID', 'uint', 0), 0x2: ('sceneName', 'str', 4), 0x3: ('sceneTransitionTime', 'uint', 0), 0x4: ('extensionFields', 'ScenesManagement.Structs.ExtensionFieldSetStruct', 1)},
+    'ServiceArea.Structs.LandmarkInfoStruct': {0x0: ('landmarkTag', 'uint', 0), 0x1: ('relativePositionTag', 'uint', 2)},
+    'ServiceArea.Structs.AreaInfoStruct': {0x0: ('locationInfo', 'Globals.Structs.locationdesc', 2), 0x1: ('landmarkInfo', 'ServiceArea.Structs.LandmarkInfoStruct', 2)},
+    'ServiceArea.Structs.MapStruct': {0x0: ('mapID', 'uint', 0), 0x1: ('name', 'str', 0)},
+    'ServiceArea.Structs.AreaStruct': {0x0: ('areaID', 'uint', 0), 0x1: ('mapID', 'uint', 2), 0x2: ('areaInfo', 'ServiceArea.Structs.AreaInfoStruct', 0)},
+    'ServiceArea.Structs.ProgressStruct': {0x0: ('areaID', 'uint', 0), 0x1: ('status', 'ServiceArea.Enums.OperationalStatusEnum', 0), 0x2: ('totalOperationalTime', 'uint', 6), 0x3: ('estimatedTime', 'uint', 6)},
+    'SoftwareDiagnostics.Structs.ThreadMetricsStruct': {0x0: ('id', 'uint', 0), 0x1: ('name', 'str', 4), 0x2: ('stackFreeCurrent', 'uint', 4), 0x3: ('stackFreeMinimum', 'uint', 4), 0x4: ('stackSize', 'uint', 4)},
+    'TargetNavigator.Structs.TargetInfoStruct': {0x0: ('identifier', 'uint', 0), 0x1: ('name', 'str', 0)},
+    'Thermostat.Structs.PresetStruct': {0x0: ('presetHandle', 'bytes', 2), 0x1: ('presetScenario', 'Thermostat.Enums.PresetScenarioEnum', 0), 0x2: ('name', 'str', 6), 0x3: ('coolingSetpoint', 'int', 4), 0x4: ('heatingSetpoint', 'int', 4), 0x5: ('builtIn', 'bool', 2)},
+    'Thermostat.Structs.PresetTypeStruct': {0x0: ('presetScenario', 'Thermostat.Enums.PresetScenarioEnum', 0), 0x1: ('numberOfPresets', 'uint', 0), 0x2: ('presetTypeFeatures', 'Thermostat.Bitmaps.PresetTypeFeaturesBitmap', 0)},
+    'Thermostat.Structs.WeeklyScheduleTransitionStruct': {0x0: ('transitionTime', 'uint', 0), 0x1: ('heatSetpoint', 'int', 2), 0x2: ('coolSetpoint', 'int', 2)},
+    'Thermostat.Structs.ScheduleStruct': {0x0: ('scheduleHandle', 'bytes', 2), 0x1: ('systemMode', 'Thermostat.Enums.SystemModeEnum', 0), 0x2: ('name', 'str', 4), 0x3: ('presetHandle', 'bytes', 4), 0x4: ('transitions', 'Thermostat.Structs.ScheduleTransitionStruct', 1), 0x5: ('builtIn', 'bool', 2)},
+    'Thermostat.Structs.ScheduleTransitionStruct': {0x0: ('dayOfWeek', 'Thermostat.Bitmaps.ScheduleDayOfWeekBitmap', 0), 0x1: ('transitionTime', 'uint', 0), 0x2: ('presetHandle', 'bytes', 4), 0x3: ('systemMode', 'Thermostat.Enums.SystemModeEnum', 4), 0x4: ('coolingSetpoint', 'int', 4), 0x5: ('heatingSetpoint', 'int', 4)},
+    'Thermostat.Structs.ScheduleTypeStruct': {0x0: ('systemMode', 'Thermostat.Enums.SystemModeEnum', 0), 0x1: ('numberOfSchedules', 'uint', 0), 0x2: ('scheduleTypeFeatures', 'Thermostat.Bitmaps.ScheduleTypeFeaturesBitmap', 0)},
+    'Thermostat.Structs.ThermostatSuggestionStruct': {0x0: ('uniqueID', 'uint', 0), 0x1: ('presetHandle', 'bytes', 0), 0x2: ('effectiveTime', 'uint', 0), 0x3: ('expirationTime', 'uint', 0)},
+    'ThreadNetworkDiagnostics.Structs.NeighborTableStruct': {0x0: ('extAddress', 'uint', 0), 0x1: ('age', 'uint', 0), 0x2: ('rloc16', 'uint', 0), 0x3: ('linkFrameCounter', 'uint', 0), 0x4: ('mleFrameCounter', 'uint', 0), 0x5: ('lqi', 'uint', 0), 0x6: ('averageRssi', 'int', 2), 0x7: ('lastRssi', 'int', 2), 0x8: ('frameErrorRate', 'uint', 0), 0x9: ('messageErrorRate', 'uint', 0), 0xA: ('rxOnWhenIdle', 'bool', 0), 0xB: ('fullThreadDevice', 'bool', 0), 0xC: ('fullNetworkData', 'bool', 0), 0xD: ('isChild', 'bool', 0)},
+    'ThreadNetworkDiagnostics.Structs.RouteTableStruct': {0x0: ('extAddress', 'uint', 0), 0x1: ('rloc16', 'uint', 0), 0x2: ('routerId', 'uint', 0), 0x3: ('nextHop', 'uint', 0), 0x4: ('pathCost', 'uint', 0), 0x5: ('LQIIn', 'uint', 0), 0x6: ('LQIOut', 'uint', 0), 0x7: ('age', 'uint', 0), 0x8: ('allocated', 'bool', 0), 0x9: ('linkEstablished', 'bool', 0)},
+    'ThreadNetworkDiagnostics.Structs.SecurityPolicy': {0x0: ('rotationTime', 'uint', 0), 0x1: ('flags', 'uint', 0)},
+    'ThreadNetworkDiagnostics.Structs.OperationalDatasetComponents': {0x0: ('activeTimestampPresent', 'bool', 0), 0x1: ('pendingTimestampPresent', 'bool', 0), 0x2: ('masterKeyPresent', 'bool', 0), 0x3: ('networkNamePresent', 'bool', 0), 0x4: ('extendedPanIdPresent', 'bool', 0), 0x5: ('meshLocalPrefixPresent', 'bool', 0), 0x6: ('delayPresent', 'bool', 0), 0x7: ('panIdPresent', 'bool', 0), 0x8: ('channelPresent', 'bool', 0), 0x9: ('pskcPresent', 'bool', 0), 0xA: ('securityPolicyPresent', 'bool', 0), 0xB: ('channelMaskPresent', 'bool', 0)},
+    'ThreadNetworkDirectory.Structs.ThreadNetworkStruct': {0x0: ('extendedPanId', 'bytes', 0), 0x1: ('networkName', 'str', 0), 0x2: ('channel', 'uint', 0), 0x3: ('activeTimestamp', 'uint', 0)},
+    'TimeSynchronization.Structs.TrustedTimeSourceStruct': {0x0: ('fabricIndex', 'uint', 0), 0x1: ('nodeID', 'uint', 0), 0x2: ('endpoint', 'uint', 0)},
+    'TimeSynchronization.Structs.FabricScopedTrustedTimeSourceStruct': {0x0: ('nodeID', 'uint', 0), 0x1: ('endpoint', 'uint', 0)},
+    'TimeSynchronization.Structs.TimeZoneStruct': {0x0: ('offset', 'int', 0), 0x1: ('validAt', 'uint', 0), 0x2: ('name', 'str', 4)},
+    'TimeSynchronization.Structs.DSTOffsetStruct': {0x0: ('offset', 'int', 0), 0x1: ('validStarting', 'uint', 0), 0x2: ('validUntil', 'uint', 2)},
+    'TlsCertificateManagement.Structs.TLSCertStruct': {0x0: ('caid', 'uint', 0), 0x1: ('certificate', 'bytes', 4), 0xFE: ('fabricIndex', 'uint', 0)},
+    'TlsCertificateManagement.Structs.TLSClientCertificateDetailStruct': {0x0: ('ccdid', 'uint', 0), 0x1: ('clientCertificate', 'bytes', 6), 0x2: ('intermediateCertificates', 'bytes', 5), 0xFE: ('fabricIndex', 'uint', 0)},
+    'TlsClientManagement.Structs.TLSEndpointStruct': {0x0: ('endpointID', 'uint', 0), 0x1: ('hostname', 'bytes', 0), 0x2: ('port', 'uint', 0), 0x3: ('caid', 'uint', 0), 0x4: ('ccdid', 'uint', 2), 0x5: ('referenceCount', 'uint', 0), 0xFE: ('fabricIndex', 'uint', 0)},
+    'UserLabel.Structs.LabelStruct': {0x0: ('label', 'str', 0), 0x1: ('value', 'str', 0)},
+    'WaterHeaterManagement.Structs.WaterHeaterBoostInfoStruct': {0x0: ('duration', 'uint', 0), 0x1: ('oneShot', 'bool', 4), 0x2: ('emergencyBoost', 'bool', 4), 0x3: ('temporarySetpoint', 'int', 4), 0x4: ('targetPercentage', 'uint', 4), 0x5: ('targetReheat', 'uint', 4)},
+    'WaterHeaterMode.Structs.ModeOptionStruct': {0x0: ('label', 'str', 0), 0x1: ('mode', 'uint', 0), 0x2: ('modeTags', 'WaterHeaterMode.Structs.ModeTagStruct', 1)},
+    'WaterHeaterMode.Structs.ModeTagStruct': {0x0: ('mfgCode', 'uint', 4), 0x1: ('value', 'WaterHeaterMode.Enums.ModeTag', 0)},
+    'WaterTankLevelMonitoring.Structs.ReplacementProductStruct': {0x0: ('productIdentifierType', 'WaterTankLevelMonitoring.Enums.ProductIdentifierTypeEnum', 0), 0x1: ('productIdentifierValue', 'str', 0)},
+    'WebRtcTransportDefinitions.Structs.ICEServerStruct': {0x0: ('urLs', 'str', 1), 0x1: ('username', 'str', 4), 0x2: ('credential', 'str', 4), 0x3: ('caid', 'uint', 4)},
+    'WebRtcTransportDefinitions.Structs.ICECandidateStruct': {0x0: ('candidate', 'str', 0), 0x1: ('sdpMid', 'str', 2), 0x2: ('sdpmLineIndex', 'uint', 2)},
+    'WebRtcTransportDefinitions.Structs.WebRTCSessionStruct': {0x0: ('id', 'uint', 0), 0x1: ('peerNodeID', 'uint', 0), 0x2: ('peerEndpointID', 'uint', 0), 0x3: ('streamUsage', 'Globals.Enums.StreamUsageEnum', 0), 0x4: ('videoStreamID', 'uint', 6), 0x5: ('audioStreamID', 'uint', 6), 0x6: ('metadataEnabled', 'bool', 0), 0x7: ('videoStreams', 'uint', 5), 0x8: ('audioStreams', 'uint', 5), 0xFE: ('fabricIndex', 'uint', 0)},
+    'ZoneManagement.Structs.TwoDCartesianVertexStruct': {0x0: ('x', 'uint', 0), 0x1: ('y', 'uint', 0)},
+    'ZoneManagement.Structs.TwoDCartesianZoneStruct': {0x0: ('name', 'str', 0), 0x1: ('use', 'ZoneManagement.Enums.ZoneUseEnum', 0), 0x2: ('vertices', 'ZoneManagement.Structs.TwoDCartesianVertexStruct', 1), 0x3: ('color', 'str', 4)},
+    'ZoneManagement.Structs.ZoneInformationStruct': {0x0: ('zoneID', 'uint', 0), 0x1: ('zoneType', 'ZoneManagement.Enums.ZoneTypeEnum', 0), 0x2: ('zoneSource', 'ZoneManagement.Enums.ZoneSourceEnum', 0), 0x3: ('twoDCartesianZone', 'ZoneManagement.Structs.TwoDCartesianZoneStruct', 4)},
+    'ZoneManagement.Structs.ZoneTriggerControlStruct': {0x0: ('zoneID', 'uint', 0), 0x1: ('initialDuration', 'uint', 0), 0x2: ('augmentationDuration', 'uint', 0), 0x3: ('maxDuration', 'uint', 0), 0x4: ('blindDuration', 'uint', 0), 0x5: ('sensitivity', 'uint', 4)},
+}
+
+# qualified enum/bitmap name -> {member name: value}
+ENUMS = {
+    'Globals.Enums.AtomicRequestTypeEnum': {'kBeginWrite': 0, 'kCommitWrite': 1, 'kRollbackWrite': 2, 'kUnknownEnumValue': 3},
+    'Globals.Enums.CertificationTypeEnum': {'kDeviceAttestationPki': 0, 'kOperationalPki': 1, 'kVIDSignerPki': 2, 'kUnknownEnumValue': 3},
+    'Globals.Enums.MeasurementTypeEnum': {'kUnspecified': 0, 'kVoltage': 1, 'kActiveCurrent': 2, 'kReactiveCurrent': 3, 'kApparentCurrent': 4, 'kActivePower': 5, 'kReactivePower': 6, 'kApparentPower': 7, 'kRMSVoltage': 8, 'kRMSCurrent': 9, 'kRMSPower': 10, 'kFrequency': 11, 'kPowerFactor': 12, 'kNeutralCurrent': 13, 'kElectricalEnergy': 14, 'kReactiveEnergy': 15, 'kApparentEnergy': 16, 'kSoilMoisture': 17, 'kUnknownEnumValue': 18},
+    'Globals.Enums.PowerThresholdSourceEnum': {'kContract': 0, 'kRegulator': 1, 'kEquipment': 2, 'kUnknownEnumValue': 3},
+    'Globals.Enums.SoftwareVersionCertificationStatusEnum': {'kDevTest': 0, 'kProvisional': 1, 'kCertified': 2, 'kRevoked': 3, 'kUnknownEnumValue': 4},
+    'Globals.Enums.StreamUsageEnum': {'kInternal': 0, 'kRecording': 1, 'kAnalysis': 2, 'kLiveView': 3, 'kUnknownEnumValue': 4},
+    'Globals.Enums.TariffPriceTypeEnum': {'kStandard': 0, 'kCritical': 1, 'kVirtual': 2, 'kIncentive': 3, 'kIncentiveSignal': 4, 'kUnknownEnumValue': 5},
+    'Globals.Enums.TariffUnitEnum': {'kKWh': 0, 'kKVAh': 1, 'kUnknownEnumValue': 2},
+    'Globals.Enums.ThreeLevelAutoEnum': {'kAuto': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kUnknownEnumValue': 4},
+    'Globals.Enums.enum16': {'kUnknownEnumValue': 0},
+    'Globals.Enums.enum8': {'kUnknownEnumValue': 0},
+    'Globals.Enums.namespace': {'kCommonClosure': 1, 'kCommonCompassDirection': 2, 'kCommonCompassLocation': 3, 'kCommonDirection': 4, 'kCommonLevel': 5, 'kCommonLocation': 6, 'kCommonNumber': 7, 'kCommonPosition': 8, 'kElectricalMeasurement': 10, 'kCommodityTariffChronology': 11, 'kCommodityTariffCommodity': 13, 'kLaundry': 14, 'kPowerSource': 15, 'kCommonAreaNamespace': 16, 'kCommonLandmarkNamespace': 17, 'kCommonRelativePosition': 18, 'kCommodityTariffFlow': 19, 'kRefrigerator': 65, 'kRoomAirConditioner': 66, 'kSwitches': 67, 'kClosure': 68, 'kClosurePanel': 69, 'kClosureCovering': 70, 'kClosureWindow': 71, 'kClosureCabinet': 72, 'kIdentifiedObject': 73, 'kIdentifiedSound': 74, 'kIdentifiedHumanActivity': 75, 'kUnknownEnumValue': 76},
+    'Globals.Enums.priority': {'kDebug': 0, 'kInfo': 1, 'kCritical': 2, 'kUnknownEnumValue': 3},
+    'Globals.Enums.status': {'kSuccess': 0, 'kFailure': 1, 'kInvalidSubscription': 125, 'kUnsupportedAccess': 126, 'kUnsupportedEndpoint': 127, 'kInvalidAction': 128, 'kUnsupportedCommand': 129, 'kInvalidCommand': 133, 'kUnsupportedAttribute': 134, 'kConstraintError': 135, 'kUnsupportedWrite': 136, 'kResourceExhausted': 137, 'kNotFound': 139, 'kUnreportableAttribute': 140, 'kInvalidDataType': 141, 'kUnsupportedRead': 143, 'kDataVersionMismatch': 146, 'kTimeout': 148, 'kUnsupportedNode': 155, 'kBusy': 156, 'kAccessRestricted': 157, 'kUnsupportedCluster': 195, 'kNoUpstreamSubscription': 197, 'kNeedsTimedInteraction': 198, 'kUnsupportedEvent': 199, 'kPathsExhausted': 200, 'kTimedRequestMismatch': 201, 'kFailsafeRequired': 202, 'kInvalidInState': 203, 'kNoCommandResponse': 204, 'kTermsAndConditionsChanged': 205, 'kMaintenanceRequired': 206, 'kDynamicConstraintError': 207, 'kAlreadyExists': 208, 'kInvalidTransportType': 209, 'kUnknownEnumValue': 210},
+    'Globals.Bitmaps.WildcardPathFlagsBitmap': {'kWildcardSkipRootNode': 1, 'kWildcardSkipGlobalAttributes': 2, 'kWildcardSkipAttributeList': 4, 'kDoNotUse': 8, 'kWildcardSkipCommandLists': 16, 'kWildcardSkipCustomElements': 32, 'kWildcardSkipFixedAttributes': 64, 'kWildcardSkipChangesOmittedAttributes': 128, 'kWildcardSkipDiagnosticsClusters': 256},
+    'Globals.Bitmaps.map16': {},
+    'Globals.Bitmaps.map32': {},
+    'Globals.Bitmaps.map64': {},
+    'Globals.Bitmaps.map8': {},
+    'AccessControl.Enums.ChangeTypeEnum': {'kChanged': 0, 'kAdded': 1, 'kRemoved': 2, 'kUnknownEnumValue': 3},
+    'AccessControl.Enums.AccessControlEntryPrivilegeEnum': {'kView': 1, 'kProxyView': 2, 'kOperate': 3, 'kManage': 4, 'kAdminister': 5, 'kUnknownEnumValue': 6},
+    'AccessControl.Enums.AccessRestrictionTypeEnum': {'kAttributeAccessForbidden': 0, 'kAttributeWriteForbidden': 1, 'kCommandForbidden': 2, 'kEventForbidden': 3, 'kUnknownEnumValue': 4},
+    'AccessControl.Enums.AccessControlEntryAuthModeEnum': {'kPase': 1, 'kCase': 2, 'kGroup': 3, 'kUnknownEnumValue': 4},
+    'AccessControl.Enums.AccessControlAuxiliaryTypeEnum': {'kSystem': 0, 'kGroupcast': 1, 'kUnknownEnumValue': 2},
+    'AccessControl.Bitmaps.Feature': {'kExtension': 1, 'kManagedDevice': 2, 'kAuxiliary': 4},
+    'Actions.Enums.ActionTypeEnum': {'kOther': 0, 'kScene': 1, 'kSequence': 2, 'kAutomation': 3, 'kException': 4, 'kNotification': 5, 'kAlarm': 6, 'kUnknownEnumValue': 7},
+    'Actions.Enums.ActionStateEnum': {'kInactive': 0, 'kActive': 1, 'kPaused': 2, 'kDisabled': 3, 'kUnknownEnumValue': 4},
+    'Actions.Enums.ActionErrorEnum': {'kUnknown': 0, 'kInterrupted': 1, 'kUnknownEnumValue': 2},
+    'Actions.Enums.EndpointListTypeEnum': {'kOther': 0, 'kRoom': 1, 'kZone': 2, 'kUnknownEnumValue': 3},
+    'Actions.Bitmaps.CommandBits': {'kInstantAction': 1, 'kInstantActionWithTransition': 2, 'kStartAction': 4, 'kStartActionWithDuration': 8, 'kStopAction': 16, 'kPauseAction': 32, 'kPauseActionWithDuration': 64, 'kResumeAction': 128, 'kEnableAction': 256, 'kEnableActionWithDuration': 512, 'kDisableAction': 1024, 'kDisableActionWithDuration': 2048},
+    'ActivatedCarbonFilterMonitoring.Enums.DegradationDirectionEnum': {'kUp': 0, 'kDown': 1, 'kUnknownEnumValue': 2},
+    'ActivatedCarbonFilterMonitoring.Enums.ChangeIndicationEnum': {'kOk': 0, 'kWarning': 1, 'kCritical': 2, 'kUnknownEnumValue': 3},
+    'ActivatedCarbonFilterMonitoring.Enums.ProductIdentifierTypeEnum': {'kUpc': 0, 'kGtin8': 1, 'kEan': 2, 'kGtin14': 3, 'kOem': 4, 'kUnknownEnumValue': 5},
+    'ActivatedCarbonFilterMonitoring.Bitmaps.Feature': {'kCondition': 1, 'kWarning': 2, 'kReplacementProductList': 4},
+    'AdministratorCommissioning.Enums.CommissioningWindowStatusEnum': {'kWindowNotOpen': 0, 'kEnhancedWindowOpen': 1, 'kBasicWindowOpen': 2, 'kUnknownEnumValue': 3},
+    'AdministratorCommissioning.Enums.StatusCode': {'kBusy': 2, 'kPAKEParameterError': 3, 'kWindowNotOpen': 4, 'kUnknownEnumValue': 5},
+    'AdministratorCommissioning.Bitmaps.Feature': {'kBasic': 1},
+    'AirQuality.Enums.AirQualityEnum': {'kUnknown': 0, 'kGood': 1, 'kFair': 2, 'kModerate': 3, 'kPoor': 4, 'kVeryPoor': 5, 'kExtremelyPoor': 6, 'kUnknownEnumValue': 7},
+    'AirQuality.Bitmaps.Feature': {'kFair': 1, 'kModerate': 2, 'kVeryPoor': 4, 'kExtremelyPoor': 8},
+    'AmbientContextSensing.Bitmaps.Feature': {'kHumanActivity': 1, 'kObjectCounting': 2, 'kObjectIdentification': 4, 'kSoundIdentification': 8, 'kPredictedActivity': 16},
+    'ApplicationBasic.Enums.ApplicationStatusEnum': {'kStopped': 0, 'kActiveVisibleFocus': 1, 'kActiveHidden': 2, 'kActiveVisibleNotFocus': 3, 'kUnknownEnumValue': 4},
+    'ApplicationLauncher.Enums.StatusEnum': {'kSuccess': 0, 'kAppNotAvailable': 1, 'kSystemBusy': 2, 'kPendingUserApproval': 3, 'kDownloading': 4, 'kInstalling': 5, 'kUnknownEnumValue': 6},
+    'ApplicationLauncher.Bitmaps.Feature': {'kApplicationPlatform': 1},
+    'AudioOutput.Enums.OutputTypeEnum': {'kHdmi': 0, 'kBt': 1, 'kOptical': 2, 'kHeadphone': 3, 'kInternal': 4, 'kOther': 5, 'kUnknownEnumValue': 6},
+    'AudioOutput.Bitmaps.Feature': {'kNameUpdates': 1},
+    'BasicInformation.Enums.ProductFinishEnum': {'kOther': 0, 'kMatte': 1, 'kSatin': 2, 'kPolished': 3, 'kRugged': 4, 'kFabric': 5, 'kUnknownEnumValue': 6},
+    'BasicInformation.Enums.ColorEnum': {'kBlack': 0, 'kNavy': 1, 'kGreen': 2, 'kTeal': 3, 'kMaroon': 4, 'kPurple': 5, 'kOlive': 6, 'kGray': 7, 'kBlue': 8, 'kLime': 9, 'kAqua': 10, 'kRed': 11, 'kFuchsia': 12, 'kYellow': 13, 'kWhite': 14, 'kNickel': 15, 'kChrome': 16, 'kBrass': 17, 'kCopper': 18, 'kSilver': 19, 'kGold': 20, 'kUnknownEnumValue': 21},
+    'BooleanState.Bitmaps.Feature': {'kChangeEvent': 1},
+    'BooleanStateConfiguration.Bitmaps.Feature': {'kVisual': 1, 'kAudible': 2, 'kAlarmSuppress': 4, 'kSensitivityLevel': 8, 'kFaultEvents': 16},
+    'BooleanStateConfiguration.Bitmaps.AlarmModeBitmap': {'kVisual': 1, 'kAudible': 2},
+    'BooleanStateConfiguration.Bitmaps.SensorFaultBitmap': {'kGeneralFault': 1},
+    'BridgedDeviceBasicInformation.Enums.ProductFinishEnum': {'kOther': 0, 'kMatte': 1, 'kSatin': 2, 'kPolished': 3, 'kRugged': 4, 'kFabric': 5, 'kUnknownEnumValue': 6},
+    'BridgedDeviceBasicInformation.Enums.ColorEnum': {'kBlack': 0, 'kNavy': 1, 'kGreen': 2, 'kTeal': 3, 'kMaroon': 4, 'kPurple': 5, 'kOlive': 6, 'kGray': 7, 'kBlue': 8, 'kLime': 9, 'kAqua': 10, 'kRed': 11, 'kFuchsia': 12, 'kYellow': 13, 'kWhite': 14, 'kNickel': 15, 'kChrome': 16, 'kBrass': 17, 'kCopper': 18, 'kSilver': 19, 'kGold': 20, 'kUnknownEnumValue': 21},
+    'BridgedDeviceBasicInformation.Bitmaps.Feature': {'kBridgedICDSupport': 1048576},
+    'CameraAvSettingsUserLevelManagement.Enums.PhysicalMovementEnum': {'kIdle': 0, 'kMoving': 1, 'kUnknownEnumValue': 2},
+    'CameraAvSettingsUserLevelManagement.Bitmaps.Feature': {'kDigitalPtz': 1, 'kMechanicalPan': 2, 'kMechanicalTilt': 4, 'kMechanicalZoom': 8, 'kMechanicalPresets': 16},
+    'CameraAvStreamManagement.Enums.VideoCodecEnum': {'kH264': 0, 'kHevc': 1, 'kVvc': 2, 'kAv1': 3, 'kUnknownEnumValue': 4},
+    'CameraAvStreamManagement.Enums.AudioCodecEnum': {'kOpus': 0, 'kAacLc': 1, 'kUnknownEnumValue': 2},
+    'CameraAvStreamManagement.Enums.ImageCodecEnum': {'kJpeg': 0, 'kHeic': 1, 'kUnknownEnumValue': 2},
+    'CameraAvStreamManagement.Enums.TwoWayTalkSupportTypeEnum': {'kNotSupported': 0, 'kHalfDuplex': 1, 'kFullDuplex': 2, 'kUnknownEnumValue': 3},
+    'CameraAvStreamManagement.Enums.TriStateAutoEnum': {'kOff': 0, 'kOn': 1, 'kAuto': 2, 'kUnknownEnumValue': 3},
+    'CameraAvStreamManagement.Bitmaps.Feature': {'kAudio': 1, 'kVideo': 2, 'kSnapshot': 4, 'kPrivacy': 8, 'kSpeaker': 16, 'kImageControl': 32, 'kWatermark': 64, 'kOnScreenDisplay': 128, 'kLocalStorage': 256, 'kHighDynamicRange': 512, 'kNightVision': 1024},
+    'CarbonDioxideConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'CarbonDioxideConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'CarbonDioxideConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'CarbonDioxideConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'CarbonMonoxideConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'CarbonMonoxideConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'CarbonMonoxideConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'CarbonMonoxideConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'Channel.Enums.LineupInfoTypeEnum': {'kMso': 0, 'kUnknownEnumValue': 1},
+    'Channel.Enums.StatusEnum': {'kSuccess': 0, 'kMultipleMatches': 1, 'kNoMatches': 2, 'kUnknownEnumValue': 3},
+    'Channel.Enums.ChannelTypeEnum': {'kSatellite': 0, 'kCable': 1, 'kTerrestrial': 2, 'kOtt': 3, 'kUnknownEnumValue': 4},
+    'Channel.Bitmaps.Feature': {'kChannelList': 1, 'kLineupInfo': 2, 'kElectronicGuide': 4, 'kRecordProgram': 8},
+    'Channel.Bitmaps.RecordingFlagBitmap': {'kScheduled': 1, 'kRecordSeries': 2, 'kRecorded': 4},
+    'ClosureControl.Enums.CurrentPositionEnum': {'kFullyClosed': 0, 'kFullyOpened': 1, 'kPartiallyOpened': 2, 'kOpenedForPedestrian': 3, 'kOpenedForVentilation': 4, 'kOpenedAtSignature': 5, 'kUnknownEnumValue': 6},
+    'ClosureControl.Enums.TargetPositionEnum': {'kMoveToFullyClosed': 0, 'kMoveToFullyOpen': 1, 'kMoveToPedestrianPosition': 2, 'kMoveToVentilationPosition': 3, 'kMoveToSignaturePosition': 4, 'kUnknownEnumValue': 5},
+    'ClosureControl.Enums.MainStateEnum': {'kStopped': 0, 'kMoving': 1, 'kWaitingForMotion': 2, 'kError': 3, 'kCalibrating': 4, 'kProtected': 5, 'kDisengaged': 6, 'kSetupRequired': 7, 'kUnknownEnumValue': 8},
+    'ClosureControl.Enums.ClosureErrorEnum': {'kPhysicallyBlocked': 0, 'kBlockedBySensor': 1, 'kTemperatureLimited': 2, 'kMaintenanceRequired': 3, 'kInternalInterference': 4, 'kUnknownEnumValue': 5},
+    'ClosureControl.Bitmaps.Feature': {'kPositioning': 1, 'kMotionLatching': 2, 'kInstantaneous': 4, 'kSpeed': 8, 'kVentilation': 16, 'kPedestrian': 32, 'kCalibration': 64, 'kProtection': 128, 'kManuallyOperable': 256},
+    'ClosureControl.Bitmaps.LatchControlModesBitmap': {'kRemoteLatching': 1, 'kRemoteUnlatching': 2},
+    'ClosureDimension.Enums.TranslationDirectionEnum': {'kDownward': 0, 'kUpward': 1, 'kVerticalMask': 2, 'kVerticalSymmetry': 3, 'kLeftward': 4, 'kRightward': 5, 'kHorizontalMask': 6, 'kHorizontalSymmetry': 7, 'kForward': 8, 'kBackward': 9, 'kDepthMask': 10, 'kDepthSymmetry': 11, 'kUnknownEnumValue': 12},
+    'ClosureDimension.Enums.RotationAxisEnum': {'kLeft': 0, 'kCenteredVertical': 1, 'kLeftAndRight': 2, 'kRight': 3, 'kTop': 4, 'kCenteredHorizontal': 5, 'kTopAndBottom': 6, 'kBottom': 7, 'kLeftBarrier': 8, 'kLeftAndRightBarriers': 9, 'kRightBarrier': 10, 'kUnknownEnumValue': 11},
+    'ClosureDimension.Enums.OverflowEnum': {'kNoOverflow': 0, 'kInside': 1, 'kOutside': 2, 'kTopInside': 3, 'kTopOutside': 4, 'kBottomInside': 5, 'kBottomOutside': 6, 'kLeftInside': 7, 'kLeftOutside': 8, 'kRightInside': 9, 'kRightOutside': 10, 'kUnknownEnumValue': 11},
+    'ClosureDimension.Enums.ModulationTypeEnum': {'kSlatsOrientation': 0, 'kSlatsOpenwork': 1, 'kStripesAlignment': 2, 'kOpacity': 3, 'kVentilation': 4, 'kUnknownEnumValue': 5},
+    'ClosureDimension.Enums.ClosureUnitEnum': {'kMillimeter': 0, 'kDegree': 1, 'kUnknownEnumValue': 2},
+    'ClosureDimension.Enums.StepDirectionEnum': {'kDecrease': 0, 'kIncrease': 1, 'kUnknownEnumValue': 2},
+    'ClosureDimension.Bitmaps.Feature': {'kPositioning': 1, 'kMotionLatching': 2, 'kUnit': 4, 'kLimitation': 8, 'kSpeed': 16, 'kTranslation': 32, 'kRotation': 64, 'kModulation': 128},
+    'ClosureDimension.Bitmaps.LatchControlModesBitmap': {'kRemoteLatching': 1, 'kRemoteUnlatching': 2},
+    'ColorControl.Enums.DriftCompensationEnum': {'kNone': 0, 'kOtherOrUnknown': 1, 'kTemperatureMonitoring': 2, 'kOpticalLuminanceMonitoringAndFeedback': 3, 'kOpticalColorMonitoringAndFeedback': 4, 'kUnknownEnumValue': 5},
+    'ColorControl.Enums.ColorModeEnum': {'kCurrentHueAndCurrentSaturation': 0, 'kCurrentXAndCurrentY': 1, 'kColorTemperatureMireds': 2, 'kUnknownEnumValue': 3},
+    'ColorControl.Enums.EnhancedColorModeEnum': {'kCurrentHueAndCurrentSaturation': 0, 'kCurrentXAndCurrentY': 1, 'kColorTemperatureMireds': 2, 'kEnhancedCurrentHueAndCurrentSaturation': 3, 'kUnknownEnumValue': 4},
+    'ColorControl.Enums.DirectionEnum': {'kShortest': 0, 'kLongest': 1, 'kUp': 2, 'kDown': 3, 'kUnknownEnumValue': 4},
+    'ColorControl.Enums.MoveModeEnum': {'kStop': 0, 'kUp': 1, 'kDown': 3, 'kUnknownEnumValue': 4},
+    'ColorControl.Enums.StepModeEnum': {'kUp': 1, 'kDown': 3, 'kUnknownEnumValue': 4},
+    'ColorControl.Enums.ColorLoopActionEnum': {'kDeactivate': 0, 'kActivateFromColorLoopStartEnhancedHue': 1, 'kActivateFromEnhancedCurrentHue': 2, 'kUnknownEnumValue': 3},
+    'ColorControl.Enums.ColorLoopDirectionEnum': {'kDecrement': 0, 'kIncrement': 1, 'kUnknownEnumValue': 2},
+    'ColorControl.Bitmaps.Feature': {'kHueAndSaturation': 1, 'kEnhancedHue': 2, 'kColorLoop': 4, 'kXy': 8, 'kColorTemperature': 16},
+    'ColorControl.Bitmaps.OptionsBitmap': {'kExecuteIfOff': 1},
+    'ColorControl.Bitmaps.UpdateFlagsBitmap': {'kUpdateAction': 1, 'kUpdateDirection': 2, 'kUpdateTime': 4, 'kUpdateStartHue': 8},
+    'ColorControl.Bitmaps.ColorCapabilitiesBitmap': {'kHueSaturation': 1, 'kEnhancedHue': 2, 'kColorLoop': 4, 'kXy': 8, 'kColorTemperature': 16},
+    'CommissionerControl.Bitmaps.SupportedDeviceCategoryBitmap': {'kFabricSynchronization': 1},
+    'CommodityPrice.Bitmaps.Feature': {'kForecasting': 1},
+    'CommodityPrice.Bitmaps.CommodityPriceDetailBitmap': {'kDescription': 1, 'kComponents': 2},
+    'CommodityTariff.Enums.AuxiliaryLoadSettingEnum': {'kOff': 0, 'kOn': 1, 'kNone': 2, 'kUnknownEnumValue': 3},
+    'CommodityTariff.Enums.DayTypeEnum': {'kStandard': 0, 'kHoliday': 1, 'kDynamic': 2, 'kEvent': 3, 'kUnknownEnumValue': 4},
+    'CommodityTariff.Enums.PeakPeriodSeverityEnum': {'kUnused': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kUnknownEnumValue': 4},
+    'CommodityTariff.Enums.DayEntryRandomizationTypeEnum': {'kNone': 0, 'kFixed': 1, 'kRandom': 2, 'kRandomPositive': 3, 'kRandomNegative': 4, 'kUnknownEnumValue': 5},
+    'CommodityTariff.Enums.BlockModeEnum': {'kNoBlock': 0, 'kCombined': 1, 'kIndividual': 2, 'kUnknownEnumValue': 3},
+    'CommodityTariff.Bitmaps.Feature': {'kPricing': 1, 'kFriendlyCredit': 2, 'kAuxiliaryLoad': 4, 'kPeakPeriod': 8, 'kPowerThreshold': 16, 'kRandomization': 32},
+    'CommodityTariff.Bitmaps.DayPatternDayOfWeekBitmap': {'kSunday': 1, 'kMonday': 2, 'kTuesday': 4, 'kWednesday': 8, 'kThursday': 16, 'kFriday': 32, 'kSaturday': 64},
+    'ContentAppObserver.Enums.StatusEnum': {'kSuccess': 0, 'kUnexpectedData': 1, 'kUnknownEnumValue': 2},
+    'ContentControl.Enums.StatusCodeEnum': {'kInvalidPINCode': 2, 'kInvalidRating': 3, 'kInvalidChannel': 4, 'kChannelAlreadyExist': 5, 'kChannelNotExist': 6, 'kUnidentifiableApplication': 7, 'kApplicationAlreadyExist': 8, 'kApplicationNotExist': 9, 'kTimeWindowAlreadyExist': 10, 'kTimeWindowNotExist': 11, 'kUnknownEnumValue': 12},
+    'ContentControl.Bitmaps.Feature': {'kScreenTime': 1, 'kPINManagement': 2, 'kBlockUnrated': 4, 'kOnDemandContentRating': 8, 'kScheduledContentRating': 16, 'kBlockChannels': 32, 'kBlockApplications': 64, 'kBlockContentTimeWindow': 128},
+    'ContentControl.Bitmaps.DayOfWeekBitmap': {'kSunday': 1, 'kMonday': 2, 'kTuesday': 4, 'kWednesday': 8, 'kThursday': 16, 'kFriday': 32, 'kSaturday': 64},
+    'ContentLauncher.Enums.StatusEnum': {'kSuccess': 0, 'kURLNotAvailable': 1, 'kAuthFailed': 2, 'kTextTrackNotAvailable': 3, 'kAudioTrackNotAvailable': 4, 'kUnknownEnumValue': 5},
+    'ContentLauncher.Enums.ParameterEnum': {'kActor': 0, 'kChannel': 1, 'kCharacter': 2, 'kDirector': 3, 'kEvent': 4, 'kFranchise': 5, 'kGenre': 6, 'kLeague': 7, 'kPopularity': 8, 'kProvider': 9, 'kSport': 10, 'kSportsTeam': 11, 'kType': 12, 'kVideo': 13, 'kSeason': 14, 'kEpisode': 15, 'kAny': 16, 'kUnknownEnumValue': 17},
+    'ContentLauncher.Enums.MetricTypeEnum': {'kPixels': 0, 'kPercentage': 1, 'kUnknownEnumValue': 2},
+    'ContentLauncher.Bitmaps.Feature': {'kContentSearch': 1, 'kURLPlayback': 2, 'kAdvancedSeek': 4, 'kTextTracks': 8, 'kAudioTracks': 16},
+    'ContentLauncher.Bitmaps.SupportedProtocolsBitmap': {'kDash': 1, 'kHls': 2},
+    'Descriptor.Bitmaps.Feature': {'kTagList': 1},
+    'DeviceEnergyManagement.Enums.CostTypeEnum': {'kFinancial': 0, 'kGHGEmissions': 1, 'kComfort': 2, 'kTemperature': 3, 'kUnknownEnumValue': 4},
+    'DeviceEnergyManagement.Enums.ESATypeEnum': {'kEvse': 0, 'kSpaceHeating': 1, 'kWaterHeating': 2, 'kSpaceCooling': 3, 'kSpaceHeatingCooling': 4, 'kBatteryStorage': 5, 'kSolarPV': 6, 'kFridgeFreezer': 7, 'kWashingMachine': 8, 'kDishwasher': 9, 'kCooking': 10, 'kHomeWaterPump': 11, 'kIrrigationWaterPump': 12, 'kPoolPump': 13, 'kOther': 255, 'kUnknownEnumValue': 256},
+    'DeviceEnergyManagement.Enums.ESAStateEnum': {'kOffline': 0, 'kOnline': 1, 'kFault': 2, 'kPowerAdjustActive': 3, 'kPaused': 4, 'kUnknownEnumValue': 5},
+    'DeviceEnergyManagement.Enums.OptOutStateEnum': {'kNoOptOut': 0, 'kLocalOptOut': 1, 'kGridOptOut': 2, 'kOptOut': 3, 'kUnknownEnumValue': 4},
+    'DeviceEnergyManagement.Enums.CauseEnum': {'kNormalCompletion': 0, 'kOffline': 1, 'kFault': 2, 'kUserOptOut': 3, 'kCancelled': 4, 'kUnknownEnumValue': 5},
+    'DeviceEnergyManagement.Enums.AdjustmentCauseEnum': {'kLocalOptimization': 0, 'kGridOptimization': 1, 'kUnknownEnumValue': 2},
+    'DeviceEnergyManagement.Enums.ForecastUpdateReasonEnum': {'kInternalOptimization': 0, 'kLocalOptimization': 1, 'kGridOptimization': 2, 'kUnknownEnumValue': 3},
+    'DeviceEnergyManagement.Enums.PowerAdjustReasonEnum': {'kNoAdjustment': 0, 'kLocalOptimizationAdjustment': 1, 'kGridOptimizationAdjustment': 2, 'kUnknownEnumValue': 3},
+    'DeviceEnergyManagement.Bitmaps.Feature': {'kPowerAdjustment': 1, 'kPowerForecastReporting': 2, 'kStateForecastReporting': 4, 'kStartTimeAdjustment': 8, 'kPausable': 16, 'kForecastAdjustment': 32, 'kConstraintBasedAdjustment': 64},
+    'DeviceEnergyManagementMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kNoOptimization': 16384, 'kDeviceOptimization': 16385, 'kLocalOptimization': 16386, 'kGridOptimization': 16387, 'kUnknownEnumValue': 16388},
+    'DeviceEnergyManagementMode.Enums.ModeChangeStatus': {'kSuccess': 0, 'kUnsupportedMode': 1, 'kGenericFailure': 2, 'kInvalidInMode': 3, 'kUnknownEnumValue': 4},
+    'DeviceEnergyManagementMode.Bitmaps.Feature': {'kOnOff': 1},
+    'DiagnosticLogs.Enums.IntentEnum': {'kEndUserSupport': 0, 'kNetworkDiag': 1, 'kCrashLogs': 2, 'kUnknownEnumValue': 3},
+    'DiagnosticLogs.Enums.StatusEnum': {'kSuccess': 0, 'kExhausted': 1, 'kNoLogs': 2, 'kBusy': 3, 'kDenied': 4, 'kUnknownEnumValue': 5},
+    'DiagnosticLogs.Enums.TransferProtocolEnum': {'kResponsePayload': 0, 'kBdx': 1, 'kUnknownEnumValue': 2},
+    'DishwasherAlarm.Bitmaps.Feature': {'kReset': 1},
+    'DishwasherAlarm.Bitmaps.AlarmBitmap': {'kInflowError': 1, 'kDrainError': 2, 'kDoorError': 4, 'kTempTooLow': 8, 'kTempTooHigh': 16, 'kWaterLevelError': 32},
+    'DishwasherMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kNormal': 16384, 'kHeavy': 16385, 'kLight': 16386, 'kUnknownEnumValue': 16387},
+    'DishwasherMode.Enums.ModeChangeStatus': {'kSuccess': 0, 'kUnsupportedMode': 1, 'kGenericFailure': 2, 'kInvalidInMode': 3, 'kUnknownEnumValue': 4},
+    'DishwasherMode.Bitmaps.Feature': {'kOnOff': 1},
+    'DoorLock.Enums.AlarmCodeEnum': {'kLockJammed': 0, 'kLockFactoryReset': 1, 'kLockRadioPowerCycled': 3, 'kWrongCodeEntryLimit': 4, 'kFrontEsceutcheonRemoved': 5, 'kDoorForcedOpen': 6, 'kDoorAjar': 7, 'kForcedUser': 8, 'kUnknownEnumValue': 9},
+    'DoorLock.Enums.CredentialRuleEnum': {'kSingle': 0, 'kDual': 1, 'kTri': 2, 'kUnknownEnumValue': 3},
+    'DoorLock.Enums.CredentialTypeEnum': {'kProgrammingPIN': 0, 'kPin': 1, 'kRfid': 2, 'kFingerprint': 3, 'kFingerVein': 4, 'kFace': 5, 'kAliroCredentialIssuerKey': 6, 'kAliroEvictableEndpointKey': 7, 'kAliroNonEvictableEndpointKey': 8, 'kUnknownEnumValue': 9},
+    'DoorLock.Enums.DataOperationTypeEnum': {'kAdd': 0, 'kClear': 1, 'kModify': 2, 'kUnknownEnumValue': 3},
+    'DoorLock.Enums.DoorStateEnum': {'kDoorOpen': 0, 'kDoorClosed': 1, 'kDoorJammed': 2, 'kDoorForcedOpen': 3, 'kDoorUnspecifiedError': 4, 'kDoorAjar': 5, 'kUnknownEnumValue': 6},
+    'DoorLock.Enums.LockDataTypeEnum': {'kUnspecified': 0, 'kProgrammingCode': 1, 'kUserIndex': 2, 'kWeekDaySchedule': 3, 'kYearDaySchedule': 4, 'kHolidaySchedule': 5, 'kPin': 6, 'kRfid': 7, 'kFingerprint': 8, 'kFingerVein': 9, 'kFace': 10, 'kAliroCredentialIssuerKey': 11, 'kAliroEvictableEndpointKey': 12, 'kAliroNonEvictableEndpointKey': 13, 'kUnknownEnumValue': 14},
+    'DoorLock.Enums.LockOperationTypeEnum': {'kLock': 0, 'kUnlock': 1, 'kNonAccessUserEvent': 2, 'kForcedUserEvent': 3, 'kUnlatch': 4, 'kUnknownEnumValue': 5},
+    'DoorLock.Enums.OperationErrorEnum': {'kUnspecified': 0, 'kInvalidCredential': 1, 'kDisabledUserDenied': 2, 'kRestricted': 3, 'kInsufficientBattery': 4, 'kUnknownEnumValue': 5},
+    'DoorLock.Enums.OperatingModeEnum': {'kNormal': 0, 'kVacation': 1, 'kPrivacy': 2, 'kNoRemoteLockUnlock': 3, 'kPassage': 4, 'kUnknownEnumValue': 5},
+    'DoorLock.Enums.OperationSourceEnum': {'kUnspecified': 0, 'kManual': 1, 'kProprietaryRemote': 2, 'kKeypad': 3, 'kAuto': 4, 'kButton': 5, 'kSchedule': 6, 'kRemote': 7, 'kRfid': 8, 'kBiometric': 9, 'kAliro': 10, 'kUnknownEnumValue': 11},
+    'DoorLock.Enums.UserStatusEnum': {'kAvailable': 0, 'kOccupiedEnabled': 1, 'kOccupiedDisabled': 3, 'kUnknownEnumValue': 4},
+    'DoorLock.Enums.UserTypeEnum': {'kUnrestrictedUser': 0, 'kYearDayScheduleUser': 1, 'kWeekDayScheduleUser': 2, 'kProgrammingUser': 3, 'kNonAccessUser': 4, 'kForcedUser': 5, 'kDisposableUser': 6, 'kExpiringUser': 7, 'kScheduleRestrictedUser': 8, 'kRemoteOnlyUser': 9, 'kUnknownEnumValue': 10},
+    'DoorLock.Enums.DlLockState': {'kNotFullyLocked': 0, 'kLocked': 1, 'kUnlocked': 2, 'kUnlatched': 3, 'kUnknownEnumValue': 4},
+    'DoorLock.Enums.DlLockType': {'kDeadBolt': 0, 'kMagnetic': 1, 'kOther': 2, 'kMortise': 3, 'kRim': 4, 'kLatchBolt': 5, 'kCylindricalLock': 6, 'kTubularLock': 7, 'kInterconnectedLock': 8, 'kDeadLatch': 9, 'kDoorFurniture': 10, 'kEurocylinder': 11, 'kUnknownEnumValue': 12},
+    'DoorLock.Enums.LEDSettingEnum': {'kNoLEDSignal': 0, 'kNoLEDSignalAccessAllowed': 1, 'kLEDSignalAll': 2, 'kUnknownEnumValue': 3},
+    'DoorLock.Enums.SoundVolumeEnum': {'kSilent': 0, 'kLow': 1, 'kHigh': 2, 'kMedium': 3, 'kUnknownEnumValue': 4},
+    'DoorLock.Enums.EventTypeEnum': {'kOperation': 0, 'kProgramming': 1, 'kAlarm': 2, 'kUnknownEnumValue': 3},
+    'DoorLock.Enums.DlStatus': {'kDuplicate': 2, 'kOccupied': 3, 'kSuccess': 0, 'kFailure': 1, 'kInvalidField': 133, 'kResourceExhausted': 137, 'kNotFound': 139, 'kUnknownEnumValue': 140},
+    'DoorLock.Bitmaps.Feature': {'kPinCredential': 1, 'kRfidCredential': 2, 'kFingerCredentials': 4, 'kWeekDayAccessSchedules': 16, 'kDoorPositionSensor': 32, 'kFaceCredentials': 64, 'kCredentialsOverTheAirAccess': 128, 'kUser': 256, 'kYearDayAccessSchedules': 1024, 'kHolidaySchedules': 2048, 'kUnbolt': 4096, 'kAliroProvisioning': 8192, 'kAliroBLEUWB': 16384},
+    'DoorLock.Bitmaps.DaysMaskBitmap': {'kSunday': 1, 'kMonday': 2, 'kTuesday': 4, 'kWednesday': 8, 'kThursday': 16, 'kFriday': 32, 'kSaturday': 64},
+    'DoorLock.Bitmaps.CredentialRulesBitmap': {'kSingle': 1, 'kDual': 2, 'kTri': 4},
+    'DoorLock.Bitmaps.OperatingModesBitmap': {'kNormal': 1, 'kVacation': 2, 'kPrivacy': 4, 'kNoRemoteLockUnlock': 8, 'kPassage': 16, 'kAlwaysSet': 65504},
+    'DoorLock.Bitmaps.ConfigurationRegisterBitmap': {'kLocalProgramming': 1, 'kKeypadInterface': 2, 'kRemoteInterface': 4, 'kSoundVolume': 32, 'kAutoRelockTime': 64, 'kLEDSettings': 128},
+    'DoorLock.Bitmaps.LocalProgrammingFeaturesBitmap': {'kAddUsersCredentialsSchedules': 1, 'kModifyUsersCredentialsSchedules': 2, 'kClearUsersCredentialsSchedules': 4, 'kAdjustSettings': 8},
+    'DoorLock.Bitmaps.AlarmMaskBitmap': {'kLockJammed': 1, 'kLockFactoryReset': 2, 'kLockRadioPowerCycled': 8, 'kWrongCodeEntryLimit': 16, 'kFrontEscutcheonRemoved': 32, 'kDoorForcedOpen': 64},
+    'ElectricalEnergyMeasurement.Enums.MeasurementTypeEnum': {'kUnspecified': 0, 'kVoltage': 1, 'kActiveCurrent': 2, 'kReactiveCurrent': 3, 'kApparentCurrent': 4, 'kActivePower': 5, 'kReactivePower': 6, 'kApparentPower': 7, 'kRMSVoltage': 8, 'kRMSCurrent': 9, 'kRMSPower': 10, 'kFrequency': 11, 'kPowerFactor': 12, 'kNeutralCurrent': 13, 'kElectricalEnergy': 14, 'kReactiveEnergy': 15, 'kApparentEnergy': 16, 'kUnknownEnumValue': 17},
+    'ElectricalEnergyMeasurement.Bitmaps.Feature': {'kImportedEnergy': 1, 'kExportedEnergy': 2, 'kCumulativeEnergy': 4, 'kPeriodicEnergy': 8, 'kApparentEnergy': 16, 'kReactiveEnergy': 32},
+    'ElectricalGridConditions.Enums.ThreeLevelEnum': {'kLow': 0, 'kMedium': 1, 'kHigh': 2, 'kUnknownEnumValue': 3},
+    'ElectricalGridConditions.Bitmaps.Feature': {'kForecasting': 1},
+    'ElectricalPowerMeasurement.Enums.PowerModeEnum': {'kUnknown': 0, 'kDc': 1, 'kAc': 2, 'kUnknownEnumValue': 3},
+    'ElectricalPowerMeasurement.Enums.MeasurementTypeEnum': {'kUnspecified': 0, 'kVoltage': 1, 'kActiveCurrent': 2, 'kReactiveCurrent': 3, 'kApparentCurrent': 4, 'kActivePower': 5, 'kReactivePower': 6, 'kApparentPower': 7, 'kRMSVoltage': 8, 'kRMSCurrent': 9, 'kRMSPower': 10, 'kFrequency': 11, 'kPowerFactor': 12, 'kNeutralCurrent': 13, 'kElectricalEnergy': 14, 'kReactiveEnergy': 15, 'kApparentEnergy': 16, 'kUnknownEnumValue': 17},
+    'ElectricalPowerMeasurement.Bitmaps.Feature': {'kDirectCurrent': 1, 'kAlternatingCurrent': 2, 'kPolyphasePower': 4, 'kHarmonics': 8, 'kPowerQuality': 16},
+    'EnergyEvse.Enums.StateEnum': {'kNotPluggedIn': 0, 'kPluggedInNoDemand': 1, 'kPluggedInDemand': 2, 'kPluggedInCharging': 3, 'kPluggedInDischarging': 4, 'kSessionEnding': 5, 'kFault': 6, 'kUnknownEnumValue': 7},
+    'EnergyEvse.Enums.SupplyStateEnum': {'kDisabled': 0, 'kChargingEnabled': 1, 'kDischargingEnabled': 2, 'kDisabledError': 3, 'kDisabledDiagnostics': 4, 'kEnabled': 5, 'kUnknownEnumValue': 6},
+    'EnergyEvse.Enums.FaultStateEnum': {'kNoError': 0, 'kMeterFailure': 1, 'kOverVoltage': 2, 'kUnderVoltage': 3, 'kOverCurrent': 4, 'kContactWetFailure': 5, 'kContactDryFailure': 6, 'kGroundFault': 7, 'kPowerLoss': 8, 'kPowerQuality': 9, 'kPilotShortCircuit': 10, 'kEmergencyStop': 11, 'kEVDisconnected': 12, 'kWrongPowerSupply': 13, 'kLiveNeutralSwap': 14, 'kOverTemperature': 15, 'kOther': 255, 'kUnknownEnumValue': 256},
+    'EnergyEvse.Enums.EnergyTransferStoppedReasonEnum': {'kEVStopped': 0, 'kEVSEStopped': 1, 'kOther': 2, 'kUnknownEnumValue': 3},
+    'EnergyEvse.Bitmaps.Feature': {'kChargingPreferences': 1, 'kSoCReporting': 2, 'kPlugAndCharge': 4, 'kRfid': 8, 'kV2x': 16},
+    'EnergyEvse.Bitmaps.TargetDayOfWeekBitmap': {'kSunday': 1, 'kMonday': 2, 'kTuesday': 4, 'kWednesday': 8, 'kThursday': 16, 'kFriday': 32, 'kSaturday': 64},
+    'EnergyEvseMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kManual': 16384, 'kTimeOfUse': 16385, 'kSolarCharging': 16386, 'kV2x': 16387, 'kUnknownEnumValue': 16388},
+    'EnergyEvseMode.Enums.ModeChangeStatus': {'kSuccess': 0, 'kUnsupportedMode': 1, 'kGenericFailure': 2, 'kInvalidInMode': 3, 'kUnknownEnumValue': 4},
+    'EnergyEvseMode.Bitmaps.Feature': {'kOnOff': 1},
+    'EnergyPreference.Enums.EnergyPriorityEnum': {'kComfort': 0, 'kSpeed': 1, 'kEfficiency': 2, 'kWaterConsumption': 3, 'kUnknownEnumValue': 4},
+    'EnergyPreference.Bitmaps.Feature': {'kEnergyBalance': 1, 'kLowPowerModeSensitivity': 2},
+    'EthernetNetworkDiagnostics.Enums.PHYRateEnum': {'kRate10M': 0, 'kRate100M': 1, 'kRate1G': 2, 'kRate25g': 3, 'kRate5G': 4, 'kRate10G': 5, 'kRate40G': 6, 'kRate100G': 7, 'kRate200G': 8, 'kRate400G': 9, 'kUnknownEnumValue': 10},
+    'EthernetNetworkDiagnostics.Bitmaps.Feature': {'kPacketCounts': 1, 'kErrorCounts': 2},
+    'FanControl.Enums.StepDirectionEnum': {'kIncrease': 0, 'kDecrease': 1, 'kUnknownEnumValue': 2},
+    'FanControl.Enums.AirflowDirectionEnum': {'kForward': 0, 'kReverse': 1, 'kUnknownEnumValue': 2},
+    'FanControl.Enums.FanModeEnum': {'kOff': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kOn': 4, 'kAuto': 5, 'kSmart': 6, 'kUnknownEnumValue': 7},
+    'FanControl.Enums.FanModeSequenceEnum': {'kOffLowMedHigh': 0, 'kOffLowHigh': 1, 'kOffLowMedHighAuto': 2, 'kOffLowHighAuto': 3, 'kOffHighAuto': 4, 'kOffHigh': 5, 'kUnknownEnumValue': 6},
+    'FanControl.Bitmaps.Feature': {'kMultiSpeed': 1, 'kAuto': 2, 'kRocking': 4, 'kWind': 8, 'kStep': 16, 'kAirflowDirection': 32},
+    'FanControl.Bitmaps.RockBitmap': {'kRockLeftRight': 1, 'kRockUpDown': 2, 'kRockRound': 4},
+    'FanControl.Bitmaps.WindBitmap': {'kSleepWind': 1, 'kNaturalWind': 2},
+    'FormaldehydeConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'FormaldehydeConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'FormaldehydeConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'FormaldehydeConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'GeneralCommissioning.Enums.CommissioningErrorEnum': {'kOk': 0, 'kValueOutsideRange': 1, 'kInvalidAuthentication': 2, 'kNoFailSafe': 3, 'kBusyWithOtherAdmin': 4, 'kRequiredTCNotAccepted': 5, 'kTCAcknowledgementsNotReceived': 6, 'kTCMinVersionNotMet': 7, 'kUnknownEnumValue': 8},
+    'GeneralCommissioning.Enums.RegulatoryLocationTypeEnum': {'kIndoor': 0, 'kOutdoor': 1, 'kIndoorOutdoor': 2, 'kUnknownEnumValue': 3},
+    'GeneralCommissioning.Enums.NetworkRecoveryReasonEnum': {'kUnspecified': 0, 'kAuth': 1, 'kVisibility': 2, 'kUnknownEnumValue': 3},
+    'GeneralCommissioning.Bitmaps.Feature': {'kTermsAndConditions': 1, 'kNetworkRecovery': 2},
+    'GeneralDiagnostics.Enums.HardwareFaultEnum': {'kUnspecified': 0, 'kRadio': 1, 'kSensor': 2, 'kResettableOverTemp': 3, 'kNonResettableOverTemp': 4, 'kPowerSource': 5, 'kVisualDisplayFault': 6, 'kAudioOutputFault': 7, 'kUserInterfaceFault': 8, 'kNonVolatileMemoryError': 9, 'kTamperDetected': 10, 'kUnknownEnumValue': 11},
+    'GeneralDiagnostics.Enums.RadioFaultEnum': {'kUnspecified': 0, 'kWiFiFault': 1, 'kCellularFault': 2, 'kThreadFault': 3, 'kNFCFault': 4, 'kBLEFault': 5, 'kEthernetFault': 6, 'kUnknownEnumValue': 7},
+    'GeneralDiagnostics.Enums.NetworkFaultEnum': {'kUnspecified': 0, 'kHardwareFailure': 1, 'kNetworkJammed': 2, 'kConnectionFailed': 3, 'kUnknownEnumValue': 4},
+    'GeneralDiagnostics.Enums.InterfaceTypeEnum': {'kUnspecified': 0, 'kWiFi': 1, 'kEthernet': 2, 'kCellular': 3, 'kThread': 4, 'kUnknownEnumValue': 5},
+    'GeneralDiagnostics.Enums.BootReasonEnum': {'kUnspecified': 0, 'kPowerOnReboot': 1, 'kBrownOutReset': 2, 'kSoftwareWatchdogReset': 3, 'kHardwareWatchdogReset': 4, 'kSoftwareUpdateCompleted': 5, 'kSoftwareReset': 6, 'kUnknownEnumValue': 7},
+    'GeneralDiagnostics.Bitmaps.Feature': {'kDataModelTest': 1},
+    'GroupKeyManagement.Enums.GroupKeySecurityPolicyEnum': {'kTrustFirst': 0, 'kCacheAndSync': 1, 'kUnknownEnumValue': 2},
+    'GroupKeyManagement.Enums.GroupKeyMulticastPolicyEnum': {'kPerGroupID': 0, 'kAllNodes': 1, 'kUnknownEnumValue': 2},
+    'GroupKeyManagement.Bitmaps.Feature': {'kCacheAndSync': 1, 'kGroupcast': 2},
+    'Groupcast.Enums.MulticastAddrPolicyEnum': {'kIanaAddr': 0, 'kPerGroup': 1, 'kUnknownEnumValue': 2},
+    'Groupcast.Enums.GroupcastTestingEnum': {'kDisableTesting': 0, 'kEnableListenerTesting': 1, 'kEnableSenderTesting': 2, 'kUnknownEnumValue': 3},
+    'Groupcast.Enums.GroupcastTestResultEnum': {'kSuccess': 0, 'kGeneralError': 1, 'kMessageReplay': 2, 'kFailedAuth': 3, 'kNoAvailableKey': 4, 'kSendFailure': 5, 'kUnknownEnumValue': 6},
+    'Groupcast.Bitmaps.Feature': {'kListener': 1, 'kSender': 2, 'kPerGroup': 4},
+    'Groups.Bitmaps.Feature': {'kGroupNames': 1},
+    'Groups.Bitmaps.NameSupportBitmap': {'kGroupNames': 128},
+    'HepaFilterMonitoring.Enums.DegradationDirectionEnum': {'kUp': 0, 'kDown': 1, 'kUnknownEnumValue': 2},
+    'HepaFilterMonitoring.Enums.ChangeIndicationEnum': {'kOk': 0, 'kWarning': 1, 'kCritical': 2, 'kUnknownEnumValue': 3},
+    'HepaFilterMonitoring.Enums.ProductIdentifierTypeEnum': {'kUpc': 0, 'kGtin8': 1, 'kEan': 2, 'kGtin14': 3, 'kOem': 4, 'kUnknownEnumValue': 5},
+    'HepaFilterMonitoring.Bitmaps.Feature': {'kCondition': 1, 'kWarning': 2, 'kReplacementProductList': 4},
+    'IcdManagement.Enums.ClientTypeEnum': {'kPermanent': 0, 'kEphemeral': 1, 'kUnknownEnumValue': 2},
+    'IcdManagement.Enums.OperatingModeEnum': {'kSit': 0, 'kLit': 1, 'kUnknownEnumValue': 2},
+    'IcdManagement.Bitmaps.Feature': {'kCheckInProtocolSupport': 1, 'kUserActiveModeTrigger': 2, 'kLongIdleTimeSupport': 4, 'kDynamicSitLitSupport': 8},
+    'IcdManagement.Bitmaps.UserActiveModeTriggerBitmap': {'kPowerCycle': 1, 'kSettingsMenu': 2, 'kCustomInstruction': 4, 'kDeviceManual': 8, 'kActuateSensor': 16, 'kActuateSensorSeconds': 32, 'kActuateSensorTimes': 64, 'kActuateSensorLightsBlink': 128, 'kResetButton': 256, 'kResetButtonLightsBlink': 512, 'kResetButtonSeconds': 1024, 'kResetButtonTimes': 2048, 'kSetupButton': 4096, 'kSetupButtonSeconds': 8192, 'kSetupButtonLightsBlink': 16384, 'kSetupButtonTimes': 32768, 'kAppDefinedButton': 65536},
+    'Identify.Enums.IdentifyTypeEnum': {'kNone': 0, 'kLightOutput': 1, 'kVisibleIndicator': 2, 'kAudibleBeep': 3, 'kDisplay': 4, 'kActuator': 5, 'kUnknownEnumValue': 6},
+    'Identify.Enums.EffectIdentifierEnum': {'kBlink': 0, 'kBreathe': 1, 'kOkay': 2, 'kChannelChange': 11, 'kFinishEffect': 254, 'kStopEffect': 255, 'kUnknownEnumValue': 256},
+    'Identify.Enums.EffectVariantEnum': {'kDefault': 0, 'kUnknownEnumValue': 1},
+    'IlluminanceMeasurement.Enums.LightSensorTypeEnum': {'kPhotodiode': 0, 'kCmos': 1, 'kUnknownEnumValue': 2},
+    'JointFabricAdministrator.Enums.ICACResponseStatusEnum': {'kOk': 0, 'kInvalidPublicKey': 1, 'kInvalidICAC': 2, 'kUnknownEnumValue': 3},
+    'JointFabricAdministrator.Enums.TransferAnchorResponseStatusEnum': {'kOk': 0, 'kTransferAnchorStatusDatastoreBusy': 1, 'kTransferAnchorStatusNoUserConsent': 2, 'kUnknownEnumValue': 3},
+    'JointFabricAdministrator.Enums.ICACCSRResponseStatusCodeEnum': {'kOk': 0, 'kBusy': 1, 'kPAKEParameterError': 2, 'kWindowNotOpen': 3, 'kVIDNotVerified': 4, 'kInvalidAdministratorFabricIndex': 5, 'kUnknownEnumValue': 6},
+    'JointFabricDatastore.Enums.DatastoreStateEnum': {'kPending': 0, 'kCommitted': 1, 'kDeletePending': 2, 'kCommitFailed': 3, 'kUnknownEnumValue': 4},
+    'JointFabricDatastore.Enums.DatastoreAccessControlEntryPrivilegeEnum': {'kView': 1, 'kOperate': 3, 'kManage': 4, 'kAdminister': 5, 'kUnknownEnumValue': 6},
+    'JointFabricDatastore.Enums.DatastoreAccessControlEntryAuthModeEnum': {'kPase': 1, 'kCase': 2, 'kGroup': 3, 'kUnknownEnumValue': 4},
+    'JointFabricDatastore.Enums.DatastoreGroupKeySecurityPolicyEnum': {'kTrustFirst': 0, 'kUnknownEnumValue': 1},
+    'JointFabricDatastore.Enums.DatastoreGroupKeyMulticastPolicyEnum': {'kPerGroupID': 0, 'kAllNodes': 1, 'kUnknownEnumValue': 2},
+    'KeypadInput.Enums.StatusEnum': {'kSuccess': 0, 'kUnsupportedKey': 1, 'kInvalidKeyInCurrentState': 2, 'kUnknownEnumValue': 3},
+    'KeypadInput.Enums.CECKeyCodeEnum': {'kSelect': 0, 'kUp': 1, 'kDown': 2, 'kLeft': 3, 'kRight': 4, 'kRightUp': 5, 'kRightDown': 6, 'kLeftUp': 7, 'kLeftDown': 8, 'kRootMenu': 9, 'kSetupMenu': 10, 'kContentsMenu': 11, 'kFavoriteMenu': 12, 'kExit': 13, 'kMediaTopMenu': 16, 'kMediaContextSensitiveMenu': 17, 'kNumberEntryMode': 29, 'kNumber11': 30, 'kNumber12': 31, 'kNumber0OrNumber10': 32, 'kNumbers1': 33, 'kNumbers2': 34, 'kNumbers3': 35, 'kNumbers4': 36, 'kNumbers5': 37, 'kNumbers6': 38, 'kNumbers7': 39, 'kNumbers8': 40, 'kNumbers9': 41, 'kDot': 42, 'kEnter': 43, 'kClear': 44, 'kNextFavorite': 47, 'kChannelUp': 48, 'kChannelDown': 49, 'kPreviousChannel': 50, 'kSoundSelect': 51, 'kInputSelect': 52, 'kDisplayInformation': 53, 'kHelp': 54, 'kPageUp': 55, 'kPageDown': 56, 'kPower': 64, 'kVolumeUp': 65, 'kVolumeDown': 66, 'kMute': 67, 'kPlay': 68, 'kStop': 69, 'kPause': 70, 'kRecord': 71, 'kRewind': 72, 'kFastForward': 73, 'kEject': 74, 'kForward': 75, 'kBackward': 76, 'kStopRecord': 77, 'kPauseRecord': 78, 'kAngle': 80, 'kSubPicture': 81, 'kVideoOnDemand': 82, 'kElectronicProgramGuide': 83, 'kTimerProgramming': 84, 'kInitialConfiguration': 85, 'kSelectBroadcastType': 86, 'kSelectSoundPresentation': 87, 'kPlayFunction': 96, 'kPausePlayFunction': 97, 'kRecordFunction': 98, 'kPauseRecordFunction': 99, 'kStopFunction': 100, 'kMuteFunction': 101, 'kRestoreVolumeFunction': 102, 'kTuneFunction': 103, 'kSelectMediaFunction': 104, 'kSelectAvInputFunction': 105, 'kSelectAudioInputFunction': 106, 'kPowerToggleFunction': 107, 'kPowerOffFunction': 108, 'kPowerOnFunction': 109, 'kF1Blue': 113, 'kF2Red': 114, 'kF3Green': 115, 'kF4Yellow': 116, 'kF5': 117, 'kData': 118, 'kUnknownEnumValue': 119},
+    'KeypadInput.Bitmaps.Feature': {'kNavigationKeyCodes': 1, 'kLocationKeys': 2, 'kNumberKeys': 4},
+    'LaundryDryerControls.Enums.DrynessLevelEnum': {'kLow': 0, 'kNormal': 1, 'kExtra': 2, 'kMax': 3, 'kUnknownEnumValue': 4},
+    'LaundryWasherControls.Enums.NumberOfRinsesEnum': {'kNone': 0, 'kNormal': 1, 'kExtra': 2, 'kMax': 3, 'kUnknownEnumValue': 4},
+    'LaundryWasherControls.Bitmaps.Feature': {'kSpin': 1, 'kRinse': 2},
+    'LaundryWasherMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kNormal': 16384, 'kDelicate': 16385, 'kHeavy': 16386, 'kWhites': 16387, 'kUnknownEnumValue': 16388},
+    'LaundryWasherMode.Enums.ModeChangeStatus': {'kSuccess': 0, 'kUnsupportedMode': 1, 'kGenericFailure': 2, 'kInvalidInMode': 3, 'kUnknownEnumValue': 4},
+    'LaundryWasherMode.Bitmaps.Feature': {'kOnOff': 1},
+    'LevelControl.Enums.MoveModeEnum': {'kUp': 0, 'kDown': 1, 'kUnknownEnumValue': 2},
+    'LevelControl.Enums.StepModeEnum': {'kUp': 0, 'kDown': 1, 'kUnknownEnumValue': 2},
+    'LevelControl.Bitmaps.Feature': {'kOnOff': 1, 'kLighting': 2, 'kFrequency': 4},
+    'LevelControl.Bitmaps.OptionsBitmap': {'kExecuteIfOff': 1, 'kCoupleColorTempToLevel': 2},
+    'MediaInput.Enums.InputTypeEnum': {'kInternal': 0, 'kAux': 1, 'kCoax': 2, 'kComposite': 3, 'kHdmi': 4, 'kInput': 5, 'kLine': 6, 'kOptical': 7, 'kVideo': 8, 'kScart': 9, 'kUsb': 10, 'kOther': 11, 'kUnknownEnumValue': 12},
+    'MediaInput.Bitmaps.Feature': {'kNameUpdates': 1},
+    'MediaPlayback.Enums.PlaybackStateEnum': {'kPlaying': 0, 'kPaused': 1, 'kNotPlaying': 2, 'kBuffering': 3, 'kUnknownEnumValue': 4},
+    'MediaPlayback.Enums.StatusEnum': {'kSuccess': 0, 'kInvalidStateForCommand': 1, 'kNotAllowed': 2, 'kNotActive': 3, 'kSpeedOutOfRange': 4, 'kSeekOutOfRange': 5, 'kUnknownEnumValue': 6},
+    'MediaPlayback.Enums.CharacteristicEnum': {'kForcedSubtitles': 0, 'kDescribesVideo': 1, 'kEasyToRead': 2, 'kFrameBased': 3, 'kMainProgram': 4, 'kOriginalContent': 5, 'kVoiceOverTranslation': 6, 'kCaption': 7, 'kSubtitle': 8, 'kAlternate': 9, 'kSupplementary': 10, 'kCommentary': 11, 'kDubbedTranslation': 12, 'kDescription': 13, 'kMetadata': 14, 'kEnhancedAudioIntelligibility': 15, 'kEmergency': 16, 'kKaraoke': 17, 'kUnknownEnumValue': 18},
+    'MediaPlayback.Bitmaps.Feature': {'kAdvancedSeek': 1, 'kVariableSpeed': 2, 'kTextTracks': 4, 'kAudioTracks': 8, 'kAudioAdvance': 16},
+    'Messages.Enums.FutureMessagePreferenceEnum': {'kAllowed': 0, 'kIncreased': 1, 'kReduced': 2, 'kDisallowed': 3, 'kBanned': 4, 'kUnknownEnumValue': 5},
+    'Messages.Enums.MessagePriorityEnum': {'kLow': 0, 'kMedium': 1, 'kHigh': 2, 'kCritical': 3, 'kUnknownEnumValue': 4},
+    'Messages.Bitmaps.Feature': {'kReceivedConfirmation': 1, 'kConfirmationResponse': 2, 'kConfirmationReply': 4, 'kProtectedMessages': 8},
+    'Messages.Bitmaps.MessageControlBitmap': {'kConfirmationRequired': 1, 'kResponseRequired': 2, 'kReplyMessage': 4, 'kMessageConfirmed': 8, 'kMessageProtected': 16},
+    'MeterIdentification.Enums.MeterTypeEnum': {'kUtility': 0, 'kPrivate': 1, 'kGeneric': 2, 'kUnknownEnumValue': 3},
+    'MeterIdentification.Bitmaps.Feature': {'kPowerThreshold': 1},
+    'MicrowaveOvenControl.Bitmaps.Feature': {'kPowerAsNumber': 1, 'kPowerInWatts': 2, 'kPowerNumberLimits': 4},
+    'MicrowaveOvenMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kNormal': 16384, 'kDefrost': 16385, 'kUnknownEnumValue': 16386},
+    'MicrowaveOvenMode.Enums.ModeChangeStatus': {'kSuccess': 0, 'kUnsupportedMode': 1, 'kGenericFailure': 2, 'kInvalidInMode': 3, 'kUnknownEnumValue': 4},
+    'MicrowaveOvenMode.Bitmaps.Feature': {'kOnOff': 1},
+    'ModeSelect.Bitmaps.Feature': {'kOnOff': 1},
+    'NetworkCommissioning.Enums.WiFiBandEnum': {'k2g4': 0, 'k3g65': 1, 'k5g': 2, 'k6g': 3, 'k60g': 4, 'k1g': 5, 'kUnknownEnumValue': 6},
+    'NetworkCommissioning.Enums.NetworkCommissioningStatusEnum': {'kSuccess': 0, 'kOutOfRange': 1, 'kBoundsExceeded': 2, 'kNetworkIDNotFound': 3, 'kDuplicateNetworkID': 4, 'kNetworkNotFound': 5, 'kRegulatoryError': 6, 'kAuthFailure': 7, 'kUnsupportedSecurity': 8, 'kOtherConnectionFailure': 9, 'kIPV6Failed': 10, 'kIPBindFailed': 11, 'kUnknownError': 12, 'kUnknownEnumValue': 13},
+    'NetworkCommissioning.Bitmaps.Feature': {'kWiFiNetworkInterface': 1, 'kThreadNetworkInterface': 2, 'kEthernetNetworkInterface': 4},
+    'NetworkCommissioning.Bitmaps.WiFiSecurityBitmap': {'kUnencrypted': 1, 'kWep': 2, 'kWpaPersonal': 4, 'kWpa2Personal': 8, 'kWpa3Personal': 16},
+    'NetworkCommissioning.Bitmaps.ThreadCapabilitiesBitmap': {'kIsBorderRouterCapable': 1, 'kIsRouterCapable': 2, 'kIsSleepyEndDeviceCapable': 4, 'kIsFullThreadDevice': 8, 'kIsSynchronizedSleepyEndDeviceCapable': 16},
+    'NitrogenDioxideConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'NitrogenDioxideConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'NitrogenDioxideConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'NitrogenDioxideConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'OccupancySensing.Enums.OccupancySensorTypeEnum': {'kPir': 0, 'kUltrasonic': 1, 'kPIRAndUltrasonic': 2, 'kPhysicalContact': 3, 'kUnknownEnumValue': 4},
+    'OccupancySensing.Bitmaps.Feature': {'kOther': 1, 'kPassiveInfrared': 2, 'kUltrasonic': 4, 'kPhysicalContact': 8, 'kActiveInfrared': 16, 'kRadar': 32, 'kRFSensing': 64, 'kVision': 128, 'kOccupancyEvent': 512},
+    'OccupancySensing.Bitmaps.OccupancyBitmap': {'kOccupied': 1},
+    'OccupancySensing.Bitmaps.OccupancySensorTypeBitmap': {'kPir': 1, 'kUltrasonic': 2, 'kPhysicalContact': 4},
+    'OnOff.Enums.StartUpOnOffEnum': {'kOff': 0, 'kOn': 1, 'kToggle': 2, 'kUnknownEnumValue': 3},
+    'OnOff.Enums.EffectIdentifierEnum': {'kDelayedAllOff': 0, 'kDyingLight': 1, 'kUnknownEnumValue': 2},
+    'OnOff.Enums.DelayedAllOffEffectVariantEnum': {'kDelayedOffFastFade': 0, 'kNoFade': 1, 'kDelayedOffSlowFade': 2, 'kUnknownEnumValue': 3},
+    'OnOff.Enums.DyingLightEffectVariantEnum': {'kDyingLightFadeOff': 0, 'kUnknownEnumValue': 1},
+    'OnOff.Bitmaps.Feature': {'kLighting': 1, 'kDeadFrontBehavior': 2, 'kOffOnly': 4},
+    'OnOff.Bitmaps.OnOffControlBitmap': {'kAcceptOnlyWhenOn': 1},
+    'OperationalCredentials.Enums.CertificateChainTypeEnum': {'kDACCertificate': 1, 'kPAICertificate': 2, 'kUnknownEnumValue': 3},
+    'OperationalCredentials.Enums.NodeOperationalCertStatusEnum': {'kOk': 0, 'kInvalidPublicKey': 1, 'kInvalidNodeOpId': 2, 'kInvalidNOC': 3, 'kMissingCsr': 4, 'kTableFull': 5, 'kInvalidAdminSubject': 6, 'kFabricConflict': 9, 'kLabelConflict': 10, 'kInvalidFabricIndex': 11, 'kUnknownEnumValue': 12},
+    'OperationalState.Enums.OperationalStateEnum': {'kStopped': 0, 'kRunning': 1, 'kPaused': 2, 'kError': 3, 'kUnknownEnumValue': 4},
+    'OperationalState.Enums.ErrorStateEnum': {'kNoError': 0, 'kUnableToStartOrResume': 1, 'kUnableToCompleteOperation': 2, 'kCommandInvalidInState': 3, 'kUnknownEnumValue': 4},
+    'OtaSoftwareUpdateProvider.Enums.StatusEnum': {'kUpdateAvailable': 0, 'kBusy': 1, 'kNotAvailable': 2, 'kDownloadProtocolNotSupported': 3, 'kUnknownEnumValue': 4},
+    'OtaSoftwareUpdateProvider.Enums.ApplyUpdateActionEnum': {'kProceed': 0, 'kAwaitNextAction': 1, 'kDiscontinue': 2, 'kUnknownEnumValue': 3},
+    'OtaSoftwareUpdateProvider.Enums.DownloadProtocolEnum': {'kBDXSynchronous': 0, 'kBDXAsynchronous': 1, 'kHttps': 2, 'kVendorSpecific': 3, 'kUnknownEnumValue': 4},
+    'OtaSoftwareUpdateRequestor.Enums.AnnouncementReasonEnum': {'kSimpleAnnouncement': 0, 'kUpdateAvailable': 1, 'kUrgentUpdateAvailable': 2, 'kUnknownEnumValue': 3},
+    'OtaSoftwareUpdateRequestor.Enums.UpdateStateEnum': {'kUnknown': 0, 'kIdle': 1, 'kQuerying': 2, 'kDelayedOnQuery': 3, 'kDownloading': 4, 'kApplying': 5, 'kDelayedOnApply': 6, 'kRollingBack': 7, 'kDelayedOnUserConsent': 8, 'kUnknownEnumValue': 9},
+    'OtaSoftwareUpdateRequestor.Enums.ChangeReasonEnum': {'kUnknown': 0, 'kSuccess': 1, 'kFailure': 2, 'kTimeOut': 3, 'kDelayByProvider': 4, 'kUnknownEnumValue': 5},
+    'OvenCavityOperationalState.Enums.OperationalStateEnum': {'kStopped': 0, 'kRunning': 1, 'kPaused': 2, 'kError': 3, 'kUnknownEnumValue': 4},
+    'OvenCavityOperationalState.Enums.ErrorStateEnum': {'kNoError': 0, 'kUnableToStartOrResume': 1, 'kUnableToCompleteOperation': 2, 'kCommandInvalidInState': 3, 'kUnknownEnumValue': 4},
+    'OvenMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kBake': 16384, 'kConvection': 16385, 'kGrill': 16386, 'kRoast': 16387, 'kClean': 16388, 'kConvectionBake': 16389, 'kConvectionRoast': 16390, 'kWarming': 16391, 'kProofing': 16392, 'kSteam': 16393, 'kAirFry': 16394, 'kAirSousVide': 16395, 'kFrozenFood': 16396, 'kUnknownEnumValue': 16397},
+    'OvenMode.Enums.ModeChangeStatus': {'kSuccess': 0, 'kUnsupportedMode': 1, 'kGenericFailure': 2, 'kInvalidInMode': 3, 'kUnknownEnumValue': 4},
+    'OvenMode.Bitmaps.Feature': {'kOnOff': 1},
+    'OzoneConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'OzoneConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'OzoneConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'OzoneConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'Pm10ConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'Pm10ConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'Pm10ConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'Pm10ConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'Pm1ConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'Pm1ConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'Pm1ConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'Pm1ConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'Pm25ConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'Pm25ConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'Pm25ConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'Pm25ConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'PowerSource.Enums.WiredFaultEnum': {'kUnspecified': 0, 'kOverVoltage': 1, 'kUnderVoltage': 2, 'kUnknownEnumValue': 3},
+    'PowerSource.Enums.BatFaultEnum': {'kUnspecified': 0, 'kOverTemp': 1, 'kUnderTemp': 2, 'kUnknownEnumValue': 3},
+    'PowerSource.Enums.BatChargeFaultEnum': {'kUnspecified': 0, 'kAmbientTooHot': 1, 'kAmbientTooCold': 2, 'kBatteryTooHot': 3, 'kBatteryTooCold': 4, 'kBatteryAbsent': 5, 'kBatteryOverVoltage': 6, 'kBatteryUnderVoltage': 7, 'kChargerOverVoltage': 8, 'kChargerUnderVoltage': 9, 'kSafetyTimeout': 10, 'kUnknownEnumValue': 11},
+    'PowerSource.Enums.PowerSourceStatusEnum': {'kUnspecified': 0, 'kActive': 1, 'kStandby': 2, 'kUnavailable': 3, 'kUnknownEnumValue': 4},
+    'PowerSource.Enums.WiredCurrentTypeEnum': {'kAc': 0, 'kDc': 1, 'kUnknownEnumValue': 2},
+    'PowerSource.Enums.BatChargeLevelEnum': {'kOk': 0, 'kWarning': 1, 'kCritical': 2, 'kUnknownEnumValue': 3},
+    'PowerSource.Enums.BatReplaceabilityEnum': {'kUnspecified': 0, 'kNotReplaceable': 1, 'kUserReplaceable': 2, 'kFactoryReplaceable': 3, 'kUnknownEnumValue': 4},
+    'PowerSource.Enums.BatCommonDesignationEnum': {'kUnspecified': 0, 'kAaa': 1, 'kAa': 2, 'kC': 3, 'kD': 4, 'k4v5': 5, 'k6v0': 6, 'k9v0': 7, 'k12aa': 8, 'kAaaa': 9, 'kA': 10, 'kB': 11, 'kF': 12, 'kN': 13, 'kNo6': 14, 'kSubC': 15, 'kA23': 16, 'kA27': 17, 'kBa5800': 18, 'kDuplex': 19, 'k4sr44': 20, 'k523': 21, 'k531': 22, 'k15v0': 23, 'k22v5': 24, 'k30v0': 25, 'k45v0': 26, 'k67v5': 27, 'kJ': 28, 'kCr123a': 29, 'kCr2': 30, 'k2cr5': 31, 'kCrP2': 32, 'kCrV3': 33, 'kSr41': 34, 'kSr43': 35, 'kSr44': 36, 'kSr45': 37, 'kSr48': 38, 'kSr54': 39, 'kSr55': 40, 'kSr57': 41, 'kSr58': 42, 'kSr59': 43, 'kSr60': 44, 'kSr63': 45, 'kSr64': 46, 'kSr65': 47, 'kSr66': 48, 'kSr67': 49, 'kSr68': 50, 'kSr69': 51, 'kSr516': 52, 'kSr731': 53, 'kSr712': 54, 'kLr932': 55, 'kA5': 56, 'kA10': 57, 'kA13': 58, 'kA312': 59, 'kA675': 60, 'kAc41e': 61, 'k10180': 62, 'k10280': 63, 'k10440': 64, 'k14250': 65, 'k14430': 66, 'k14500': 67, 'k14650': 68, 'k15270': 69, 'k16340': 70, 'kRcr123a': 71, 'k17500': 72, 'k17670': 73, 'k18350': 74, 'k18500': 75, 'k18650': 76, 'k19670': 77, 'k25500': 78, 'k26650': 79, 'k32600': 80, 'kUnknownEnumValue': 81},
+    'PowerSource.Enums.BatApprovedChemistryEnum': {'kUnspecified': 0, 'kAlkaline': 1, 'kLithiumCarbonFluoride': 2, 'kLithiumChromiumOxide': 3, 'kLithiumCopperOxide': 4, 'kLithiumIronDisulfide': 5, 'kLithiumManganeseDioxide': 6, 'kLithiumThionylChloride': 7, 'kMagnesium': 8, 'kMercuryOxide': 9, 'kNickelOxyhydride': 10, 'kSilverOxide': 11, 'kZincAir': 12, 'kZincCarbon': 13, 'kZincChloride': 14, 'kZincManganeseDioxide': 15, 'kLeadAcid': 16, 'kLithiumCobaltOxide': 17, 'kLithiumIon': 18, 'kLithiumIonPolymer': 19, 'kLithiumIronPhosphate': 20, 'kLithiumSulfur': 21, 'kLithiumTitanate': 22, 'kNickelCadmium': 23, 'kNickelHydrogen': 24, 'kNickelIron': 25, 'kNickelMetalHydride': 26, 'kNickelZinc': 27, 'kSilverZinc': 28, 'kSodiumIon': 29, 'kSodiumSulfur': 30, 'kZincBromide': 31, 'kZincCerium': 32, 'kUnknownEnumValue': 33},
+    'PowerSource.Enums.BatChargeStateEnum': {'kUnknown': 0, 'kIsCharging': 1, 'kIsAtFullCharge': 2, 'kIsNotCharging': 3, 'kUnknownEnumValue': 4},
+    'PowerSource.Bitmaps.Feature': {'kWired': 1, 'kBattery': 2, 'kRechargeable': 4, 'kReplaceable': 8},
+    'PowerTopology.Bitmaps.Feature': {'kNodeTopology': 1, 'kTreeTopology': 2, 'kSetTopology': 4, 'kDynamicPowerFlow': 8},
+    'PressureMeasurement.Bitmaps.Feature': {'kExtended': 1},
+    'PumpConfigurationAndControl.Enums.OperationModeEnum': {'kNormal': 0, 'kMinimum': 1, 'kMaximum': 2, 'kLocal': 3, 'kUnknownEnumValue': 4},
+    'PumpConfigurationAndControl.Enums.ControlModeEnum': {'kConstantSpeed': 0, 'kConstantPressure': 1, 'kProportionalPressure': 2, 'kConstantFlow': 3, 'kConstantTemperature': 5, 'kAutomatic': 7, 'kUnknownEnumValue': 8},
+    'PumpConfigurationAndControl.Bitmaps.Feature': {'kConstantPressure': 1, 'kCompensatedPressure': 2, 'kConstantFlow': 4, 'kConstantSpeed': 8, 'kConstantTemperature': 16, 'kAutomatic': 32, 'kLocalOperation': 64},
+    'PumpConfigurationAndControl.Bitmaps.PumpStatusBitmap': {'kDeviceFault': 1, 'kSupplyFault': 2, 'kSpeedLow': 4, 'kSpeedHigh': 8, 'kLocalOverride': 16, 'kRunning': 32, 'kRemotePressure': 64, 'kRemoteFlow': 128, 'kRemoteTemperature': 256},
+    'PushAvStreamTransport.Enums.TransportTriggerTypeEnum': {'kCommand': 0, 'kMotion': 1, 'kContinuous': 2, 'kUnknownEnumValue': 3},
+    'PushAvStreamTransport.Enums.TransportStatusEnum': {'kActive': 0, 'kInactive': 1, 'kUnknownEnumValue': 2},
+    'PushAvStreamTransport.Enums.ContainerFormatEnum': {'kCmaf': 0, 'kUnknownEnumValue': 1},
+    'PushAvStreamTransport.Enums.IngestMethodsEnum': {'kCmafIngest': 0, 'kUnknownEnumValue': 1},
+    'PushAvStreamTransport.Enums.TriggerActivationReasonEnum': {'kUserInitiated': 0, 'kAutomation': 1, 'kEmergency': 2, 'kDoorbellPressed': 3, 'kUnknownEnumValue': 4},
+    'PushAvStreamTransport.Enums.CMAFInterfaceEnum': {'kInterface1': 0, 'kInterface2Dash': 1, 'kInterface2Hls': 2, 'kUnknownEnumValue': 3},
+    'PushAvStreamTransport.Enums.StatusCodeEnum': {'kInvalidTlsEndpoint': 2, 'kInvalidStream': 3, 'kInvalidURL': 4, 'kInvalidZone': 5, 'kInvalidCombination': 6, 'kInvalidTriggerType': 7, 'kInvalidTransportStatus': 8, 'kInvalidOptions': 9, 'kInvalidStreamUsage': 10, 'kInvalidTime': 11, 'kInvalidPreRollLength': 12, 'kDuplicateStreamValues': 13, 'kUnknownEnumValue': 14},
+    'PushAvStreamTransport.Bitmaps.Feature': {'kPerZoneSensitivity': 1, 'kMetadata': 2},
+    'RadonConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'RadonConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'RadonConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'RadonConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'RefrigeratorAlarm.Bitmaps.Feature': {'kReset': 1},
+    'RefrigeratorAlarm.Bitmaps.AlarmBitmap': {'kDoorOpen': 1},
+    'RefrigeratorAndTemperatureControlledCabinetMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kRapidCool': 16384, 'kRapidFreeze': 16385, 'kUnknownEnumValue': 16386},
+    'RefrigeratorAndTemperatureControlledCabinetMode.Enums.ModeChangeStatus': {'kSuccess': 0, 'kUnsupportedMode': 1, 'kGenericFailure': 2, 'kInvalidInMode': 3, 'kUnknownEnumValue': 4},
+    'RefrigeratorAndTemperatureControlledCabinetMode.Bitmaps.Feature': {'kOnOff': 1},
+    'RvcCleanMode.Enums.ModeChangeStatus': {'kCleaningInProgress': 64, 'kUnknownEnumValue': 65},
+    'RvcCleanMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kDeepClean': 16384, 'kVacuum': 16385, 'kMop': 16386, 'kVacuumThenMop': 16387, 'kUnknownEnumValue': 16388},
+    'RvcCleanMode.Bitmaps.Feature': {'kOnOff': 1, 'kDirectModeChange': 1048576},
+    'RvcOperationalState.Enums.OperationalStateEnum': {'kStopped': 0, 'kRunning': 1, 'kPaused': 2, 'kError': 3, 'kSeekingCharger': 64, 'kCharging': 65, 'kDocked': 66, 'kEmptyingDustBin': 67, 'kCleaningMop': 68, 'kFillingWaterTank': 69, 'kUpdatingMaps': 70, 'kUnknownEnumValue': 71},
+    'RvcOperationalState.Enums.ErrorStateEnum': {'kNoError': 0, 'kUnableToStartOrResume': 1, 'kUnableToCompleteOperation': 2, 'kCommandInvalidInState': 3, 'kFailedToFindChargingDock': 64, 'kStuck': 65, 'kDustBinMissing': 66, 'kDustBinFull': 67, 'kWaterTankEmpty': 68, 'kWaterTankMissing': 69, 'kWaterTankLidOpen': 70, 'kMopCleaningPadMissing': 71, 'kLowBattery': 72, 'kCannotReachTargetArea': 73, 'kDirtyWaterTankFull': 74, 'kDirtyWaterTankMissing': 75, 'kWheelsJammed': 76, 'kBrushJammed': 77, 'kNavigationSensorObscured': 78, 'kUnknownEnumValue': 79},
+    'RvcRunMode.Enums.ModeChangeStatus': {'kStuck': 65, 'kDustBinMissing': 66, 'kDustBinFull': 67, 'kWaterTankEmpty': 68, 'kWaterTankMissing': 69, 'kWaterTankLidOpen': 70, 'kMopCleaningPadMissing': 71, 'kBatteryLow': 72, 'kUnknownEnumValue': 73},
+    'RvcRunMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kIdle': 16384, 'kCleaning': 16385, 'kMapping': 16386, 'kUnknownEnumValue': 16387},
+    'RvcRunMode.Bitmaps.Feature': {'kOnOff': 1, 'kDirectModeChange': 1048576},
+    'ScenesManagement.Bitmaps.Feature': {'kSceneNames': 1},
+    'ScenesManagement.Bitmaps.CopyModeBitmap': {'kCopyAllScenes': 1},
+    'ServiceArea.Enums.OperationalStatusEnum': {'kPending': 0, 'kOperating': 1, 'kSkipped': 2, 'kCompleted': 3, 'kUnknownEnumValue': 4},
+    'ServiceArea.Enums.SelectAreasStatus': {'kSuccess': 0, 'kUnsupportedArea': 1, 'kInvalidInMode': 2, 'kInvalidSet': 3, 'kUnknownEnumValue': 4},
+    'ServiceArea.Enums.SkipAreaStatus': {'kSuccess': 0, 'kInvalidAreaList': 1, 'kInvalidInMode': 2, 'kInvalidSkippedArea': 3, 'kUnknownEnumValue': 4},
+    'ServiceArea.Bitmaps.Feature': {'kSelectWhileRunning': 1, 'kProgressReporting': 2, 'kMaps': 4},
+    'SmokeCoAlarm.Enums.AlarmStateEnum': {'kNormal': 0, 'kWarning': 1, 'kCritical': 2, 'kUnknownEnumValue': 3},
+    'SmokeCoAlarm.Enums.SensitivityEnum': {'kHigh': 0, 'kStandard': 1, 'kLow': 2, 'kUnknownEnumValue': 3},
+    'SmokeCoAlarm.Enums.ExpressedStateEnum': {'kNormal': 0, 'kSmokeAlarm': 1, 'kCOAlarm': 2, 'kBatteryAlert': 3, 'kTesting': 4, 'kHardwareFault': 5, 'kEndOfService': 6, 'kInterconnectSmoke': 7, 'kInterconnectCO': 8, 'kInoperative': 9, 'kUnknownEnumValue': 10},
+    'SmokeCoAlarm.Enums.MuteStateEnum': {'kNotMuted': 0, 'kMuted': 1, 'kUnknownEnumValue': 2},
+    'SmokeCoAlarm.Enums.EndOfServiceEnum': {'kNormal': 0, 'kExpired': 1, 'kUnknownEnumValue': 2},
+    'SmokeCoAlarm.Enums.ContaminationStateEnum': {'kNormal': 0, 'kLow': 1, 'kWarning': 2, 'kCritical': 3, 'kUnknownEnumValue': 4},
+    'SmokeCoAlarm.Bitmaps.Feature': {'kSmokeAlarm': 1, 'kCOAlarm': 2},
+    'SoftwareDiagnostics.Bitmaps.Feature': {'kWatermarks': 1},
+    'Switch.Bitmaps.Feature': {'kLatchingSwitch': 1, 'kMomentarySwitch': 2, 'kMomentarySwitchRelease': 4, 'kMomentarySwitchLongPress': 8, 'kMomentarySwitchMultiPress': 16, 'kActionSwitch': 32},
+    'TargetNavigator.Enums.StatusEnum': {'kSuccess': 0, 'kTargetNotFound': 1, 'kNotAllowed': 2, 'kUnknownEnumValue': 3},
+    'TemperatureAlarm.Bitmaps.Feature': {'kOverTemperature': 1048576, 'kUnderTemperature': 2097152, 'kMajorThreshold': 4194304, 'kMinorThreshold': 8388608, 'kOverCriticalAdjustable': 16777216, 'kOverMajorAdjustable': 33554432, 'kOverMinorAdjustable': 67108864, 'kUnderMinorAdjustable': 134217728, 'kUnderMajorAdjustable': 268435456, 'kUnderCriticalAdjustable': 536870912, 'kReset': 1},
+    'TemperatureAlarm.Bitmaps.AlarmBitmap': {'kCriticalOverTemperatureAlarm': 1, 'kMajorOverTemperatureAlarm': 2, 'kMinorOverTemperatureAlarm': 4, 'kMinorUnderTemperatureAlarm': 8, 'kMajorUnderTemperatureAlarm': 16, 'kCriticalUnderTemperatureAlarm': 32},
+    'TemperatureControl.Bitmaps.Feature': {'kTemperatureNumber': 1, 'kTemperatureLevel': 2, 'kTemperatureStep': 4},
+    'Thermostat.Enums.ACCapacityFormatEnum': {'kBTUh': 0, 'kUnknownEnumValue': 1},
+    'Thermostat.Enums.ACCompressorTypeEnum': {'kUnknown': 0, 'kT1': 1, 'kT2': 2, 'kT3': 3, 'kUnknownEnumValue': 4},
+    'Thermostat.Enums.ACLouverPositionEnum': {'kClosed': 1, 'kOpen': 2, 'kQuarter': 3, 'kHalf': 4, 'kThreeQuarters': 5, 'kUnknownEnumValue': 6},
+    'Thermostat.Enums.ACRefrigerantTypeEnum': {'kUnknown': 0, 'kR22': 1, 'kR410a': 2, 'kR407c': 3, 'kUnknownEnumValue': 4},
+    'Thermostat.Enums.ACTypeEnum': {'kUnknown': 0, 'kCoolingFixed': 1, 'kHeatPumpFixed': 2, 'kCoolingInverter': 3, 'kHeatPumpInverter': 4, 'kUnknownEnumValue': 5},
+    'Thermostat.Enums.SetpointRaiseLowerModeEnum': {'kHeat': 0, 'kCool': 1, 'kBoth': 2, 'kUnknownEnumValue': 3},
+    'Thermostat.Enums.ControlSequenceOfOperationEnum': {'kCoolingOnly': 0, 'kCoolingWithReheat': 1, 'kHeatingOnly': 2, 'kHeatingWithReheat': 3, 'kCoolingAndHeating': 4, 'kCoolingAndHeatingWithReheat': 5, 'kUnknownEnumValue': 6},
+    'Thermostat.Enums.PresetScenarioEnum': {'kOccupied': 1, 'kUnoccupied': 2, 'kSleep': 3, 'kWake': 4, 'kVacation': 5, 'kGoingToSleep': 6, 'kUserDefined': 254, 'kUnknownEnumValue': 255},
+    'Thermostat.Enums.SetpointChangeSourceEnum': {'kManual': 0, 'kSchedule': 1, 'kExternal': 2, 'kUnknownEnumValue': 3},
+    'Thermostat.Enums.StartOfWeekEnum': {'kSunday': 0, 'kMonday': 1, 'kTuesday': 2, 'kWednesday': 3, 'kThursday': 4, 'kFriday': 5, 'kSaturday': 6, 'kUnknownEnumValue': 7},
+    'Thermostat.Enums.SystemModeEnum': {'kOff': 0, 'kAuto': 1, 'kCool': 3, 'kHeat': 4, 'kEmergencyHeat': 5, 'kPrecooling': 6, 'kFanOnly': 7, 'kDry': 8, 'kSleep': 9, 'kUnknownEnumValue': 10},
+    'Thermostat.Enums.ThermostatRunningModeEnum': {'kOff': 0, 'kCool': 3, 'kHeat': 4, 'kUnknownEnumValue': 5},
+    'Thermostat.Enums.TemperatureSetpointHoldEnum': {'kSetpointHoldOff': 0, 'kSetpointHoldOn': 1, 'kUnknownEnumValue': 2},
+    'Thermostat.Bitmaps.Feature': {'kHeating': 1, 'kCooling': 2, 'kOccupancy': 4, 'kSetback': 16, 'kAutoMode': 32, 'kLocalTemperatureNotExposed': 64, 'kMatterScheduleConfiguration': 128, 'kPresets': 256, 'kEvents': 512, 'kThermostatSuggestions': 1024},
+    'Thermostat.Bitmaps.ACErrorCodeBitmap': {'kCompressorFail': 1, 'kRoomSensorFail': 2, 'kOutdoorSensorFail': 4, 'kCoilSensorFail': 8, 'kFanFail': 16},
+    'Thermostat.Bitmaps.OccupancyBitmap': {'kOccupied': 1},
+    'Thermostat.Bitmaps.PresetTypeFeaturesBitmap': {'kAutomatic': 1, 'kSupportsNames': 2},
+    'Thermostat.Bitmaps.RelayStateBitmap': {'kHeat': 1, 'kCool': 2, 'kFan': 4, 'kHeatStage2': 8, 'kCoolStage2': 16, 'kFanStage2': 32, 'kFanStage3': 64},
+    'Thermostat.Bitmaps.RemoteSensingBitmap': {'kLocalTemperature': 1, 'kOutdoorTemperature': 2, 'kOccupancy': 4},
+    'Thermostat.Bitmaps.ScheduleTypeFeaturesBitmap': {'kSupportsPresets': 1, 'kSupportsSetpoints': 2, 'kSupportsNames': 4, 'kSupportsOff': 8},
+    'Thermostat.Bitmaps.ScheduleDayOfWeekBitmap': {'kSunday': 1, 'kMonday': 2, 'kTuesday': 4, 'kWednesday': 8, 'kThursday': 16, 'kFriday': 32, 'kSaturday': 64, 'kAway': 128},
+    'Thermostat.Bitmaps.ScheduleModeBitmap': {'kHeatSetpointPresent': 1, 'kCoolSetpointPresent': 2},
+    'Thermostat.Bitmaps.ThermostatSuggestionNotFollowingReasonBitmap': {'kDemandResponseEvent': 1, 'kOngoingHold': 2, 'kSchedule': 4, 'kOccupancy': 8, 'kVacationMode': 16, 'kTimeOfUseCostSavings': 32, 'kPreCoolingOrPreHeating': 64, 'kConflictingSuggestions': 128},
+    'ThermostatUserInterfaceConfiguration.Enums.TemperatureDisplayModeEnum': {'kCelsius': 0, 'kFahrenheit': 1, 'kUnknownEnumValue': 2},
+    'ThermostatUserInterfaceConfiguration.Enums.KeypadLockoutEnum': {'kNoLockout': 0, 'kLockout1': 1, 'kLockout2': 2, 'kLockout3': 3, 'kLockout4': 4, 'kLockout5': 5, 'kUnknownEnumValue': 6},
+    'ThermostatUserInterfaceConfiguration.Enums.ScheduleProgrammingVisibilityEnum': {'kScheduleProgrammingPermitted': 0, 'kScheduleProgrammingDenied': 1, 'kUnknownEnumValue': 2},
+    'ThreadBorderRouterManagement.Bitmaps.Feature': {'kPANChange': 1},
+    'ThreadNetworkDiagnostics.Enums.NetworkFaultEnum': {'kUnspecified': 0, 'kLinkDown': 1, 'kHardwareFailure': 2, 'kNetworkJammed': 3, 'kUnknownEnumValue': 4},
+    'ThreadNetworkDiagnostics.Enums.ConnectionStatusEnum': {'kConnected': 0, 'kNotConnected': 1, 'kUnknownEnumValue': 2},
+    'ThreadNetworkDiagnostics.Enums.RoutingRoleEnum': {'kUnspecified': 0, 'kUnassigned': 1, 'kSleepyEndDevice': 2, 'kEndDevice': 3, 'kReed': 4, 'kRouter': 5, 'kLeader': 6, 'kUnknownEnumValue': 7},
+    'ThreadNetworkDiagnostics.Bitmaps.Feature': {'kPacketCounts': 1, 'kErrorCounts': 2, 'kMLECounts': 4, 'kMACCounts': 8},
+    'TimeFormatLocalization.Enums.HourFormatEnum': {'k12hr': 0, 'k24hr': 1, 'kUseActiveLocale': 255, 'kUnknownEnumValue': 256},
+    'TimeFormatLocalization.Enums.CalendarTypeEnum': {'kBuddhist': 0, 'kChinese': 1, 'kCoptic': 2, 'kEthiopian': 3, 'kGregorian': 4, 'kHebrew': 5, 'kIndian': 6, 'kIslamic': 7, 'kJapanese': 8, 'kKorean': 9, 'kPersian': 10, 'kTaiwanese': 11, 'kUseActiveLocale': 255, 'kUnknownEnumValue': 256},
+    'TimeFormatLocalization.Bitmaps.Feature': {'kCalendarFormat': 1},
+    'TimeSynchronization.Enums.GranularityEnum': {'kNoTimeGranularity': 0, 'kMinutesGranularity': 1, 'kSecondsGranularity': 2, 'kMillisecondsGranularity': 3, 'kMicrosecondsGranularity': 4, 'kUnknownEnumValue': 5},
+    'TimeSynchronization.Enums.TimeSourceEnum': {'kNone': 0, 'kUnknown': 1, 'kAdmin': 2, 'kNodeTimeCluster': 3, 'kNonMatterSNTP': 4, 'kNonMatterNTP': 5, 'kMatterSNTP': 6, 'kMatterNTP': 7, 'kMixedNTP': 8, 'kNonMatterSNTPNTS': 9, 'kNonMatterNTPNTS': 10, 'kMatterSNTPNTS': 11, 'kMatterNTPNTS': 12, 'kMixedNTPNTS': 13, 'kCloudSource': 14, 'kPtp': 15, 'kGnss': 16, 'kUnknownEnumValue': 17},
+    'TimeSynchronization.Enums.TimeZoneDatabaseEnum': {'kFull': 0, 'kPartial': 1, 'kNone': 2, 'kUnknownEnumValue': 3},
+    'TimeSynchronization.Enums.StatusCode': {'kTimeNotAccepted': 2, 'kUnknownEnumValue': 3},
+    'TimeSynchronization.Bitmaps.Feature': {'kTimeZone': 1, 'kNTPClient': 2, 'kNTPServer': 4, 'kTimeSyncClient': 8},
+    'TlsClientManagement.Enums.StatusCodeEnum': {'kEndpointAlreadyInstalled': 2, 'kRootCertificateNotFound': 3, 'kClientCertificateNotFound': 4, 'kEndpointInUse': 5, 'kInvalidTime': 6, 'kUnknownEnumValue': 7},
+    'TotalVolatileOrganicCompoundsConcentrationMeasurement.Enums.MeasurementUnitEnum': {'kPpm': 0, 'kPpb': 1, 'kPpt': 2, 'kMgm3': 3, 'kUgm3': 4, 'kNgm3': 5, 'kPm3': 6, 'kBqm3': 7, 'kUnknownEnumValue': 8},
+    'TotalVolatileOrganicCompoundsConcentrationMeasurement.Enums.MeasurementMediumEnum': {'kAir': 0, 'kWater': 1, 'kSoil': 2, 'kUnknownEnumValue': 3},
+    'TotalVolatileOrganicCompoundsConcentrationMeasurement.Enums.LevelValueEnum': {'kUnknown': 0, 'kLow': 1, 'kMedium': 2, 'kHigh': 3, 'kCritical': 4, 'kUnknownEnumValue': 5},
+    'TotalVolatileOrganicCompoundsConcentrationMeasurement.Bitmaps.Feature': {'kNumericMeasurement': 1, 'kLevelIndication': 2, 'kMediumLevel': 4, 'kCriticalLevel': 8, 'kPeakMeasurement': 16, 'kAverageMeasurement': 32},
+    'UnitLocalization.Enums.TempUnitEnum': {'kFahrenheit': 0, 'kCelsius': 1, 'kKelvin': 2, 'kUnknownEnumValue': 3},
+    'UnitLocalization.Bitmaps.Feature': {'kTemperatureUnit': 1},
+    'ValveConfigurationAndControl.Enums.ValveStateEnum': {'kClosed': 0, 'kOpen': 1, 'kTransitioning': 2, 'kUnknownEnumValue': 3},
+    'ValveConfigurationAndControl.Enums.StatusCodeEnum': {'kFailureDueToFault': 2, 'kUnknownEnumValue': 3},
+    'ValveConfigurationAndControl.Bitmaps.Feature': {'kTimeSync': 1, 'kLevel': 2},
+    'ValveConfigurationAndControl.Bitmaps.ValveFaultBitmap': {'kGeneralFault': 1, 'kBlocked': 2, 'kLeaking': 4, 'kNotConnected': 8, 'kShortCircuit': 16, 'kCurrentExceeded': 32},
+    'WaterHeaterManagement.Enums.BoostStateEnum': {'kInactive': 0, 'kActive': 1, 'kUnknownEnumValue': 2},
+    'WaterHeaterManagement.Bitmaps.Feature': {'kEnergyManagement': 1, 'kTankPercent': 2},
+    'WaterHeaterManagement.Bitmaps.WaterHeaterHeatSourceBitmap': {'kImmersionElement1': 1, 'kImmersionElement2': 2, 'kHeatPump': 4, 'kBoiler': 8, 'kOther': 16},
+    'WaterHeaterMode.Enums.ModeTag': {'kAuto': 0, 'kQuick': 1, 'kQuiet': 2, 'kLowNoise': 3, 'kLowEnergy': 4, 'kVacation': 5, 'kMin': 6, 'kMax': 7, 'kNight': 8, 'kDay': 9, 'kOff': 16384, 'kManual': 16385, 'kTimed': 16386, 'kUnknownEnumValue': 16387},
+    'WaterHeaterMode.Enums.ModeChangeStatus': {'kSuccess': 0, 'kUnsupportedMode': 1, 'kGenericFailure': 2, 'kInvalidInMode': 3, 'kUnknownEnumValue': 4},
+    'WaterHeaterMode.Bitmaps.Feature': {'kOnOff': 1},
+    'WaterTankLevelMonitoring.Enums.DegradationDirectionEnum': {'kUp': 0, 'kDown': 1, 'kUnknownEnumValue': 2},
+    'WaterTankLevelMonitoring.Enums.ChangeIndicationEnum': {'kOk': 0, 'kWarning': 1, 'kCritical': 2, 'kUnknownEnumValue': 3},
+    'WaterTankLevelMonitoring.Enums.ProductIdentifierTypeEnum': {'kUpc': 0, 'kGtin8': 1, 'kEan': 2, 'kGtin14': 3, 'kOem': 4, 'kUnknownEnumValue': 5},
+    'WaterTankLevelMonitoring.Bitmaps.Feature': {'kCondition': 1, 'kWarning': 2, 'kReplacementProductList': 4},
+    'WebRtcTransportDefinitions.Enums.WebRTCEndReasonEnum': {'kIceFailed': 0, 'kIceTimeout': 1, 'kUserHangup': 2, 'kUserBusy': 3, 'kReplaced': 4, 'kNoUserMedia': 5, 'kInviteTimeout': 6, 'kAnsweredElsewhere': 7, 'kOutOfResources': 8, 'kMediaTimeout': 9, 'kLowPower': 10, 'kPrivacyMode': 11, 'kUnknownReason': 12, 'kUnknownEnumValue': 13},
+    'WebRtcTransportProvider.Bitmaps.Feature': {'kMetadata': 1},
+    'WiFiNetworkDiagnostics.Enums.SecurityTypeEnum': {'kUnspecified': 0, 'kNone': 1, 'kWep': 2, 'kWpa': 3, 'kWpa2': 4, 'kWpa3': 5, 'kUnknownEnumValue': 6},
+    'WiFiNetworkDiagnostics.Enums.WiFiVersionEnum': {'kA': 0, 'kB': 1, 'kG': 2, 'kN': 3, 'kAc': 4, 'kAx': 5, 'kAh': 6, 'kUnknownEnumValue': 7},
+    'WiFiNetworkDiagnostics.Enums.AssociationFailureCauseEnum': {'kUnknown': 0, 'kAssociationFailed': 1, 'kAuthenticationFailed': 2, 'kSsidNotFound': 3, 'kUnknownEnumValue': 4},
+    'WiFiNetworkDiagnostics.Enums.ConnectionStatusEnum': {'kConnected': 0, 'kNotConnected': 1, 'kUnknownEnumValue': 2},
+    'WiFiNetworkDiagnostics.Bitmaps.Feature': {'kPacketCounts': 1, 'kErrorCounts': 2},
+    'WindowCovering.Enums.Type': {'kRollerShade': 0, 'kRollerShade2Motor': 1, 'kRollerShadeExterior': 2, 'kRollerShadeExterior2Motor': 3, 'kDrapery': 4, 'kAwning': 5, 'kShutter': 6, 'kTiltBlindTiltOnly': 7, 'kTiltBlindLiftAndTilt': 8, 'kProjectorScreen': 9, 'kUnknown': 255, 'kUnknownEnumValue': 256},
+    'WindowCovering.Enums.EndProductType': {'kRollerShade': 0, 'kRomanShade': 1, 'kBalloonShade': 2, 'kWovenWood': 3, 'kPleatedShade': 4, 'kCellularShade': 5, 'kLayeredShade': 6, 'kLayeredShade2D': 7, 'kSheerShade': 8, 'kTiltOnlyInteriorBlind': 9, 'kInteriorBlind': 10, 'kVerticalBlindStripCurtain': 11, 'kInteriorVenetianBlind': 12, 'kExteriorVenetianBlind': 13, 'kLateralLeftCurtain': 14, 'kLateralRightCurtain': 15, 'kCentralCurtain': 16, 'kRollerShutter': 17, 'kExteriorVerticalScreen': 18, 'kAwningTerracePatio': 19, 'kAwningVerticalScreen': 20, 'kTiltOnlyPergola': 21, 'kSwingingShutter': 22, 'kSlidingShutter': 23, 'kUnknown': 255, 'kUnknownEnumValue': 256},
+    'WindowCovering.Enums.MovementStatus': {'kStopped': 0, 'kOpening': 1, 'kClosing': 2, 'kUnknownEnumValue': 3},
+    'WindowCovering.Bitmaps.Feature': {'kLift': 1, 'kTilt': 2, 'kPositionAwareLift': 4, 'kPositionAwareTilt': 16},
+    'WindowCovering.Bitmaps.ConfigStatus': {'kOperational': 1, 'kOnlineReserved': 2, 'kLiftMovementReversed': 4, 'kLiftPositionAware': 8, 'kTiltPositionAware': 16, 'kLiftEncoderControlled': 32, 'kTiltEncoderControlled': 64},
+    'WindowCovering.Bitmaps.Mode': {'kMotorDirectionReversed': 1, 'kCalibrationMode': 2, 'kMaintenanceMode': 4, 'kLedFeedback': 8},
+    'WindowCovering.Bitmaps.OperationalStatus': {'kGlobal': 3, 'kLift': 12, 'kTilt': 48},
+    'WindowCovering.Bitmaps.SafetyStatus': {'kRemoteLockout': 1, 'kTamperDetection': 2, 'kFailedCommunication': 4, 'kPositionFailure': 8, 'kThermalProtection': 16, 'kObstacleDetected': 32, 'kPower': 64, 'kStopInput': 128, 'kMotorJammed': 256, 'kHardwareFailure': 512, 'kManualOperation': 1024, 'kProtection': 2048},
+    'ZoneManagement.Enums.ZoneTypeEnum': {'kTwoDcartZone': 0, 'kUnknownEnumValue': 1},
+    'ZoneManagement.Enums.ZoneUseEnum': {'kMotion': 0, 'kPrivacy': 1, 'kFocus': 2, 'kUnknownEnumValue': 3},
+    'ZoneManagement.Enums.ZoneSourceEnum': {'kMfg': 0, 'kUser': 1, 'kUnknownEnumValue': 2},
+    'ZoneManagement.Enums.ZoneEventTriggeredReasonEnum': {'kMotion': 0, 'kUnknownEnumValue': 1},
+    'ZoneManagement.Enums.ZoneEventStoppedReasonEnum': {'kActionStopped': 0, 'kTimeout': 1, 'kUnknownEnumValue': 2},
+    'ZoneManagement.Bitmaps.Feature': {'kTwoDimensionalCartesianZone': 1, 'kPerZoneSensitivity': 2, 'kUserDefined': 4, 'kFocusZones': 8},
+}
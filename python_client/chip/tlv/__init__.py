@@ -1,15 +1,16 @@
 """Minimal reimplementation of chip.tlv for matter-python-client.
 
-Provides uint, float32, TLVList, TLVWriter and TLVReader types used by
-ClusterObjects for serialization/deserialization.
+Provides uint, float32, TLVList, TLVWriter, TLVReader and TLVStreamReader types
+used by ClusterObjects for serialization/deserialization.
 """
 
 from __future__ import absolute_import, print_function
 
 import struct
-from collections import OrderedDict
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from enum import Enum
+from operator import itemgetter
+from typing import Any, NamedTuple, Optional
 
 from .tlvlist import TLVList
 
@@ -64,10 +65,70 @@ class float32(float):
     pass
 
 
+# Precompiled value structs, indexed by the low two bits of the element type
+# (1/2/4/8 byte encodings).
+_SIGNED_STRUCTS = tuple(struct.Struct(fmt) for fmt in ("<b", "<h", "<l", "<q"))
+_UNSIGNED_STRUCTS = tuple(struct.Struct(fmt) for fmt in ("<B", "<H", "<L", "<Q"))
+_FLOAT_STRUCT = struct.Struct("<f")
+_DOUBLE_STRUCT = struct.Struct("<d")
+# decoded unsigned values can never be negative, skip the range check in uint.__init__
+_newUint = int.__new__
+
+
+def _headerStructs(valueFormat):
+    """Return the (anonymous, context tag) structs for a control byte followed by a value."""
+    return struct.Struct("<B" + valueFormat), struct.Struct("<BB" + valueFormat)
+
+
+# Precompiled structs used by TLVWriter, indexed by the low two bits of the
+# element type (1/2/4/8 byte encodings). Each entry packs the control byte,
+# the (optional) context tag and the value (or length) in one call.
+_CONTEXT_TAG_STRUCT = struct.Struct("<BB")
+_SIGNED_HEADER_STRUCTS = tuple(_headerStructs(fmt) for fmt in "bhlq")
+_UNSIGNED_HEADER_STRUCTS = tuple(_headerStructs(fmt) for fmt in "BHLQ")
+_FLOAT_HEADER_STRUCTS = _headerStructs("f")
+_DOUBLE_HEADER_STRUCTS = _headerStructs("d")
+
+
+def _unsignedSizeIndex(val):
+    if val < 0:
+        raise ValueError("Integer value out of range")
+    if val <= UINT8_MAX:
+        return 0
+    if val <= UINT16_MAX:
+        return 1
+    if val <= UINT32_MAX:
+        return 2
+    if val <= UINT64_MAX:
+        return 3
+    raise ValueError("Integer value out of range")
+
+
+def _signedSizeIndex(val):
+    if INT8_MIN <= val <= INT8_MAX:
+        return 0
+    if INT16_MIN <= val <= INT16_MAX:
+        return 1
+    if INT32_MIN <= val <= INT32_MAX:
+        return 2
+    if INT64_MIN <= val <= INT64_MAX:
+        return 3
+    raise ValueError("Integer value out of range")
+
+
+def _sortedItems(val):
+    """Return the items of a dict in TLV tag order."""
+    if all(type(tag) is int for tag in val):
+        # (unique) context tags sort by their number
+        return sorted(val.items(), key=itemgetter(0))
+    return sorted(val.items(), key=lambda item: tlvTagToSortKey(item[0]))
+
+
 class TLVWriter:
     def __init__(self, encoding=None, implicitProfile=None):
         self._encoding = encoding if encoding is not None else bytearray()
         self._implicitProfile = implicitProfile
+        # element types of the open containers, innermost last
         self._containerStack = []
 
     @property
@@ -79,8 +140,10 @@ class TLVWriter:
         self._encoding = val
 
     def put(self, tag, val):
-        if val is None:
-            self.putNull(tag)
+        # dispatch on the exact type first, subclasses (enums, mappings, ...) below
+        putter = _PUTTERS.get(type(val))
+        if putter is not None:
+            putter(self, tag, val)
         elif isinstance(val, Enum):
             self.putUnsignedInt(tag, val)
         elif isinstance(val, bool):
@@ -98,101 +161,78 @@ class TLVWriter:
         elif isinstance(val, (bytes, bytearray)):
             self.putBytes(tag, val)
         elif isinstance(val, Mapping):
-            self.startStructure(tag)
-            if type(val) is dict:
-                val = OrderedDict(
-                    sorted(val.items(), key=lambda item: tlvTagToSortKey(item[0]))
-                )
-            for containedTag, containedVal in val.items():
-                self.put(containedTag, containedVal)
-            self.endContainer()
+            self.putStructure(tag, val)
         elif isinstance(val, TLVList):
             self.startPath(tag)
             for containedTag, containedVal in val:
                 self.put(containedTag, containedVal)
             self.endContainer()
         elif isinstance(val, Sequence):
-            self.startArray(tag)
-            for containedVal in val:
-                self.put(None, containedVal)
-            self.endContainer()
+            self.putArray(tag, val)
         else:
             raise ValueError("Attempt to TLV encode unsupported value")
 
+    def putStructure(self, tag, val):
+        """Encode a mapping as a struct, plain dicts are written in tag order."""
+        self.startStructure(tag)
+        items = _sortedItems(val) if type(val) is dict else val.items()
+        for containedTag, containedVal in items:
+            self.put(containedTag, containedVal)
+        self.endContainer()
+
+    def putArray(self, tag, val):
+        """Encode a sequence as an array."""
+        self.startArray(tag)
+        for containedVal in val:
+            self.put(None, containedVal)
+        self.endContainer()
+
     def putSignedInt(self, tag, val):
-        if val >= INT8_MIN and val <= INT8_MAX:
-            fmt = "<b"
-        elif val >= INT16_MIN and val <= INT16_MAX:
-            fmt = "<h"
-        elif val >= INT32_MIN and val <= INT32_MAX:
-            fmt = "<l"
-        elif val >= INT64_MIN and val <= INT64_MAX:
-            fmt = "<q"
-        else:
-            raise ValueError("Integer value out of range")
-        val = struct.pack(fmt, val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_SIGNED_INTEGER, tag, lenOfLenOrVal=len(val)
+        sizeIndex = _signedSizeIndex(val)
+        self._putValue(
+            _SIGNED_HEADER_STRUCTS[sizeIndex], TLV_TYPE_SIGNED_INTEGER | sizeIndex, tag, val
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
 
     def putUnsignedInt(self, tag, val):
-        val = self._encodeUnsignedInt(val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_UNSIGNED_INTEGER, tag, lenOfLenOrVal=len(val)
+        sizeIndex = _unsignedSizeIndex(val)
+        self._putValue(
+            _UNSIGNED_HEADER_STRUCTS[sizeIndex], TLV_TYPE_UNSIGNED_INTEGER | sizeIndex, tag, val
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
 
     def putFloat(self, tag, val):
-        val = struct.pack("f", val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
+        self._putValue(
+            _FLOAT_HEADER_STRUCTS, TLV_TYPE_FLOATING_POINT_NUMBER | 2, tag, val
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
 
     def putDouble(self, tag, val):
-        val = struct.pack("d", val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
+        self._putValue(
+            _DOUBLE_HEADER_STRUCTS, TLV_TYPE_FLOATING_POINT_NUMBER | 3, tag, val
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
 
     def putString(self, tag, val):
         val = val.encode("utf-8")
-        valLen = self._encodeUnsignedInt(len(val))
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_UTF8_STRING, tag, lenOfLenOrVal=len(valLen)
+        sizeIndex = _unsignedSizeIndex(len(val))
+        self._putValue(
+            _UNSIGNED_HEADER_STRUCTS[sizeIndex], TLV_TYPE_UTF8_STRING | sizeIndex, tag, len(val)
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(valLen)
         self._encoding.extend(val)
 
     def putBytes(self, tag, val):
-        valLen = self._encodeUnsignedInt(len(val))
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_BYTE_STRING, tag, lenOfLenOrVal=len(valLen)
+        sizeIndex = _unsignedSizeIndex(len(val))
+        self._putValue(
+            _UNSIGNED_HEADER_STRUCTS[sizeIndex], TLV_TYPE_BYTE_STRING | sizeIndex, tag, len(val)
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(valLen)
         self._encoding.extend(val)
 
     def putBool(self, tag, val):
-        t = TLVBoolean_True if val else TLVBoolean_False
-        controlAndTag = self._encodeControlAndTag(t, tag)
-        self._encoding.extend(controlAndTag)
+        self._putControlAndTag(TLVBoolean_True if val else TLVBoolean_False, tag)
 
     def putNull(self, tag):
-        controlAndTag = self._encodeControlAndTag(TLV_TYPE_NULL, tag)
-        self._encoding.extend(controlAndTag)
+        self._putControlAndTag(TLV_TYPE_NULL, tag)
 
     def startContainer(self, tag, containerType):
-        controlAndTag = self._encodeControlAndTag(containerType, tag)
-        self._encoding.extend(controlAndTag)
-        self._containerStack.insert(0, containerType)
+        self._putControlAndTag(containerType, tag)
+        self._containerStack.append(containerType)
 
     def startStructure(self, tag):
         self.startContainer(tag, containerType=TLV_TYPE_STRUCTURE)
@@ -204,176 +244,362 @@ class TLVWriter:
         self.startContainer(tag, containerType=TLV_TYPE_PATH)
 
     def endContainer(self):
-        self._containerStack.pop(0)
-        controlAndTag = self._encodeControlAndTag(TLVEndOfContainer, None)
-        self._encoding.extend(controlAndTag)
-
-    def _encodeControlAndTag(self, type, tag, lenOfLenOrVal=0):
-        controlByte = type
-        if lenOfLenOrVal == 2:
-            controlByte |= 1
-        elif lenOfLenOrVal == 4:
-            controlByte |= 2
-        elif lenOfLenOrVal == 8:
-            controlByte |= 3
+        self._containerStack.pop()
+        self._encoding.append(TLVEndOfContainer)
+
+    def _putValue(self, structs, controlByte, tag, val):
+        """Write the control byte, the tag and a fixed size value (or length) in one go."""
         if tag is None:
-            if (
-                type != TLVEndOfContainer
-                and len(self._containerStack) != 0
-                and self._containerStack[0] == TLV_TYPE_STRUCTURE
-            ):
-                raise ValueError("Attempt to encode anonymous tag within TLV structure")
-            controlByte |= TLV_TAG_CONTROL_ANONYMOUS
-            return struct.pack("<B", controlByte)
-        if isinstance(tag, int):
-            if tag < 0 or tag > UINT8_MAX:
-                raise ValueError("Context-specific TLV tag number out of range")
-            if len(self._containerStack) == 0:
-                raise ValueError(
-                    "Attempt to encode context-specific TLV tag at top level"
-                )
-            if self._containerStack[0] == TLV_TYPE_ARRAY:
-                raise ValueError(
-                    "Attempt to encode context-specific tag within TLV array"
-                )
-            controlByte |= TLV_TAG_CONTROL_CONTEXT_SPECIFIC
-            return struct.pack("<BB", controlByte, tag)
-        raise ValueError("Invalid object given for TLV tag")
+            self._checkAnonymousTag()
+            self._encoding.extend(structs[0].pack(controlByte, val))
+        else:
+            self._checkContextTag(tag)
+            self._encoding.extend(
+                structs[1].pack(controlByte | TLV_TAG_CONTROL_CONTEXT_SPECIFIC, tag, val)
+            )
+
+    def _putControlAndTag(self, controlByte, tag):
+        if tag is None:
+            self._checkAnonymousTag()
+            self._encoding.append(controlByte)
+        else:
+            self._checkContextTag(tag)
+            self._encoding.extend(
+                _CONTEXT_TAG_STRUCT.pack(controlByte | TLV_TAG_CONTROL_CONTEXT_SPECIFIC, tag)
+            )
+
+    def _checkAnonymousTag(self):
+        if self._containerStack and self._containerStack[-1] == TLV_TYPE_STRUCTURE:
+            raise ValueError("Attempt to encode anonymous tag within TLV structure")
+
+    def _checkContextTag(self, tag):
+        if not isinstance(tag, int):
+            raise ValueError("Invalid object given for TLV tag")
+        if tag < 0 or tag > UINT8_MAX:
+            raise ValueError("Context-specific TLV tag number out of range")
+        if not self._containerStack:
+            raise ValueError("Attempt to encode context-specific TLV tag at top level")
+        if self._containerStack[-1] == TLV_TYPE_ARRAY:
+            raise ValueError("Attempt to encode context-specific tag within TLV array")
 
     @staticmethod
     def _encodeUnsignedInt(val):
-        if val < 0:
-            raise ValueError("Integer value out of range")
-        if val <= UINT8_MAX:
-            fmt = "<B"
-        elif val <= UINT16_MAX:
-            fmt = "<H"
-        elif val <= UINT32_MAX:
-            fmt = "<L"
-        elif val <= UINT64_MAX:
-            fmt = "<Q"
-        else:
-            raise ValueError("Integer value out of range")
-        return struct.pack(fmt, val)
+        return _UNSIGNED_STRUCTS[_unsignedSizeIndex(val)].pack(val)
+
+
+# exact type -> TLVWriter method, for the most common value types
+_PUTTERS = {
+    type(None): lambda writer, tag, _: writer.putNull(tag),
+    bool: TLVWriter.putBool,
+    uint: TLVWriter.putUnsignedInt,
+    int: TLVWriter.putSignedInt,
+    float32: TLVWriter.putFloat,
+    float: TLVWriter.putDouble,
+    str: TLVWriter.putString,
+    bytes: TLVWriter.putBytes,
+    bytearray: TLVWriter.putBytes,
+    dict: TLVWriter.putStructure,
+    list: TLVWriter.putArray,
+}
 
 
 class TLVReader:
+    """Decode a TLV encoded buffer into (nested) dicts and lists.
+
+    The buffer is walked once with an integer cursor over a memoryview, so
+    decoding is linear in the size of the input and no intermediate copies
+    of the remaining buffer are made.
+    """
+
     def __init__(self, tlv):
         self._tlv = tlv
         self._bytesRead = 0
-        self._decodings = []
 
     def get(self):
         out = {}
-        self._get(self._tlv, self._decodings, out)
+        buf = memoryview(self._tlv)
+        if buf.format != "B" or buf.ndim != 1:
+            buf = buf.cast("B")
+        try:
+            self._bytesRead = self._get(buf, self._bytesRead, out)
+        except IndexError as ex:
+            # keep the error type of struct.unpack on truncated input
+            raise struct.error("TLV buffer is truncated") from ex
         return out
 
-    def _decodeControlAndTag(self, tlv, decoding):
-        (controlByte,) = struct.unpack("<B", tlv[self._bytesRead : self._bytesRead + 1])
-        tagControl = controlByte & 0xE0
-        elementType = controlByte & 0x1F
-        decoding["type"] = elementType
-        self._bytesRead += 1
-
-        if tagControl == TLV_TAG_CONTROL_ANONYMOUS:
-            decoding["tag"] = None
-        elif tagControl == TLV_TAG_CONTROL_CONTEXT_SPECIFIC:
-            (decoding["tag"],) = struct.unpack(
-                "<B", tlv[self._bytesRead : self._bytesRead + 1]
-            )
-            self._bytesRead += 1
-        else:
-            decoding["tag"] = None
-
-    def _decodeVal(self, tlv, decoding):
-        t = decoding["type"]
-        if t == TLV_TYPE_STRUCTURE:
-            decoding["value"] = {}
-            self._get(tlv, [], decoding["value"])
-        elif t == TLV_TYPE_ARRAY:
-            decoding["value"] = []
-            self._get(tlv, [], decoding["value"])
-        elif t == TLV_TYPE_NULL:
-            decoding["value"] = None
-        elif t == TLVEndOfContainer:
-            decoding["value"] = None
-        elif t == TLVBoolean_True:
-            decoding["value"] = True
-        elif t == TLVBoolean_False:
-            decoding["value"] = False
-        elif t >= 0x00 and t <= 0x03:
-            # Signed integers 1/2/4/8 byte
-            sizes = {0: ("<b", 1), 1: ("<h", 2), 2: ("<l", 4), 3: ("<q", 8)}
-            fmt, size = sizes[t - TLV_TYPE_SIGNED_INTEGER]
-            (decoding["value"],) = struct.unpack(
-                fmt, tlv[self._bytesRead : self._bytesRead + size]
-            )
-            self._bytesRead += size
-        elif t >= 0x04 and t <= 0x07:
-            # Unsigned integers 1/2/4/8 byte
-            sizes = {0: ("<B", 1), 1: ("<H", 2), 2: ("<L", 4), 3: ("<Q", 8)}
-            fmt, size = sizes[t - TLV_TYPE_UNSIGNED_INTEGER]
-            (decoding["value"],) = struct.unpack(
-                fmt, tlv[self._bytesRead : self._bytesRead + size]
-            )
-            decoding["value"] = uint(decoding["value"])
-            self._bytesRead += size
-        elif t == 0x0A:
-            (decoding["value"],) = struct.unpack(
-                "<f", tlv[self._bytesRead : self._bytesRead + 4]
-            )
-            decoding["value"] = float32(decoding["value"])
-            self._bytesRead += 4
-        elif t == 0x0B:
-            (decoding["value"],) = struct.unpack(
-                "<d", tlv[self._bytesRead : self._bytesRead + 8]
-            )
-            self._bytesRead += 8
-        elif t >= 0x0C and t <= 0x0F:
-            # UTF-8 strings
-            lenSizes = {0: ("<B", 1), 1: ("<H", 2), 2: ("<L", 4), 3: ("<Q", 8)}
-            fmt, size = lenSizes[t - TLV_TYPE_UTF8_STRING]
-            (strLen,) = struct.unpack(
-                fmt, tlv[self._bytesRead : self._bytesRead + size]
-            )
-            self._bytesRead += size
-            val = tlv[self._bytesRead : self._bytesRead + strLen]
+    def _get(self, buf, offset, out):
+        """Decode elements into out until the end of the container (or buffer).
+
+        Returns the offset directly after the last consumed byte.
+        """
+        end = len(buf)
+        isDict = isinstance(out, dict)
+        while offset < end:
+            controlByte = buf[offset]
+            offset += 1
+            elementType = controlByte & 0x1F
+            if elementType == TLVEndOfContainer:
+                # the end of container element has no tag (or value)
+                break
+
+            tag = None
+            if controlByte & 0xE0 == TLV_TAG_CONTROL_CONTEXT_SPECIFIC:
+                tag = buf[offset]
+                offset += 1
+
+            if elementType <= 0x07:
+                # integers are by far the most common element, decode them inline
+                # 0x00-0x03: signed integers, 0x04-0x07: unsigned integers (1/2/4/8 byte)
+                sizeIndex = elementType & 0x03
+                if elementType >= TLV_TYPE_UNSIGNED_INTEGER:
+                    (value,) = _UNSIGNED_STRUCTS[sizeIndex].unpack_from(buf, offset)
+                    value = _newUint(uint, value)
+                else:
+                    (value,) = _SIGNED_STRUCTS[sizeIndex].unpack_from(buf, offset)
+                offset += 1 << sizeIndex
+            else:
+                value, offset = self._decodeVal(buf, offset, elementType)
+
+            if isDict:
+                out[tag if tag is not None else "Any"] = value
+            else:
+                out.append(value)
+        return offset
+
+    def _decodeVal(self, buf, offset, elementType):
+        """Decode the value of a non-integer element, returns the value and the new offset."""
+        if elementType == TLV_TYPE_STRUCTURE:
+            value = {}
+            return value, self._get(buf, offset, value)
+        if elementType == TLV_TYPE_ARRAY:
+            value = []
+            return value, self._get(buf, offset, value)
+        return _decodeScalar(buf, offset, elementType)
+
+
+def _decodeScalar(buf, offset, elementType):
+    """Decode the value of a non-container element, returns the value and the new offset."""
+    if elementType <= 0x07:
+        # 0x00-0x03: signed integers, 0x04-0x07: unsigned integers (1/2/4/8 byte)
+        sizeIndex = elementType & 0x03
+        if elementType >= TLV_TYPE_UNSIGNED_INTEGER:
+            (value,) = _UNSIGNED_STRUCTS[sizeIndex].unpack_from(buf, offset)
+            return _newUint(uint, value), offset + (1 << sizeIndex)
+        (value,) = _SIGNED_STRUCTS[sizeIndex].unpack_from(buf, offset)
+        return value, offset + (1 << sizeIndex)
+    if elementType == TLVBoolean_False:
+        return False, offset
+    if elementType == TLVBoolean_True:
+        return True, offset
+    if elementType == TLV_TYPE_NULL:
+        return None, offset
+    if TLV_TYPE_UTF8_STRING <= elementType <= 0x13:
+        # 0x0C-0x0F: UTF-8 strings, 0x10-0x13: byte strings (1/2/4/8 byte length)
+        lenStruct = _UNSIGNED_STRUCTS[elementType & 0x03]
+        (strLen,) = lenStruct.unpack_from(buf, offset)
+        offset += lenStruct.size
+        val = buf[offset : offset + strLen]
+        if elementType < TLV_TYPE_BYTE_STRING:
             try:
-                decoding["value"] = val.decode("utf-8")
-            except Exception:
-                decoding["value"] = val
-            self._bytesRead += strLen
-        elif t >= 0x10 and t <= 0x13:
-            # Byte strings
-            lenSizes = {0: ("<B", 1), 1: ("<H", 2), 2: ("<L", 4), 3: ("<Q", 8)}
-            fmt, size = lenSizes[t - TLV_TYPE_BYTE_STRING]
-            (strLen,) = struct.unpack(
-                fmt, tlv[self._bytesRead : self._bytesRead + size]
-            )
-            self._bytesRead += size
-            decoding["value"] = bytes(
-                tlv[self._bytesRead : self._bytesRead + strLen]
-            )
-            self._bytesRead += strLen
-        else:
-            raise ValueError("Attempt to decode unsupported TLV type")
+                return str(val, "utf-8"), offset + strLen
+            except UnicodeDecodeError:
+                pass
+        return bytes(val), offset + strLen
+    if elementType == TLV_TYPE_FLOATING_POINT_NUMBER:
+        (value,) = _FLOAT_STRUCT.unpack_from(buf, offset)
+        return float32(value), offset + 4
+    if elementType == 0x0B:
+        (value,) = _DOUBLE_STRUCT.unpack_from(buf, offset)
+        return value, offset + 8
+    raise ValueError("Attempt to decode unsupported TLV type")
+
+
+def _scalarSize(buf, offset, elementType):
+    """Return the encoded size of a non-container value, or None when its length is not available yet."""
+    if elementType <= 0x07:
+        return 1 << (elementType & 0x03)
+    if TLVBoolean_False <= elementType <= TLVBoolean_True or elementType == TLV_TYPE_NULL:
+        return 0
+    if TLV_TYPE_UTF8_STRING <= elementType <= 0x13:
+        lenStruct = _UNSIGNED_STRUCTS[elementType & 0x03]
+        if offset + lenStruct.size > len(buf):
+            return None
+        (strLen,) = lenStruct.unpack_from(buf, offset)
+        return lenStruct.size + strLen
+    if elementType == TLV_TYPE_FLOATING_POINT_NUMBER:
+        return 4
+    if elementType == 0x0B:
+        return 8
+    raise ValueError("Attempt to decode unsupported TLV type")
+
+
+class TLVElement(NamedTuple):
+    """A single element produced by TLVStreamReader.
+
+    depth is the number of containers the element is nested in, type is the
+    TLV element type (including the size bits for integers and strings).
+    value is None for the start and end (TLVEndOfContainer) of a container.
+    """
+
+    depth: int
+    tag: Optional[int]
+    type: int
+    value: Any
+
+
+class TLVStreamReader:
+    """Iterate over the elements of a TLV encoded buffer, without materializing containers.
+
+    Elements are returned one at a time as TLVElement, so callers can stop early
+    or skip the remainder of a container (see skip) without decoding it. Data can
+    be fed incrementally: when the buffered bytes do not hold a complete element,
+    read returns None (and iteration stops) until more data is fed.
+    """
+
+    def __init__(self, tlv=b""):
+        if isinstance(tlv, memoryview) and (tlv.format != "B" or tlv.ndim != 1):
+            tlv = tlv.cast("B")
+        self._buf = tlv
+        self._ownsBuffer = False
+        self._offset = 0
+        # element types of the currently open containers
+        self._containers = []
+        # while set, elements are consumed (not returned) until the depth drops to this value
+        self._skipTo = None
 
-    def _get(self, tlv, decodings, out):
-        while len(tlv[self._bytesRead :]) > 0:
-            decoding = {}
-            self._decodeControlAndTag(tlv, decoding)
-            self._decodeVal(tlv, decoding)
-            decodings.append(decoding)
+    @property
+    def depth(self) -> int:
+        """Return the number of currently open containers."""
+        return len(self._containers)
 
-            if decoding["type"] == TLVEndOfContainer:
-                break
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered bytes that have not been consumed yet."""
+        return len(self._buf) - self._offset
+
+    def feed(self, data) -> None:
+        """Append (a chunk of) TLV encoded data to the buffer."""
+        if not self._ownsBuffer:
+            self._buf = bytearray(self._buf[self._offset :])
+            self._ownsBuffer = True
+            self._offset = 0
+        elif self._offset > len(self._buf) // 2:
+            # drop consumed data once it makes up most of the buffer
+            del self._buf[: self._offset]
+            self._offset = 0
+        self._buf += data
+
+    def __iter__(self) -> Iterator[TLVElement]:
+        while (element := self.read()) is not None:
+            yield element
+
+    def read(self) -> Optional[TLVElement]:
+        """Return the next element, or None when more data is needed."""
+        while True:
+            element = self._readElement()
+            if element is not False:
+                return element
+
+    def skip(self) -> None:
+        """Skip the remainder of the innermost open container, including its end.
+
+        Skipped elements are walked over but their values are never decoded.
+        Whatever part of the container is not buffered yet is skipped by the
+        following reads.
+        """
+        if not self._containers:
+            raise ValueError("No open container to skip")
+        self._skipTo = len(self._containers) - 1
+        while self._skipTo is not None and self._readElement() is not None:
+            pass
+
+    def readContainer(self):
+        """Decode the remainder of the innermost open container into a dict or list.
+
+        The container must be completely buffered, else a ValueError is raised
+        and the reader position is left untouched (so it can be retried after
+        feeding more data).
+        """
+        if not self._containers:
+            raise ValueError("No open container to read")
+        if self._skipTo is not None:
+            raise ValueError("A skipped container is not completely consumed yet")
+        offset, containers = self._offset, list(self._containers)
+        root = {} if containers[-1] == TLV_TYPE_STRUCTURE else []
+        stack = [root]
+        while stack:
+            element = self.read()
+            if element is None:
+                self._offset, self._containers = offset, containers
+                raise ValueError("TLV container is not completely buffered")
+            if element.type == TLVEndOfContainer:
+                stack.pop()
+                continue
+            if element.type == TLV_TYPE_STRUCTURE:
+                value = {}
+            elif element.type == TLV_TYPE_ARRAY:
+                value = []
             else:
-                tag = decoding["tag"]
-                if isinstance(out, dict):
-                    key = tag if tag is not None else "Any"
-                    out[key] = decoding["value"]
-                elif isinstance(out, list):
-                    out.append(decoding["value"])
+                value = element.value
+            out = stack[-1]
+            if isinstance(out, dict):
+                out[element.tag if element.tag is not None else "Any"] = value
+            else:
+                out.append(value)
+            if element.type in (TLV_TYPE_STRUCTURE, TLV_TYPE_ARRAY):
+                stack.append(value)
+        return root
+
+    def _readElement(self):
+        """Consume the next element.
+
+        Returns the element, None when the buffer does not hold a complete element
+        or False when the element was consumed as part of a skipped container.
+        """
+        buf = self._buf
+        end = len(buf)
+        offset = self._offset
+        if offset >= end:
+            return None
+        controlByte = buf[offset]
+        offset += 1
+        elementType = controlByte & 0x1F
+        depth = len(self._containers)
+
+        if elementType == TLVEndOfContainer:
+            if not depth:
+                raise ValueError("Unexpected end of container")
+            self._containers.pop()
+            self._offset = offset
+            depth -= 1
+            if self._skipTo is not None:
+                if depth == self._skipTo:
+                    self._skipTo = None
+                return False
+            return TLVElement(depth, None, elementType, None)
+
+        tag = None
+        if controlByte & 0xE0 == TLV_TAG_CONTROL_CONTEXT_SPECIFIC:
+            if offset >= end:
+                return None
+            tag = buf[offset]
+            offset += 1
+
+        if elementType == TLV_TYPE_STRUCTURE or elementType == TLV_TYPE_ARRAY:
+            self._containers.append(elementType)
+            self._offset = offset
+            if self._skipTo is not None:
+                return False
+            return TLVElement(depth, tag, elementType, None)
+
+        size = _scalarSize(buf, offset, elementType)
+        if size is None or offset + size > end:
+            return None
+        self._offset = offset + size
+        if self._skipTo is not None:
+            return False
+        value, _ = _decodeScalar(buf, offset, elementType)
+        return TLVElement(depth, tag, elementType, value)
 
 
 def tlvTagToSortKey(tag):
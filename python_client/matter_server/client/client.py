@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final, Literal, Self, cast
+from typing import TYPE_CHECKING, Any, Literal, Self, cast
 import uuid
 
 from chip.clusters import Objects as Clusters
@@ -45,23 +45,41 @@ from matter_server.common.models import (
     SuccessResultMessage,
 )
 
-from .connection import MatterClientConnection
+from .connection import MatterClientConnection, is_result_frame
+from .dispatch import (
+    DispatchOptions,
+    EventDispatcher,
+    MessageQueue,
+    ReaderMetrics,
+    SubscriberMetrics,
+)
 from .exceptions import (
     ConnectionClosed,
     InvalidMessage,
     InvalidState,
     ServerVersionTooOld,
 )
+from .models.fabric_index import FabricIndex
 from .models.node import (
+    MatterEndpoint,
     MatterFabricData,
     MatterNode,
     NetworkType,
     NodeDiagnostics,
     NodeType,
 )
+from .subscribers import (
+    SUB_WILDCARD,
+    AttributeFilter,
+    ClusterFilter,
+    EndpointFilter,
+    PathKeys,
+    make_path_filters,
+    parse_path_filter,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
     from os import PathLike
     from types import TracebackType
 
@@ -69,7 +87,16 @@ if TYPE_CHECKING:
 
     from chip.clusters.Objects import ClusterCommand
 
-SUB_WILDCARD: Final = "*"
+    from .models.device_types import DeviceType
+
+# commands whose result follows the node events they cause (node_added, node_updated, ...)
+NODE_EVENT_COMMANDS = {
+    APICommand.COMMISSION_WITH_CODE,
+    APICommand.COMMISSION_ON_NETWORK,
+    APICommand.INTERVIEW_NODE,
+    APICommand.REMOVE_NODE,
+    APICommand.IMPORT_TEST_NODE,
+}
 
 # pylint: disable=too-many-public-methods,too-many-locals,too-many-branches
 
@@ -77,16 +104,56 @@ SUB_WILDCARD: Final = "*"
 class MatterClient:
     """Manage a Matter server over WebSockets."""
 
-    def __init__(self, ws_server_url: str, aiohttp_session: ClientSession) -> None:
-        """Initialize the Client class."""
+    def __init__(
+        self,
+        ws_server_url: str,
+        aiohttp_session: ClientSession,
+        lazy_nodes: bool = False,
+        keep_raw_attributes: bool = True,
+        batch_attribute_updates: bool = False,
+        dispatch_options: DispatchOptions | None = None,
+        message_queue_size: int = 0,
+    ) -> None:
+        """
+        Initialize the Client class.
+
+        With lazy_nodes the clusters of the nodes are only parsed from the raw attribute
+        values when they are accessed, which speeds up startup with many (bridged) devices.
+        Without keep_raw_attributes the raw attribute values of the nodes are dropped once
+        parsed (MatterNodeData.attributes is empty), to save memory.
+        With batch_attribute_updates the attribute updates received within one event loop
+        iteration are grouped per node and applied in one pass, before the subscribers are
+        called (so a subscriber sees the node with all updates of the burst applied).
+        With async_dispatch in the dispatch_options every event subscriber gets a bounded
+        queue (of queue_size events, full queues handled by the overflow_policy) that is
+        drained by its own task, so slow or async callbacks do not stall reading from the server.
+        With a message_queue_size start_listening only reads the messages into a queue
+        (of at most that many messages), which a separate task processes, so reading
+        does not wait for the processing; command results are handled right away.
+        """
         self.connection = MatterClientConnection(ws_server_url, aiohttp_session)
+        self.lazy_nodes = lazy_nodes
+        self.keep_raw_attributes = keep_raw_attributes
+        self.batch_attribute_updates = batch_attribute_updates
+        self.message_queue_size = message_queue_size
+        self._message_queue: MessageQueue | None = None
         self.logger = logging.getLogger(__package__)
         self._nodes: dict[int, MatterNode] = {}
+        # fabric-wide index of the endpoints of all nodes
+        self._fabric_index = FabricIndex()
         self._result_futures: dict[str, asyncio.Future] = {}
-        self._subscribers: dict[str, list[Callable[[EventType, Any], None]]] = {}
+        self._dispatcher = EventDispatcher(dispatch_options or DispatchOptions())
+        # node_id -> (attribute path, new value) of the attribute updates not applied yet
+        self._pending_attribute_updates: dict[int, list[tuple[str, Any]]] = {}
+        self._flush_handle: asyncio.Handle | None = None
         self._stop_called: bool = False
         self._loop: asyncio.AbstractEventLoop | None = None
 
+    @property
+    def dispatch_options(self) -> DispatchOptions:
+        """Return the options of the event dispatch."""
+        return self._dispatcher.options
+
     @property
     def server_info(self) -> ServerInfoMessage | None:
         """Return info of the server we're currently connected to."""
@@ -94,15 +161,31 @@ class MatterClient:
 
     def subscribe_events(
         self,
-        callback: Callable[[EventType, Any], None],
+        callback: Callable[[EventType, Any], Awaitable[None] | None],
         event_filter: EventType | None = None,
         node_filter: int | None = None,
         attr_path_filter: str | None = None,
+        *,
+        dispatch_options: DispatchOptions | None = None,
+        coalesce_interval: float | None = None,
+        endpoint_filter: EndpointFilter = None,
+        cluster_filter: ClusterFilter = None,
+        attribute_filter: AttributeFilter = None,
     ) -> Callable[[], None]:
         """
         Subscribe to node and server events.
 
         Optionally filter by specific events or node attributes.
+        The attribute path filter can hold wildcards (*) and match all attributes
+        below a prefix, e.g. "1/0x0006/*" for all OnOff attributes of endpoint 1.
+        Instead of a path, the endpoint, cluster and attribute can be filtered
+        separately, each by an id (or class), a collection of them or None for all.
+        With async_dispatch the callback can be a coroutine function (else a ValueError
+        is raised), the dispatch options of the client can be overridden per subscriber.
+        With a coalesce_interval (seconds) the callback gets at most one attribute
+        update per attribute path per interval, with the latest value; with 0 only
+        the latest value of each path received within one event loop iteration.
+        The nodes are always updated with every attribute update.
         Returns:
             function to unsubscribe.
 
@@ -110,25 +193,42 @@ class MatterClient:
         you must also register the attributes to subscribe to
         with the `subscribe_attributes` method.
         """
-        # for fast lookups we create a key based on the filters, allowing
-        # a "catch all" with a wildcard (*).
-        _event_filter: str
-        _event_filter = SUB_WILDCARD if event_filter is None else event_filter.value
-
-        _node_filter: str
-        _node_filter = SUB_WILDCARD if node_filter is None else str(node_filter)
-
-        if attr_path_filter is None:
-            attr_path_filter = SUB_WILDCARD
+        path_filters: list[PathKeys] | None = None
+        if endpoint_filter is not None or cluster_filter is not None or attribute_filter is not None:
+            if attr_path_filter is not None:
+                msg = "Use either attr_path_filter or the endpoint/cluster/attribute filters"
+                raise ValueError(msg)
+            path_filters = make_path_filters(endpoint_filter, cluster_filter, attribute_filter)
+        elif attr_path_filter is not None and attr_path_filter != SUB_WILDCARD:
+            path_filters = [parse_path_filter(attr_path_filter)]
+        return self._dispatcher.subscribe(
+            callback,
+            event_filter,
+            node_filter,
+            path_filters,
+            dispatch_options,
+            coalesce_interval,
+        )
 
-        key = f"{_event_filter}/{_node_filter}/{attr_path_filter}"
-        self._subscribers.setdefault(key, [])
-        self._subscribers[key].append(callback)
+    def get_subscriber_metrics(self) -> list[SubscriberMetrics]:
+        """Return the queue and callback metrics of the subscribers (with async_dispatch)."""
+        return self._dispatcher.get_metrics()
 
-        def unsubscribe() -> None:
-            self._subscribers[key].remove(callback)
+    def subscribe_attribute_updates(
+        self,
+        callback: Callable[[MatterNode, dict[str, Any]], None],
+        node_filter: int | None = None,
+    ) -> Callable[[], None]:
+        """
+        Subscribe to batches of attribute updates.
 
-        return unsubscribe
+        The callback is called once per node with all attribute paths updated
+        in the batch (attribute path -> new value), after they are applied to the node.
+        Without batch_attribute_updates every batch holds a single attribute update.
+        Returns:
+            function to unsubscribe.
+        """
+        return self._dispatcher.subscribe_batches(callback, node_filter)
 
     def get_nodes(self) -> list[MatterNode]:
         """Return all Matter nodes."""
@@ -140,6 +240,23 @@ class MatterClient:
             return node
         raise NodeNotExists(f"Node {node_id} does not exist or is not yet interviewed")
 
+    def get_endpoints(
+        self,
+        cluster: type[Clusters.Cluster] | int | None = None,
+        device_type: type[DeviceType] | int | None = None,
+        vendor_id: int | None = None,
+        product_id: int | None = None,
+    ) -> list[MatterEndpoint]:
+        """
+        Return the endpoints of all nodes matching all given filters (None matches all).
+
+        E.g. all endpoints with a specific cluster or of a specific device type, or all
+        endpoints of the nodes of a vendor (and product). Uses a fabric-wide index that
+        is kept up to date from the node events, so no scan of all nodes is needed.
+        """
+        cluster_id = cluster.id if isinstance(cluster, type) else cluster
+        return self._fabric_index.query(cluster_id, device_type, vendor_id, product_id)
+
     async def set_default_fabric_label(self, label: str | None) -> None:
         """Set the default fabric label."""
         await self.send_command(APICommand.SET_DEFAULT_FABRIC_LABEL, require_schema=11, label=label)
@@ -620,9 +737,19 @@ class MatterClient:
         attribute_path: str,
     ) -> None:
         """Read attribute(s) on a node and store the updated value(s)."""
-        updated_values = await self.read_attribute(node_id, attribute_path)
+        updated_values, read_seq = await self._send_command(
+            APICommand.READ_ATTRIBUTE,
+            require_schema=9,
+            node_id=node_id,
+            attribute_path=attribute_path,
+        )
+        node = self._nodes[node_id]
         for attr_path, value in updated_values.items():
-            self._nodes[node_id].update_attribute(attr_path, value)
+            node.update_attribute(attr_path, value)
+            self._fabric_index.attribute_updated(node, attr_path)
+            if read_seq is not None and self._message_queue is not None:
+                # the updates queued before the result are older than the value read
+                self._message_queue.skip_attribute(node_id, attr_path, read_seq)
 
     async def write_attribute(
         self,
@@ -768,6 +895,22 @@ class MatterClient:
         **kwargs: Any,
     ) -> Any:
         """Send a command and get a response."""
+        result, _ = await self._send_command(command, require_schema, **kwargs)
+        return result
+
+    async def _send_command(
+        self,
+        command: str,
+        require_schema: int | None = None,
+        **kwargs: Any,
+    ) -> tuple[Any, int | None]:
+        """
+        Send a command and get a response.
+
+        Also returns the read sequence number of the response if it was handled ahead of
+        queued messages (with a message_queue_size), else None. The commands of
+        NODE_EVENT_COMMANDS return once the messages read before the response are processed.
+        """
         if not self._loop:
             raise InvalidState("Not connected")
 
@@ -775,10 +918,17 @@ class MatterClient:
         future: asyncio.Future[Any] = self._loop.create_future()
         self._result_futures[message.message_id] = future
         await self.connection.send_message(message)
+        queue = self._message_queue
+        read_seq: int | None = None
         try:
-            return await future
+            result = await future
         finally:
             self._result_futures.pop(message.message_id)
+            if queue is not None:
+                read_seq = queue.pop_result(message.message_id)
+        if read_seq is not None and queue is not None and command in NODE_EVENT_COMMANDS:
+            await queue.wait_processed(read_seq)
+        return result, read_seq
 
     async def send_command_no_wait(
         self,
@@ -816,28 +966,113 @@ class MatterClient:
             nodes_msg = cast(SuccessResultMessage, await self.connection.receive_message_or_raise())
             # a full dump of all nodes will be the result of the start_listening command
             # create MatterNode objects from the basic MatterNodeData objects
-            nodes = [MatterNode(dataclass_from_dict(MatterNodeData, x)) for x in nodes_msg.result]
+            nodes = [self._create_node(dataclass_from_dict(MatterNodeData, x)) for x in nodes_msg.result]
             self._nodes = {node.node_id: node for node in nodes}
+            self._fabric_index = FabricIndex(nodes)
             # once we've hit this point we're all set
             self.logger.info("Matter client initialized.")
             if init_ready is not None:
                 init_ready.set()
 
             # keep reading incoming messages
+            if self.message_queue_size:
+                await self._read_messages()
+                return
             while not self._stop_called:
                 msg = await self.connection.receive_message_or_raise()
                 self._handle_incoming_message(msg)
+                if self._dispatcher.full:
+                    await self._dispatcher.wait_for_space()
         except ConnectionClosed:
             pass
         finally:
             await self.disconnect()
 
+    async def _read_messages(self) -> None:
+        """
+        Read the messages into a queue that a separate task processes.
+
+        Reading only waits for the processing when the queue is full. Command results are
+        handled right away, ahead of the queued messages (see _send_command for the order).
+        Returns once the connection is closed and the messages read so far are processed.
+        """
+        loop = asyncio.get_running_loop()
+        reader = asyncio.current_task()
+        queue = self._message_queue = MessageQueue(self.message_queue_size)
+        processor = loop.create_task(self._process_messages(queue))
+        reading = True
+
+        def on_processor_done(task: asyncio.Task[None]) -> None:
+            # a processing error stops reading, also while waiting for the next message
+            if reading and reader is not None and not task.cancelled() and task.exception():
+                reader.cancel()
+
+        processor.add_done_callback(on_processor_done)
+        try:
+            try:
+                while not self._stop_called and not processor.done():
+                    try:
+                        frame = await self.connection.receive_frame_or_raise()
+                    except ConnectionClosed:
+                        break
+                    if is_result_frame(frame):
+                        msg = cast(ResultMessageBase, self.connection.decode_message(frame))
+                        queue.put_result(msg.message_id)
+                        self._handle_incoming_message(msg)
+                        continue
+                    queue.put(frame)
+                    if queue.full:
+                        # stop reading until the processing caught up
+                        waiter = loop.create_task(queue.wait_for_space())
+                        await asyncio.wait((waiter, processor), return_when=asyncio.FIRST_COMPLETED)
+                        waiter.cancel()
+            except asyncio.CancelledError:
+                if reader is None or not processor.done() or processor.cancelled() or not processor.exception():
+                    raise
+                # cancelled by on_processor_done, the error is raised below
+                reader.uncancel()
+            reading = False
+            queue.close()
+            # raises the error of the processing, if any
+            await processor
+        finally:
+            processor.cancel()
+            queue.release()
+
+    async def _process_messages(self, queue: MessageQueue) -> None:
+        """
+        Process the messages queued by _read_messages.
+
+        Only yields to the event loop once the queue is empty (or a subscriber queue is
+        full), so the attribute updates read together are also batched together.
+        """
+        while (entry := await queue.get()) is not None:
+            frame, seq = entry
+            msg = self.connection.decode_message(frame)
+            if not (
+                isinstance(msg, EventMessage)
+                and msg.event == EventType.ATTRIBUTE_UPDATED
+                and queue.is_skipped(msg.data[0], msg.data[1], seq)
+            ):
+                self._handle_incoming_message(msg)
+            queue.processed()
+            if self._dispatcher.full:
+                await self._dispatcher.wait_for_space()
+
+    def get_reader_metrics(self) -> ReaderMetrics | None:
+        """Return the metrics of the message queue (with a message_queue_size, once listening)."""
+        return self._message_queue.metrics if self._message_queue is not None else None
+
     async def disconnect(self) -> None:
         """Disconnect the client and cleanup."""
         self._stop_called = True
+        # apply the attribute updates that were received already
+        self._flush_attribute_updates()
         # cancel all command-tasks awaiting a result
         for future in self._result_futures.values():
             future.cancel()
+        # the events not delivered yet to the queued and coalescing subscribers are dropped
+        self._dispatcher.close()
         await self.connection.disconnect()
 
     def _handle_incoming_message(self, msg: MessageType) -> None:
@@ -848,6 +1083,8 @@ class MatterClient:
         """
         # handle result message
         if isinstance(msg, ResultMessageBase):
+            # a command result must not overtake the attribute updates received before it
+            self._flush_attribute_updates()
             future = self._result_futures.get(msg.message_id)
 
             if future is None:
@@ -874,22 +1111,17 @@ class MatterClient:
             msg,
         )
 
+    def _create_node(self, node_data: MatterNodeData) -> MatterNode:
+        """Create a MatterNode from the (raw) node data."""
+        return MatterNode(node_data, lazy=self.lazy_nodes, keep_raw=self.keep_raw_attributes)
+
     def _handle_event_message(self, msg: EventMessage) -> None:
         """Handle incoming event from the server."""
+        if msg.event != EventType.ATTRIBUTE_UPDATED:
+            # keep the order of the attribute updates and the other events
+            self._flush_attribute_updates()
         if msg.event in (EventType.NODE_ADDED, EventType.NODE_UPDATED):
-            # an update event can potentially arrive for a not yet known node
-            node_data = dataclass_from_dict(MatterNodeData, msg.data)
-            node = self._nodes.get(node_data.node_id)
-            if node is None:
-                event = EventType.NODE_ADDED
-                node = MatterNode(node_data)
-                self._nodes[node.node_id] = node
-                self.logger.debug("New node added: %s", node.node_id)
-            else:
-                event = EventType.NODE_UPDATED
-                node.update(node_data)
-                self.logger.debug("Node updated: %s", node.node_id)
-            self._signal_event(event, data=node, node_id=node.node_id)
+            self._handle_node_data(msg.data)
             return
         if msg.event == EventType.NODE_REMOVED:
             node_id = msg.data
@@ -897,6 +1129,7 @@ class MatterClient:
             self._signal_event(EventType.NODE_REMOVED, data=node_id, node_id=node_id)
             # cleanup node only after signalling subscribers
             self._nodes.pop(node_id, None)
+            self._fabric_index.remove_node(node_id)
             return
         if msg.event == EventType.ENDPOINT_REMOVED:
             node_id = msg.data["node_id"]
@@ -905,30 +1138,20 @@ class MatterClient:
             self._signal_event(EventType.ENDPOINT_REMOVED, data=msg.data, node_id=node_id)
             # cleanup endpoint only after signalling subscribers
             if node := self._nodes.get(node_id):
-                node.endpoints.pop(endpoint_id, None)
+                node.remove_endpoint(endpoint_id)
+            self._fabric_index.remove_endpoint(node_id, endpoint_id)
             return
         if msg.event == EventType.ATTRIBUTE_UPDATED:
             # data is tuple[node_id, attribute_path, new_value]
-            node_id, attribute_path, new_value = msg.data
-            if self.logger.isEnabledFor(logging.DEBUG):
-                self.logger.debug(
-                    "Attribute updated: Node: %s - Attribute: %s - New value: %s",
-                    node_id,
-                    attribute_path,
-                    new_value,
-                )
-            self._nodes[node_id].update_attribute(attribute_path, new_value)
-            self._signal_event(
-                EventType.ATTRIBUTE_UPDATED,
-                data=new_value,
-                node_id=node_id,
-                attribute_path=attribute_path,
-            )
+            self._handle_attribute_updated(*msg.data)
             return
         if msg.event == EventType.ENDPOINT_ADDED:
             node_id = msg.data["node_id"]
             endpoint_id = msg.data["endpoint_id"]
             self.logger.debug("Endpoint added: %s/%s", node_id, endpoint_id)
+            # the endpoint attributes usually follow with a node update
+            if node := self._nodes.get(node_id):
+                self._fabric_index.update_endpoint(node, endpoint_id)
         if msg.event == EventType.NODE_EVENT:
             if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
@@ -957,6 +1180,80 @@ class MatterClient:
             self.logger.debug("Received event: %s", msg)
         self._signal_event(msg.event, msg.data)
 
+    def _handle_node_data(self, data: dict[str, Any]) -> None:
+        """Handle the (full) data of a new or updated node."""
+        # an update event can potentially arrive for a not yet known node
+        node_data = dataclass_from_dict(MatterNodeData, data)
+        node = self._nodes.get(node_data.node_id)
+        if node is None:
+            event = EventType.NODE_ADDED
+            node = self._create_node(node_data)
+            self._nodes[node.node_id] = node
+            self._fabric_index.update_node(node)
+            self.logger.debug("New node added: %s", node.node_id)
+        else:
+            event = EventType.NODE_UPDATED
+            changed = node.update(node_data)
+            self._fabric_index.update_node(node, changed)
+            self.logger.debug("Node updated: %s (%s attributes changed)", node.node_id, len(changed))
+        self._signal_event(event, data=node, node_id=node.node_id)
+
+    def _handle_attribute_updated(self, node_id: int, attribute_path: str, new_value: Any) -> None:
+        """Handle an attribute update of a node (applied right away or batched)."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Attribute updated: Node: %s - Attribute: %s - New value: %s",
+                node_id,
+                attribute_path,
+                new_value,
+            )
+        if self.batch_attribute_updates and self._loop is not None:
+            # apply all updates received within this event loop iteration at once
+            self._pending_attribute_updates.setdefault(node_id, []).append((attribute_path, new_value))
+            if self._flush_handle is None:
+                self._flush_handle = self._loop.call_soon(self._flush_attribute_updates)
+            return
+        node = self._nodes[node_id]
+        node.update_attribute(attribute_path, new_value)
+        self._fabric_index.attribute_updated(node, attribute_path)
+        self._signal_event(
+            EventType.ATTRIBUTE_UPDATED,
+            data=new_value,
+            node_id=node_id,
+            attribute_path=attribute_path,
+        )
+        if self._dispatcher.has_batch_subscribers:
+            self._dispatcher.signal_batch(node, {attribute_path: new_value})
+
+    def _flush_attribute_updates(self) -> None:
+        """Apply the pending (batched) attribute updates and signal the subscribers."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_attribute_updates:
+            return
+        pending = self._pending_attribute_updates
+        self._pending_attribute_updates = {}
+        # skip the per attribute dispatch if there are only batch subscribers (and vice versa)
+        signal_events = self._dispatcher.has_subscribers
+        signal_batches = self._dispatcher.has_batch_subscribers
+        for node_id, updates in pending.items():
+            if (node := self._nodes.get(node_id)) is None:
+                continue
+            node.update_attributes(updates)
+            for attribute_path, _ in updates:
+                self._fabric_index.attribute_updated(node, attribute_path)
+            if signal_events:
+                for attribute_path, new_value in updates:
+                    self._signal_event(
+                        EventType.ATTRIBUTE_UPDATED,
+                        data=new_value,
+                        node_id=node_id,
+                        attribute_path=attribute_path,
+                    )
+            if signal_batches:
+                self._dispatcher.signal_batch(node, dict(updates))
+
     def _signal_event(
         self,
         event: EventType,
@@ -965,18 +1262,7 @@ class MatterClient:
         attribute_path: str | None = None,
     ) -> None:
         """Signal event to all subscribers."""
-        # instead of iterating all subscribers we iterate over subscription keys
-        # each callback is stored under a specific key based on the filters
-        for evt_key in (event.value, SUB_WILDCARD):
-            for node_key in (node_id, SUB_WILDCARD):
-                if node_key is None:
-                    continue
-                for attribute_path_key in (attribute_path, SUB_WILDCARD):
-                    if attribute_path_key is None:
-                        continue
-                    key = f"{evt_key}/{node_key}/{attribute_path_key}"
-                    for callback in self._subscribers.get(key, []):
-                        callback(event, data)
+        self._dispatcher.signal(event, data, node_id, attribute_path)
 
     async def __aenter__(self) -> Self:
         """Initialize and connect the Matter Websocket client."""
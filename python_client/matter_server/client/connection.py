@@ -11,7 +11,7 @@ from urllib.parse import urlparse, urlunparse
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType, client_exceptions
 
 from matter_server.common.const import SCHEMA_VERSION
-from matter_server.common.helpers.json import json_dumps, json_loads
+from matter_server.common.helpers.json import json_dumps_compact, json_loads
 from matter_server.common.helpers.util import dataclass_from_dict
 from matter_server.common.models import (
     CommandMessage,
@@ -148,6 +148,10 @@ class MatterClientConnection:
 
     async def receive_message_or_raise(self) -> MessageType:
         """Receive (raw) message or raise."""
+        return self.decode_message(await self.receive_frame_or_raise())
+
+    async def receive_frame_or_raise(self) -> str:
+        """Receive the (undecoded) text of a message or raise."""
         assert self._ws_client
         ws_msg = await self._ws_client.receive()
 
@@ -162,18 +166,21 @@ class MatterClientConnection:
                 f"Received non-Text message: {ws_msg.type}: {ws_msg.data}"
             )
 
+        if VERBOSE_LOGGER and LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Received message:\n%s\n", pprint.pformat(ws_msg))
+
+        return cast(str, ws_msg.data)
+
+    @staticmethod
+    def decode_message(data: str) -> MessageType:
+        """Decode the text of a received message or raise."""
         try:
-            msg = parse_message(json_loads(ws_msg.data))
+            return parse_message(json_loads(data))
         except TypeError as err:
             raise InvalidMessage(f"Received unsupported JSON: {err}") from err
         except ValueError as err:
             raise InvalidMessage("Received invalid JSON.") from err
 
-        if VERBOSE_LOGGER and LOGGER.isEnabledFor(logging.DEBUG):
-            LOGGER.debug("Received message:\n%s\n", pprint.pformat(ws_msg))
-
-        return msg
-
     async def send_message(self, message: CommandMessage) -> None:
         """
         Send a CommandMessage to the server.
@@ -189,7 +196,7 @@ class MatterClientConnection:
         assert self._ws_client
         assert isinstance(message, CommandMessage)
 
-        await self._ws_client.send_json(message, dumps=json_dumps)
+        await self._ws_client.send_json(message, dumps=json_dumps_compact)
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -197,6 +204,12 @@ class MatterClientConnection:
         return f"{type(self).__name__}(ws_server_url={self.ws_server_url!r}, {prefix}connected)"
 
 
+def is_result_frame(data: str) -> bool:
+    """Return if the text of a received message is a command result, without decoding it."""
+    # the server sends the message_id as the first key of (only) the command results
+    return data.startswith('{"message_id"')
+
+
 def parse_message(raw: dict) -> MessageType:
     """Parse Message from raw dict object."""
     if "event" in raw:
@@ -0,0 +1,591 @@
+"""Event dispatch (direct, asynchronous and coalescing) of the Matter client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+import inspect
+from itertools import count
+import logging
+from typing import TYPE_CHECKING, Any, cast
+
+from .subscribers import SUB_WILDCARD, SubscriberIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Collection
+
+    from matter_server.common.models import EventType
+
+    from .models.node import MatterNode
+    from .subscribers import PathKeys
+
+LOGGER = logging.getLogger(__package__)
+
+
+class OverflowPolicy(str, Enum):
+    """What the queue of an asynchronous subscriber does when it is full."""
+
+    # drop the oldest queued event
+    DROP_OLDEST = "drop_oldest"
+    # replace the queued value of the same attribute path, else drop the oldest event
+    COALESCE = "coalesce"
+    # stop reading from the server until the subscriber caught up
+    BLOCK = "block"
+
+
+@dataclass
+class DispatchOptions:
+    """Options of the event dispatch of the Matter client."""
+
+    # give every event subscriber a bounded queue, drained by its own task
+    async_dispatch: bool = False
+    # number of events a subscriber queue holds (with async_dispatch)
+    queue_size: int = 1000
+    # what a full subscriber queue does (with async_dispatch)
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+
+    def __post_init__(self) -> None:
+        """Validate the options."""
+        if self.queue_size < 1:
+            msg = f"The queue_size must be at least 1, got {self.queue_size}"
+            raise ValueError(msg)
+
+
+@dataclass
+class SubscriberMetrics:
+    """Metrics of an asynchronous subscriber."""
+
+    name: str
+    queue_size: int
+    overflow_policy: OverflowPolicy
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    # seconds between queueing an event and calling the callback
+    queue_time: float = 0.0
+    max_queue_time: float = 0.0
+    # seconds spent in the callback (incl. awaiting it)
+    callback_time: float = 0.0
+    max_callback_time: float = 0.0
+
+    @property
+    def average_queue_time(self) -> float:
+        """Return the average time an event waited in the queue."""
+        return self.queue_time / self.delivered if self.delivered else 0.0
+
+    @property
+    def average_callback_time(self) -> float:
+        """Return the average duration of a callback."""
+        return self.callback_time / self.delivered if self.delivered else 0.0
+
+
+@dataclass
+class ReaderMetrics:
+    """Metrics of the queue between reading and processing the messages from the server."""
+
+    queue_size: int
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    # command results handled right away, ahead of the queued messages
+    fast_tracked: int = 0
+    processed: int = 0
+    # queued attribute updates dropped as a newer value was read (refresh_attribute)
+    skipped: int = 0
+    # seconds between receiving and processing a message
+    processing_lag: float = 0.0
+    max_processing_lag: float = 0.0
+    total_processing_lag: float = 0.0
+
+    @property
+    def average_processing_lag(self) -> float:
+        """Return the average time a message waited to be processed."""
+        return self.total_processing_lag / self.processed if self.processed else 0.0
+
+
+class MessageQueue:
+    """
+    Bounded queue of the messages read from the server, until they are processed.
+
+    Every message gets a sequence number in the order it is read. Command results are
+    handled right away, ahead of the queued messages; the sequence number of a result
+    tells which messages were read before it: wait_processed waits until those are
+    processed and skip_attribute drops their updates of an attribute read by the command.
+    """
+
+    __slots__ = ("_entries", "_ready", "_results", "_skip", "_space", "_waiters", "metrics", "read_count")
+
+    def __init__(self, queue_size: int) -> None:
+        """Initialize MessageQueue."""
+        self.metrics = ReaderMetrics(queue_size)
+        self.read_count = 0
+        # (message text, time read, sequence number) of the messages to process, None to stop
+        self._entries: deque[tuple[str, float, int] | None] = deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        # message id -> sequence number of the results handled ahead of queued messages
+        self._results: dict[str, int] = {}
+        # (node_id, attribute path) -> sequence number, older queued updates are skipped
+        self._skip: dict[tuple[int, str], int] = {}
+        # (sequence number, future) of the wait_processed calls
+        self._waiters: list[tuple[int, asyncio.Future[None]]] = []
+
+    @property
+    def full(self) -> bool:
+        """Return if reading has to wait for the processing."""
+        return len(self._entries) >= self.metrics.queue_size
+
+    def put(self, frame: str) -> None:
+        """Queue a message to process."""
+        self.read_count += 1
+        self._entries.append((frame, asyncio.get_running_loop().time(), self.read_count))
+        self.metrics.queue_depth = len(self._entries)
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.metrics.queue_depth)
+        self._ready.set()
+        if self.full:
+            self._space.clear()
+
+    def put_result(self, message_id: str) -> None:
+        """Count a command result that is handled right away, ahead of the queued messages."""
+        self.read_count += 1
+        self.metrics.fast_tracked += 1
+        if self._entries:
+            self._results[message_id] = self.read_count
+
+    def pop_result(self, message_id: str) -> int | None:
+        """Return the sequence number of a result if messages were queued before it."""
+        return self._results.pop(message_id, None)
+
+    def close(self) -> None:
+        """Stop the processing once the queued messages are processed."""
+        self._entries.append(None)
+        self._ready.set()
+
+    async def wait_for_space(self) -> None:
+        """Wait until the queue is no longer full."""
+        await self._space.wait()
+
+    async def get(self) -> tuple[str, int] | None:
+        """Return the next message (text, sequence number) to process, None once closed."""
+        while not self._entries:
+            self._ready.clear()
+            await self._ready.wait()
+        if (entry := self._entries.popleft()) is None:
+            self.metrics.queue_depth = 0
+            self.release()
+            return None
+        frame, read, seq = entry
+        metrics = self.metrics
+        metrics.queue_depth = len(self._entries)
+        if metrics.queue_depth < metrics.queue_size:
+            self._space.set()
+        lag = asyncio.get_running_loop().time() - read
+        metrics.processed += 1
+        metrics.processing_lag = lag
+        metrics.max_processing_lag = max(metrics.max_processing_lag, lag)
+        metrics.total_processing_lag += lag
+        return frame, seq
+
+    def processed(self) -> None:
+        """Mark the message returned by get as processed."""
+        if not self._entries:
+            self._skip.clear()
+            self.release()
+        elif self._waiters:
+            entry = self._entries[0]
+            self.release(None if entry is None else entry[2])
+
+    def release(self, before: int | None = None) -> None:
+        """Wake the wait_processed calls for the messages read before a sequence number (or all)."""
+        waiters = self._waiters
+        self._waiters = []
+        for seq, future in waiters:
+            if before is None or seq < before:
+                if not future.done():
+                    future.set_result(None)
+            else:
+                self._waiters.append((seq, future))
+
+    async def wait_processed(self, seq: int) -> None:
+        """Wait until the messages read before a sequence number are processed."""
+        entry = self._entries[0] if self._entries else None
+        if entry is None or entry[2] > seq:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((seq, future))
+        await future
+
+    def skip_attribute(self, node_id: int, attribute_path: str, seq: int) -> None:
+        """Skip the queued updates of an attribute read before a sequence number."""
+        if self._entries:
+            key = (node_id, attribute_path)
+            self._skip[key] = max(self._skip.get(key, 0), seq)
+
+    def is_skipped(self, node_id: int, attribute_path: str, seq: int) -> bool:
+        """Return if a queued update of an attribute is older than a value read afterwards."""
+        if self._skip and self._skip.get((node_id, attribute_path), 0) > seq:
+            self.metrics.skipped += 1
+            return True
+        return False
+
+
+class AsyncSubscriber:
+    """
+    Subscriber that receives its events from a bounded queue, drained by its own task.
+
+    Signalling an event only queues it, so a slow (or async) callback does not stall
+    reading from the server nor the other subscribers. The callback may be a coroutine
+    function, exceptions of the callback are logged.
+    """
+
+    __slots__ = ("_callback", "_on_full", "_paths", "_queue", "_ready", "_space", "_task", "metrics")
+
+    def __init__(
+        self,
+        callback: Callable[[EventType, Any], Awaitable[None] | None],
+        queue_size: int,
+        overflow_policy: OverflowPolicy,
+        on_full: Callable[[AsyncSubscriber], None] | None = None,
+    ) -> None:
+        """Initialize AsyncSubscriber."""
+        self._callback = callback
+        self._on_full = on_full
+        # [event, data, attribute path key, time queued] of the queued events
+        self._queue: deque[list[Any]] = deque()
+        # (node_id, attribute_path) -> queued attribute event, to coalesce
+        self._paths: dict[tuple[int | None, str], list[Any]] = {}
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._task: asyncio.Task[None] | None = None
+        self.metrics = SubscriberMetrics(
+            name=getattr(callback, "__qualname__", repr(callback)),
+            queue_size=queue_size,
+            overflow_policy=overflow_policy,
+        )
+
+    @property
+    def full(self) -> bool:
+        """Return if the queue is full."""
+        return len(self._queue) >= self.metrics.queue_size
+
+    def put(self, event: EventType, data: Any, node_id: int | None, attribute_path: str | None) -> None:
+        """Queue an event for the callback."""
+        metrics = self.metrics
+        key = None if attribute_path is None else (node_id, attribute_path)
+        if self.full:
+            if metrics.overflow_policy == OverflowPolicy.COALESCE and key and (entry := self._paths.get(key)):
+                entry[1] = data
+                metrics.coalesced += 1
+                return
+            if metrics.overflow_policy == OverflowPolicy.BLOCK:
+                # queued beyond the size, the client stops reading until there is space again
+                self._space.clear()
+                if self._on_full is not None:
+                    self._on_full(self)
+            else:
+                self._pop()
+                metrics.dropped += 1
+        entry = [event, data, key, asyncio.get_running_loop().time()]
+        self._queue.append(entry)
+        if key is not None and metrics.overflow_policy == OverflowPolicy.COALESCE:
+            self._paths[key] = entry
+        metrics.queue_depth = len(self._queue)
+        metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._ready.set()
+
+    async def wait_for_space(self) -> None:
+        """Wait until the queue is no longer full."""
+        await self._space.wait()
+
+    def close(self) -> None:
+        """Stop the task, queued events are dropped."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._queue.clear()
+        self._paths.clear()
+        self.metrics.queue_depth = 0
+        self._space.set()
+
+    def _pop(self) -> list[Any]:
+        """Remove and return the oldest queued event."""
+        entry = self._queue.popleft()
+        if entry[2] is not None and self._paths.get(entry[2]) is entry:
+            del self._paths[entry[2]]
+        if len(self._queue) < self.metrics.queue_size:
+            self._space.set()
+        return entry
+
+    async def _run(self) -> None:
+        """Call the callback for the queued events."""
+        metrics = self.metrics
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self._queue:
+                event, data, _, queued = self._pop()
+                metrics.queue_depth = len(self._queue)
+                start = loop.time()
+                awaited = False
+                try:
+                    result = self._callback(event, data)
+                    if awaited := inspect.isawaitable(result):
+                        await result
+                except Exception:  # pylint: disable=broad-exception-caught
+                    LOGGER.exception("Error in event subscriber %s", metrics.name)
+                end = loop.time()
+                if not awaited:
+                    # let the client (and other subscribers) run between the events
+                    await asyncio.sleep(0)
+                metrics.delivered += 1
+                metrics.queue_time += start - queued
+                metrics.max_queue_time = max(metrics.max_queue_time, start - queued)
+                metrics.callback_time += end - start
+                metrics.max_callback_time = max(metrics.max_callback_time, end - start)
+
+
+class CoalescingSubscriber:
+    """
+    Subscriber that gets at most one attribute event per (node, attribute path) per interval.
+
+    The first event of a path is delivered right away, later events within the interval
+    only keep the latest value, which is delivered at the end of the interval. With an
+    interval of 0 the latest value of each path is delivered on the next event loop
+    iteration. Other events are delivered right away.
+    """
+
+    __slots__ = ("_deliver", "_delivered", "_flush_handle", "_handles", "_metrics", "_pending", "interval")
+
+    def __init__(
+        self,
+        deliver: Callable[[EventType, Any, int | None, str | None], None],
+        interval: float,
+        metrics: SubscriberMetrics | None = None,
+    ) -> None:
+        """Initialize CoalescingSubscriber, the coalesced events are counted in the metrics."""
+        self._deliver = deliver
+        self.interval = interval
+        self._metrics = metrics
+        # (node_id, attribute_path) -> time of the last delivery
+        self._delivered: dict[tuple[int | None, str], float] = {}
+        # (node_id, attribute_path) -> (event, latest value) not delivered yet
+        self._pending: dict[tuple[int | None, str], tuple[EventType, Any]] = {}
+        self._handles: dict[tuple[int | None, str], asyncio.TimerHandle] = {}
+        self._flush_handle: asyncio.Handle | None = None
+
+    def put(self, event: EventType, data: Any, node_id: int | None, attribute_path: str | None) -> None:
+        """Deliver or hold back an event."""
+        if attribute_path is None:
+            self._deliver(event, data, node_id, attribute_path)
+            return
+        key = (node_id, attribute_path)
+        if key in self._pending:
+            self._pending[key] = (event, data)
+            if self._metrics is not None:
+                self._metrics.coalesced += 1
+            return
+        loop = asyncio.get_running_loop()
+        if not self.interval:
+            self._pending[key] = (event, data)
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_soon(self._flush)
+            return
+        now = loop.time()
+        if (last := self._delivered.get(key)) is None or now - last >= self.interval:
+            self._delivered[key] = now
+            self._deliver(event, data, node_id, attribute_path)
+            return
+        self._pending[key] = (event, data)
+        self._handles[key] = loop.call_at(last + self.interval, self._flush_path, key)
+
+    def close(self) -> None:
+        """Cancel the delivery of the held back events."""
+        for handle in self._handles.values():
+            handle.cancel()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._handles.clear()
+        self._pending.clear()
+
+    def _flush(self) -> None:
+        """Deliver the latest value of all held back paths."""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = {}
+        for (node_id, attribute_path), (event, data) in pending.items():
+            self._deliver(event, data, node_id, attribute_path)
+
+    def _flush_path(self, key: tuple[int | None, str]) -> None:
+        """Deliver the latest value of a held back path."""
+        del self._handles[key]
+        if (pending := self._pending.pop(key, None)) is None:
+            return
+        self._delivered[key] = asyncio.get_running_loop().time()
+        self._deliver(*pending, *key)
+
+
+class EventDispatcher:
+    """
+    Event subscribers of the Matter client.
+
+    Subscribers are called directly, unless the options enable async dispatch or the
+    subscriber coalesces its attribute updates: then it is an AsyncSubscriber and/or a
+    CoalescingSubscriber in a second index, which also passes the node id and attribute
+    path of the event. Subscribers to batches of attribute updates are kept per node.
+    """
+
+    __slots__ = (
+        "_batch_ids",
+        "_batch_subscribers",
+        "_coalescers",
+        "_full",
+        "_index",
+        "_path_index",
+        "_queued",
+        "options",
+    )
+
+    def __init__(self, options: DispatchOptions) -> None:
+        """Initialize EventDispatcher."""
+        self.options = options
+        self._index = SubscriberIndex()
+        # subscribers that also get the node id and attribute path (queued/coalesced)
+        self._path_index = SubscriberIndex(with_path=True)
+        # the subscribers with their own queue, those that are full and the coalescing ones
+        self._queued: dict[AsyncSubscriber, None] = {}
+        self._full: set[AsyncSubscriber] = set()
+        self._coalescers: dict[CoalescingSubscriber, None] = {}
+        # node id (or the wildcard) -> subscription id -> callback of the batches of attribute updates
+        self._batch_subscribers: dict[str, dict[int, Callable[[MatterNode, dict[str, Any]], None]]] = {}
+        self._batch_ids = count()
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Return if there are event subscribers (besides the batch subscribers)."""
+        return bool(self._index or self._path_index)
+
+    @property
+    def has_batch_subscribers(self) -> bool:
+        """Return if there are subscribers to the batches of attribute updates."""
+        return bool(self._batch_subscribers)
+
+    @property
+    def full(self) -> bool:
+        """Return if the queue of a (blocking) subscriber is full."""
+        return bool(self._full)
+
+    def subscribe(
+        self,
+        callback: Callable[[EventType, Any], Awaitable[None] | None],
+        event_filter: EventType | None = None,
+        node_filter: int | None = None,
+        path_filters: Collection[PathKeys] | None = None,
+        options: DispatchOptions | None = None,
+        coalesce_interval: float | None = None,
+    ) -> Callable[[], None]:
+        """
+        Add an event subscriber and return the function to unsubscribe (see MatterClient.subscribe_events).
+
+        The options override the options of the dispatcher for this subscriber.
+        """
+        options = options or self.options
+        if not options.async_dispatch and inspect.iscoroutinefunction(callback):
+            msg = "A coroutine function callback needs async_dispatch"
+            raise ValueError(msg)
+        if not options.async_dispatch and coalesce_interval is None:
+            return self._index.subscribe(cast("Callable[..., None]", callback), event_filter, node_filter, path_filters)
+
+        deliver: Callable[[EventType, Any, int | None, str | None], None]
+        subscriber: AsyncSubscriber | None = None
+        if options.async_dispatch:
+            subscriber = AsyncSubscriber(callback, options.queue_size, options.overflow_policy, self._full.add)
+            self._queued[subscriber] = None
+            deliver = subscriber.put
+        else:
+
+            def deliver(event: EventType, data: Any, _node_id: int | None, _attribute_path: str | None) -> None:
+                callback(event, data)
+
+        coalescer: CoalescingSubscriber | None = None
+        if coalesce_interval is not None:
+            coalescer = CoalescingSubscriber(
+                deliver, coalesce_interval, None if subscriber is None else subscriber.metrics
+            )
+            self._coalescers[coalescer] = None
+            deliver = coalescer.put
+        remove_subscriber = self._path_index.subscribe(deliver, event_filter, node_filter, path_filters)
+
+        def unsubscribe() -> None:
+            remove_subscriber()
+            if coalescer is not None:
+                coalescer.close()
+                self._coalescers.pop(coalescer, None)
+            if subscriber is not None:
+                subscriber.close()
+                self._queued.pop(subscriber, None)
+                self._full.discard(subscriber)
+
+        return unsubscribe
+
+    def subscribe_batches(
+        self,
+        callback: Callable[[MatterNode, dict[str, Any]], None],
+        node_filter: int | None = None,
+    ) -> Callable[[], None]:
+        """Add a subscriber to the batches of attribute updates and return the function to unsubscribe."""
+        key = SUB_WILDCARD if node_filter is None else str(node_filter)
+        subscription_id = next(self._batch_ids)
+        self._batch_subscribers.setdefault(key, {})[subscription_id] = callback
+
+        def unsubscribe() -> None:
+            if (callbacks := self._batch_subscribers.get(key)) is None:
+                return
+            callbacks.pop(subscription_id, None)
+            if not callbacks:
+                del self._batch_subscribers[key]
+
+        return unsubscribe
+
+    def signal(
+        self,
+        event: EventType,
+        data: Any = None,
+        node_id: int | None = None,
+        attribute_path: str | None = None,
+    ) -> None:
+        """Signal an event to the matching subscribers."""
+        self._index.signal(event, data, node_id, attribute_path)
+        if self._path_index:
+            self._path_index.signal(event, data, node_id, attribute_path)
+
+    def signal_batch(self, node: MatterNode, updates: dict[str, Any]) -> None:
+        """Signal a batch of attribute updates of a node to the batch subscribers."""
+        for node_key in (str(node.node_id), SUB_WILDCARD):
+            if callbacks := self._batch_subscribers.get(node_key):
+                for callback in tuple(callbacks.values()):
+                    callback(node, updates)
+
+    async def wait_for_space(self) -> None:
+        """Wait until the (blocking) subscribers with a full queue caught up."""
+        while self._full:
+            await self._full.pop().wait_for_space()
+
+    def get_metrics(self) -> list[SubscriberMetrics]:
+        """Return the metrics of the queued subscribers."""
+        return [x.metrics for x in self._queued]
+
+    def close(self) -> None:
+        """Stop the tasks and timers of the queued and coalescing subscribers, their pending events are dropped."""
+        for coalescer in self._coalescers:
+            coalescer.close()
+        for subscriber in self._queued:
+            subscriber.close()
+        self._full.clear()
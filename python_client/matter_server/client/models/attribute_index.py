@@ -0,0 +1,145 @@
+"""Index of the attribute paths of a Matter node, keyed by integer ids."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator
+
+# (endpoint_id, cluster_id, attribute_id) of a concrete attribute path
+AttributeIds = tuple[int, int, int]
+
+# the parsed ids of all attribute paths, shared by all nodes (which mostly have the same paths)
+_PATH_IDS: dict[str, AttributeIds] = {}
+
+
+def parse_path(attribute_path: str) -> AttributeIds:
+    """Return the ids of a concrete attribute path, each distinct path is only parsed once."""
+    if (ids := _PATH_IDS.get(attribute_path)) is None:
+        endpoint_str, cluster_str, attribute_str = attribute_path.split("/")
+        ids = _PATH_IDS[sys.intern(attribute_path)] = (
+            int(endpoint_str),
+            int(cluster_str),
+            int(attribute_str),
+        )
+    return ids
+
+
+class AttributeIndex:
+    """
+    Index of the (concrete) attribute paths of a node.
+
+    The "endpoint/cluster/attribute" path strings (the keys of the raw attribute data)
+    are parsed only once and interned. Lookups are done by integer ids and there are
+    sub-indexes per endpoint and per cluster, so wildcard queries (e.g. all attributes
+    of a cluster across endpoints) only touch the matching attributes.
+    """
+
+    __slots__ = ("by_cluster", "by_endpoint")
+
+    def __init__(self, attribute_paths: Iterable[str] = ()) -> None:
+        """Initialize the index with the given attribute paths."""
+        # endpoint_id -> cluster_id -> attribute_id -> attribute path
+        self.by_endpoint: dict[int, dict[int, dict[int, str]]] = {}
+        # cluster_id -> endpoint_id -> attribute_id -> attribute path
+        # (the attribute dicts are shared with by_endpoint)
+        self.by_cluster: dict[int, dict[int, dict[int, str]]] = {}
+        for attribute_path in attribute_paths:
+            self.add(attribute_path)
+
+    def add(self, attribute_path: str) -> AttributeIds:
+        """Add a concrete attribute path (if needed) and return its ids."""
+        endpoint_id, cluster_id, attribute_id = ids = parse_path(attribute_path)
+        clusters = self.by_endpoint.get(endpoint_id)
+        if clusters is None:
+            clusters = self.by_endpoint[endpoint_id] = {}
+        if (attributes := clusters.get(cluster_id)) is None:
+            attributes = clusters[cluster_id] = {}
+            self.by_cluster.setdefault(cluster_id, {})[endpoint_id] = attributes
+        if attribute_id not in attributes:
+            attributes[attribute_id] = sys.intern(attribute_path)
+        return ids
+
+    def remove(self, attribute_path: str) -> None:
+        """Remove an attribute path (if present)."""
+        endpoint_id, cluster_id, attribute_id = parse_path(attribute_path)
+        clusters = self.by_endpoint.get(endpoint_id, {})
+        attributes = clusters.get(cluster_id, {})
+        if attributes.pop(attribute_id, None) is None or attributes:
+            return
+        del clusters[cluster_id]
+        if not clusters:
+            del self.by_endpoint[endpoint_id]
+        endpoints = self.by_cluster[cluster_id]
+        del endpoints[endpoint_id]
+        if not endpoints:
+            del self.by_cluster[cluster_id]
+
+    def update(self, attribute_paths: Collection[str]) -> list[str]:
+        """Update the index to (exactly) the given attribute paths, return the removed paths."""
+        removed = [x for _, x in self.query() if x not in attribute_paths]
+        for attribute_path in removed:
+            self.remove(attribute_path)
+        for attribute_path in attribute_paths:
+            self.add(attribute_path)
+        return removed
+
+    def remove_endpoint(self, endpoint_id: int) -> list[str]:
+        """Remove all attribute paths of an endpoint, return the removed paths."""
+        removed: list[str] = []
+        for cluster_id, attributes in self.by_endpoint.pop(endpoint_id, {}).items():
+            endpoints = self.by_cluster[cluster_id]
+            del endpoints[endpoint_id]
+            if not endpoints:
+                del self.by_cluster[cluster_id]
+            removed.extend(attributes.values())
+        return removed
+
+    def get_path(self, endpoint_id: int, cluster_id: int, attribute_id: int) -> str | None:
+        """Return the attribute path of the given ids, None if it is not present."""
+        return self.by_endpoint.get(endpoint_id, {}).get(cluster_id, {}).get(attribute_id)
+
+    def get_attributes(self, endpoint_id: int, cluster_id: int) -> dict[int, str]:
+        """Return the attribute paths (by attribute id) of a cluster on an endpoint."""
+        return self.by_endpoint.get(endpoint_id, {}).get(cluster_id, {})
+
+    def query(
+        self,
+        endpoint_id: int | None = None,
+        cluster_id: int | None = None,
+        attribute_id: int | None = None,
+    ) -> Iterator[tuple[AttributeIds, str]]:
+        """Yield the ids and path of all attributes matching the ids, None is a wildcard."""
+        if cluster_id is not None:
+            endpoints = self.by_cluster.get(cluster_id, {})
+            if endpoint_id is not None:
+                endpoints = {endpoint_id: endpoints[endpoint_id]} if endpoint_id in endpoints else {}
+            for endpoint_key, attributes in endpoints.items():
+                yield from _match_attributes(endpoint_key, cluster_id, attributes, attribute_id)
+            return
+        clusters = self.by_endpoint if endpoint_id is None else {endpoint_id: self.by_endpoint.get(endpoint_id, {})}
+        for endpoint_key, endpoint_clusters in clusters.items():
+            for cluster_key, attributes in endpoint_clusters.items():
+                yield from _match_attributes(endpoint_key, cluster_key, attributes, attribute_id)
+
+    def __contains__(self, ids: AttributeIds) -> bool:
+        """Return if the attribute (ids) is present."""
+        endpoint_id, cluster_id, attribute_id = ids
+        return attribute_id in self.by_endpoint.get(endpoint_id, {}).get(cluster_id, {})
+
+    def __len__(self) -> int:
+        """Return the number of attributes."""
+        return sum(len(x) for clusters in self.by_endpoint.values() for x in clusters.values())
+
+
+def _match_attributes(
+    endpoint_id: int, cluster_id: int, attributes: dict[int, str], attribute_id: int | None
+) -> Iterator[tuple[AttributeIds, str]]:
+    """Yield the matching attributes of a cluster on an endpoint."""
+    if attribute_id is None:
+        for attribute_key, attribute_path in attributes.items():
+            yield (endpoint_id, cluster_id, attribute_key), attribute_path
+    elif (matched_path := attributes.get(attribute_id)) is not None:
+        yield (endpoint_id, cluster_id, attribute_id), matched_path
@@ -0,0 +1,58 @@
+"""
+Lookups of device types by their required clusters, using the static device type index.
+
+A set of clusters is represented as a bitmask (a cluster set) with a bit per cluster,
+so matching the clusters of an endpoint against all device types only takes a bitwise
+and + compare per device type. The index (device_type_index_data.py) is generated
+from the device type definitions by scripts/generate_device_type_index.py.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .device_type_index_data import CLUSTER_BITS, CLUSTER_DEVICE_TYPES, DEVICE_TYPE_CLUSTERS
+from .device_types import ALL_TYPES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from chip.clusters.ClusterObjects import Cluster
+
+    from .device_types import DeviceType
+
+# (device type, cluster set of its required clusters) of the device types requiring any cluster
+_REQUIRED_CLUSTERS: list[tuple[type[DeviceType], int]] = [
+    (ALL_TYPES[device_type_id], required) for device_type_id, required in DEVICE_TYPE_CLUSTERS.items() if required
+]
+
+
+def get_cluster_set(cluster_ids: Iterable[int]) -> int:
+    """Return the cluster set of the clusters, clusters not required by any device type are left out."""
+    cluster_set = 0
+    for cluster_id in cluster_ids:
+        if (bit := CLUSTER_BITS.get(cluster_id)) is not None:
+            cluster_set |= 1 << bit
+    return cluster_set
+
+
+def get_required_clusters(device_type: type[DeviceType] | int) -> int:
+    """Return the cluster set of the required clusters of a device type (0 if unknown)."""
+    device_type_id = device_type if isinstance(device_type, int) else device_type.device_type
+    return DEVICE_TYPE_CLUSTERS.get(device_type_id, 0)
+
+
+def get_device_types_requiring(cluster: type[Cluster] | int) -> list[type[DeviceType]]:
+    """Return the device types that require a cluster."""
+    cluster_id = cluster if isinstance(cluster, int) else cluster.id
+    return [ALL_TYPES[x] for x in CLUSTER_DEVICE_TYPES.get(cluster_id, ())]
+
+
+def get_matching_device_types(clusters: Iterable[int] | int) -> list[type[DeviceType]]:
+    """
+    Return the device types of which all required clusters are present.
+
+    Provide the clusters either as cluster ids or as a cluster set (see get_cluster_set).
+    """
+    cluster_set = clusters if isinstance(clusters, int) else get_cluster_set(clusters)
+    return [device_type for device_type, required in _REQUIRED_CLUSTERS if cluster_set & required == required]
@@ -0,0 +1,558 @@
+"""
+Static index of the device types (auto-generated, DO NOT edit).
+
+Generated by scripts/generate_device_type_index.py, use device_type_index to query it.
+"""
+
+# cluster id -> bit of the cluster in a cluster set
+CLUSTER_BITS: dict[int, int] = {
+    0x001D: 0,
+    0x0003: 1,
+    0x0006: 2,
+    0x0004: 3,
+    0x0062: 4,
+    0x0008: 5,
+    0x0402: 6,
+    0x0056: 7,
+    0x0060: 8,
+    0x0080: 9,
+    0x0202: 10,
+    0x0035: 11,
+    0x0045: 12,
+    0x0072: 13,
+    0x0404: 14,
+    0x0405: 15,
+    0x0551: 16,
+    0x0554: 17,
+    0x003B: 18,
+    0x0071: 19,
+    0x0102: 20,
+    0x0104: 21,
+    0x0105: 22,
+    0x0201: 23,
+    0x0204: 24,
+    0x0406: 25,
+    0x0504: 26,
+    0x0505: 27,
+    0x0506: 28,
+    0x0509: 29,
+    0x0552: 30,
+    0x0553: 31,
+    0x002E: 32,
+    0x002F: 33,
+    0x0031: 34,
+    0x0036: 35,
+    0x0037: 36,
+    0x003C: 37,
+    0x0051: 38,
+    0x0052: 39,
+    0x0090: 40,
+    0x0091: 41,
+    0x0097: 42,
+    0x0300: 43,
+    0x0403: 44,
+    0x040C: 45,
+    0x0452: 46,
+    0x0453: 47,
+    0x0503: 48,
+    0x0507: 49,
+    0x0508: 50,
+    0x050A: 51,
+    0x050B: 52,
+    0x050C: 53,
+    0x050E: 54,
+    0x050F: 55,
+    0x0550: 56,
+    0x0555: 57,
+    0x001F: 58,
+    0x0025: 59,
+    0x0028: 60,
+    0x0029: 61,
+    0x002A: 62,
+    0x002B: 63,
+    0x002C: 64,
+    0x002D: 65,
+    0x0030: 66,
+    0x0032: 67,
+    0x0033: 68,
+    0x0034: 69,
+    0x0038: 70,
+    0x0039: 71,
+    0x003E: 72,
+    0x003F: 73,
+    0x0046: 74,
+    0x0048: 75,
+    0x0049: 76,
+    0x004A: 77,
+    0x0050: 78,
+    0x0053: 79,
+    0x0054: 80,
+    0x0055: 81,
+    0x0057: 82,
+    0x0059: 83,
+    0x005B: 84,
+    0x005C: 85,
+    0x005D: 86,
+    0x005E: 87,
+    0x005F: 88,
+    0x0061: 89,
+    0x0064: 90,
+    0x0081: 91,
+    0x0094: 92,
+    0x0095: 93,
+    0x0098: 94,
+    0x0099: 95,
+    0x009B: 96,
+    0x009C: 97,
+    0x009D: 98,
+    0x009E: 99,
+    0x009F: 100,
+    0x00A0: 101,
+    0x0101: 102,
+    0x0150: 103,
+    0x0200: 104,
+    0x0400: 105,
+    0x040D: 106,
+    0x0413: 107,
+    0x0415: 108,
+    0x042A: 109,
+    0x042B: 110,
+    0x042C: 111,
+    0x042D: 112,
+    0x042E: 113,
+    0x042F: 114,
+    0x0430: 115,
+    0x0451: 116,
+    0x050D: 117,
+    0x0510: 118,
+    0x0556: 119,
+    0x0700: 120,
+    0x0750: 121,
+    0x0751: 122,
+    0x0752: 123,
+    0x0753: 124,
+    0x0801: 125,
+    0x0802: 126,
+    0x0B06: 127,
+    0x0B07: 128,
+}
+
+# device type id -> cluster set of the required (server) clusters
+DEVICE_TYPE_CLUSTERS: dict[int, int] = {
+    0x000A: 0x4000000000000000000000001B,
+    0x000B: 0x1,
+    0x000E: 0x4000000000000000800000000000003,
+    0x000F: 0x40003,
+    0x0011: 0x200000001,
+    0x0012: 0x4000000000000001,
+    0x0013: 0x2000000000000800000002300000001,
+    0x0014: 0x2000000000000001,
+    0x0015: 0x1203,
+    0x0016: 0x600000000000077F9400003D00000801,
+    0x0017: 0x3,
+    0x0018: 0x3,
+    0x0019: 0x1C00000801,
+    0x0022: 0x25,
+    0x0023: 0xFF04003C000005,
+    0x0024: 0x20000000000000006800003C000001,
+    0x0027: 0x40000000000000000001,
+    0x0028: 0x9704003C000005,
+    0x0029: 0x400000000000000000000000000001,
+    0x002A: 0x1,
+    0x002B: 0x40F,
+    0x002C: 0x7FC00001000000000200000008043,
+    0x002D: 0x8240F,
+    0x0040: 0x4103,
+    0x0041: 0x1203,
+    0x0042: 0x80000000000000000004003,
+    0x0043: 0x1203,
+    0x0044: 0x1203,
+    0x0045: 0x80000000000000000000000000043,
+    0x0070: 0x400000000008000002003,
+    0x0071: 0x400180000000080000000C1,
+    0x0072: 0x188A45F,
+    0x0073: 0x80000000004000000187,
+    0x0074: 0x80020300000000000000000003,
+    0x0075: 0x4800000000000000000187,
+    0x0076: 0x200000000020000000804B,
+    0x0077: 0xC5,
+    0x0078: 0x7,
+    0x0079: 0x18000000000000000000503,
+    0x007A: 0x82403,
+    0x007B: 0x3,
+    0x007C: 0x20000000004000000187,
+    0x0090: 0x100000000000000000C00000000801,
+    0x0091: 0xC00000000801,
+    0x0100: 0x3F,
+    0x0101: 0x3F,
+    0x0103: 0x3,
+    0x0104: 0x3,
+    0x0105: 0x3,
+    0x0106: 0x200000000000000000000000003,
+    0x0107: 0x2000203,
+    0x010A: 0x3F,
+    0x010B: 0x3F,
+    0x010C: 0x8000000003F,
+    0x010D: 0x8000000003F,
+    0x010F: 0x3F,
+    0x0110: 0x3F,
+    0x0130: 0x18000000000000000000000000000001,
+    0x0140: 0xC0030003,
+    0x0141: 0x200000080070003,
+    0x0142: 0x3000000C2030003,
+    0x0143: 0x1,
+    0x0144: 0x1,
+    0x0145: 0x100000042010003,
+    0x0146: 0x800000000000000000000000000003,
+    0x0147: 0x20001,
+    0x0148: 0x40003,
+    0x0202: 0x70000B,
+    0x0203: 0x3,
+    0x0230: 0x700003,
+    0x0231: 0x700001,
+    0x023E: 0x1,
+    0x0301: 0x100000000000000000180000B,
+    0x0302: 0x1000043,
+    0x0303: 0x10000000000000010000000407F,
+    0x0304: 0x3,
+    0x0305: 0x100000000003,
+    0x0306: 0x4003,
+    0x0307: 0x8003,
+    0x0309: 0x3,
+    0x030A: 0x1,
+    0x050C: 0x4800000000000000000000043,
+    0x050D: 0x10400000000000000000000001,
+    0x050F: 0x8100000000000000000800003,
+    0x0510: 0x2000000000000030000000001,
+    0x0511: 0x80000000000000000000000000000001,
+    0x0512: 0x3,
+    0x0513: 0x1000020200000000000000000000001,
+    0x0514: 0x100000000000000000000030000000001,
+    0x0840: 0x3,
+    0x0850: 0x3,
+}
+
+# cluster id -> ids of the device types requiring the cluster
+CLUSTER_DEVICE_TYPES: dict[int, tuple[int, ...]] = {
+    0x0003: (
+        0x000A,
+        0x000E,
+        0x000F,
+        0x0015,
+        0x0017,
+        0x0018,
+        0x002B,
+        0x002C,
+        0x002D,
+        0x0040,
+        0x0041,
+        0x0042,
+        0x0043,
+        0x0044,
+        0x0045,
+        0x0070,
+        0x0072,
+        0x0073,
+        0x0074,
+        0x0075,
+        0x0076,
+        0x0078,
+        0x0079,
+        0x007A,
+        0x007B,
+        0x007C,
+        0x0100,
+        0x0101,
+        0x0103,
+        0x0104,
+        0x0105,
+        0x0106,
+        0x0107,
+        0x010A,
+        0x010B,
+        0x010C,
+        0x010D,
+        0x010F,
+        0x0110,
+        0x0140,
+        0x0141,
+        0x0142,
+        0x0145,
+        0x0146,
+        0x0148,
+        0x0202,
+        0x0203,
+        0x0230,
+        0x0301,
+        0x0302,
+        0x0303,
+        0x0304,
+        0x0305,
+        0x0306,
+        0x0307,
+        0x0309,
+        0x050C,
+        0x050F,
+        0x0512,
+        0x0840,
+        0x0850,
+    ),
+    0x0004: (
+        0x000A,
+        0x002B,
+        0x002D,
+        0x0072,
+        0x0076,
+        0x0100,
+        0x0101,
+        0x010A,
+        0x010B,
+        0x010C,
+        0x010D,
+        0x010F,
+        0x0110,
+        0x0202,
+        0x0301,
+        0x0303,
+    ),
+    0x0006: (
+        0x0022,
+        0x0023,
+        0x0028,
+        0x002B,
+        0x002D,
+        0x0072,
+        0x0073,
+        0x0075,
+        0x0077,
+        0x0078,
+        0x007C,
+        0x0100,
+        0x0101,
+        0x010A,
+        0x010B,
+        0x010C,
+        0x010D,
+        0x010F,
+        0x0110,
+        0x0303,
+    ),
+    0x0008: (0x0022, 0x0100, 0x0101, 0x010A, 0x010B, 0x010C, 0x010D, 0x010F, 0x0110, 0x0303),
+    0x001D: (
+        0x000A,
+        0x000B,
+        0x000E,
+        0x000F,
+        0x0011,
+        0x0012,
+        0x0013,
+        0x0014,
+        0x0015,
+        0x0016,
+        0x0017,
+        0x0018,
+        0x0019,
+        0x0022,
+        0x0023,
+        0x0024,
+        0x0027,
+        0x0028,
+        0x0029,
+        0x002A,
+        0x002B,
+        0x002C,
+        0x002D,
+        0x0040,
+        0x0041,
+        0x0042,
+        0x0043,
+        0x0044,
+        0x0045,
+        0x0070,
+        0x0071,
+        0x0072,
+        0x0073,
+        0x0074,
+        0x0075,
+        0x0076,
+        0x0077,
+        0x0078,
+        0x0079,
+        0x007A,
+        0x007B,
+        0x007C,
+        0x0090,
+        0x0091,
+        0x0100,
+        0x0101,
+        0x0103,
+        0x0104,
+        0x0105,
+        0x0106,
+        0x0107,
+        0x010A,
+        0x010B,
+        0x010C,
+        0x010D,
+        0x010F,
+        0x0110,
+        0x0130,
+        0x0140,
+        0x0141,
+        0x0142,
+        0x0143,
+        0x0144,
+        0x0145,
+        0x0146,
+        0x0147,
+        0x0148,
+        0x0202,
+        0x0203,
+        0x0230,
+        0x0231,
+        0x023E,
+        0x0301,
+        0x0302,
+        0x0303,
+        0x0304,
+        0x0305,
+        0x0306,
+        0x0307,
+        0x0309,
+        0x030A,
+        0x050C,
+        0x050D,
+        0x050F,
+        0x0510,
+        0x0511,
+        0x0512,
+        0x0513,
+        0x0514,
+        0x0840,
+        0x0850,
+    ),
+    0x001F: (0x0016,),
+    0x0025: (0x000E,),
+    0x0028: (0x0016,),
+    0x0029: (0x0014,),
+    0x002A: (0x0012,),
+    0x002B: (0x0016,),
+    0x002C: (0x0016,),
+    0x002D: (0x0016,),
+    0x002E: (0x0013, 0x0016),
+    0x002F: (0x0011, 0x0013),
+    0x0030: (0x0016,),
+    0x0031: (0x0016, 0x0019),
+    0x0032: (0x0016,),
+    0x0033: (0x0016,),
+    0x0034: (0x0016,),
+    0x0035: (0x0016, 0x0019, 0x0090, 0x0091),
+    0x0036: (0x0016, 0x0019),
+    0x0037: (0x0016, 0x0019),
+    0x0038: (0x0016,),
+    0x0039: (0x0013,),
+    0x003B: (0x000F, 0x0141, 0x0148),
+    0x003C: (0x0013, 0x0016),
+    0x003E: (0x0016,),
+    0x003F: (0x0016,),
+    0x0045: (0x0015, 0x0041, 0x0043, 0x0044),
+    0x0046: (0x0016,),
+    0x0048: (0x0071,),
+    0x0049: (0x0071,),
+    0x004A: (0x007C,),
+    0x0050: (0x0027,),
+    0x0051: (0x0073, 0x007C),
+    0x0052: (0x0070, 0x0071),
+    0x0053: (0x0073,),
+    0x0054: (0x0074,),
+    0x0055: (0x0074,),
+    0x0056: (0x0071, 0x0073, 0x0075, 0x0077, 0x007C),
+    0x0057: (0x0070,),
+    0x0059: (0x0075,),
+    0x005B: (0x002C,),
+    0x005C: (0x0076,),
+    0x005D: (0x0075,),
+    0x005E: (0x0079,),
+    0x005F: (0x0079,),
+    0x0060: (0x0040, 0x0073, 0x0075, 0x0079, 0x007C),
+    0x0061: (0x0074,),
+    0x0062: (0x000A, 0x0072, 0x0100, 0x0101, 0x010A, 0x010B, 0x010C, 0x010D, 0x010F, 0x0110, 0x0303),
+    0x0064: (0x0071,),
+    0x0071: (0x002D, 0x0072, 0x007A),
+    0x0072: (0x002D, 0x0070, 0x0072, 0x007A),
+    0x0080: (0x0015, 0x0041, 0x0043, 0x0044, 0x0107),
+    0x0081: (0x0042,),
+    0x0090: (0x0510, 0x0514),
+    0x0091: (0x0510, 0x0514),
+    0x0094: (0x050F,),
+    0x0095: (0x0513,),
+    0x0097: (0x0023, 0x0028),
+    0x0098: (0x050D,),
+    0x0099: (0x050C,),
+    0x009B: (0x0301,),
+    0x009C: (0x0510,),
+    0x009D: (0x050C,),
+    0x009E: (0x050F,),
+    0x009F: (0x050D,),
+    0x00A0: (0x0513,),
+    0x0101: (0x000A,),
+    0x0102: (0x0202, 0x0230, 0x0231),
+    0x0104: (0x0202, 0x0230, 0x0231),
+    0x0105: (0x0202, 0x0230, 0x0231),
+    0x0150: (0x0074,),
+    0x0200: (0x0303,),
+    0x0201: (0x0072, 0x0301, 0x050F),
+    0x0202: (0x002B, 0x002D, 0x0072, 0x0079, 0x007A),
+    0x0204: (0x0072, 0x0301, 0x0302),
+    0x0300: (0x010C, 0x010D),
+    0x0400: (0x0106,),
+    0x0402: (0x002C, 0x0045, 0x0071, 0x0072, 0x0076, 0x0077, 0x0302, 0x0303, 0x050C),
+    0x0403: (0x0303, 0x0305),
+    0x0404: (0x0040, 0x0042, 0x0303, 0x0306),
+    0x0405: (0x002C, 0x0072, 0x0076, 0x0307),
+    0x0406: (0x0107, 0x0142, 0x0145),
+    0x040C: (0x002C, 0x0076),
+    0x040D: (0x002C,),
+    0x0413: (0x002C,),
+    0x0415: (0x002C,),
+    0x042A: (0x002C,),
+    0x042B: (0x002C,),
+    0x042C: (0x002C,),
+    0x042D: (0x002C,),
+    0x042E: (0x002C,),
+    0x042F: (0x002C,),
+    0x0430: (0x0045,),
+    0x0451: (0x0090,),
+    0x0452: (0x0090, 0x0091),
+    0x0453: (0x0090, 0x0091),
+    0x0503: (0x0023, 0x0028),
+    0x0504: (0x0023, 0x0024, 0x0028),
+    0x0505: (0x0023, 0x0024, 0x0028),
+    0x0506: (0x0023, 0x0024, 0x0028),
+    0x0507: (0x0023, 0x0028),
+    0x0508: (0x0023, 0x0028),
+    0x0509: (0x0023, 0x0024, 0x0028),
+    0x050A: (0x0023, 0x0024),
+    0x050B: (0x0023, 0x0028),
+    0x050C: (0x0023, 0x0024),
+    0x050D: (0x0024,),
+    0x050E: (0x0023, 0x0024),
+    0x050F: (0x0023, 0x0028),
+    0x0510: (0x0029,),
+    0x0550: (0x0142, 0x0145),
+    0x0551: (0x0140, 0x0141, 0x0142, 0x0145),
+    0x0552: (0x0140, 0x0142, 0x0145),
+    0x0553: (0x0140, 0x0141, 0x0142),
+    0x0554: (0x0140, 0x0141, 0x0142, 0x0147),
+    0x0555: (0x0141, 0x0142),
+    0x0556: (0x0146,),
+    0x0700: (0x0513,),
+    0x0750: (0x0013,),
+    0x0751: (0x000E,),
+    0x0752: (0x0130,),
+    0x0753: (0x0130,),
+    0x0801: (0x0016,),
+    0x0802: (0x0016,),
+    0x0B06: (0x0511,),
+    0x0B07: (0x0514,),
+}
@@ -0,0 +1,219 @@
+"""Fabric-wide index of the endpoints of all Matter nodes, keyed by cluster, device type and product."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from chip.clusters import Objects as Clusters
+
+from .attribute_index import parse_path
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from .device_types import DeviceType
+    from .node import MatterEndpoint, MatterNode
+
+# (node_id, endpoint_id) of an endpoint
+EndpointKey = tuple[int, int]
+
+
+class FabricIndex:
+    """
+    Index of the endpoints of all nodes of a fabric.
+
+    Endpoints are indexed by cluster id and device type id, nodes by the vendor id
+    and (vendor id, product id) of their BasicInformation cluster. The index is
+    updated incrementally (per endpoint) from the node events, so a query only
+    touches the matching endpoints instead of scanning all endpoints of all nodes.
+    """
+
+    __slots__ = ("_endpoints", "_nodes", "by_cluster", "by_device_type", "by_product", "by_vendor")
+
+    def __init__(self, nodes: Iterable[MatterNode] = ()) -> None:
+        """Initialize the index with the given nodes."""
+        # cluster_id -> endpoints
+        self.by_cluster: dict[int, dict[EndpointKey, MatterEndpoint]] = {}
+        # device type id -> endpoints
+        self.by_device_type: dict[int, dict[EndpointKey, MatterEndpoint]] = {}
+        # vendor_id -> node ids
+        self.by_vendor: dict[int, dict[int, None]] = {}
+        # (vendor_id, product_id) -> node ids
+        self.by_product: dict[tuple[int, int], dict[int, None]] = {}
+        # endpoint -> (endpoint, cluster ids, device type ids) as indexed
+        self._endpoints: dict[EndpointKey, tuple[MatterEndpoint, frozenset[int], frozenset[int]]] = {}
+        # node_id -> ((vendor_id, product_id), indexed endpoint ids)
+        self._nodes: dict[int, tuple[tuple[int, int] | None, set[int]]] = {}
+        for node in nodes:
+            self.update_node(node)
+
+    def update_node(self, node: MatterNode, changed: Collection[str] | None = None) -> None:
+        """
+        Update the index for a (new or updated) node.
+
+        Pass the changed attribute paths of a node update to only update the affected endpoints.
+        """
+        _, endpoint_ids = self._nodes.setdefault(node.node_id, (None, set()))
+        if changed is None:
+            update_endpoints = {*endpoint_ids, *node.endpoints}
+            update_product = True
+        else:
+            update_endpoints = {parse_path(x)[0] for x in changed}
+            update_product = any(_is_product_attribute(*parse_path(x)) for x in changed)
+        for endpoint_id in update_endpoints:
+            self.update_endpoint(node, endpoint_id)
+        if update_product:
+            self._update_product(node)
+
+    def remove_node(self, node_id: int) -> None:
+        """Remove a node (and all its endpoints) from the index."""
+        if (entry := self._nodes.pop(node_id, None)) is None:
+            return
+        product, endpoint_ids = entry
+        for endpoint_id in list(endpoint_ids):
+            self.remove_endpoint(node_id, endpoint_id)
+        if product is not None:
+            _discard(self.by_vendor, product[0], node_id)
+            _discard(self.by_product, product, node_id)
+
+    def update_endpoint(self, node: MatterNode, endpoint_id: int) -> None:
+        """Update the index for an endpoint of a node (removed if the node no longer has it)."""
+        if (endpoint := node.endpoints.get(endpoint_id)) is None:
+            self.remove_endpoint(node.node_id, endpoint_id)
+            return
+        key = (node.node_id, endpoint_id)
+        old_cluster_ids: frozenset[int] = frozenset()
+        old_device_type_ids: frozenset[int] = frozenset()
+        if (entry := self._endpoints.get(key)) is not None and entry[0] is endpoint:
+            _, old_cluster_ids, old_device_type_ids = entry
+        elif entry is not None:
+            # the endpoint was replaced (e.g. removed and added again)
+            self.remove_endpoint(*key)
+        cluster_ids = frozenset(endpoint.clusters)
+        device_type_ids = frozenset(x.device_type for x in endpoint.device_types)
+        self._endpoints[key] = (endpoint, cluster_ids, device_type_ids)
+        self._nodes.setdefault(node.node_id, (None, set()))[1].add(endpoint_id)
+        for cluster_id in old_cluster_ids - cluster_ids:
+            _discard(self.by_cluster, cluster_id, key)
+        for cluster_id in cluster_ids - old_cluster_ids:
+            self.by_cluster.setdefault(cluster_id, {})[key] = endpoint
+        for device_type_id in old_device_type_ids - device_type_ids:
+            _discard(self.by_device_type, device_type_id, key)
+        for device_type_id in device_type_ids - old_device_type_ids:
+            self.by_device_type.setdefault(device_type_id, {})[key] = endpoint
+
+    def remove_endpoint(self, node_id: int, endpoint_id: int) -> None:
+        """Remove an endpoint of a node from the index."""
+        key = (node_id, endpoint_id)
+        if (entry := self._endpoints.pop(key, None)) is None:
+            return
+        _, cluster_ids, device_type_ids = entry
+        for cluster_id in cluster_ids:
+            _discard(self.by_cluster, cluster_id, key)
+        for device_type_id in device_type_ids:
+            _discard(self.by_device_type, device_type_id, key)
+        if node_entry := self._nodes.get(node_id):
+            node_entry[1].discard(endpoint_id)
+
+    def attribute_updated(self, node: MatterNode, attribute_path: str) -> None:
+        """Update the index after a (single) attribute update of a node, if needed."""
+        endpoint_id, cluster_id, attribute_id = parse_path(attribute_path)
+        entry = self._endpoints.get((node.node_id, endpoint_id))
+        if (
+            entry is None
+            # the device types are in the Descriptor cluster
+            or cluster_id == Clusters.Descriptor.id
+            # a cluster that was not present before
+            or (cluster_id not in entry[1] and node.has_cluster(cluster_id, endpoint_id))
+        ):
+            self.update_endpoint(node, endpoint_id)
+        if _is_product_attribute(endpoint_id, cluster_id, attribute_id):
+            self._update_product(node)
+
+    def query(
+        self,
+        cluster_id: int | None = None,
+        device_type: type[DeviceType] | int | None = None,
+        vendor_id: int | None = None,
+        product_id: int | None = None,
+    ) -> list[MatterEndpoint]:
+        """
+        Return the endpoints matching all given filters, None is a wildcard.
+
+        The vendor and product id match all endpoints of the nodes with that vendor (and product).
+        """
+        matches: list[dict[EndpointKey, MatterEndpoint]] = []
+        if cluster_id is not None:
+            matches.append(self.by_cluster.get(cluster_id, {}))
+        if device_type is not None:
+            device_type_id = device_type if isinstance(device_type, int) else device_type.device_type
+            matches.append(self.by_device_type.get(device_type_id, {}))
+        if vendor_id is not None or product_id is not None:
+            node_ids: Collection[int]
+            if vendor_id is not None and product_id is not None:
+                node_ids = self.by_product.get((vendor_id, product_id), {})
+            elif vendor_id is not None:
+                node_ids = self.by_vendor.get(vendor_id, {})
+            else:
+                # a product id is only unique per vendor
+                node_ids = {
+                    node_id
+                    for (_, product_key), product_node_ids in self.by_product.items()
+                    if product_key == product_id
+                    for node_id in product_node_ids
+                }
+            matches.append(
+                {
+                    key: self._endpoints[key][0]
+                    for node_id in node_ids
+                    for key in sorted((node_id, x) for x in self._nodes[node_id][1])
+                }
+            )
+        if not matches:
+            return [x[0] for x in self._endpoints.values()]
+        # start with the smallest set of candidates
+        matches.sort(key=len)
+        candidates, *others = matches
+        for other in others:
+            candidates = {key: endpoint for key, endpoint in candidates.items() if key in other}
+        return list(candidates.values())
+
+    def _update_product(self, node: MatterNode) -> None:
+        """Update the (vendor_id, product_id) of a node."""
+        old_product, endpoint_ids = self._nodes.setdefault(node.node_id, (None, set()))
+        product: tuple[int, int] | None = None
+        if 0 in node.endpoints:
+            vendor_id = node.get_attribute_value(0, None, Clusters.BasicInformation.Attributes.VendorID)
+            product_id = node.get_attribute_value(0, None, Clusters.BasicInformation.Attributes.ProductID)
+            if vendor_id is not None and product_id is not None:
+                product = (vendor_id, product_id)
+        if product == old_product:
+            return
+        self._nodes[node.node_id] = (product, endpoint_ids)
+        if old_product is not None:
+            _discard(self.by_vendor, old_product[0], node.node_id)
+            _discard(self.by_product, old_product, node.node_id)
+        if product is not None:
+            self.by_vendor.setdefault(product[0], {})[node.node_id] = None
+            self.by_product.setdefault(product, {})[node.node_id] = None
+
+    def __len__(self) -> int:
+        """Return the number of (indexed) endpoints."""
+        return len(self._endpoints)
+
+
+def _is_product_attribute(endpoint_id: int, cluster_id: int, attribute_id: int) -> bool:
+    """Return if the attribute is the vendor or product id of a node."""
+    if endpoint_id != 0 or cluster_id != Clusters.BasicInformation.id:
+        return False
+    attributes = Clusters.BasicInformation.Attributes
+    return attribute_id in (attributes.VendorID.attribute_id, attributes.ProductID.attribute_id)
+
+
+def _discard[K, V](index: dict[K, dict[V, Any]], key: K, value: V) -> None:
+    """Remove a value from the (ordered) set of a key, and the key once its set is empty."""
+    if (values := index.get(key)) is None:
+        return
+    values.pop(value, None)
+    if not values:
+        del index[key]
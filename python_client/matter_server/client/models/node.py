@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Mapping, MutableMapping
+from dataclasses import MISSING, dataclass
 from enum import Enum
+from functools import partial
 import logging
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast
 
 from chip.clusters import Objects as Clusters
 from chip.clusters.ClusterObjects import ALL_ATTRIBUTES, ALL_CLUSTERS
-from matter_server.common.helpers.util import (
-    create_attribute_path,
-    parse_attribute_path,
-    parse_value,
-)
+from matter_server.common.helpers.util import compile_value_parser
 
+from .attribute_index import AttributeIndex, parse_path
+from .device_type_index import get_matching_device_types
 from .device_types import (
     ALL_TYPES as DEVICE_TYPES,
     Aggregator,
@@ -22,8 +24,11 @@ from .device_types import (
     DeviceType,
     RootNode,
 )
+from .snapshot import EndpointValues, NodeSnapshot
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from matter_server.common.models import MatterNodeData
 
 LOGGER = logging.getLogger(__name__)
@@ -38,12 +43,89 @@ def get_object_params(
     descriptor: Clusters.ClusterObjectDescriptor, object_id: int
 ) -> tuple[str, type]:
     """Parse label/key and type for an object from the descriptors, given the raw object id."""
-    for desc in descriptor.Fields:
-        if desc.Tag == object_id:
-            return (desc.Label, desc.Type)
+    if desc := descriptor.GetFieldByTag(object_id):
+        return (desc.Label, desc.Type)
     raise KeyError(f"No descriptor found for object {object_id}")
 
 
+class _AttributeEntry(NamedTuple):
+    """What is needed to set a raw attribute value on a cluster instance."""
+
+    cluster_class: type[Clusters.Cluster]
+    name: str
+    type: Any
+    default_factory: Callable[[], Any]
+    parse: Callable[[Any], Any]
+
+
+_ATTRIBUTE_ENTRIES: dict[tuple[int, int], _AttributeEntry] = {}
+
+
+def _get_attribute_entry(cluster_id: int, attribute_id: int) -> _AttributeEntry | None:
+    """Return the (cached) entry of an attribute, None for unknown/custom attributes."""
+    if (entry := _ATTRIBUTE_ENTRIES.get((cluster_id, attribute_id))) is not None:
+        return entry
+    if (
+        cluster_id not in ALL_CLUSTERS
+        or cluster_id not in ALL_ATTRIBUTES
+        or attribute_id not in ALL_ATTRIBUTES[cluster_id]
+    ):
+        # guard for unknown/custom clusters/attributes
+        # (not cached, as custom clusters may be registered later on)
+        return None
+    cluster_class: type[Clusters.Cluster] = ALL_CLUSTERS[cluster_id]
+    # unpack cluster attribute, using the descriptor
+    attribute_class: type[Clusters.ClusterAttributeDescriptor] = ALL_ATTRIBUTES[
+        cluster_id
+    ][attribute_id]
+    attribute_name, attribute_type = get_object_params(
+        cluster_class.descriptor, attribute_id
+    )
+    # a missing (None) value is parsed into the default of the attribute value
+    value_field = attribute_class.__dataclass_fields__["value"]
+    default_factory: Callable[[], Any]
+    if value_field.default_factory is not MISSING:
+        default_factory = value_field.default_factory
+    else:
+        default_factory = partial(_identity, value_field.default)
+    parse_raw = compile_value_parser(attribute_name, attribute_type)
+
+    def parse(value: Any) -> Any:
+        if value is None:
+            return default_factory()
+        return parse_raw(value)
+
+    entry = _ATTRIBUTE_ENTRIES[(cluster_id, attribute_id)] = _AttributeEntry(
+        cluster_class, attribute_name, attribute_type, default_factory, parse
+    )
+    return entry
+
+
+def _identity(value: Any) -> Any:
+    """Return the value itself."""
+    return value
+
+
+def _parse_attribute(
+    cluster_id: int, attribute_id: int, attribute_value: Any
+) -> tuple[type[Clusters.Cluster], str, Any] | None:
+    """Parse a raw attribute value into (cluster class, attribute name, value), None if unknown."""
+    if (entry := _get_attribute_entry(cluster_id, attribute_id)) is None:
+        return None
+    return entry.cluster_class, entry.name, entry.parse(attribute_value)
+
+
+def _reset_attribute(cluster_instance: Clusters.Cluster, attribute_id: int) -> None:
+    """Reset an attribute of a cluster instance to its default value."""
+    if not (desc := cluster_instance.descriptor.GetFieldByTag(attribute_id)):
+        return
+    cluster_field = cluster_instance.__dataclass_fields__[desc.Label]
+    if cluster_field.default_factory is not MISSING:
+        setattr(cluster_instance, desc.Label, cluster_field.default_factory())
+    else:
+        setattr(cluster_instance, desc.Label, cluster_field.default)
+
+
 @dataclass
 class MatterFabricData:
     """Data about a Matter fabric."""
@@ -55,6 +137,108 @@ class MatterFabricData:
     vendor_name: str | None = None
 
 
+class LazyClusters(MutableMapping[int, Clusters.Cluster]):
+    """
+    Clusters of an endpoint in lazy mode, keyed by cluster id.
+
+    The raw attribute values stay in the node data, a cluster instance is only
+    created (and cached) from those raw values when it is accessed for the first time.
+    """
+
+    def __init__(self, node: MatterNode, endpoint_id: int) -> None:
+        """Initialize LazyClusters."""
+        self.node = node
+        self.endpoint_id = endpoint_id
+        self._clusters: dict[int, Clusters.Cluster] = {}
+
+    @property
+    def attribute_paths(self) -> dict[int, dict[int, str]]:
+        """Return the paths of the raw attribute values: cluster_id -> attribute_id -> path."""
+        return self.node.attribute_index.by_endpoint.get(self.endpoint_id, {})
+
+    def is_materialized(self, cluster_id: int) -> bool:
+        """Return if the cluster instance has been created already."""
+        return cluster_id in self._clusters
+
+    def invalidate(self, cluster_id: int) -> None:
+        """Drop the materialized cluster (if any), it is created again on next access."""
+        self._clusters.pop(cluster_id, None)
+
+    def parse_attribute(self, cluster_id: int, attribute_id: int) -> Any:
+        """Return the (parsed) value of a single attribute, without materializing its cluster."""
+        if cluster_id in self._clusters:
+            if (entry := _get_attribute_entry(cluster_id, attribute_id)) is None:
+                return None
+            return getattr(self._clusters[cluster_id], entry.name)
+        attribute_path = self.node.attribute_index.get_path(
+            self.endpoint_id, cluster_id, attribute_id
+        )
+        if attribute_path is None:
+            # like the eager cluster instance: the default value if the cluster is present
+            if not self.node.attribute_index.get_attributes(self.endpoint_id, cluster_id):
+                return None
+            entry = _get_attribute_entry(cluster_id, attribute_id)
+            return None if entry is None else entry.default_factory()
+        parsed = _parse_attribute(
+            cluster_id, attribute_id, self.node.node_data.attributes[attribute_path]
+        )
+        return None if parsed is None else parsed[2]
+
+    def __getitem__(self, cluster_id: int) -> Clusters.Cluster:
+        """Return the cluster instance, created from the raw values on first access."""
+        if (cluster_instance := self._clusters.get(cluster_id)) is not None:
+            return cluster_instance
+        raw_attributes = self.node.node_data.attributes
+        for attribute_id, attribute_path in self.node.attribute_index.get_attributes(
+            self.endpoint_id, cluster_id
+        ).items():
+            parsed = _parse_attribute(
+                cluster_id, attribute_id, raw_attributes[attribute_path]
+            )
+            if parsed is None:
+                continue
+            cluster_class, attribute_name, attribute_value = parsed
+            if cluster_instance is None:
+                cluster_instance = cluster_class()
+            setattr(cluster_instance, attribute_name, attribute_value)
+        if cluster_instance is None:
+            raise KeyError(cluster_id)
+        self._clusters[cluster_id] = cluster_instance
+        return cluster_instance
+
+    def __setitem__(self, cluster_id: int, cluster_instance: Clusters.Cluster) -> None:
+        """Set a (materialized) cluster instance."""
+        self._clusters[cluster_id] = cluster_instance
+
+    def __delitem__(self, cluster_id: int) -> None:
+        """Remove a cluster (and its raw attribute paths from the index)."""
+        if cluster_id not in self:
+            raise KeyError(cluster_id)
+        self._clusters.pop(cluster_id, None)
+        index = self.node.attribute_index
+        for attribute_path in list(index.get_attributes(self.endpoint_id, cluster_id).values()):
+            index.remove(attribute_path)
+
+    def __contains__(self, cluster_id: object) -> bool:
+        """Return if the endpoint has the cluster, without materializing it."""
+        if cluster_id in self._clusters:
+            return True
+        if not isinstance(cluster_id, int) or cluster_id not in self.attribute_paths:
+            return False
+        if cluster_id not in ALL_CLUSTERS or cluster_id not in ALL_ATTRIBUTES:
+            return False
+        known_attributes = ALL_ATTRIBUTES[cluster_id]
+        return any(x in known_attributes for x in self.attribute_paths[cluster_id])
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate the ids of the (known) clusters, without materializing them."""
+        return iter([x for x in self.attribute_paths if x in self])
+
+    def __len__(self) -> int:
+        """Return the number of (known) clusters."""
+        return sum(1 for _ in self)
+
+
 class MatterEndpoint:
     """Representation of a Matter Endpoint."""
 
@@ -67,7 +251,9 @@ class MatterEndpoint:
         """Initialize MatterEndpoint."""
         self.node = node
         self.endpoint_id = endpoint_id
-        self.clusters: dict[int, Clusters.Cluster] = {}
+        self.clusters: MutableMapping[int, Clusters.Cluster] = (
+            LazyClusters(node, endpoint_id) if node.lazy else {}
+        )
         self.device_types: set[type[DeviceType]] = set()
         self.update(attributes_data)
 
@@ -108,6 +294,15 @@ class MatterEndpoint:
             return cluster.id in self.clusters
         return cluster in self.clusters
 
+    def get_matching_device_types(self) -> list[type[DeviceType]]:
+        """
+        Return the device types of which this endpoint has all required clusters.
+
+        Unlike device_types (from the Descriptor), this also works for unknown or
+        vendor-specific devices.
+        """
+        return get_matching_device_types(self.clusters)
+
     def get_cluster(self, cluster: type[_CLUSTER_T] | int) -> _CLUSTER_T | None:
         """
         Get a full Cluster object containing all attributes.
@@ -137,15 +332,15 @@ class MatterEndpoint:
             cluster = attribute.cluster_id
         # get cluster first, grab value from cluster instance next
         if cluster_obj := self.get_cluster(cluster):
-            if isinstance(attribute, type):
-                attribute_name, _ = get_object_params(
-                    cluster_obj.descriptor, attribute.attribute_id
-                )
-                return getattr(cluster_obj, attribute_name)
+            attribute_id = (
+                attribute.attribute_id if isinstance(attribute, type) else attribute
+            )
             # actual value is just a class attribute on the cluster instance
             # NOTE: do not use the value on the ClusterAttribute
             # instance itself as that is not used!
-            attribute_name, _ = get_object_params(cluster_obj.descriptor, attribute)
+            if entry := _get_attribute_entry(cluster_obj.id, attribute_id):
+                return getattr(cluster_obj, entry.name)
+            attribute_name, _ = get_object_params(cluster_obj.descriptor, attribute_id)
             return getattr(
                 cluster_obj,
                 attribute_name,
@@ -172,9 +367,8 @@ class MatterEndpoint:
         attribute_id = (
             attribute if isinstance(attribute, int) else attribute.attribute_id
         )
-        # the fastest way to check this is just by checking the AttributePath in the raw data...
-        attr_path = create_attribute_path(self.endpoint_id, cluster_id, attribute_id)
-        return attr_path in self.node.node_data.attributes
+        # the fastest way to check this is just by checking the (indexed) raw data...
+        return (self.endpoint_id, cluster_id, attribute_id) in self.node.attribute_index
 
     def set_attribute_value(self, attribute_path: str, attribute_value: Any) -> None:
         """
@@ -183,51 +377,83 @@ class MatterEndpoint:
         May only be called by logic that received data from the server.
         Do not modify the data directly from a consumer.
         """
-        _, cluster_id, attribute_id = parse_attribute_path(attribute_path)
-        if (
-            cluster_id not in ALL_CLUSTERS
-            or cluster_id not in ALL_ATTRIBUTES
-            or attribute_id not in ALL_ATTRIBUTES[cluster_id]
-        ):
-            # guard for unknown/custom clusters/attributes
+        _, cluster_id, attribute_id = self.node.attribute_index.add(attribute_path)
+        self.node._invalidate_snapshot(self.endpoint_id, cluster_id)
+        if self.node.keep_raw:
+            # keep the raw data in sync, it is diffed on a node update
+            self.node.node_data.attributes[attribute_path] = attribute_value
+        if (entry := _get_attribute_entry(cluster_id, attribute_id)) is None:
+            # unknown (custom) cluster or attribute
             return
-        assert cluster_id is not None  # for mypy
-        assert attribute_id is not None  # for mypy
-        cluster_class: type[Clusters.Cluster] = ALL_CLUSTERS[cluster_id]
-        if cluster_id in self.clusters:
-            cluster_instance = self.clusters[cluster_id]
-        else:
-            cluster_instance = cluster_class()
+        if isinstance(
+            self.clusters, LazyClusters
+        ) and not self.clusters.is_materialized(cluster_id):
+            # lazy mode: only parse the value if the cluster is materialized
+            self.node._add_cluster_endpoint(cluster_id, self.endpoint_id)
+            return
+        if (cluster_instance := self.clusters.get(cluster_id)) is None:
+            cluster_instance = entry.cluster_class()
             self.clusters[cluster_id] = cluster_instance
-
-        # unpack cluster attribute, using the descriptor
-        attribute_class: type[Clusters.ClusterAttributeDescriptor] = ALL_ATTRIBUTES[
-            cluster_id
-        ][attribute_id]
-        attribute_name, attribute_type = get_object_params(
-            cluster_class.descriptor, attribute_id
-        )
-
+            self.node._add_cluster_endpoint(cluster_id, self.endpoint_id)
         # we only set the value at cluster instance level and we leave
         # the underlying Attributes classproperty alone
-        attribute_value = parse_value(
-            attribute_name, attribute_value, attribute_type, attribute_class().value
-        )
-        setattr(cluster_instance, attribute_name, attribute_value)
+        setattr(cluster_instance, entry.name, entry.parse(attribute_value))
+
+    def _peek_attribute_value(
+        self, attribute: type[Clusters.ClusterAttributeDescriptor]
+    ) -> Any:
+        """Return an attribute value (in lazy mode without materializing the cluster)."""
+        if isinstance(self.clusters, LazyClusters):
+            return self.clusters.parse_attribute(
+                attribute.cluster_id, attribute.attribute_id
+            )
+        return self.get_attribute_value(None, attribute)
 
     def update(self, attributes_data: dict[str, Any]) -> None:
-        """Update MatterEndpoint from (endpoint-specific) raw Attributes data."""
+        """Update MatterEndpoint from (endpoint-specific, changed) raw Attributes data."""
+        descriptor_changed = False
         # unwrap cluster and clusterattributes from raw node data attributes
         for attribute_path, attribute_value in attributes_data.items():
             self.set_attribute_value(attribute_path, attribute_value)
-        # extract device types from Descriptor Cluster
-        if cluster := self.get_cluster(Clusters.Descriptor):
-            for dev_info in cluster.deviceTypeList:
-                device_type = DEVICE_TYPES.get(dev_info.deviceType)
-                if device_type is None:
-                    LOGGER.debug("Found unknown device type %s", dev_info)
-                    continue
-                self.device_types.add(device_type)
+            if parse_path(attribute_path)[1] == Clusters.Descriptor.id:
+                descriptor_changed = True
+        if descriptor_changed:
+            self._update_device_types()
+
+    def remove_attributes(self, attribute_paths: list[str]) -> None:
+        """Remove attributes that are no longer present in the raw node data."""
+        index = self.node.attribute_index
+        cluster_ids: set[int] = set()
+        for attribute_path in attribute_paths:
+            _, cluster_id, attribute_id = parse_path(attribute_path)
+            cluster_ids.add(cluster_id)
+            index.remove(attribute_path)
+            self.node._invalidate_snapshot(self.endpoint_id, cluster_id)
+            if isinstance(self.clusters, LazyClusters):
+                self.clusters.invalidate(cluster_id)
+            elif not index.get_attributes(self.endpoint_id, cluster_id):
+                self.clusters.pop(cluster_id, None)
+            elif cluster_instance := self.clusters.get(cluster_id):
+                _reset_attribute(cluster_instance, attribute_id)
+        for cluster_id in cluster_ids:
+            if cluster_id not in self.clusters:
+                self.node._remove_cluster_endpoint(cluster_id, self.endpoint_id)
+        if Clusters.Descriptor.id in cluster_ids:
+            self._update_device_types()
+
+    def _update_device_types(self) -> None:
+        """Extract the device types from the Descriptor Cluster."""
+        self.device_types.clear()
+        if not self.has_cluster(Clusters.Descriptor):
+            return
+        for dev_info in self._peek_attribute_value(
+            Clusters.Descriptor.Attributes.DeviceTypeList
+        ):
+            device_type = DEVICE_TYPES.get(dev_info.deviceType)
+            if device_type is None:
+                LOGGER.debug("Found unknown device type %s", dev_info)
+                continue
+            self.device_types.add(device_type)
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -237,13 +463,45 @@ class MatterEndpoint:
 class MatterNode:
     """Representation of a Matter Node."""
 
-    def __init__(self, node_data: MatterNodeData) -> None:
-        """Initialize MatterNode from MatterNodeData."""
+    def __init__(
+        self, node_data: MatterNodeData, lazy: bool = False, keep_raw: bool = True
+    ) -> None:
+        """
+        Initialize MatterNode from MatterNodeData.
+
+        In lazy mode the raw attribute values are kept in the node data and a cluster
+        is only parsed when it is accessed (e.g. by get_cluster) for the first time.
+        Without keep_raw the raw attribute values are dropped (node_data.attributes
+        is emptied) once parsed, to save memory. A node update then has to parse all
+        attributes again, as there is nothing to compare to.
+        """
+        if lazy and not keep_raw:
+            raise ValueError("Lazy mode needs the raw attribute values")
+        self.lazy = lazy
+        self.keep_raw = keep_raw
+        # index of the attribute paths in the raw data (by integer ids)
+        self.attribute_index = AttributeIndex()
         self.endpoints: dict[int, MatterEndpoint] = {}
         # composed devices reference to other endpoints through the partsList attribute
-        # create a mapping table
+        # create mapping tables: parent -> child endpoints (the partsList),
+        # child -> parent endpoints referencing it and child -> (nearest) parent
+        self._compose_children: dict[int, tuple[int, ...]] = {}
+        self._compose_parents: dict[int, set[int]] = {}
         self._composed_endpoints: dict[int, int] = {}
-        self.update(node_data)
+        # cluster_id -> ids of the endpoints that have the cluster
+        self._cluster_endpoints: dict[int, dict[int, None]] = {}
+        # the (parts of the) last snapshot, dropped when an attribute changes
+        self._snapshot: NodeSnapshot | None = None
+        self._endpoint_values: dict[int, EndpointValues] = {}
+        self._cluster_values: dict[tuple[int, int], Mapping[int, Any]] = {}
+        if keep_raw:
+            # the nodes mostly have the same attribute paths, share the strings
+            node_data.attributes = {
+                sys.intern(attribute_path): attribute_value
+                for attribute_path, attribute_value in node_data.attributes.items()
+            }
+        self.node_data = node_data
+        self._update_attributes(list(node_data.attributes), [])
 
     @property
     def node_id(self) -> int:
@@ -289,12 +547,20 @@ class MatterNode:
         self, cluster: type[_CLUSTER_T] | int, endpoint: int | None = None
     ) -> bool:
         """Check if node has a specific cluster on any of the endpoints."""
-        return any(
-            x
-            for x in self.endpoints.values()
-            if x.has_cluster(cluster)
-            and (endpoint is None or x.endpoint_id == endpoint)
-        )
+        cluster_id = cluster.id if isinstance(cluster, type) else cluster
+        if endpoint is None:
+            return cluster_id in self._cluster_endpoints
+        return endpoint in self._cluster_endpoints.get(cluster_id, ())
+
+    def get_cluster_endpoints(
+        self, cluster: type[_CLUSTER_T] | int
+    ) -> list[MatterEndpoint]:
+        """Return the endpoints that have a specific cluster."""
+        cluster_id = cluster.id if isinstance(cluster, type) else cluster
+        return [
+            self.endpoints[endpoint_id]
+            for endpoint_id in self._cluster_endpoints.get(cluster_id, ())
+        ]
 
     def get_cluster(
         self, endpoint: int, cluster: type[_CLUSTER_T] | int
@@ -308,60 +574,245 @@ class MatterNode:
 
     def get_compose_parent(self, endpoint_id: int) -> MatterEndpoint | None:
         """Return endpoint of parent if the endpoint belongs to a Composed device."""
-        if parent_id := self._composed_endpoints.get(endpoint_id):
-            return self.endpoints[parent_id]
+        if endpoint_id not in self.endpoints:
+            return None
+        if (parent_id := self._composed_endpoints.get(endpoint_id)) is not None:
+            return self.endpoints.get(parent_id)
         return None
 
     def get_compose_child_ids(self, endpoint_id: int) -> tuple[int, ...] | None:
         """Return endpoint IDs of any child if the endpoint represents a Composed device."""
-        return tuple(x for x, y in self._composed_endpoints.items() if y == endpoint_id)
+        return tuple(
+            x
+            for x in self._compose_children.get(endpoint_id, ())
+            if self._composed_endpoints.get(x) == endpoint_id and x in self.endpoints
+        )
+
+    def snapshot(self) -> NodeSnapshot:
+        """
+        Return an immutable snapshot of the current (parsed) attribute values.
+
+        Unchanged endpoints and clusters are shared with the previous snapshot, so it is
+        cheap to take a snapshot on every event. In lazy mode all clusters are materialized.
+        """
+        if self._snapshot is None:
+            self._snapshot = NodeSnapshot(
+                self.node_id,
+                MappingProxyType(
+                    {
+                        endpoint_id: values
+                        for endpoint_id in self.endpoints
+                        if (values := self._get_endpoint_values(endpoint_id))
+                    }
+                ),
+            )
+        return self._snapshot
+
+    def _get_endpoint_values(self, endpoint_id: int) -> EndpointValues:
+        """Return the (cached) immutable attribute values of an endpoint."""
+        if (values := self._endpoint_values.get(endpoint_id)) is None:
+            values = self._endpoint_values[endpoint_id] = MappingProxyType(
+                {
+                    cluster_id: cluster_values
+                    for cluster_id in self.endpoints[endpoint_id].clusters
+                    if (cluster_values := self._get_cluster_values(endpoint_id, cluster_id))
+                }
+            )
+        return values
+
+    def _get_cluster_values(self, endpoint_id: int, cluster_id: int) -> Mapping[int, Any]:
+        """Return the (cached) immutable attribute values of a cluster on an endpoint."""
+        if (values := self._cluster_values.get((endpoint_id, cluster_id))) is None:
+            cluster_instance = self.endpoints[endpoint_id].clusters[cluster_id]
+            values = self._cluster_values[(endpoint_id, cluster_id)] = MappingProxyType(
+                {
+                    attribute_id: getattr(cluster_instance, entry.name)
+                    for attribute_id in self.attribute_index.get_attributes(
+                        endpoint_id, cluster_id
+                    )
+                    if (entry := _get_attribute_entry(cluster_id, attribute_id))
+                }
+            )
+        return values
+
+    def _invalidate_snapshot(self, endpoint_id: int, cluster_id: int) -> None:
+        """Drop the snapshot (parts) of a changed cluster."""
+        self._snapshot = None
+        self._endpoint_values.pop(endpoint_id, None)
+        self._cluster_values.pop((endpoint_id, cluster_id), None)
+
+    def update(self, node_data: MatterNodeData) -> set[str]:
+        """
+        Update MatterNode from MatterNodeData.
 
-    def update(self, node_data: MatterNodeData) -> None:
-        """Update MatterNode from MatterNodeData."""
+        Only the attributes that changed (compared to the current data) are processed.
+        Returns the paths of the added, changed and removed attributes.
+        """
+        old_attributes = self.node_data.attributes
+        new_attributes = node_data.attributes
+        changed = [
+            attribute_path
+            for attribute_path, attribute_value in new_attributes.items()
+            if attribute_path not in old_attributes
+            or old_attributes[attribute_path] != attribute_value
+        ]
+        if self.keep_raw:
+            added = sum(1 for x in changed if x not in old_attributes)
+            removed = (
+                []
+                if len(old_attributes) + added == len(new_attributes)
+                else [x for x in old_attributes if x not in new_attributes]
+            )
+            # apply the changes to the current raw data (which has the interned paths)
+            for attribute_path in changed:
+                old_attributes[sys.intern(attribute_path)] = new_attributes[
+                    attribute_path
+                ]
+            for attribute_path in removed:
+                del old_attributes[attribute_path]
+            node_data.attributes = old_attributes
+        else:
+            removed = [
+                attribute_path
+                for _, attribute_path in self.attribute_index.query()
+                if attribute_path not in new_attributes
+            ]
         self.node_data = node_data
+        self._update_attributes(changed, removed)
+        return {*changed, *removed}
+
+    def _update_attributes(self, changed: list[str], removed: list[str]) -> None:
+        """Process the changed and removed attributes (paths) of the raw node data."""
+        attributes = self.node_data.attributes
+        # the endpoints of which the composed device children need an update
+        compose_endpoints: set[int] = set()
         # collect per endpoint data
-        endpoint_data: dict[int, dict[str, Any]] = {}
-        for attribute_path, attribute_data in node_data.attributes.items():
-            endpoint_id = int(attribute_path.split("/")[0])
-            if endpoint_id not in endpoint_data:
-                endpoint_data[endpoint_id] = {}
-            endpoint_data[endpoint_id][attribute_path] = attribute_data
-        for endpoint_id, attributes_data in endpoint_data.items():
+        changed_data: dict[int, dict[str, Any]] = {}
+        for attribute_path in changed:
+            endpoint_id, cluster_id, _ = parse_path(attribute_path)
+            changed_data.setdefault(endpoint_id, {})[attribute_path] = attributes[
+                attribute_path
+            ]
+            if cluster_id == Clusters.Descriptor.id:
+                compose_endpoints.add(endpoint_id)
+        removed_paths: dict[int, list[str]] = {}
+        for attribute_path in removed:
+            endpoint_id, cluster_id, _ = parse_path(attribute_path)
+            removed_paths.setdefault(endpoint_id, []).append(attribute_path)
+            if cluster_id == Clusters.Descriptor.id:
+                compose_endpoints.add(endpoint_id)
+        for endpoint_id, attribute_paths in removed_paths.items():
+            if endpoint := self.endpoints.get(endpoint_id):
+                endpoint.remove_attributes(attribute_paths)
+            if (
+                endpoint_id not in changed_data
+                and endpoint_id not in self.attribute_index.by_endpoint
+            ):
+                # all attributes of the endpoint are gone
+                self.remove_endpoint(endpoint_id)
+        for endpoint_id, attributes_data in changed_data.items():
             if endpoint_id in self.endpoints:
                 self.endpoints[endpoint_id].update(attributes_data)
             else:
                 self.endpoints[endpoint_id] = MatterEndpoint(
                     endpoint_id=endpoint_id, attributes_data=attributes_data, node=self
                 )
-        # composed devices reference to other endpoints through the partsList attribute
-        # create a mapping table to quickly map this
-        for endpoint in self.endpoints.values():
-            if RootNode in endpoint.device_types:
-                # ignore root endpoint
-                continue
-            if Aggregator in endpoint.device_types:
-                # ignore Bridge endpoint
-                # (as that will also use partsList to indicate its child's)
-                continue
-            descriptor = endpoint.get_cluster(Clusters.Descriptor)
-            if descriptor is None:
-                LOGGER.warning(
-                    "Found endpoint without a Descriptor: Node %s, endpoint %s",
-                    self.node_id,
-                    endpoint.endpoint_id,
-                )
-                continue
-            if descriptor.partsList:
-                for endpoint_id in descriptor.partsList:
-                    self._composed_endpoints[endpoint_id] = endpoint.endpoint_id
+                compose_endpoints.add(endpoint_id)
+        for endpoint_id in compose_endpoints:
+            if endpoint := self.endpoints.get(endpoint_id):
+                self._update_compose_children(endpoint)
+        if not self.keep_raw:
+            self.node_data.attributes = {}
+
+    def _update_compose_children(self, endpoint: MatterEndpoint) -> None:
+        """Update the (composed device) child endpoints of an endpoint from its partsList."""
+        children: tuple[int, ...] = ()
+        if RootNode in endpoint.device_types or Aggregator in endpoint.device_types:
+            # ignore root endpoint and Bridge endpoint
+            # (as that will also use partsList to indicate its child's)
+            pass
+        elif not endpoint.has_cluster(Clusters.Descriptor):
+            LOGGER.warning(
+                "Found endpoint without a Descriptor: Node %s, endpoint %s",
+                self.node_id,
+                endpoint.endpoint_id,
+            )
+        elif parts_list := endpoint._peek_attribute_value(
+            Clusters.Descriptor.Attributes.PartsList
+        ):
+            children = tuple(parts_list)
+        self._set_compose_children(endpoint.endpoint_id, children)
+
+    def _set_compose_children(self, parent_id: int, children: tuple[int, ...]) -> None:
+        """Set the child endpoints of a composed device and (re)link them to their parent."""
+        old_children = self._compose_children.pop(parent_id, ())
+        if children:
+            self._compose_children[parent_id] = children
+        for child_id in {*old_children, *children}:
+            parents = self._compose_parents.setdefault(child_id, set())
+            if child_id in children:
+                parents.add(parent_id)
+            else:
+                parents.discard(parent_id)
+            if parents:
+                # the partsList of a composed device also lists the children of its
+                # (nested) composed child devices, link those to the nearest parent
+                self._composed_endpoints[child_id] = max(parents)
+            else:
+                del self._compose_parents[child_id]
+                self._composed_endpoints.pop(child_id, None)
+
+    def _add_cluster_endpoint(self, cluster_id: int, endpoint_id: int) -> None:
+        """Add an endpoint to the cluster_id -> endpoints index."""
+        self._cluster_endpoints.setdefault(cluster_id, {})[endpoint_id] = None
+
+    def _remove_cluster_endpoint(self, cluster_id: int, endpoint_id: int) -> None:
+        """Remove an endpoint from the cluster_id -> endpoints index."""
+        if (endpoint_ids := self._cluster_endpoints.get(cluster_id)) is None:
+            return
+        endpoint_ids.pop(endpoint_id, None)
+        if not endpoint_ids:
+            del self._cluster_endpoints[cluster_id]
 
     def update_attribute(self, attribute_path: str, new_value: Any) -> None:
         """Handle Attribute value update."""
-        endpoint_id = int(attribute_path.split("/", maxsplit=1)[0])
-        if endpoint_id not in self.endpoints:
+        endpoint_id, cluster_id, _ = parse_path(attribute_path)
+        if (endpoint := self.endpoints.get(endpoint_id)) is None:
             # race condition when a bridge is in the process of adding a new endpoint
             return
-        self.endpoints[endpoint_id].set_attribute_value(attribute_path, new_value)
+        endpoint.set_attribute_value(attribute_path, new_value)
+        if cluster_id == Clusters.Descriptor.id:
+            endpoint._update_device_types()
+            self._update_compose_children(endpoint)
+
+    def update_attributes(self, attributes: Iterable[tuple[str, Any]]) -> None:
+        """
+        Handle a batch of Attribute value updates (attribute path, new value) in one pass.
+
+        The device types and composed devices are only updated once per endpoint
+        with Descriptor changes, after all values are set.
+        """
+        descriptor_endpoints: dict[int, MatterEndpoint] = {}
+        for attribute_path, new_value in attributes:
+            endpoint_id, cluster_id, _ = parse_path(attribute_path)
+            if (endpoint := self.endpoints.get(endpoint_id)) is None:
+                # race condition when a bridge is in the process of adding a new endpoint
+                continue
+            endpoint.set_attribute_value(attribute_path, new_value)
+            if cluster_id == Clusters.Descriptor.id:
+                descriptor_endpoints[endpoint_id] = endpoint
+        for endpoint in descriptor_endpoints.values():
+            endpoint._update_device_types()
+            self._update_compose_children(endpoint)
+
+    def remove_endpoint(self, endpoint_id: int) -> None:
+        """Handle removal of an endpoint."""
+        if (endpoint := self.endpoints.pop(endpoint_id, None)) is not None:
+            for cluster_id in list(endpoint.clusters):
+                self._remove_cluster_endpoint(cluster_id, endpoint_id)
+                self._invalidate_snapshot(endpoint_id, cluster_id)
+        self._set_compose_children(endpoint_id, ())
+        self.attribute_index.remove_endpoint(endpoint_id)
 
     def __repr__(self) -> str:
         """Return the representation."""
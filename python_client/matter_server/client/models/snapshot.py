@@ -0,0 +1,70 @@
+"""Immutable snapshots of the attribute values of a Matter node."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+# cluster_id -> attribute_id -> value
+EndpointValues = Mapping[int, Mapping[int, Any]]
+
+EMPTY: Mapping[Any, Any] = MappingProxyType({})
+
+
+class NodeSnapshot:
+    """
+    Immutable view of the (parsed) attribute values of a node at one point in time.
+
+    The values are kept per endpoint and cluster in read-only mappings, which are shared
+    between the snapshots of a node: after an attribute update only the mappings of that
+    cluster and its endpoint are new, so taking a snapshot is cheap and diffing two
+    snapshots skips everything that is shared. The values themselves are not copied,
+    they are replaced (not modified) on an update and must not be modified by consumers.
+    """
+
+    __slots__ = ("endpoints", "node_id")
+
+    def __init__(self, node_id: int, endpoints: Mapping[int, EndpointValues]) -> None:
+        """Initialize NodeSnapshot."""
+        self.node_id = node_id
+        # endpoint_id -> cluster_id -> attribute_id -> value
+        self.endpoints = endpoints
+
+    def get_cluster(self, endpoint_id: int, cluster_id: int) -> Mapping[int, Any]:
+        """Return the attribute values (by attribute id) of a cluster on an endpoint."""
+        clusters: EndpointValues = self.endpoints.get(endpoint_id, EMPTY)
+        return clusters.get(cluster_id, EMPTY)
+
+    def get_attribute_value(self, endpoint_id: int, cluster_id: int, attribute_id: int, default: Any = None) -> Any:
+        """Return the value of an attribute, default if it is not present."""
+        return self.get_cluster(endpoint_id, cluster_id).get(attribute_id, default)
+
+    def changed_paths(self, previous: NodeSnapshot) -> list[str]:
+        """Return the paths of the attributes that were added, changed or removed since a previous snapshot."""
+        changed: list[str] = []
+        for endpoint_id in {*previous.endpoints, *self.endpoints}:
+            old_clusters = previous.endpoints.get(endpoint_id, EMPTY)
+            new_clusters = self.endpoints.get(endpoint_id, EMPTY)
+            if old_clusters is new_clusters:
+                continue
+            for cluster_id in {*old_clusters, *new_clusters}:
+                old_values = old_clusters.get(cluster_id, EMPTY)
+                new_values = new_clusters.get(cluster_id, EMPTY)
+                if old_values is new_values:
+                    continue
+                changed.extend(
+                    f"{endpoint_id}/{cluster_id}/{attribute_id}"
+                    for attribute_id in {*old_values, *new_values}
+                    if attribute_id not in old_values
+                    or attribute_id not in new_values
+                    or (
+                        old_values[attribute_id] is not new_values[attribute_id]
+                        and old_values[attribute_id] != new_values[attribute_id]
+                    )
+                )
+        return sorted(changed)
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<NodeSnapshot of node {self.node_id}>"
@@ -0,0 +1,259 @@
+"""Index of the event subscribers of the Matter client, keyed by event, node and attribute path."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterable
+from itertools import count
+from typing import TYPE_CHECKING, Any, Final
+
+from matter_server.common.models import EventType
+
+from .models.attribute_index import parse_path
+
+if TYPE_CHECKING:
+    from chip.clusters.ClusterObjects import Cluster, ClusterAttributeDescriptor
+
+SUB_WILDCARD: Final = "*"
+
+# key of a branch: an event, node id, endpoint/cluster/attribute id or the wildcard
+BranchKey = EventType | str | int
+# (endpoint, cluster, attribute) keys of an attribute path filter, trailing wildcards omitted
+PathKeys = tuple[BranchKey, ...]
+# an id (or class), a collection of them or None (the wildcard)
+type EndpointFilter = int | Iterable[int] | None
+type ClusterFilter = type[Cluster] | int | Iterable[type[Cluster] | int] | None
+type AttributeFilter = type[ClusterAttributeDescriptor] | int | Iterable[type[ClusterAttributeDescriptor] | int] | None
+
+
+class _Branch:
+    """Branch of the subscriber index, with the callbacks subscribed at this level."""
+
+    __slots__ = ("callbacks", "children", "paths")
+
+    def __init__(self) -> None:
+        """Initialize _Branch."""
+        # subscription id -> callback, in order of subscription
+        self.callbacks: dict[int, Callable[..., None]] = {}
+        self.children: dict[BranchKey, _Branch] = {}
+        # concrete attribute path -> branch (of a node), matched without parsing the path
+        self.paths: dict[BranchKey, _Branch] = {}
+
+
+class SubscriberIndex:
+    """
+    Nested index (event -> node -> endpoint -> cluster -> attribute) of the event subscribers.
+
+    Signalling an event only visits the branches of the event and the wildcard that
+    actually have subscribers, so the cost does not grow with the number of subscriptions
+    for other nodes or attributes. Attribute path filters can hold wildcards per part and
+    match all attributes below a prefix, e.g. "1/0x0006/*" or "*/6/0"; subscriptions to a
+    concrete attribute path are looked up by the path string of the event directly.
+    Every subscription has its own id, so unsubscribing does not scan the other subscribers.
+    With with_path the callbacks also get the node id and attribute path of the event.
+    """
+
+    __slots__ = ("_ids", "_root", "_subscriptions", "with_path")
+
+    def __init__(self, with_path: bool = False) -> None:
+        """Initialize SubscriberIndex."""
+        self.with_path = with_path
+        self._root = _Branch()
+        # subscription id -> (children, key) of the branches from the root, per path filter
+        self._subscriptions: dict[int, list[list[tuple[dict[BranchKey, _Branch], BranchKey]]]] = {}
+        self._ids = count()
+
+    def subscribe(
+        self,
+        callback: Callable[..., None],
+        event_filter: EventType | None = None,
+        node_filter: int | None = None,
+        path_filters: Collection[PathKeys] | None = None,
+    ) -> Callable[[], None]:
+        """
+        Add a subscriber and return the function to unsubscribe.
+
+        None filters match all, the subscriber matches the attribute paths of any of the
+        path filters (see parse_path_filter and make_path_filters). The path filters that
+        another path filter also matches are dropped, so an event calls the subscriber once.
+        """
+        keys: tuple[BranchKey, ...] = (
+            SUB_WILDCARD if event_filter is None else event_filter,
+            SUB_WILDCARD if node_filter is None else node_filter,
+        )
+        subscription_id = next(self._ids)
+        subscription: list[list[tuple[dict[BranchKey, _Branch], BranchKey]]] = []
+        for path_keys in [()] if path_filters is None else _drop_covered(path_filters):
+            branch = self._root
+            branches: list[tuple[dict[BranchKey, _Branch], BranchKey]] = []
+            for key in keys + path_keys if len(path_keys) < 3 or SUB_WILDCARD in path_keys else keys:
+                branches.append((branch.children, key))
+                branch = branch.children.setdefault(key, _Branch())
+            if len(path_keys) == 3 and SUB_WILDCARD not in path_keys:
+                path = "/".join(str(x) for x in path_keys)
+                branches.append((branch.paths, path))
+                branch = branch.paths.setdefault(path, _Branch())
+            branch.callbacks[subscription_id] = callback
+            subscription.append(branches)
+        self._subscriptions[subscription_id] = subscription
+
+        def unsubscribe() -> None:
+            self._unsubscribe(subscription_id)
+
+        return unsubscribe
+
+    def signal(
+        self,
+        event: EventType,
+        data: Any = None,
+        node_id: int | None = None,
+        attribute_path: str | None = None,
+    ) -> None:
+        """Call the subscribers matching the event, node and attribute path."""
+        args = (event, data, node_id, attribute_path) if self.with_path else (event, data)
+        children = self._root.children
+        for event_branch in (children.get(event), children.get(SUB_WILDCARD)):
+            if event_branch is None:
+                continue
+            event_children = event_branch.children
+            node_branches = (
+                (event_children.get(SUB_WILDCARD),)
+                if node_id is None
+                else (event_children.get(node_id), event_children.get(SUB_WILDCARD))
+            )
+            for node_branch in node_branches:
+                if node_branch is None:
+                    continue
+                if attribute_path is not None:
+                    if node_branch.paths and (path_branch := node_branch.paths.get(attribute_path)):
+                        for callback in tuple(path_branch.callbacks.values()):
+                            callback(*args)
+                    if node_branch.children:
+                        self._signal_path(node_branch, parse_path(attribute_path), 0, args)
+                if node_branch.callbacks:
+                    for callback in tuple(node_branch.callbacks.values()):
+                        callback(*args)
+
+    def _signal_path(
+        self,
+        branch: _Branch,
+        path_ids: tuple[int, int, int],
+        depth: int,
+        args: tuple[Any, ...],
+    ) -> None:
+        """Call the subscribers of the (endpoint, cluster, attribute) path below a branch."""
+        children = branch.children
+        for child in (children.get(path_ids[depth]), children.get(SUB_WILDCARD)):
+            if child is None:
+                continue
+            if depth < 2 and child.children:
+                self._signal_path(child, path_ids, depth + 1, args)
+            if child.callbacks:
+                for callback in tuple(child.callbacks.values()):
+                    callback(*args)
+
+    def _unsubscribe(self, subscription_id: int) -> None:
+        """Remove a subscriber and the branches that are left empty."""
+        for branches in self._subscriptions.pop(subscription_id, ()):
+            children, key = branches[-1]
+            del children[key].callbacks[subscription_id]
+            for children, key in reversed(branches):
+                branch = children[key]
+                if branch.callbacks or branch.children or branch.paths:
+                    break
+                del children[key]
+
+    def __len__(self) -> int:
+        """Return the number of subscribers."""
+        return len(self._subscriptions)
+
+
+def parse_path_filter(attr_path_filter: str) -> PathKeys:
+    """
+    Return the (endpoint, cluster, attribute) keys of an attribute path filter.
+
+    Each part is a (decimal or 0x prefixed hex) id or the wildcard, missing trailing
+    parts are wildcards: "1/0x0006" (or "1/6/*") matches all attributes of the OnOff
+    cluster on endpoint 1.
+    """
+    parts = attr_path_filter.split("/")
+    if len(parts) > 3:
+        msg = f"Invalid attribute path filter: {attr_path_filter}"
+        raise ValueError(msg)
+    keys: list[BranchKey] = []
+    for part in parts:
+        if part == SUB_WILDCARD:
+            keys.append(SUB_WILDCARD)
+            continue
+        try:
+            keys.append(int(part, 16) if part.lower().startswith("0x") else int(part))
+        except ValueError as err:
+            msg = f"Invalid attribute path filter: {attr_path_filter}"
+            raise ValueError(msg) from err
+    # trailing wildcards are matched at the level of the last concrete part
+    while len(keys) > 1 and keys[-1] == SUB_WILDCARD:
+        keys.pop()
+    return tuple(keys)
+
+
+def make_path_filters(
+    endpoint_filter: EndpointFilter = None,
+    cluster_filter: ClusterFilter = None,
+    attribute_filter: AttributeFilter = None,
+) -> list[PathKeys]:
+    """
+    Return the path filters matching the given endpoint, cluster and attribute (ids).
+
+    Each filter is an id, a collection of ids or None to match all. Clusters and
+    attributes can also be given as cluster or attribute classes, an attribute class
+    implies its cluster.
+    """
+    endpoint_keys = _get_keys(endpoint_filter)
+    cluster_keys = _get_keys(cluster_filter)
+    attribute_keys: list[tuple[BranchKey, BranchKey]] = []
+    for attribute in _get_items(attribute_filter):
+        if isinstance(attribute, int):
+            attribute_keys.extend((cluster_key, attribute) for cluster_key in cluster_keys)
+        elif cluster_filter is None or attribute.cluster_id in cluster_keys:
+            attribute_keys.append((attribute.cluster_id, attribute.attribute_id))
+    if attribute_filter is None:
+        attribute_keys = [(cluster_key, SUB_WILDCARD) for cluster_key in cluster_keys]
+    path_filters = []
+    for endpoint_key in endpoint_keys:
+        for cluster_key, attribute_key in attribute_keys:
+            path_keys = [endpoint_key, cluster_key, attribute_key]
+            # trailing wildcards are matched at the level of the last concrete part
+            while len(path_keys) > 1 and path_keys[-1] == SUB_WILDCARD:
+                path_keys.pop()
+            path_filters.append(tuple(path_keys))
+    return path_filters
+
+
+def _drop_covered(path_filters: Collection[PathKeys]) -> list[PathKeys]:
+    """Return the path filters without the ones that only match a subset of another filter."""
+    # padded with the omitted trailing wildcards -> path filter
+    unique = {path_keys + (SUB_WILDCARD,) * (3 - len(path_keys)): path_keys for path_keys in path_filters}
+    wildcards = [padded for padded in unique if SUB_WILDCARD in padded]
+    return [
+        path_keys
+        for padded, path_keys in unique.items()
+        if not any(
+            other != padded and all(key in (SUB_WILDCARD, own) for key, own in zip(other, padded, strict=True))
+            for other in wildcards
+        )
+    ]
+
+
+def _get_items(id_filter: Any) -> list[Any]:
+    """Return the items of an id filter: a single id or class, a collection of them, or None."""
+    if id_filter is None:
+        return []
+    if isinstance(id_filter, int | type):
+        return [id_filter]
+    return list(id_filter)
+
+
+def _get_keys(id_filter: Any) -> list[BranchKey]:
+    """Return the keys of an id (or cluster class) filter, the wildcard for None."""
+    if id_filter is None:
+        return [SUB_WILDCARD]
+    return [x if isinstance(x, int) else x.id for x in _get_items(id_filter)]
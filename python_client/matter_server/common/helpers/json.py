@@ -1,6 +1,7 @@
 """Helpers to work with (de)serializing of json."""
 
-from base64 import b64encode
+from binascii import b2a_base64
+from collections.abc import Callable
 from typing import Any
 
 import orjson
@@ -12,12 +13,34 @@ JSON_ENCODE_EXCEPTIONS = (TypeError, ValueError)
 JSON_DECODE_EXCEPTIONS = (orjson.JSONDecodeError,)
 
 
+def _encode_bytes(obj: bytes) -> str:
+    return b2a_base64(obj, newline=False).decode("ascii")
+
+
+def _encode_null(obj: Nullable) -> None:
+    return None
+
+
+# converters of the (exact) types that are most common in Matter payloads,
+# looked up before falling back to the isinstance checks in json_encoder_default
+_ENCODERS: dict[type, Callable[[Any], Any]] = {
+    uint: int,
+    float32: float,
+    Nullable: _encode_null,
+    bytes: _encode_bytes,
+    set: list,
+    tuple: list,
+}
+
+
 def json_encoder_default(obj: Any) -> Any:
     """Convert Special objects.
 
     Hand other objects to the original method.
     """
     # pylint: disable=too-many-return-statements
+    if (encoder := _ENCODERS.get(type(obj))) is not None:
+        return encoder(obj)
     if getattr(obj, "do_not_serialize", None):
         return None
     if isinstance(obj, (set, tuple)):
@@ -29,7 +52,7 @@ def json_encoder_default(obj: Any) -> Any:
     if isinstance(obj, Nullable):
         return None
     if isinstance(obj, bytes):
-        return b64encode(obj).decode("utf-8")
+        return _encode_bytes(obj)
     if isinstance(obj, Exception):
         return str(obj)
     if type(obj) is type:  # pylint: disable=unidiomatic-typecheck
@@ -38,7 +61,7 @@ def json_encoder_default(obj: Any) -> Any:
 
 
 def json_dumps(data: Any) -> str:
-    """Dump json string."""
+    """Dump (indented) json string, e.g. for diagnostics."""
     return orjson.dumps(
         data,
         option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
@@ -46,4 +69,13 @@ def json_dumps(data: Any) -> str:
     ).decode("utf-8")
 
 
+def json_dumps_compact(data: Any) -> str:
+    """Dump compact json string, for the messages sent over the wire."""
+    return orjson.dumps(
+        data,
+        option=orjson.OPT_NON_STR_KEYS,
+        default=json_encoder_default,
+    ).decode("utf-8")
+
+
 json_loads = orjson.loads
@@ -8,7 +8,7 @@ import binascii
 from dataclasses import MISSING, asdict, fields, is_dataclass
 from datetime import datetime
 from enum import Enum
-from functools import cache
+from functools import cache, partial
 from importlib.metadata import PackageNotFoundError, version as pkg_version
 import logging
 import platform
@@ -29,6 +29,8 @@ from chip.clusters.Types import Nullable, NullValue
 from chip.tlv import float32, uint
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from _typeshed import DataclassInstance
 
     from chip.clusters.ClusterObjects import (
@@ -180,7 +182,7 @@ def parse_value(
             value = None
 
     if is_dataclass(value_type) and isinstance(value, dict):
-        return dataclass_from_dict(value_type, value)  # type: ignore[arg-type]
+        return _dataclass_from_dict_reflective(value_type, value)  # type: ignore[arg-type]
     # get origin value type and inspect one-by-one
     origin: Any = get_origin(value_type)
     if origin in (list, tuple, set) and isinstance(value, (list, tuple, set)):
@@ -314,6 +316,23 @@ def dataclass_from_dict[T: DataclassInstance](  # type: ignore[valid-type]
 
     Including support for nested structures and common type conversions.
     If strict mode enabled, any additional keys in the provided dict will result in a KeyError.
+
+    The actual decoding is done by a specialized decoder, which is compiled (and cached)
+    once per dataclass/mode combination, see `compile_dataclass_decoder`.
+    """
+    return cast("_T", compile_dataclass_decoder(cls, strict, allow_sdk_types)(dict_obj))
+
+
+def _dataclass_from_dict_reflective[T: DataclassInstance](
+    cls: type[T],
+    dict_obj: dict,
+    strict: bool = False,
+    allow_sdk_types: bool = False,
+) -> T:
+    """
+    Create (instance of) a dataclass by inspecting its type hints on every call.
+
+    Reference implementation for `dataclass_from_dict`, used by `parse_value`.
     """
     dc_fields = cached_fields(cls)
     if strict:
@@ -339,6 +358,409 @@ def dataclass_from_dict[T: DataclassInstance](  # type: ignore[valid-type]
     )
 
 
+@cache
+def compile_dataclass_decoder(
+    cls: type[DataclassInstance],
+    strict: bool = False,
+    allow_sdk_types: bool = False,
+) -> Callable[[dict], DataclassInstance]:
+    """
+    Compile (and cache) a decoder that creates a dataclass instance from a dict.
+
+    All type introspection happens once, when the decoder is compiled, so decoding
+    a message only runs the (specialized) value parsers of the fields.
+    The decoder behaves exactly like the reflective `parse_value` based implementation.
+    """
+    dc_fields = cached_fields(cls)
+    field_names = frozenset(f.name for f in dc_fields)
+    type_hints = cached_type_hints(cls)
+    field_parsers = tuple(
+        (
+            field.name,
+            compile_value_parser(
+                f"{cls.__name__}.{field.name}",
+                type_hints[field.name],
+                field.default,
+                allow_none=not strict,
+                allow_sdk_types=allow_sdk_types,
+            ),
+        )
+        for field in dc_fields
+        if field.init
+    )
+
+    def decode(dict_obj: dict) -> DataclassInstance:
+        if strict:
+            extra_keys = dict_obj.keys() - field_names
+            if extra_keys:
+                raise KeyError(
+                    f"Extra key(s) {','.join(extra_keys)} not allowed for {cls!s}"
+                )
+        get_value = dict_obj.get
+        return cls(**{name: parser(get_value(name)) for name, parser in field_parsers})
+
+    return decode
+
+
+def compile_value_parser(
+    name: str,
+    value_type: Any,
+    default: Any = MISSING,
+    allow_none: bool = False,
+    allow_sdk_types: bool = False,
+) -> Callable[[Any], Any]:
+    """
+    Compile a parser for raw (json) values of a single type annotation.
+
+    The returned function is equivalent to calling `parse_value` with the same
+    arguments, but the type annotation is only inspected once.
+    """
+    origin: Any = get_origin(value_type)
+    if (
+        isinstance(value_type, str)
+        or origin is type
+        or (origin in (list, tuple, set, dict) and not get_args(value_type))
+    ):
+        # this shouldn't happen, leave these to the reflective parser
+        return partial(
+            _parse_value_reflective,
+            name,
+            value_type=value_type,
+            default=default,
+            allow_none=allow_none,
+            allow_sdk_types=allow_sdk_types,
+        )
+    try:
+        descriptor = getattr(value_type, "descriptor", None)
+    except NotImplementedError:
+        # (abstract) ClusterObject without descriptor
+        descriptor = None
+    tag_labels: dict[int, str] | None = None
+    if descriptor is not None:
+        # first match wins, like ClusterObjectDescriptor.GetFieldByTag
+        tag_labels = {
+            field_desc.Tag: field_desc.Label for field_desc in reversed(descriptor.Fields)
+        }
+    sdk_error_is_none = value_type in (None, Nullable, Any)
+    has_default = not isinstance(default, type(MISSING))
+    none_is_nullable = value_type is Nullable and allow_sdk_types
+    none_is_none = value_type is Nullable or value_type is NoneType
+    parse_body = _compile_value_body(name, value_type, origin, allow_none, allow_sdk_types)
+
+    def parse(value: Any) -> Any:
+        if value is None:
+            # handle value is None/missing but a default value is set
+            if has_default:
+                return default
+            if none_is_nullable:
+                return Nullable()
+            if none_is_none:
+                return None
+        elif isinstance(value, dict):
+            if tag_labels is not None:
+                # handle matter TLV dicts where the keys are just tag identifiers
+                value = {
+                    (
+                        tag_labels.get(int(key), key)
+                        if (isinstance(key, str) and key.isnumeric()) or isinstance(key, int)
+                        else key
+                    ): subvalue
+                    for key, subvalue in value.items()
+                }
+            # handle a parse error in the sdk which is returned as:
+            # {'TLVValue': None, 'Reason': None} or {'TLVValue': None}
+            if value.get("TLVValue", MISSING) is None:
+                if sdk_error_is_none:
+                    return None
+                value = None
+        return parse_body(value)
+
+    return parse
+
+
+def _parse_value_reflective(
+    name: str,
+    value: Any,
+    value_type: Any,
+    default: Any,
+    allow_none: bool,
+    allow_sdk_types: bool,
+) -> Any:
+    """Call parse_value with the (bound) arguments of a compiled parser."""
+    return parse_value(name, value, value_type, default, allow_none, allow_sdk_types)
+
+
+def _compile_value_body(
+    name: str,
+    value_type: Any,
+    origin: Any,
+    allow_none: bool,
+    allow_sdk_types: bool,
+) -> Callable[[Any], Any]:
+    """Compile the type specific part of a value parser."""
+    if is_dataclass(value_type):
+        return _compile_dataclass_value(
+            cast("type[DataclassInstance]", value_type),
+            _compile_plain_value(name, value_type, allow_none, allow_sdk_types),
+        )
+    if origin in (list, tuple, set):
+        return _compile_collection_value(
+            origin,
+            compile_value_parser(name, get_args(value_type)[0]),
+            _compile_plain_value(name, value_type, allow_none, allow_sdk_types),
+        )
+    if origin is dict:
+        return _compile_dict_value(value_type, allow_none, allow_sdk_types)
+    if origin is Union or origin is UnionType:
+        return _compile_union_value(name, value_type, allow_none, allow_sdk_types)
+    if value_type is Any:
+        # Any is basically unprocessable
+        return _identity
+    return _compile_plain_value(name, value_type, allow_none, allow_sdk_types)
+
+
+def _compile_dataclass_value(
+    dataclass_type: type[DataclassInstance],
+    parse_other: Callable[[Any], Any],
+) -> Callable[[Any], Any]:
+    """Compile the parser for a (nested) dataclass value."""
+    decode: Callable[[dict], DataclassInstance] | None = None
+
+    def parse_dataclass(value: Any) -> Any:
+        nonlocal decode
+        if not isinstance(value, dict):
+            return parse_other(value)
+        if decode is None:
+            # resolved lazily to allow (self) referencing dataclasses
+            decode = compile_dataclass_decoder(dataclass_type, False, False)
+        return decode(value)
+
+    return parse_dataclass
+
+
+def _compile_collection_value(
+    origin: type,
+    parse_item: Callable[[Any], Any],
+    parse_other: Callable[[Any], Any],
+) -> Callable[[Any], Any]:
+    """Compile the parser for a list, tuple or set value."""
+
+    def parse_list(value: Any) -> Any:
+        if isinstance(value, (list, tuple, set)):
+            return [parse_item(subvalue) for subvalue in value if subvalue is not None]
+        return parse_other(value)
+
+    def parse_collection(value: Any) -> Any:
+        if isinstance(value, (list, tuple, set)):
+            return origin(parse_item(subvalue) for subvalue in value if subvalue is not None)
+        return parse_other(value)
+
+    return parse_list if origin is list else parse_collection
+
+
+def _compile_dict_value(
+    value_type: Any,
+    allow_none: bool,
+    allow_sdk_types: bool,
+) -> Callable[[Any], Any]:
+    """Compile the parser for a dict value, where all keys and values are inspected."""
+    subkey_type, subvalue_type = get_args(value_type)
+
+    def parse_dict(value: Any) -> Any:
+        # the name of each item depends on its key, so these are parsed reflectively
+        return {
+            parse_value(subkey, subkey, subkey_type): parse_value(
+                f"{subkey}.value",
+                subvalue,
+                subvalue_type,
+                allow_none=allow_none,
+                allow_sdk_types=allow_sdk_types,
+            )
+            for subkey, subvalue in value.items()
+        }
+
+    if subkey_type is not str or subvalue_type is not Any:
+        return parse_dict
+
+    def parse_any_dict(value: Any) -> Any:
+        # fast path for the common dict[str, Any] (e.g. the raw attributes of a node)
+        result: dict[Any, Any] = {}
+        for subkey, subvalue in value.items():
+            if not isinstance(subkey, str):
+                return parse_dict(value)
+            result[b"" if subkey == "NOCStruct.noc" else subkey] = (
+                None
+                if isinstance(subvalue, dict) and subvalue.get("TLVValue", MISSING) is None
+                else subvalue
+            )
+        return result
+
+    return parse_any_dict
+
+
+def _compile_union_value(
+    name: str,
+    value_type: Any,
+    allow_none: bool,
+    allow_sdk_types: bool,
+) -> Callable[[Any], Any]:
+    """Compile the parser for a Union type, which tries all member types in order."""
+    sub_value_types = get_args(value_type)
+    none_is_null = Nullable in sub_value_types and allow_sdk_types
+    none_allowed = NoneType in sub_value_types
+    sub_parsers = tuple(
+        compile_value_parser(
+            name,
+            sub_arg_type,
+            allow_none=allow_none,
+            allow_sdk_types=allow_sdk_types,
+        )
+        for sub_arg_type in sub_value_types
+    )
+
+    def parse_union(value: Any) -> Any:
+        # return early if value is None and None or Nullable allowed
+        if value is None and none_is_null:
+            return NullValue
+        if value is None and none_allowed:
+            return None
+        # try all possible types until one succeeds
+        for sub_parser in sub_parsers:
+            try:
+                return sub_parser(value)
+            except (KeyError, TypeError, ValueError):
+                pass
+        # if we get to this point, all possibilities failed
+        # find out if we should raise or log this
+        err = (
+            f"Value {value} of type {type(value)} is invalid for {name}, "
+            f"expected value of type {value_type}"
+        )
+        if not none_allowed:
+            # raise exception, we have no idea how to handle this value
+            raise TypeError(err)
+        # failed to parse the (sub) value but None allowed, log only
+        logging.getLogger(__name__).warning(err)
+        return None
+
+    return parse_union
+
+
+def _compile_plain_value(
+    name: str,
+    value_type: Any,
+    allow_none: bool,
+    allow_sdk_types: bool,
+) -> Callable[[Any], Any]:
+    """Compile the parser for a plain value (enum, datetime, bytes, SDK types, etc.)."""
+    # pylint: disable=too-many-statements,too-many-locals
+    try:
+        is_enum = issubclass(value_type, Enum)
+        is_datetime = issubclass(value_type, datetime)
+    except TypeError:
+        # happens if value_type is not a class
+        is_enum = is_datetime = False
+    is_noc = name == "NOCStruct.noc"
+    # pylint: disable-next=protected-access
+    enum_values = value_type._value2member_map_ if is_enum else {}
+
+    def check_value(value: Any) -> Any:
+        # handle NOCStruct.noc which is typed/specified as bytes but parsed
+        # as integer in the tlv parser somehow.
+        if is_noc and not isinstance(value, bytes):
+            return b""
+        # If we reach this point, we could not match the value with the type and we raise
+        if not isinstance(value, value_type):
+            raise TypeError(
+                f"Value {value} of type {type(value)} is invalid for {name}, "
+                f"expected value of type {value_type}"
+            )
+        return value
+
+    def convert_enum(value: Any) -> Any:
+        try:
+            # handle enums from the SDK that have a value that does not exist in the enum (sigh)
+            if value not in enum_values:
+                # we do not want to crash so we return the raw value
+                return value
+            return value_type(value)
+        except TypeError:
+            return check_value(value)
+
+    def convert_datetime(value: Any) -> Any:
+        try:
+            return parse_utc_timestamp(value)
+        except TypeError:
+            return check_value(value)
+
+    def convert_float(value: Any) -> Any:
+        if isinstance(value, int):
+            return float(value)
+        return check_value(value)
+
+    def convert_int(value: Any) -> Any:
+        if isinstance(value, str) and value.isnumeric():
+            return int(value)
+        return check_value(value)
+
+    def convert_bytes(value: Any) -> Any:
+        # handle bytes values (sent over the wire as base64 encoded strings)
+        if isinstance(value, str):
+            try:
+                return b64decode(value.encode("utf-8"))
+            except binascii.Error:
+                # unfortunately sometimes the data is malformed
+                return b""
+        return check_value(value)
+
+    def convert_uint(value: Any) -> Any:
+        if is_noc and not isinstance(value, bytes):
+            return b""
+        if isinstance(value, int) or (isinstance(value, str) and value.isnumeric()):
+            return uint(value) if allow_sdk_types else int(value)  # type: ignore[arg-type]
+        return check_value(value)
+
+    def convert_float32(value: Any) -> Any:
+        if is_noc and not isinstance(value, bytes):
+            return b""
+        if isinstance(value, (float, int)) or (isinstance(value, str) and value.isnumeric()):
+            return float32(value) if allow_sdk_types else float(value)
+        return check_value(value)
+
+    convert = check_value
+    if is_enum:
+        convert = convert_enum
+    elif is_datetime:
+        convert = convert_datetime
+    elif value_type is float:
+        convert = convert_float
+    elif value_type is int:
+        convert = convert_int
+    elif value_type is bytes:
+        convert = convert_bytes
+    elif value_type is uint:
+        convert = convert_uint
+    elif value_type is float32:
+        convert = convert_float32
+    required_err = f"`{name}` of type `{value_type}` is required."
+
+    def parse_plain(value: Any) -> Any:
+        if value is None:
+            # handle value is None (but that is allowed)
+            if allow_none:
+                return None
+            # raise if value is None and the value is required according to annotations
+            raise KeyError(required_err)
+        return convert(value)
+
+    return parse_plain
+
+
+def _identity(value: Any) -> Any:
+    """Return the value as-is."""
+    return value
+
+
 def package_version(pkg_name: str) -> str:
     """
     Return the version of an installed package.
@@ -782,6 +782,8 @@ class PythonWriter {
 interface ClusterGenResult {
     fileName: string;
     className: string;
+    /** Cluster id, undefined for id-less "definitions" clusters */
+    clusterId?: number;
     content: string;
     crossClusterImports: Set<string>;
 }
@@ -1100,6 +1102,7 @@ function generateClusterFile(
     return {
         fileName: `${clusterName}.py`,
         className: clusterName,
+        clusterId,
         content,
         crossClusterImports,
     };
@@ -1687,10 +1690,12 @@ function generateObjectsReexport(clusterNames: string[]): string {
     w.line(" Cluster object definitions.");
     w.line(" This file is auto-generated, DO NOT edit.");
     w.line(" Users can import chip.clusters.Objects to get all cluster definitions.");
+    w.line(" The cluster classes are imported lazily, on first access.");
     w.line('"""');
     w.blankLine();
-    w.line("# Re-export all cluster classes from per-cluster files");
-    w.line("from chip.clusters.cluster_defs import *  # noqa: F401,F403");
+    w.line("import typing");
+    w.blankLine();
+    w.line("from chip.clusters import cluster_defs");
     w.blankLine();
     w.line("# Also re-export base classes and primitive types for backward compatibility");
     w.line("from chip.clusters.ClusterObjects import (  # noqa: F401");
@@ -1705,6 +1710,10 @@ function generateObjectsReexport(clusterNames: string[]): string {
     w.line("from chip.clusters.Types import NullValue, Nullable  # noqa: F401");
     w.line("from chip.tlv import float32, uint  # noqa: F401");
     w.blankLine();
+    w.line("if typing.TYPE_CHECKING:");
+    w.line("    # Re-export all cluster classes from per-cluster files");
+    w.line("    from chip.clusters.cluster_defs import *  # noqa: F401,F403");
+    w.blankLine();
 
     // __all__ for mypy: explicitly list all exports so mypy knows what this module provides
     w.line("__all__ = [");
@@ -1725,6 +1734,20 @@ function generateObjectsReexport(clusterNames: string[]): string {
     }
     w.popIndent();
     w.line("]");
+    w.blankLine();
+    w.blankLine();
+    w.line("def __getattr__(name: str) -> typing.Any:");
+    w.pushIndent();
+    w.line("if name not in cluster_defs.__all__:");
+    w.line("    raise AttributeError(f\"module {__name__!r} has no attribute {name!r}\")");
+    w.line("value = getattr(cluster_defs, name)");
+    w.line("globals()[name] = value");
+    w.line("return value");
+    w.popIndent();
+    w.blankLine();
+    w.blankLine();
+    w.line("def __dir__() -> typing.List[str]:");
+    w.line("    return sorted(set(globals()) | set(__all__))");
 
     return w.toString();
 }
@@ -1733,16 +1756,36 @@ function generateObjectsReexport(clusterNames: string[]): string {
 // cluster_defs/__init__.py
 // ============================================================================
 
-function generateObjectsInit(clusterNames: string[]): string {
+function generateObjectsInit(clusterNames: string[], results: ClusterGenResult[]): string {
     const w = new PythonWriter();
 
-    w.line('"""Auto-generated cluster imports (DO NOT edit)."""');
+    w.line('"""Auto-generated cluster imports (DO NOT edit).');
     w.blankLine();
-
+    w.line("The cluster modules are imported lazily: on first access of a cluster class here");
+    w.line("(or in chip.clusters.Objects) or on lookup of its id in the ALL_* registries.");
+    w.line('"""');
+    w.blankLine();
+    w.line("import importlib");
+    w.line("import sys");
+    w.line("import types");
+    w.line("import typing");
+    w.blankLine();
+    w.line("if typing.TYPE_CHECKING:");
+    w.pushIndent();
     for (const name of clusterNames) {
         w.line(`from .${name} import ${name}`);
     }
-
+    w.popIndent();
+    w.blankLine();
+    w.line("# cluster id -> name of the module (and class) defining the cluster");
+    w.line("CLUSTER_MODULES: typing.Dict[int, str] = {");
+    w.pushIndent();
+    const withId = results.filter(r => r.clusterId !== undefined).sort((a, b) => a.clusterId! - b.clusterId!);
+    for (const r of withId) {
+        w.line(`${hex8(r.clusterId!)}: "${r.className}",`);
+    }
+    w.popIndent();
+    w.line("}");
     w.blankLine();
     w.line("__all__ = [");
     w.pushIndent();
@@ -1752,6 +1795,43 @@ function generateObjectsInit(clusterNames: string[]): string {
     w.popIndent();
     w.line("]");
     w.blankLine();
+    w.blankLine();
+    w.line("class _LazyClusterDefs(types.ModuleType):");
+    w.pushIndent();
+    w.line("def __setattr__(self, name: str, value: typing.Any) -> None:");
+    w.pushIndent();
+    w.line("# importing a cluster module binds the module on this package, bind its cluster class instead");
+    w.line('if name in __all__ and isinstance(value, types.ModuleType) and value.__name__ == f"{self.__name__}.{name}":');
+    w.line("    value = getattr(value, name)");
+    w.line("super().__setattr__(name, value)");
+    w.popIndent();
+    w.popIndent();
+    w.blankLine();
+    w.blankLine();
+    w.line("def __getattr__(name: str) -> typing.Any:");
+    w.pushIndent();
+    w.line("if name not in __all__:");
+    w.line("    raise AttributeError(f\"module {__name__!r} has no attribute {name!r}\")");
+    w.line('value = getattr(importlib.import_module(f".{name}", __name__), name)');
+    w.line("globals()[name] = value");
+    w.line("return value");
+    w.popIndent();
+    w.blankLine();
+    w.blankLine();
+    w.line("def __dir__() -> typing.List[str]:");
+    w.line("    return sorted(set(globals()) | set(__all__))");
+    w.blankLine();
+    w.blankLine();
+    w.line("def import_all() -> None:");
+    w.pushIndent();
+    w.line('"""Import all cluster modules at once (eager loading)."""');
+    w.line("for name in __all__:");
+    w.line("    if name not in globals():");
+    w.line("        __getattr__(name)");
+    w.popIndent();
+    w.blankLine();
+    w.blankLine();
+    w.line("sys.modules[__name__].__class__ = _LazyClusterDefs");
 
     return w.toString();
 }
@@ -1774,6 +1854,24 @@ function generateDeviceTypes(): string {
     w.line("from chip.clusters import Objects as all_clusters");
     w.line("from chip.clusters.ClusterObjects import Cluster");
     w.blankLine();
+    w.line("ALL_TYPES: dict[int, type[DeviceType]] = {}");
+    w.blankLine();
+    w.blankLine();
+    w.line("class _DeviceTypeClusters:");
+    w.pushIndent();
+    w.line('"""Resolve the clusters of a device type on first access (they are imported lazily)."""');
+    w.blankLine();
+    w.line("def __init__(self) -> None:");
+    w.line("    self._resolved: dict[type[DeviceType], set[type[Cluster]]] = {}");
+    w.blankLine();
+    w.line("def __get__(self, instance: DeviceType | None, owner: type[DeviceType]) -> set[type[Cluster]]:");
+    w.pushIndent();
+    w.line("if (clusters := self._resolved.get(owner)) is None:");
+    w.line("    clusters = {getattr(all_clusters, name) for name in owner.cluster_names}");
+    w.line("    self._resolved[owner] = clusters");
+    w.line("return clusters");
+    w.popIndent();
+    w.popIndent();
 
     // Collect cluster names for lookup
     const clustersByName = new Map<string, ClusterModel>();
@@ -1781,7 +1879,6 @@ function generateDeviceTypes(): string {
         if (c.id !== undefined) clustersByName.set(c.name, c);
     }
 
-    w.line("ALL_TYPES: dict[int, type[DeviceType]] = {}");
     w.blankLine();
     w.blankLine();
 
@@ -1790,7 +1887,8 @@ function generateDeviceTypes(): string {
     w.line('"""Base class for Matter device types."""');
     w.blankLine();
     w.line("device_type: int = 0");
-    w.line("clusters: set[type[Cluster]] = set()");
+    w.line("cluster_names: tuple[str, ...] = ()");
+    w.line("clusters = _DeviceTypeClusters()");
     w.blankLine();
     w.line("def __init_subclass__(cls, **kwargs: object) -> None:");
     w.pushIndent();
@@ -1817,7 +1915,7 @@ function generateDeviceTypes(): string {
         for (const req of requirements) {
             const clusterName = req.name;
             if (clustersByName.has(clusterName)) {
-                clusterRefs.push(`all_clusters.${clusterName}`);
+                clusterRefs.push(`"${clusterName}"`);
             }
         }
 
@@ -1826,15 +1924,17 @@ function generateDeviceTypes(): string {
         w.line(`device_type: int = 0x${dt.id.toString(16).toUpperCase().padStart(4, "0")}`);
 
         if (clusterRefs.length === 0) {
-            w.line("clusters: set[type[Cluster]] = set()");
+            w.line("cluster_names: tuple[str, ...] = ()");
+        } else if (clusterRefs.length === 1) {
+            w.line(`cluster_names: tuple[str, ...] = (${clusterRefs[0]},)`);
         } else {
-            w.line("clusters: set[type[Cluster]] = {");
+            w.line("cluster_names: tuple[str, ...] = (");
             w.pushIndent();
             for (const ref of clusterRefs.sort()) {
                 w.line(`${ref},`);
             }
             w.popIndent();
-            w.line("}");
+            w.line(")");
         }
 
         w.popIndent();
@@ -1900,7 +2000,7 @@ function main(): void {
 
     // Generate cluster_defs/__init__.py
     const allNames = ["Globals", ...results.map(r => r.className).sort()];
-    const initContent = generateObjectsInit(allNames);
+    const initContent = generateObjectsInit(allNames, results);
     writeFileSync(join(objectsDir, "__init__.py"), initContent);
 
     // Generate Objects.py re-export
@@ -0,0 +1,129 @@
+"""
+Generate the static cluster index (chip/clusters/cluster_defs/_index.py).
+
+The index holds the ids, names, field tags/types and enum values of the generated
+cluster definitions, so paths, names and types can be resolved without importing
+(and executing) the cluster class bodies. Run after generate-python-clusters.ts:
+
+    .venv/bin/python scripts/generate_cluster_index.py
+"""
+
+from __future__ import annotations
+
+import enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from chip.clusters import cluster_defs
+from chip.clusters.ClusterIndex import FLAG_LIST, FLAG_NULLABLE, FLAG_OPTIONAL
+from chip.clusters.ClusterObjects import (
+    ALL_ACCEPTED_COMMANDS,
+    ALL_ATTRIBUTES,
+    ALL_CLUSTERS,
+    ALL_EVENTS,
+    ALL_GENERATED_COMMANDS,
+    ClusterObject,
+    _ResolveFieldType,
+)
+from chip.tlv import float32, uint
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from chip.clusters.ClusterObjects import ClusterObjectFieldDescriptor
+
+INDEX_FILE = Path(__file__).parent.parent / "chip" / "clusters" / "cluster_defs" / "_index.py"
+
+TYPE_NAMES: dict[Any, str] = {
+    uint: "uint",
+    int: "int",
+    bool: "bool",
+    str: "str",
+    bytes: "bytes",
+    float32: "float32",
+    float: "float",
+}
+
+HEADER = '''"""
+Static index of the generated cluster definitions (auto-generated, DO NOT edit).
+
+Generated by scripts/generate_cluster_index.py, use chip.clusters.ClusterIndex to query it.
+"""
+
+# cluster id -> (name, attributes, events, accepted commands, generated commands)
+#   attributes: attribute id -> (name, label, type, flags)
+#   events/commands: id -> (name, {tag: (label, type, flags)})
+'''
+
+
+def type_entry(field_type: Any) -> tuple[str, int]:
+    """Return the (type name, flags) of a field type annotation."""
+    element_type, is_list, nullable, optional = _ResolveFieldType(field_type)  # type: ignore[no-untyped-call]
+    name = TYPE_NAMES.get(element_type) or element_type.__qualname__
+    flags = (FLAG_LIST if is_list else 0) | (FLAG_NULLABLE if nullable else 0) | (FLAG_OPTIONAL if optional else 0)
+    return name, flags
+
+
+def field_entry(field: ClusterObjectFieldDescriptor) -> str:
+    """Return the index entry of a struct/event/command field."""
+    name, flags = type_entry(field.Type)
+    return f"0x{field.Tag:X}: ({field.Label!r}, {name!r}, {flags})"
+
+
+def fields_entry(cls: type[ClusterObject]) -> str:
+    """Return the index entry of all fields of a struct/event/command."""
+    return "{" + ", ".join(field_entry(field) for field in cls.descriptor.Fields) + "}"
+
+
+def nested_classes(cls: type) -> Iterator[type]:
+    """Yield all classes nested in the (cluster) class, recursively."""
+    for value in vars(cls).values():
+        if isinstance(value, type) and value.__qualname__ == f"{cls.__qualname__}.{value.__name__}":
+            yield value
+            yield from nested_classes(value)
+
+
+def generate() -> str:
+    """Return the source of the index module."""
+    cluster_defs.import_all()
+    lines = [HEADER, "CLUSTERS = {"]
+    for cluster_id, cluster in sorted(ALL_CLUSTERS.items()):
+        lines.append(f"    0x{cluster_id:08X}: (")
+        lines.append(f"        {cluster.__name__!r},")
+        lines.append("        {")
+        for attribute_id, attribute in sorted(ALL_ATTRIBUTES.get(cluster_id, {}).items()):
+            field = cluster.descriptor.GetFieldByTag(attribute_id)
+            name, flags = type_entry(attribute.attribute_type.Type)
+            label = field.Label if field is not None else None
+            lines.append(f"            0x{attribute_id:08X}: ({attribute.__name__!r}, {label!r}, {name!r}, {flags}),")
+        lines.append("        },")
+        for registry in (ALL_EVENTS, ALL_ACCEPTED_COMMANDS, ALL_GENERATED_COMMANDS):
+            lines.append("        {")
+            for object_id, cls in sorted(registry.get(cluster_id, {}).items()):
+                lines.append(f"            0x{object_id:08X}: ({cls.__name__!r}, {fields_entry(cls)}),")
+            lines.append("        },")
+        lines.append("    ),")
+    lines.append("}")
+
+    structs: list[str] = []
+    enums: list[str] = []
+    for name in cluster_defs.__all__:
+        for cls in nested_classes(getattr(cluster_defs, name)):
+            if issubclass(cls, enum.Enum):
+                values = ", ".join(f"{name!r}: {member.value}" for name, member in cls.__members__.items())
+                enums.append(f"    {cls.__qualname__!r}: {{{values}}},")
+            elif issubclass(cls, ClusterObject) and ".Structs." in cls.__qualname__:
+                structs.append(f"    {cls.__qualname__!r}: {fields_entry(cls)},")
+    lines += ["", "# qualified struct name -> {tag: (label, type, flags)}", "STRUCTS = {", *structs, "}"]
+    lines += ["", "# qualified enum/bitmap name -> {member name: value}", "ENUMS = {", *enums, "}"]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    """Generate the index file."""
+    INDEX_FILE.write_text(generate())
+    print(f"Generated {INDEX_FILE}")
+
+
+if __name__ == "__main__":
+    main()
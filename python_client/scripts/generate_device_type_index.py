@@ -0,0 +1,74 @@
+"""
+Generate the static device type index (matter_server/client/models/device_type_index_data.py).
+
+The index maps the clusters to bits of a cluster set (bitmask) and holds the required
+(server) clusters of each device type as such a bitmask, plus the reverse mapping of
+each cluster to the device types requiring it. Run after generate-python-clusters.ts:
+
+    .venv/bin/python scripts/generate_device_type_index.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from matter_server.client.models.device_types import ALL_TYPES
+
+INDEX_FILE = Path(__file__).parent.parent / "matter_server" / "client" / "models" / "device_type_index_data.py"
+LINE_LENGTH = 120
+
+HEADER = '''"""
+Static index of the device types (auto-generated, DO NOT edit).
+
+Generated by scripts/generate_device_type_index.py, use device_type_index to query it.
+"""
+'''
+
+
+def generate() -> str:
+    """Return the source of the index module."""
+    device_type_clusters = {
+        device_type_id: sorted(cluster.id for cluster in device_type.clusters)
+        for device_type_id, device_type in sorted(ALL_TYPES.items())
+    }
+    # the clusters that are required by the most device types get the lowest bits
+    usage: dict[int, int] = {}
+    for cluster_ids in device_type_clusters.values():
+        for cluster_id in cluster_ids:
+            usage[cluster_id] = usage.get(cluster_id, 0) + 1
+    cluster_bits = {cluster_id: bit for bit, cluster_id in enumerate(sorted(usage, key=lambda x: (-usage[x], x)))}
+
+    lines = [HEADER, "# cluster id -> bit of the cluster in a cluster set", "CLUSTER_BITS: dict[int, int] = {"]
+    lines += [f"    0x{cluster_id:04X}: {bit}," for cluster_id, bit in cluster_bits.items()]
+    lines += ["}", "", "# device type id -> cluster set of the required (server) clusters"]
+    lines.append("DEVICE_TYPE_CLUSTERS: dict[int, int] = {")
+    for device_type_id, cluster_ids in device_type_clusters.items():
+        mask = sum(1 << cluster_bits[cluster_id] for cluster_id in cluster_ids)
+        lines.append(f"    0x{device_type_id:04X}: 0x{mask:X},")
+    lines += ["}", "", "# cluster id -> ids of the device types requiring the cluster"]
+    lines.append("CLUSTER_DEVICE_TYPES: dict[int, tuple[int, ...]] = {")
+    for cluster_id in sorted(cluster_bits):
+        device_type_ids = [x for x, cluster_ids in device_type_clusters.items() if cluster_id in cluster_ids]
+        if len(device_type_ids) == 1:
+            lines.append(f"    0x{cluster_id:04X}: (0x{device_type_ids[0]:04X},),")
+            continue
+        # formatted like ruff format does: on a single line if it fits
+        line = f"    0x{cluster_id:04X}: ({', '.join(f'0x{x:04X}' for x in device_type_ids)}),"
+        if len(line) <= LINE_LENGTH:
+            lines.append(line)
+            continue
+        lines.append(f"    0x{cluster_id:04X}: (")
+        lines += [f"        0x{x:04X}," for x in device_type_ids]
+        lines.append("    ),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    """Generate the index file."""
+    INDEX_FILE.write_text(generate())
+    print(f"Generated {INDEX_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Tests for matter_server.client.models.attribute_index."""
+
+from __future__ import annotations
+
+from matter_server.client.models.attribute_index import AttributeIndex, parse_path
+
+PATHS = ["0/29/0", "0/40/5", "1/6/0", "1/6/16387", "1/8/0", "2/6/0"]
+
+
+def test_add_and_lookup() -> None:
+    """Paths are parsed once into integer ids, and looked up by ids."""
+    index = AttributeIndex(PATHS)
+    assert len(index) == len(PATHS)
+    assert index.add("1/6/0") == (1, 6, 0)
+    assert parse_path("3/6/0") == (3, 6, 0)
+    assert parse_path("3/6/0") is parse_path(str(3) + "/6/0")
+    assert (3, 6, 0) not in index
+    assert (1, 6, 16387) in index
+    assert index.get_path(1, 8, 0) == "1/8/0"
+    assert index.get_path(1, 8, 1) is None
+    assert index.get_attributes(1, 6) == {0: "1/6/0", 16387: "1/6/16387"}
+    assert index.get_attributes(5, 6) == {}
+    # the paths are interned, so they are shared between (the indexes of) nodes
+    assert AttributeIndex([str(1) + "/6/0"]).get_path(1, 6, 0) is index.get_path(1, 6, 0)
+
+
+def test_query() -> None:
+    """Wildcard queries only touch the matching endpoints/clusters."""
+    index = AttributeIndex(PATHS)
+    assert [path for _, path in index.query(cluster_id=6)] == ["1/6/0", "1/6/16387", "2/6/0"]
+    assert [ids for ids, _ in index.query(cluster_id=6, attribute_id=0)] == [(1, 6, 0), (2, 6, 0)]
+    assert [path for _, path in index.query(endpoint_id=1)] == ["1/6/0", "1/6/16387", "1/8/0"]
+    assert [path for _, path in index.query(endpoint_id=1, cluster_id=8)] == ["1/8/0"]
+    assert [path for _, path in index.query(endpoint_id=3, cluster_id=8)] == []
+    assert [path for _, path in index.query(1, 6, 16387)] == ["1/6/16387"]
+    assert [path for _, path in index.query()] == PATHS
+
+
+def test_remove_and_update() -> None:
+    """Removed paths disappear from all sub-indexes."""
+    index = AttributeIndex(PATHS)
+    index.remove("2/6/0")
+    index.remove("2/6/0")
+    assert 2 not in index.by_endpoint
+    assert list(index.by_cluster[6]) == [1]
+    assert index.remove_endpoint(1) == ["1/6/0", "1/6/16387", "1/8/0"]
+    assert 6 not in index.by_cluster
+    assert [path for _, path in index.query()] == ["0/29/0", "0/40/5"]
+
+    assert index.update(["0/29/0", "3/6/0"]) == ["0/40/5"]
+    assert [path for _, path in index.query()] == ["0/29/0", "3/6/0"]
+    assert index.by_cluster[6][3] is index.by_endpoint[3][6]
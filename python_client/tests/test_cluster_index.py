@@ -0,0 +1,98 @@
+"""Tests for the static cluster index (chip.clusters.ClusterIndex)."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+from chip.clusters import ClusterIndex, Objects as clusters
+from chip.clusters.ClusterIndex import FLAG_LIST, FLAG_NULLABLE, FLAG_OPTIONAL
+from chip.tlv import uint
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+
+def test_index_is_up_to_date() -> None:
+    """The generated index must match the cluster definitions it is generated from."""
+    spec = importlib.util.spec_from_file_location("generate_cluster_index", SCRIPTS_DIR / "generate_cluster_index.py")
+    assert spec is not None
+    assert spec.loader is not None
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+    assert generator.INDEX_FILE.read_text() == generator.generate(), (
+        "cluster index is outdated, run scripts/generate_cluster_index.py"
+    )
+
+
+def test_cluster_lookups() -> None:
+    """Clusters are looked up by id and name, the class is only imported on request."""
+    on_off = ClusterIndex.GetCluster(0x0006)
+    assert on_off == (0x0006, "OnOff")
+    assert ClusterIndex.GetClusterByName("OnOff") == on_off
+    assert on_off.cluster_class is clusters.OnOff
+    attributes = vars(clusters.OnOff.Attributes).values()
+    assert set(on_off.attributes) == {x.attribute_id for x in attributes if hasattr(x, "attribute_id")}
+    assert ClusterIndex.GetCluster(0xFFF1FC01) is None
+    assert ClusterIndex.GetClusterByName("NoSuchCluster") is None
+
+
+def test_attribute_lookups() -> None:
+    """Attributes resolve to their name, label and type (name and flags)."""
+    attribute = ClusterIndex.GetAttribute(0x0006, 0x4003)
+    assert attribute is not None
+    assert attribute.name == "StartUpOnOff"
+    assert attribute.label == "startUpOnOff"
+    assert attribute.type == "OnOff.Enums.StartUpOnOffEnum"
+    assert attribute.flags == FLAG_NULLABLE | FLAG_OPTIONAL
+    assert attribute.field.nullable
+    assert attribute.field.optional
+    assert not attribute.field.is_list
+    assert attribute.attribute_class is clusters.OnOff.Attributes.StartUpOnOff
+    assert ClusterIndex.ResolveType(attribute.type) is clusters.OnOff.Enums.StartUpOnOffEnum
+
+    parts_list = ClusterIndex.GetAttribute(0x001D, 0x0003)
+    assert parts_list is not None
+    assert parts_list.type == "uint"
+    assert parts_list.flags == FLAG_LIST
+    assert ClusterIndex.ResolveType(parts_list.type) is uint
+
+    assert ClusterIndex.GetAttribute(0x0006, 0x1234) is None
+    assert ClusterIndex.GetAttribute(0xFFF1FC01, 0x0000) is None
+
+
+def test_resolve_attribute_path() -> None:
+    """Concrete attribute paths of known attributes are resolved, others return None."""
+    resolved = ClusterIndex.ResolveAttributePath("1/8/0")
+    assert resolved is not None
+    endpoint_id, cluster, attribute = resolved
+    assert endpoint_id == 1
+    assert cluster.name == "LevelControl"
+    assert attribute.name == "CurrentLevel"
+    assert ClusterIndex.ResolveAttributePath("1/8/4660") is None
+    assert ClusterIndex.ResolveAttributePath("1/*/0") is None
+    assert ClusterIndex.ResolveAttributePath("1/8") is None
+
+
+def test_event_command_struct_and_enum_lookups() -> None:
+    """Events, commands, structs and enums resolve to their fields/values."""
+    event = ClusterIndex.GetEvent(0x003B, 0x0001)
+    assert event is not None
+    assert event.name == "InitialPress"
+    assert [field.label for field in event.fields] == ["newPosition"]
+    assert event.event_class is clusters.Switch.Events.InitialPress
+
+    command = ClusterIndex.GetCommand(0x0006, 0x0042)
+    assert command is not None
+    assert command.name == "OnWithTimedOff"
+    assert [field.label for field in command.fields] == ["onOffControl", "onTime", "offWaitTime"]
+    assert command.command_class is clusters.OnOff.Commands.OnWithTimedOff
+    assert ClusterIndex.GetCommand(0x0006, 0x0042, isClient=False) is None
+
+    fields = ClusterIndex.GetStructFields("Descriptor.Structs.DeviceTypeStruct")
+    assert fields is not None
+    assert [(field.label, field.type) for field in fields] == [("deviceType", "uint"), ("revision", "uint")]
+    assert ClusterIndex.GetStructFields("Descriptor.Structs.NoSuchStruct") is None
+
+    values = ClusterIndex.GetEnumValues("OnOff.Enums.StartUpOnOffEnum")
+    assert values == {member.name: member.value for member in clusters.OnOff.Enums.StartUpOnOffEnum}
+    assert ClusterIndex.GetEnumValues("OnOff.Enums.NoSuchEnum") is None
@@ -0,0 +1,287 @@
+"""Tests for the chip cluster object base classes (chip.clusters.ClusterObjects)."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from enum import Enum
+from operator import attrgetter
+import re
+import typing
+from typing import Any
+
+import pytest
+
+from chip import tlv
+from chip.clusters import Objects as clusters
+from chip.clusters.ClusterObjects import (
+    ALL_ATTRIBUTES,
+    ALL_CLUSTERS,
+    Cluster,
+    ClusterAttributeDescriptor,
+    ClusterObject,
+    ClusterObjectDescriptor,
+    ClusterObjectFieldDescriptor,
+)
+from chip.clusters.Types import Nullable, NullValue
+from chip.tlv import float32, uint
+
+
+def test_descriptor_is_built_once_per_class() -> None:
+    """The descriptor of a cluster object is memoized, per class."""
+    descriptor = clusters.OnOff.descriptor
+    assert clusters.OnOff.descriptor is descriptor
+    assert clusters.OnOff().descriptor is descriptor
+    assert clusters.LevelControl.descriptor is not descriptor
+    struct_descriptor = clusters.Descriptor.Structs.DeviceTypeStruct.descriptor
+    assert clusters.Descriptor.Structs.DeviceTypeStruct.descriptor is struct_descriptor
+    command_descriptor = clusters.OnOff.Commands.OnWithTimedOff.descriptor
+    assert clusters.OnOff.Commands.OnWithTimedOff.descriptor is command_descriptor
+
+
+def test_descriptor_field_lookups() -> None:
+    """Fields can be looked up by tag and label, the first field wins on duplicates."""
+    first = ClusterObjectFieldDescriptor(Label="a", Tag=1, Type=int)
+    descriptor = ClusterObjectDescriptor(
+        Fields=[
+            first,
+            ClusterObjectFieldDescriptor(Label="b", Tag=2, Type=str),
+            ClusterObjectFieldDescriptor(Label="a", Tag=1, Type=bool),
+        ]
+    )
+    assert descriptor.GetFieldByTag(1) is first
+    assert descriptor.GetFieldByLabel("a") is first
+    assert descriptor.GetFieldByTag(2).Label == "b"  # type: ignore[union-attr]
+    assert descriptor.GetFieldByTag(3) is None
+    assert descriptor.GetFieldByLabel("c") is None
+    # the lookup tables are not part of the dataclass comparison
+    assert descriptor == ClusterObjectDescriptor(Fields=list(descriptor.Fields))
+
+
+def test_generated_descriptor_lookups() -> None:
+    """Generated cluster descriptors resolve attribute ids to their fields."""
+    field = clusters.OnOff.descriptor.GetFieldByTag(clusters.OnOff.Attributes.OnTime.attribute_id)
+    assert field is not None
+    assert field.Label == "onTime"
+    assert clusters.OnOff.descriptor.GetFieldByLabel("onTime") is field
+
+
+def test_attribute_wrapper_is_created_once_per_class() -> None:
+    """The internal wrapper dataclass of an attribute is memoized, per attribute class."""
+    wrapper = clusters.OnOff.Attributes.OnOff._cluster_object
+    assert clusters.OnOff.Attributes.OnOff._cluster_object is wrapper
+    assert clusters.OnOff.Attributes.OnTime._cluster_object is not wrapper
+    assert wrapper.descriptor is clusters.OnOff.Attributes.OnOff._cluster_object.descriptor
+    assert clusters.OnOff.Attributes.OnOff.attribute_type is clusters.OnOff.Attributes.OnOff.attribute_type
+
+
+def test_attribute_tlv_round_trip() -> None:
+    """Attribute values survive a TLV round trip through the (memoized) wrapper."""
+    device_types = [
+        clusters.Descriptor.Structs.DeviceTypeStruct(deviceType=uint(0x0100), revision=uint(3)),
+        clusters.Descriptor.Structs.DeviceTypeStruct(deviceType=uint(0x0013), revision=uint(1)),
+    ]
+    for _ in range(2):
+        device_type_list = clusters.Descriptor.Attributes.DeviceTypeList
+        assert device_type_list.FromTLV(bytes(device_type_list.ToTLV(None, device_types))) == device_types
+        start_up = clusters.OnOff.Attributes.StartUpOnOff
+        assert start_up.FromTLV(bytes(start_up.ToTLV(None, NullValue))) == NullValue
+        value = clusters.OnOff.Enums.StartUpOnOffEnum.kToggle
+        assert start_up.FromTLV(bytes(start_up.ToTLV(None, value))) == value
+    assert clusters.OnOff.Attributes.OnOff.FromTagDictOrRawValue(True) is True
+
+
+def test_tlv_to_dict_selected_fields() -> None:
+    """Only the requested fields are decoded from a TLV encoded struct."""
+    entry = clusters.AccessControl.Structs.AccessControlEntryStruct(
+        privilege=clusters.AccessControl.Enums.AccessControlEntryPrivilegeEnum.kAdminister,
+        authMode=clusters.AccessControl.Enums.AccessControlEntryAuthModeEnum.kCase,
+        subjects=[uint(1), uint(2)],
+        targets=[clusters.AccessControl.Structs.AccessControlTargetStruct(cluster=uint(6))],
+        fabricIndex=uint(1),
+    )
+    descriptor = entry.descriptor
+    payload = entry.ToTLV()
+    full = descriptor.TLVToDict(payload)
+    assert descriptor.TLVToDict(payload, ["fabricIndex", "targets"]) == {
+        "targets": full["targets"],
+        "fabricIndex": 1,
+    }
+    assert descriptor.TLVToDict(payload, []) == {}
+    with pytest.raises(ValueError, match="Unknown field"):
+        descriptor.TLVToDict(payload, ["unknown"])
+
+
+def _make_tlv_value(value_type: Any, prefer_null: bool, depth: int = 0) -> Any:
+    """Create a decoded TLV value (tag dicts, lists, scalars) for a field type."""
+    if typing.get_origin(value_type) is typing.Union:
+        args = typing.get_args(value_type)
+        if prefer_null and Nullable in args:
+            return None
+        sub_types = [arg for arg in args if arg not in (type(None), Nullable)]
+        return _make_tlv_value(sub_types[0], prefer_null, depth)
+    if typing.get_origin(value_type) is list:
+        (item_type,) = typing.get_args(value_type)
+        return [] if depth > 2 else [_make_tlv_value(item_type, prefer_null, depth + 1) for _ in range(2)]
+    if issubclass(value_type, ClusterObject):
+        return {
+            field.Tag: _make_tlv_value(field.Type, prefer_null, depth + 1)
+            for field in value_type.descriptor.Fields
+            if not (
+                prefer_null
+                and typing.get_origin(field.Type) is typing.Union
+                and type(None) in typing.get_args(field.Type)
+            )
+        }
+    if issubclass(value_type, Enum):
+        member = next(iter(value_type), None)
+        return uint(0 if member is None else member.value)
+    values: dict[type, Any] = {
+        bool: True,
+        float: 1.5,
+        float32: float32(2.5),
+        str: "value",
+        bytes: b"\x00\x01",
+        int: -3,
+        uint: uint(7),
+    }
+    return values[value_type]
+
+
+def _cluster_objects(cluster: type[Cluster]) -> list[type[ClusterObject]]:
+    """Return the cluster and all cluster objects (structs, commands, events) nested in it."""
+    result: list[type[ClusterObject]] = [cluster]
+    for name in ("Structs", "Commands", "Events"):
+        container = getattr(cluster, name, None)
+        if container is not None:
+            result.extend(
+                obj for obj in vars(container).values() if isinstance(obj, type) and issubclass(obj, ClusterObject)
+            )
+    return result
+
+
+def _interpreted_struct_round_trip(cls: type[ClusterObject], raw: dict) -> tuple[Any, bytes]:
+    obj = cls.FromDict(cls.descriptor.TagDictToLabelDict("", raw))
+    return obj, cls.descriptor.DictToTLV(asdict(obj))
+
+
+def _interpreted_attribute_round_trip(attribute: type[ClusterAttributeDescriptor], raw: Any) -> tuple[Any, bytes]:
+    obj_class: Any = attribute._cluster_object
+    value = obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict("", {0: raw})).Value
+    writer = tlv.TLVWriter()
+    attribute.attribute_type.PutFieldToTLV(None, asdict(obj_class(Value=value))["Value"], writer, "")
+    return value, bytes(writer.encoding)
+
+
+def _compiled_encode(encoder: Any, value: Any) -> bytes:
+    writer = tlv.TLVWriter()
+    encoder(writer, None, value)
+    return bytes(writer.encoding)
+
+
+def _assert_compiled_raises(obj: Any, raw: Any, err: Exception) -> None:
+    """Assert the compiled decode and encode of a value raise the error of the interpreted path."""
+    with pytest.raises(type(err), match=re.escape(str(err))):
+        _compiled_encode(obj._tlv_encoder, obj._tlv_decoder(raw))
+
+
+@pytest.mark.parametrize(
+    "cluster", sorted(ALL_CLUSTERS.values(), key=attrgetter("id")), ids=lambda cluster: cluster.__name__
+)
+def test_compiled_tlv_matches_interpreted(cluster: type[Cluster]) -> None:
+    """The compiled encoders/decoders give the same results (and errors) as the interpreted descriptors."""
+    for prefer_null in (False, True):
+        for cls in _cluster_objects(cluster):
+            raw = _make_tlv_value(cls, prefer_null)
+            try:
+                expected, expected_tlv = _interpreted_struct_round_trip(cls, raw)
+            except (TypeError, ValueError) as err:
+                # e.g. the attribute ids of a cluster do not fit in a context tag
+                _assert_compiled_raises(cls, raw, err)
+                continue
+            assert cls._tlv_decoder(raw) == expected, cls.__qualname__
+            assert _compiled_encode(cls._tlv_encoder, expected) == expected_tlv, cls.__qualname__
+            assert cls.FromTLV(expected.ToTLV()) == expected, cls.__qualname__
+
+        for attribute in ALL_ATTRIBUTES.get(cluster.id, {}).values():
+            raw = _make_tlv_value(attribute.attribute_type.Type, prefer_null)
+            try:
+                expected, expected_tlv = _interpreted_attribute_round_trip(attribute, raw)
+            except (TypeError, ValueError) as err:
+                _assert_compiled_raises(attribute, raw, err)
+                continue
+            assert attribute._tlv_decoder(raw) == expected, attribute.__qualname__
+            assert _compiled_encode(attribute._tlv_encoder, expected) == expected_tlv, attribute.__qualname__
+            assert attribute.FromTLV(bytes(attribute.ToTLV(None, expected))) == expected, attribute.__qualname__
+
+
+def test_compiled_tlv_is_cached() -> None:
+    """The compiled encoder/decoder is built once per class."""
+    struct = clusters.Descriptor.Structs.DeviceTypeStruct
+    assert struct._tlv_encoder is struct._tlv_encoder
+    assert struct._tlv_decoder is struct._tlv_decoder
+    assert struct._tlv_decoder is not clusters.AccessControl.Structs.AccessControlTargetStruct._tlv_decoder
+    attribute = clusters.OnOff.Attributes.OnTime
+    assert attribute._tlv_encoder is attribute._tlv_encoder
+    assert attribute._tlv_decoder is attribute._tlv_decoder
+
+
+def test_compiled_tlv_falls_back_to_interpreted() -> None:
+    """Values the compiled path does not handle give the results and errors of the interpreted path."""
+    struct = clusters.Descriptor.Structs.DeviceTypeStruct
+    assert struct(deviceType=uint(1), revision=uint(1)).ToTLV() == struct.descriptor.DictToTLV(
+        {"deviceType": 1, "revision": 1}
+    )
+    # a dict (keyed by label) where a struct is expected is accepted by both paths
+    device_type_list = clusters.Descriptor.Attributes.DeviceTypeList
+    assert bytes(device_type_list.ToTLV(None, [{"deviceType": 1, "revision": 1}])) == bytes(
+        device_type_list.ToTLV(None, [struct(deviceType=uint(1), revision=uint(1))])
+    )
+    with pytest.raises(ValueError, match=r"expected <class 'chip\.tlv\.uint'>"):
+        struct(deviceType=-1, revision=uint(1)).ToTLV()  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="was not nullable"):
+        clusters.OnOff.Attributes.OnTime.ToTLV(None, NullValue)
+    with pytest.raises(ValueError, match="was not optional"):
+        clusters.OnOff.Attributes.OnOff.ToTLV(None, None)
+    writer = tlv.TLVWriter()
+    writer.put(None, {0: "text", 1: uint(1)})
+    with pytest.raises(ValueError, match="Failed to decode field"):
+        struct.FromTLV(bytes(writer.encoding))
+
+
+def test_compiled_tlv_malformed_values() -> None:
+    """Malformed values raise the errors of the interpreted path, errors of the compiled path itself are not hidden."""
+    struct = clusters.Descriptor.Structs.DeviceTypeStruct
+    writer = tlv.TLVWriter()
+    writer.put(None, 5)
+    with pytest.raises(AttributeError):
+        # the interpreted path does not check for a struct either
+        struct.FromTLV(bytes(writer.encoding))
+    with pytest.raises(TypeError, match="not iterable"):
+        clusters.Descriptor.Attributes.DeviceTypeList.FromTagDictOrRawValue(5)
+    with pytest.raises(ValueError, match="struct expected"):
+        clusters.Descriptor.Attributes.DeviceTypeList.FromTagDictOrRawValue([5])
+    with pytest.raises(ValueError, match=r"Failed to decode field \.Value"):
+        clusters.OnOff.Attributes.OnOff.FromTagDictOrRawValue("on")
+    with pytest.raises(ValueError, match=r"expected <class 'chip\.tlv\.uint'>, but got <class 'str'>"):
+        clusters.OnOff.Attributes.OnTime.ToTLV(None, "abc")
+
+
+def test_compiled_tlv_errors_are_not_hidden(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An unexpected error of a compiled encoder/decoder is raised, not handled by the interpreted path."""
+
+    def broken(*_: Any) -> Any:
+        raise KeyError("bug")
+
+    struct = clusters.Descriptor.Structs.DeviceTypeStruct
+    attribute = clusters.OnOff.Attributes.OnTime
+    for cls in (struct, attribute):
+        monkeypatch.setattr(cls, "_tlv_encoder", staticmethod(broken))
+        monkeypatch.setattr(cls, "_tlv_decoder", staticmethod(broken))
+    with pytest.raises(KeyError):
+        struct(deviceType=uint(1), revision=uint(1)).ToTLV()
+    with pytest.raises(KeyError):
+        struct.FromTLV(struct.descriptor.DictToTLV({"deviceType": 1, "revision": 1}))
+    with pytest.raises(KeyError):
+        attribute.ToTLV(None, uint(1))
+    with pytest.raises(KeyError):
+        attribute.FromTagDictOrRawValue(1)
@@ -0,0 +1,59 @@
+"""Tests for matter_server.client.models.device_type_index."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+from chip.clusters import Objects as clusters
+from matter_server.client.models.device_type_index import (
+    get_cluster_set,
+    get_device_types_requiring,
+    get_matching_device_types,
+    get_required_clusters,
+)
+from matter_server.client.models.device_types import ALL_TYPES, DimmableLight, OnOffLight, RootNode
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+
+def test_index_is_up_to_date() -> None:
+    """The generated index must match the device type definitions it is generated from."""
+    spec = importlib.util.spec_from_file_location(
+        "generate_device_type_index", SCRIPTS_DIR / "generate_device_type_index.py"
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+    assert generator.INDEX_FILE.read_text() == generator.generate(), (
+        "device type index is outdated, run scripts/generate_device_type_index.py"
+    )
+
+
+def test_matches_device_type_clusters() -> None:
+    """The cluster sets match the required clusters of all device types."""
+    for device_type in ALL_TYPES.values():
+        cluster_ids = [cluster.id for cluster in device_type.clusters]
+        assert get_required_clusters(device_type) == get_cluster_set(cluster_ids)
+        assert device_type in get_matching_device_types(cluster_ids)
+        for cluster_id in cluster_ids:
+            assert device_type in get_device_types_requiring(cluster_id)
+    assert get_required_clusters(0xFFFF) == 0
+
+
+def test_matching_device_types() -> None:
+    """All device types of which the clusters are present are matched, unknown clusters are ignored."""
+    light_clusters = [cluster.id for cluster in DimmableLight.clusters]
+    matches = get_matching_device_types([*light_clusters, 0xFFF1FC01])
+    assert DimmableLight in matches
+    assert OnOffLight in matches
+    assert RootNode not in matches
+    assert matches == get_matching_device_types(get_cluster_set(light_clusters))
+    assert set(matches) == {
+        device_type
+        for device_type in ALL_TYPES.values()
+        if device_type.clusters and all(cluster.id in light_clusters for cluster in device_type.clusters)
+    }
+    assert OnOffLight in get_device_types_requiring(clusters.OnOff)
+    assert get_device_types_requiring(0xFFF1FC01) == []
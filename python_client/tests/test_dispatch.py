@@ -0,0 +1,221 @@
+"""Tests for the asynchronous and coalescing event dispatch of MatterClient (matter_server.client.dispatch)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from matter_server.client import MatterClient
+from matter_server.client.dispatch import DispatchOptions, OverflowPolicy
+from matter_server.common.models import EventType
+
+
+def _make_client(**kwargs: Any) -> MatterClient:
+    return MatterClient(
+        "ws://localhost:5580/ws", MagicMock(), dispatch_options=DispatchOptions(async_dispatch=True, **kwargs)
+    )
+
+
+async def _drain() -> None:
+    """Let the subscriber tasks run until their queues are empty."""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+async def test_slow_subscriber_does_not_block_others() -> None:
+    """Each subscriber drains its own queue, async callbacks are awaited."""
+    client = _make_client()
+    fast: list[Any] = []
+    slow: list[Any] = []
+    release = asyncio.Event()
+
+    async def slow_callback(_: EventType, data: Any) -> None:
+        await release.wait()
+        slow.append(data)
+
+    client.subscribe_events(lambda _, data: fast.append(data))
+    client.subscribe_events(slow_callback)
+    for value in range(3):
+        client._signal_event(EventType.ATTRIBUTE_UPDATED, value, 1, "1/6/0")
+    # signalling only queues the events
+    assert fast == []
+    await _drain()
+    assert fast == [0, 1, 2]
+    assert slow == []
+    release.set()
+    await _drain()
+    assert slow == [0, 1, 2]
+
+    fast_metrics, slow_metrics = client.get_subscriber_metrics()
+    assert slow_metrics.name.endswith("slow_callback")
+    assert fast_metrics.delivered == slow_metrics.delivered == 3
+    assert slow_metrics.max_queue_depth == 3
+    assert slow_metrics.queue_depth == 0
+    assert slow_metrics.max_callback_time >= fast_metrics.max_callback_time
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected", "dropped", "coalesced"),
+    [
+        (OverflowPolicy.DROP_OLDEST, [("1/6/0", 1), ("1/6/0", 2), ("1/6/0", 3)], 3, 0),
+        (OverflowPolicy.COALESCE, [("1/6/0", 3), ("1/8/0", 0), ("1/8/0", 1)], 0, 3),
+    ],
+)
+async def test_overflow_policies(
+    policy: OverflowPolicy, expected: list[tuple[str, int]], dropped: int, coalesced: int
+) -> None:
+    """A full queue drops the oldest event or replaces the queued value of the same path."""
+    client = _make_client(queue_size=3, overflow_policy=policy)
+    received: list[Any] = []
+    client.subscribe_events(lambda _, data: received.append(data))
+    for path, value in [("1/6/0", 0), ("1/8/0", 0), ("1/8/0", 1), ("1/6/0", 1), ("1/6/0", 2), ("1/6/0", 3)]:
+        client._signal_event(EventType.ATTRIBUTE_UPDATED, (path, value), 1, path)
+    await _drain()
+    assert received == expected
+    (metrics,) = client.get_subscriber_metrics()
+    assert (metrics.dropped, metrics.coalesced) == (dropped, coalesced)
+
+
+async def test_block_policy_waits_for_subscriber() -> None:
+    """With the block policy the client waits until a full subscriber caught up."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock())
+    received: list[Any] = []
+    options = DispatchOptions(async_dispatch=True, queue_size=2, overflow_policy=OverflowPolicy.BLOCK)
+    client.subscribe_events(lambda _, data: received.append(data), dispatch_options=options)
+    for value in range(3):
+        client._signal_event(EventType.NODE_UPDATED, value, 1)
+    assert client._dispatcher.full
+    await asyncio.wait_for(client._dispatcher.wait_for_space(), 1)
+    await _drain()
+    assert received == [0, 1, 2]
+
+
+async def test_callback_errors_and_unsubscribe(caplog: pytest.LogCaptureFixture) -> None:
+    """A failing callback is logged and keeps receiving events, until unsubscribed."""
+    client = _make_client()
+    received: list[Any] = []
+
+    def callback(_: EventType, data: Any) -> None:
+        received.append(data)
+        if data == 0:
+            raise ValueError
+
+    unsubscribe = client.subscribe_events(callback)
+    client._signal_event(EventType.NODE_UPDATED, 0, 1)
+    client._signal_event(EventType.NODE_UPDATED, 1, 1)
+    await _drain()
+    assert received == [0, 1]
+    assert "Error in event subscriber" in caplog.text
+    unsubscribe()
+    assert client.get_subscriber_metrics() == []
+    client._signal_event(EventType.NODE_UPDATED, 2, 1)
+    await _drain()
+    assert received == [0, 1]
+
+
+@pytest.mark.parametrize("queue_size", [0, -1])
+def test_invalid_queue_size(queue_size: int) -> None:
+    """A subscriber queue holds at least one event."""
+    with pytest.raises(ValueError, match="queue_size"):
+        DispatchOptions(async_dispatch=True, queue_size=queue_size)
+
+
+@pytest.mark.parametrize("coalesce_interval", [None, 0])
+async def test_coroutine_callback_needs_async_dispatch(coalesce_interval: float | None) -> None:
+    """A coroutine function callback is rejected without async_dispatch, as it would never be awaited."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock())
+
+    async def callback(_: EventType, data: Any) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="async_dispatch"):
+        client.subscribe_events(callback, coalesce_interval=coalesce_interval)
+    client.subscribe_events(
+        callback, coalesce_interval=coalesce_interval, dispatch_options=DispatchOptions(async_dispatch=True)
+    )
+    assert len(client.get_subscriber_metrics()) == 1
+
+
+async def test_disconnect_closes_subscribers() -> None:
+    """Disconnecting stops the subscriber tasks, queued events are not delivered afterwards."""
+    client = _make_client()
+    client.connection = MagicMock(disconnect=AsyncMock())
+    received: list[Any] = []
+    release = asyncio.Event()
+
+    async def slow_callback(_: EventType, data: Any) -> None:
+        await release.wait()
+        received.append(data)
+
+    client.subscribe_events(slow_callback)
+    for value in range(3):
+        client._signal_event(EventType.ATTRIBUTE_UPDATED, value, 1, "1/6/0")
+    await _drain()
+    await client.disconnect()
+    release.set()
+    await _drain()
+    assert received == []
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.parametrize("async_dispatch", [False, True])
+async def test_disconnect_closes_coalescers(async_dispatch: bool) -> None:
+    """Disconnecting cancels the timers of the coalescing subscribers, held back values are dropped."""
+    client = MatterClient(
+        "ws://localhost:5580/ws", MagicMock(), dispatch_options=DispatchOptions(async_dispatch=async_dispatch)
+    )
+    client.connection = MagicMock(disconnect=AsyncMock())
+    received: list[Any] = []
+    client.subscribe_events(lambda _, data: received.append(data), coalesce_interval=0.01)
+    client.subscribe_events(lambda _, data: received.append(data), coalesce_interval=0)
+    for value in range(3):
+        client._signal_event(EventType.ATTRIBUTE_UPDATED, value, 1, "1/6/0")
+    await client.disconnect()
+    await asyncio.sleep(0.05)
+    await _drain()
+    assert received == ([] if async_dispatch else [0])
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+async def test_coalesce_latest_value() -> None:
+    """With a coalesce interval of 0 only the latest value per path of an event loop iteration is delivered."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock())
+    received: list[Any] = []
+    client.subscribe_events(lambda _, data: received.append(data), coalesce_interval=0)
+    for path, value in [("1/6/0", 0), ("1/8/0", 0), ("1/6/0", 1), ("1/8/0", 1), ("1/8/0", 2)]:
+        client._signal_event(EventType.ATTRIBUTE_UPDATED, (path, value), 1, path)
+    client._signal_event(EventType.NODE_UPDATED, "node", 1)
+    assert received == ["node"]
+    await asyncio.sleep(0)
+    assert received == ["node", ("1/6/0", 1), ("1/8/0", 2)]
+
+
+async def test_coalesce_interval() -> None:
+    """With a coalesce interval at most one update per path per interval is delivered, the latest at the end."""
+    client = _make_client()
+    received: list[Any] = []
+    unsubscribe = client.subscribe_events(lambda _, data: received.append(data), coalesce_interval=0.05)
+    for value in range(5):
+        client._signal_event(EventType.ATTRIBUTE_UPDATED, value, 1, "1/6/0")
+    client._signal_event(EventType.ATTRIBUTE_UPDATED, "other", 2, "1/6/0")
+    await _drain()
+    assert received == [0, "other"]
+    await asyncio.sleep(0.1)
+    await _drain()
+    assert received == [0, "other", 4]
+    (metrics,) = client.get_subscriber_metrics()
+    assert metrics.coalesced == 3
+
+    # the held back value is dropped on unsubscribe
+    unsubscribe()
+    received.clear()
+    unsubscribe = client.subscribe_events(lambda _, data: received.append(data), coalesce_interval=10)
+    client._signal_event(EventType.ATTRIBUTE_UPDATED, 5, 1, "1/6/0")
+    client._signal_event(EventType.ATTRIBUTE_UPDATED, 6, 1, "1/6/0")
+    await _drain()
+    unsubscribe()
+    await _drain()
+    assert received == [5]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock
 
 from matter_server.client import MatterClient
@@ -33,3 +34,93 @@ def test_known_event_still_dispatches() -> None:
     client._handle_event_message(EventMessage(event=EventType.SERVER_SHUTDOWN, data=None))
 
     assert received == [(EventType.SERVER_SHUTDOWN, None)]
+
+
+def _node_added(node_id: int) -> EventMessage:
+    attributes = {"0/29/0": [{"0": 22, "1": 1}], "1/29/0": [{"0": 256, "1": 1}], "1/6/0": False, "1/8/0": 1}
+    data = {
+        "node_id": node_id,
+        "date_commissioned": "2024-01-01T00:00:00",
+        "last_interview": "2024-01-01T00:00:00",
+        "interview_version": 6,
+        "available": True,
+        "attributes": attributes,
+    }
+    return EventMessage(event=EventType.NODE_ADDED, data=data)
+
+
+def _attribute_updated(node_id: int, attribute_path: str, value: object) -> EventMessage:
+    return EventMessage(event=EventType.ATTRIBUTE_UPDATED, data=[node_id, attribute_path, value])
+
+
+async def test_attribute_updates_are_batched() -> None:
+    """Attribute updates within one loop iteration are applied per node at once, then signalled."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock(), batch_attribute_updates=True)
+    client._loop = asyncio.get_running_loop()
+    client._handle_event_message(_node_added(1))
+    client._handle_event_message(_node_added(2))
+    node = client.get_node(1)
+    received: list[tuple[object, object]] = []
+    batches: list[tuple[int, dict[str, object]]] = []
+    node_batches: list[dict[str, object]] = []
+
+    def on_event(event: object, data: object) -> None:
+        # the node already has all updates of the batch applied
+        assert node.get_attribute_value(1, 8, 0) == 100
+        received.append((event, data))
+
+    client.subscribe_events(on_event, EventType.ATTRIBUTE_UPDATED, node_filter=1)
+    client.subscribe_attribute_updates(lambda node, updates: batches.append((node.node_id, updates)))
+    unsubscribe = client.subscribe_attribute_updates(lambda _, updates: node_batches.append(updates), node_filter=2)
+
+    client._handle_event_message(_attribute_updated(1, "1/6/0", True))
+    client._handle_event_message(_attribute_updated(2, "1/6/0", True))
+    client._handle_event_message(_attribute_updated(1, "1/8/0", 50))
+    client._handle_event_message(_attribute_updated(1, "1/8/0", 100))
+    assert node.get_attribute_value(1, 6, 0) is False
+    assert batches == []
+
+    await asyncio.sleep(0)
+    assert node.get_attribute_value(1, 6, 0) is True
+    # every update is signalled to the (per attribute) event subscribers
+    assert received == [
+        (EventType.ATTRIBUTE_UPDATED, True),
+        (EventType.ATTRIBUTE_UPDATED, 50),
+        (EventType.ATTRIBUTE_UPDATED, 100),
+    ]
+    assert batches == [(1, {"1/6/0": True, "1/8/0": 100}), (2, {"1/6/0": True})]
+    assert node_batches == [{"1/6/0": True}]
+
+    unsubscribe()
+    client._handle_event_message(_attribute_updated(2, "1/6/0", False))
+    # another event flushes the pending updates first, to keep the order
+    client._handle_event_message(EventMessage(event=EventType.NODE_REMOVED, data=2))
+    assert batches[-1] == (2, {"1/6/0": False})
+    assert node_batches == [{"1/6/0": True}]
+    await asyncio.sleep(0)
+    assert len(batches) == 3
+
+
+def test_attribute_updates_without_batching() -> None:
+    """Without batching every attribute update is applied at once, as a batch of one."""
+    client = _make_client()
+    client._handle_event_message(_node_added(1))
+    batches: list[dict[str, object]] = []
+
+    def on_batch(_: object, updates: dict[str, object]) -> None:
+        batches.append(updates)
+
+    assert not client._dispatcher.has_batch_subscribers
+    unsubscribe_first = client.subscribe_attribute_updates(on_batch, node_filter=1)
+    unsubscribe = client.subscribe_attribute_updates(on_batch, node_filter=1)
+    client._handle_event_message(_attribute_updated(1, "1/6/0", True))
+    assert client.get_node(1).get_attribute_value(1, 6, 0) is True
+    assert batches == [{"1/6/0": True}, {"1/6/0": True}]
+
+    unsubscribe()
+    # unsubscribing twice is a no-op, the other subscription of the same callback stays
+    unsubscribe()
+    client._handle_event_message(_attribute_updated(1, "1/6/0", False))
+    assert batches[2:] == [{"1/6/0": False}]
+    unsubscribe_first()
+    assert not client._dispatcher.has_batch_subscribers
@@ -0,0 +1,111 @@
+"""Tests for matter_server.client.models.fabric_index and the MatterClient endpoint queries."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+from chip.clusters import Objects as clusters
+from matter_server.client import MatterClient
+from matter_server.client.models.device_types import ExtendedColorLight, OnOffLight
+from matter_server.client.models.fabric_index import FabricIndex
+from matter_server.client.models.node import MatterEndpoint, MatterNode
+from matter_server.common.helpers.util import dataclass_from_dict
+from matter_server.common.models import EventMessage, EventType, MatterNodeData
+
+
+def make_node_data(node_id: int, vendor_id: int = 0xFFF1, product_id: int = 0x8000) -> dict[str, Any]:
+    """Return the raw data of a (root endpoint + light) node, as received from the server."""
+    return {
+        "node_id": node_id,
+        "date_commissioned": "2024-01-01T00:00:00",
+        "last_interview": "2024-01-01T00:00:00",
+        "interview_version": 6,
+        "available": True,
+        "attributes": {
+            "0/29/0": [{"0": 22, "1": 1}],
+            "0/40/2": vendor_id,
+            "0/40/4": product_id,
+            "1/29/0": [{"0": 256, "1": 1}],
+            "1/6/0": True,
+        },
+    }
+
+
+def make_node(node_id: int, vendor_id: int = 0xFFF1, product_id: int = 0x8000) -> MatterNode:
+    """Return a MatterNode of a (root endpoint + light) node."""
+    return MatterNode(dataclass_from_dict(MatterNodeData, make_node_data(node_id, vendor_id, product_id)))
+
+
+def keys(endpoints: list[MatterEndpoint]) -> list[tuple[int, int]]:
+    """Return the (node_id, endpoint_id) of the endpoints."""
+    return [(x.node.node_id, x.endpoint_id) for x in endpoints]
+
+
+def test_query() -> None:
+    """Endpoints are found by cluster, device type and vendor/product, combined filters intersect."""
+    node_1 = make_node(1)
+    node_2 = make_node(2, product_id=0x8001)
+    index = FabricIndex([node_1, node_2])
+    assert len(index) == 4
+    assert keys(index.query(cluster_id=clusters.OnOff.id)) == [(1, 1), (2, 1)]
+    assert keys(index.query(device_type=OnOffLight)) == [(1, 1), (2, 1)]
+    assert keys(index.query(device_type=OnOffLight.device_type, product_id=0x8001)) == [(2, 1)]
+    assert keys(index.query(vendor_id=0xFFF1, product_id=0x8000)) == [(1, 0), (1, 1)]
+    assert keys(index.query(cluster_id=clusters.OnOff.id, vendor_id=0xFFF2)) == []
+    assert keys(index.query(cluster_id=clusters.LevelControl.id)) == []
+    assert keys(index.query()) == [(1, 0), (1, 1), (2, 0), (2, 1)]
+
+
+def test_incremental_updates() -> None:
+    """The index follows attribute updates, node updates and removed endpoints/nodes."""
+    node = make_node(1)
+    index = FabricIndex([node])
+
+    node.update_attribute("1/8/0", 128)
+    index.attribute_updated(node, "1/8/0")
+    assert keys(index.query(cluster_id=clusters.LevelControl.id)) == [(1, 1)]
+    node.update_attribute("1/29/0", [{"0": 269, "1": 1}])
+    index.attribute_updated(node, "1/29/0")
+    assert keys(index.query(device_type=OnOffLight)) == []
+    assert keys(index.query(device_type=ExtendedColorLight)) == [(1, 1)]
+    node.update_attribute("0/40/4", 0x8002)
+    index.attribute_updated(node, "0/40/4")
+    assert keys(index.query(vendor_id=0xFFF1, product_id=0x8000)) == []
+    assert keys(index.query(product_id=0x8002)) == [(1, 0), (1, 1)]
+
+    node_data = dataclass_from_dict(MatterNodeData, make_node_data(1))
+    node_data.attributes["2/29/0"] = [{"0": 256, "1": 1}]
+    node_data.attributes["2/6/0"] = False
+    index.update_node(node, node.update(node_data))
+    assert keys(index.query(cluster_id=clusters.OnOff.id)) == [(1, 1), (1, 2)]
+    assert keys(index.query(cluster_id=clusters.LevelControl.id)) == []
+    assert sorted(keys(index.query(device_type=OnOffLight))) == [(1, 1), (1, 2)]
+    assert keys(index.query(vendor_id=0xFFF1, product_id=0x8000)) == [(1, 0), (1, 1), (1, 2)]
+
+    node.remove_endpoint(1)
+    index.remove_endpoint(1, 1)
+    assert keys(index.query(cluster_id=clusters.OnOff.id)) == [(1, 2)]
+    index.remove_node(1)
+    assert len(index) == 0
+    assert index.by_cluster == {}
+    assert index.by_device_type == {}
+    assert index.by_vendor == {}
+    assert index.by_product == {}
+
+
+def test_client_get_endpoints() -> None:
+    """MatterClient keeps the fabric index up to date from the node events."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock())
+    client._handle_event_message(EventMessage(event=EventType.NODE_ADDED, data=make_node_data(1)))
+    client._handle_event_message(EventMessage(event=EventType.NODE_ADDED, data=make_node_data(2)))
+    node_1 = client.get_node(1)
+    assert client.get_endpoints(clusters.OnOff) == [node_1.endpoints[1], client.get_node(2).endpoints[1]]
+
+    client._handle_event_message(EventMessage(event=EventType.ATTRIBUTE_UPDATED, data=[1, "1/8/0", 128]))
+    assert client.get_endpoints(clusters.LevelControl.id, device_type=OnOffLight) == [node_1.endpoints[1]]
+
+    client._handle_event_message(EventMessage(event=EventType.ENDPOINT_REMOVED, data={"node_id": 1, "endpoint_id": 1}))
+    client._handle_event_message(EventMessage(event=EventType.NODE_REMOVED, data=2))
+    assert client.get_endpoints(clusters.OnOff) == []
+    assert client.get_endpoints(vendor_id=0xFFF1) == [node_1.endpoints[0]]
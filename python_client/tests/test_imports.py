@@ -1,5 +1,9 @@
 """Smoke tests verifying all HA integration imports resolve."""
 
+from pathlib import Path
+import subprocess
+import sys
+import textwrap
 from typing import Any
 
 
@@ -189,3 +193,55 @@ def test_wago_window_covering_extension_attributes_exist() -> None:
     assert tags["wagoTravelTimeUp"] == 0x15340001
     assert tags["wagoTravelTimeDown"] == 0x15340002
     assert tags["wagoSlatRotationTime"] == 0x15340003
+
+
+def _run_python(code: str) -> str:
+    """Run code in a fresh interpreter (so nothing is imported yet), return its stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+    return result.stdout
+
+
+def test_cluster_definitions_imported_lazily() -> None:
+    """Importing the client must not import the generated cluster modules, only on first use."""
+    output = _run_python(
+        """
+        import sys
+
+        import matter_server.client.models.node
+        from chip.clusters import Objects as clusters
+        from chip.clusters import ClusterIndex, cluster_defs
+        from chip.clusters.ClusterObjects import ALL_ATTRIBUTES, ALL_CLUSTERS, ALL_EVENTS
+        from matter_server.client.models.device_types import OnOffLight
+
+        def imported():
+            prefix = "chip.clusters.cluster_defs."
+            return sorted(name.removeprefix(prefix) for name in sys.modules if name.startswith(prefix))
+
+        print(imported())
+        print(ClusterIndex.ResolveAttributePath("1/6/0")[2].label, imported())
+        print(0x0006 in ALL_CLUSTERS, imported())
+        print(ALL_ATTRIBUTES[0x0008][0x0000].__name__, imported())
+        print(ALL_EVENTS[0x003B][0x0001] is clusters.Switch.Events.InitialPress)
+        print(0xFFF1FC01 in ALL_CLUSTERS, ALL_CLUSTERS.get(0xFFF1FC01))
+        print(clusters.OnOff is ALL_CLUSTERS[0x0006] is cluster_defs.OnOff)
+        print(sorted(cluster.__name__ for cluster in OnOffLight.clusters) == sorted(OnOffLight.cluster_names))
+        print(len(ALL_CLUSTERS) == len(cluster_defs.CLUSTER_MODULES), len(imported()) == len(cluster_defs.__all__) + 1)
+        """
+    )
+    assert output.splitlines() == [
+        "[]",
+        "onOff ['_index']",
+        "True ['Globals', 'OnOff', '_index']",
+        "CurrentLevel ['Globals', 'LevelControl', 'OnOff', '_index']",
+        "True",
+        "False None",
+        "True",
+        "True",
+        "True True",
+    ]
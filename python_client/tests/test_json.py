@@ -0,0 +1,74 @@
+"""Tests for matter_server.common.helpers.json."""
+
+from __future__ import annotations
+
+from base64 import b64encode
+
+import pytest
+
+from chip.clusters.Types import Nullable, NullValue
+from chip.tlv import float32, uint
+from matter_server.common.helpers.json import (
+    json_dumps,
+    json_dumps_compact,
+    json_encoder_default,
+    json_loads,
+)
+from matter_server.common.models import APICommand, CommandMessage
+
+
+class _Bytes(bytes):
+    """Subclass of a special type, handled by the isinstance fallback."""
+
+
+class _NotSerialized:
+    do_not_serialize = True
+
+
+def test_compact_and_indented_encode_the_same_data() -> None:
+    """The compact (wire) form holds the same data as the indented form, without whitespace."""
+    message = CommandMessage(
+        message_id="1",
+        command=APICommand.DEVICE_COMMAND,
+        args={"node_id": 1, "payload": {"level": uint(128), "data": b"\x01\x02", 5: NullValue}},
+    )
+    compact = json_dumps_compact(message)
+    indented = json_dumps(message)
+    assert "\n" not in compact
+    assert " " not in compact
+    assert "\n" in indented
+    assert json_loads(compact) == json_loads(indented)
+    assert json_loads(compact)["args"]["payload"] == {"level": 128, "data": "AQI=", "5": None}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (uint(5), 5),
+        (float32(1.5), 1.5),
+        (NullValue, None),
+        (Nullable(), None),
+        (b"\x00\xff", "AP8="),
+        (_Bytes(b"\x00\xff"), "AP8="),
+        ({3}, [3]),
+        ((1, 2), [1, 2]),
+        (_NotSerialized(), None),
+        (ValueError("boom"), "boom"),
+        (uint, "chip.tlv.uint"),
+    ],
+)
+def test_encoder_default(value: object, expected: object) -> None:
+    """Special (Matter) types are converted to plain json types."""
+    assert json_encoder_default(value) == expected
+
+
+def test_encoder_default_unknown_type() -> None:
+    """Unknown types are rejected."""
+    with pytest.raises(TypeError):
+        json_encoder_default(object())
+
+
+def test_encode_large_bytes() -> None:
+    """Bytes are base64 encoded without line breaks."""
+    data = bytes(range(256)) * 4
+    assert json_loads(json_dumps_compact([data])) == [b64encode(data).decode()]
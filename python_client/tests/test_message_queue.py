@@ -0,0 +1,235 @@
+"""Tests for reading the messages into a queue, processed by a separate task (MatterClient message_queue_size)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from matter_server.client import MatterClient
+from matter_server.client.connection import MatterClientConnection, is_result_frame
+from matter_server.client.dispatch import DispatchOptions, OverflowPolicy
+from matter_server.client.exceptions import ConnectionClosed, InvalidMessage
+from matter_server.common.models import EventType, SuccessResultMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+NODE_DATA = {
+    "node_id": 1,
+    "date_commissioned": "2024-01-01T00:00:00",
+    "last_interview": "2024-01-01T00:00:00",
+    "interview_version": 6,
+    "available": True,
+    "attributes": {"1/29/1": [6], "1/6/0": True},
+}
+
+
+def _make_client(
+    frames: Iterable[str | None],
+    message_queue_size: int,
+    nodes: list[dict[str, Any]] | None = None,
+    idle: asyncio.Event | None = None,
+    batch_attribute_updates: bool = False,
+) -> MatterClient:
+    """
+    Return a client with a fake connection that receives the frames, then closes.
+
+    A None frame waits for the idle event, like a connection without messages.
+    """
+    client = MatterClient(
+        "ws://localhost:5580/ws",
+        MagicMock(),
+        batch_attribute_updates=batch_attribute_updates,
+        message_queue_size=message_queue_size,
+    )
+    connection = MagicMock()
+    connection.connected = True
+    connection.server_info = None
+    connection.send_message = AsyncMock()
+    connection.disconnect = AsyncMock()
+    connection.receive_message_or_raise = AsyncMock(
+        return_value=SuccessResultMessage(message_id="1", result=nodes or [])
+    )
+    connection.decode_message = MatterClientConnection.decode_message
+    remaining = iter(frames)
+
+    async def receive_frame_or_raise() -> str:
+        while (frame := next(remaining, "")) is None:
+            assert idle is not None
+            await idle.wait()
+        if not frame:
+            raise ConnectionClosed("Connection was closed.")
+        return frame
+
+    connection.receive_frame_or_raise = receive_frame_or_raise
+    client.connection = connection
+    return client
+
+
+def _node_removed(node_id: int) -> str:
+    return f'{{"event": "node_removed", "data": {node_id}}}'
+
+
+def _result(client: MatterClient, result: str) -> str:
+    """Return the result frame of the last command sent by the client."""
+    sent = cast(AsyncMock, client.connection.send_message).await_args
+    assert sent is not None
+    message = sent.args[0]
+    return f'{{"message_id": "{message.message_id}", "result": {result}}}'
+
+
+def _block_processing(client: MatterClient) -> asyncio.Event:
+    """
+    Make the processing wait after the third node_removed event, until the returned event is set.
+
+    The subscriber waits in its callback for the first event, its full queue blocks the processing.
+    """
+    release = asyncio.Event()
+
+    async def wait_for_release(*_: Any) -> None:
+        await release.wait()
+
+    client.subscribe_events(
+        wait_for_release,
+        EventType.NODE_REMOVED,
+        dispatch_options=DispatchOptions(async_dispatch=True, queue_size=1, overflow_policy=OverflowPolicy.BLOCK),
+    )
+    return release
+
+
+def test_is_result_frame() -> None:
+    """Command results are recognized from the start of the message text."""
+    assert is_result_frame('{"message_id": "abc", "result": null}')
+    assert not is_result_frame(_node_removed(1))
+
+
+async def test_results_are_fast_tracked() -> None:
+    """A command result is handled right away, ahead of the messages queued before it."""
+    client = _make_client([_node_removed(1), _node_removed(2), '{"message_id": "abc", "result": 1}'], 10)
+    future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+    client._result_futures["abc"] = future
+    received: list[bool] = []
+    client.subscribe_events(lambda *_: received.append(future.done()), EventType.NODE_REMOVED)
+
+    await client.start_listening()
+    assert future.result() == 1
+    assert received == [True, True]
+    metrics = client.get_reader_metrics()
+    assert metrics is not None
+    assert (metrics.fast_tracked, metrics.processed, metrics.max_queue_depth) == (1, 2, 2)
+    assert metrics.queue_depth == 0
+    assert metrics.max_processing_lag >= metrics.average_processing_lag
+
+
+async def test_refresh_skips_older_queued_updates() -> None:
+    """The queued updates read before a refresh_attribute result do not overwrite the value read."""
+    idle = asyncio.Event()
+    client: MatterClient
+
+    def frames() -> Iterator[str | None]:
+        # wait for the refresh_attribute command, then queue an older update before its result
+        yield None
+        yield _node_removed(2)
+        yield _node_removed(3)
+        yield _node_removed(4)
+        yield '{"event": "attribute_updated", "data": [1, "1/6/0", false]}'
+        yield _result(client, '{"1/6/0": true}')
+
+    client = _make_client(frames(), 10, [NODE_DATA], idle=idle)
+    release = _block_processing(client)
+    received: list[Any] = []
+    client.subscribe_events(lambda _, data: received.append(data), EventType.ATTRIBUTE_UPDATED)
+    listening = asyncio.create_task(client.start_listening())
+    await asyncio.sleep(0)
+    refresh = asyncio.create_task(client.refresh_attribute(1, "1/6/0"))
+    await asyncio.sleep(0)
+    idle.set()
+
+    await asyncio.wait_for(refresh, 1)
+    release.set()
+    await asyncio.wait_for(listening, 1)
+    assert client.get_node(1).get_attribute_value(1, 6, 0) is True
+    assert not received
+    metrics = client.get_reader_metrics()
+    assert metrics is not None
+    assert (metrics.fast_tracked, metrics.processed, metrics.skipped) == (1, 4, 1)
+
+
+async def test_node_commands_wait_for_queued_events() -> None:
+    """A command whose result follows node events returns once the events read before it are processed."""
+    idle = asyncio.Event()
+    client: MatterClient
+
+    def frames() -> Iterator[str | None]:
+        yield None
+        yield _node_removed(2)
+        yield _node_removed(3)
+        yield _node_removed(4)
+        yield _node_removed(1)
+        yield _result(client, "null")
+
+    client = _make_client(frames(), 10, [NODE_DATA], idle=idle)
+    release = _block_processing(client)
+    listening = asyncio.create_task(client.start_listening())
+    await asyncio.sleep(0)
+    remove = asyncio.create_task(client.remove_node(1))
+    await asyncio.sleep(0)
+    idle.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert not remove.done()
+    assert client.get_nodes()
+
+    release.set()
+    await asyncio.wait_for(remove, 1)
+    assert not client.get_nodes()
+    await asyncio.wait_for(listening, 1)
+
+
+async def test_full_queue_stops_reading() -> None:
+    """The reader waits for the processing once the queue is full, all messages are processed in order."""
+    client = _make_client([_node_removed(x) for x in range(10)], 3)
+    received: list[int] = []
+    client.subscribe_events(lambda _, node_id: received.append(node_id), EventType.NODE_REMOVED)
+
+    await client.start_listening()
+    assert received == list(range(10))
+    metrics = client.get_reader_metrics()
+    assert metrics is not None
+    assert metrics.max_queue_depth == 3
+
+
+async def test_queued_updates_are_batched() -> None:
+    """The attribute updates read together are applied and signalled in one batch per node."""
+    frames = [
+        f'{{"event": "attribute_updated", "data": [1, "1/6/0", {"true" if x % 2 else "false"}]}}' for x in range(5)
+    ]
+    frames.append('{"event": "attribute_updated", "data": [1, "1/29/1", [6, 7]]}')
+    client = _make_client(frames, 10, [NODE_DATA], batch_attribute_updates=True)
+    batches: list[dict[str, Any]] = []
+    client.subscribe_attribute_updates(lambda _, updates: batches.append(updates))
+
+    await client.start_listening()
+    assert batches == [{"1/6/0": False, "1/29/1": [6, 7]}]
+
+
+async def test_processing_error_is_raised() -> None:
+    """An invalid message ends start_listening with the error, like without the queue."""
+    client = _make_client([_node_removed(1), "not json", _node_removed(2)], 10)
+    received: list[int] = []
+    client.subscribe_events(lambda _, node_id: received.append(node_id), EventType.NODE_REMOVED)
+    with pytest.raises(InvalidMessage):
+        await client.start_listening()
+    assert received == [1]
+
+
+async def test_processing_error_while_idle() -> None:
+    """A processing error ends start_listening also while no more messages are received."""
+    idle = asyncio.Event()
+    client = _make_client([_node_removed(1), "not json", None], 10, idle=idle)
+    with pytest.raises(InvalidMessage):
+        await asyncio.wait_for(client.start_listening(), 1)
+    assert not idle.is_set()
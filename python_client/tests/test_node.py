@@ -0,0 +1,320 @@
+"""Tests for matter_server.client.models.node."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from chip.clusters import Objects as clusters
+from chip.tlv import uint
+from matter_server.client.models.device_types import Aggregator, ExtendedColorLight, OnOffLight, RootNode
+from matter_server.client.models.node import LazyClusters, MatterNode, _get_attribute_entry
+from matter_server.client.models.snapshot import NodeSnapshot
+from matter_server.common.models import MatterNodeData
+
+CUSTOM_CLUSTER_ID = 0xFFF1FC01
+
+
+def make_node_data() -> MatterNodeData:
+    """Return the data of a (root endpoint + color light) node, as received from the server."""
+    attributes: dict[str, Any] = {
+        "0/29/0": [{"0": 22, "1": 1}],
+        "0/29/1": [29, 40],
+        "0/29/3": [1],
+        "0/40/1": "Vendor",
+        "0/40/5": "Kitchen",
+        "1/29/0": [{"0": 269, "1": 1}],
+        "1/29/1": [29, 6, 8],
+        "1/29/3": [],
+        "1/6/0": True,
+        "1/6/16387": None,
+        "1/8/0": 128,
+        f"1/{CUSTOM_CLUSTER_ID}/0": 1,
+    }
+    return MatterNodeData(
+        node_id=1,
+        date_commissioned=datetime(2024, 1, 1, tzinfo=UTC),
+        last_interview=datetime(2024, 1, 1, tzinfo=UTC),
+        interview_version=6,
+        available=True,
+        attributes=attributes,
+    )
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_node_clusters(lazy: bool) -> None:
+    """Clusters, attributes and device types are the same in eager and lazy mode."""
+    node = MatterNode(make_node_data(), lazy=lazy)
+    endpoint = node.endpoints[1]
+    assert isinstance(endpoint.clusters, LazyClusters) == lazy
+    assert node.name == "Kitchen"
+    assert RootNode in node.endpoints[0].device_types
+    assert endpoint.device_types == {ExtendedColorLight}
+    assert sorted(endpoint.clusters) == [6, 8, 29]
+    assert endpoint.has_cluster(clusters.OnOff)
+    assert not endpoint.has_cluster(clusters.ColorControl)
+    assert not endpoint.has_cluster(CUSTOM_CLUSTER_ID)
+    assert endpoint.has_attribute(CUSTOM_CLUSTER_ID, 0)
+    assert endpoint.get_attribute_value(None, clusters.OnOff.Attributes.OnOff) is True
+    assert endpoint.get_attribute_value(8, 0) == 128
+    on_off = endpoint.get_cluster(clusters.OnOff)
+    assert on_off is not None
+    assert on_off.startUpOnOff is None
+    assert endpoint.get_cluster(clusters.ColorControl) is None
+
+    node.update_attribute("1/6/0", False)
+    node.update_attribute("1/8/0", 64)
+    node.update_attribute("1/768/7", 300)
+    assert on_off.onOff is False
+    assert endpoint.get_attribute_value(8, 0) == 64
+    assert endpoint.get_attribute_value(None, clusters.ColorControl.Attributes.ColorTemperatureMireds) == 300
+
+    # a Descriptor cluster without DeviceTypeList (and PartsList) holds the default values
+    node_data = make_node_data()
+    node_data.attributes = {"0/29/3": [1], "1/6/0": True, "1/29/1": [6]}
+    endpoint = MatterNode(node_data, lazy=lazy).endpoints[1]
+    assert endpoint.device_types == set()
+    assert endpoint.get_attribute_value(None, clusters.Descriptor.Attributes.DeviceTypeList) == []
+    assert endpoint.get_attribute_value(None, clusters.Descriptor.Attributes.PartsList) == []
+
+
+def test_lazy_clusters_materialized_on_access() -> None:
+    """In lazy mode a cluster is only parsed on first access, updates are kept raw until then."""
+    node_data = make_node_data()
+    node = MatterNode(node_data, lazy=True)
+    endpoint_clusters = node.endpoints[1].clusters
+    assert isinstance(endpoint_clusters, LazyClusters)
+    # the device types are derived from the raw Descriptor attributes
+    assert not endpoint_clusters.is_materialized(clusters.Descriptor.id)
+    assert not endpoint_clusters.is_materialized(clusters.OnOff.id)
+    assert clusters.OnOff.id in endpoint_clusters
+    assert not endpoint_clusters.is_materialized(clusters.OnOff.id)
+
+    node.update_attribute("1/6/0", False)
+    assert node_data.attributes["1/6/0"] is False
+    assert not endpoint_clusters.is_materialized(clusters.OnOff.id)
+    on_off = node.get_cluster(1, clusters.OnOff)
+    assert on_off is not None
+    assert on_off.onOff is False
+    assert endpoint_clusters.is_materialized(clusters.OnOff.id)
+    assert node.get_cluster(1, clusters.OnOff) is on_off
+
+    # a node update keeps the materialized clusters in sync
+    assert node.update(make_node_data()) == {"1/6/0"}
+    assert node.get_cluster(1, clusters.OnOff) is on_off
+    assert node.get_attribute_value(1, None, clusters.OnOff.Attributes.OnOff) is True
+    with pytest.raises(KeyError):
+        endpoint_clusters[CUSTOM_CLUSTER_ID]
+
+
+def test_node_attribute_index() -> None:
+    """The attribute index follows attribute updates and removed endpoints."""
+    node = MatterNode(make_node_data())
+    assert [path for _, path in node.attribute_index.query(cluster_id=clusters.Descriptor.id, attribute_id=0)] == [
+        "0/29/0",
+        "1/29/0",
+    ]
+    assert not node.endpoints[1].has_attribute(clusters.ColorControl, 7)
+    node.update_attribute("1/768/7", 300)
+    assert node.endpoints[1].has_attribute(clusters.ColorControl, 7)
+    # updates for an unknown endpoint are ignored
+    node.update_attribute("5/6/0", True)
+    assert (5, 6, 0) not in node.attribute_index
+
+    node.remove_endpoint(1)
+    assert 1 not in node.endpoints
+    assert node.get_compose_parent(1) is None
+    assert [path for _, path in node.attribute_index.query(cluster_id=clusters.Descriptor.id)] == [
+        "0/29/0",
+        "0/29/1",
+        "0/29/3",
+    ]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_node_update_incremental(lazy: bool) -> None:
+    """A node update only processes the changed attributes and returns their paths."""
+    node = MatterNode(make_node_data(), lazy=lazy)
+    endpoint = node.endpoints[1]
+    assert node.update(make_node_data()) == set()
+
+    node_data = make_node_data()
+    node_data.attributes["1/8/0"] = 10
+    del node_data.attributes["1/6/16387"]
+    # endpoint 1 becomes a composed device with a (new) child endpoint 2
+    node_data.attributes["1/29/3"] = [2]
+    node_data.attributes["2/29/0"] = [{"0": 256, "1": 1}]
+    node_data.attributes["2/6/0"] = False
+    assert node.update(node_data) == {"1/8/0", "1/6/16387", "1/29/3", "2/29/0", "2/6/0"}
+    assert node.endpoints[1] is endpoint
+    assert endpoint.get_attribute_value(8, 0) == 10
+    assert not endpoint.has_attribute(6, 16387)
+    assert endpoint.get_attribute_value(6, 0) is True
+    assert node.get_compose_parent(2) is endpoint
+    assert node.get_compose_child_ids(1) == (2,)
+    assert node.endpoints[2].device_types == {OnOffLight}
+    assert node.endpoints[2].get_attribute_value(6, 0) is False
+
+    # endpoint 2 is removed again and endpoint 1 changes device type
+    node_data = make_node_data()
+    node_data.attributes["1/29/0"] = [{"0": 256, "1": 1}]
+    assert node.update(node_data) == {"1/29/0", "1/29/3", "1/6/16387", "1/8/0", "2/29/0", "2/6/0"}
+    assert 2 not in node.endpoints
+    assert node.get_compose_parent(2) is None
+    assert endpoint.device_types == {OnOffLight}
+    assert endpoint.has_attribute(6, 16387)
+
+
+def test_node_without_raw_attributes() -> None:
+    """Without keep_raw the raw values are dropped once parsed, updates parse all values again."""
+    with pytest.raises(ValueError, match="raw attribute values"):
+        MatterNode(make_node_data(), lazy=True, keep_raw=False)
+    node = MatterNode(make_node_data(), keep_raw=False)
+    assert node.node_data.attributes == {}
+    endpoint = node.endpoints[1]
+    on_off = endpoint.get_cluster(clusters.OnOff)
+    assert on_off is not None
+    assert endpoint.has_attribute(6, 16387)
+    node.update_attribute("1/6/0", False)
+    assert node.node_data.attributes == {}
+    assert endpoint.get_attribute_value(6, 0) is False
+
+    node_data = make_node_data()
+    node_data.attributes["1/6/16387"] = 1
+    del node_data.attributes["1/8/0"]
+    assert len(node.update(node_data)) == len(make_node_data().attributes)
+    assert node.node_data.attributes == {}
+    assert endpoint.get_attribute_value(6, 0) is True
+    assert on_off.startUpOnOff == clusters.OnOff.Enums.StartUpOnOffEnum.kOn
+    # the last attribute of a cluster is removed with the cluster
+    assert not endpoint.has_cluster(clusters.LevelControl)
+
+
+def test_removed_attribute_is_reset() -> None:
+    """An attribute removed by a node update is reset to its default, the cluster instance is kept."""
+    node = MatterNode(make_node_data())
+    on_off = node.get_cluster(1, clusters.OnOff)
+    assert on_off is not None
+    node_data = make_node_data()
+    node_data.attributes["1/6/16387"] = 1
+    node.update(node_data)
+    assert on_off.startUpOnOff == clusters.OnOff.Enums.StartUpOnOffEnum.kOn
+    node_data = make_node_data()
+    del node_data.attributes["1/6/16387"]
+    assert node.update(node_data) == {"1/6/16387"}
+    assert node.get_cluster(1, clusters.OnOff) is on_off
+    assert on_off.startUpOnOff is None
+
+
+def test_attribute_entries() -> None:
+    """The cached attribute entries parse raw values like parse_value does."""
+    parts_list = _get_attribute_entry(clusters.Descriptor.id, clusters.Descriptor.Attributes.PartsList.attribute_id)
+    assert parts_list is not None
+    assert parts_list.name == "partsList"
+    assert parts_list.parse([1, 2]) == [1, 2]
+    # a missing value becomes a fresh default
+    assert parts_list.parse(None) == []
+    assert parts_list.parse(None) is not parts_list.parse(None)
+    assert _get_attribute_entry(clusters.Descriptor.id, clusters.Descriptor.Attributes.PartsList.attribute_id) is (
+        parts_list
+    )
+    start_up = _get_attribute_entry(clusters.OnOff.id, clusters.OnOff.Attributes.StartUpOnOff.attribute_id)
+    assert start_up is not None
+    assert start_up.parse(1) is clusters.OnOff.Enums.StartUpOnOffEnum.kOn
+    assert start_up.parse(None) is None
+    device_types = _get_attribute_entry(clusters.Descriptor.id, 0)
+    assert device_types is not None
+    assert device_types.parse([{"0": 22, "1": 1}]) == [clusters.Descriptor.Structs.DeviceTypeStruct(uint(22), uint(1))]
+    assert _get_attribute_entry(CUSTOM_CLUSTER_ID, 0) is None
+    assert _get_attribute_entry(clusters.OnOff.id, 0x1234) is None
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_composed_device_index(lazy: bool) -> None:
+    """Composed device children link to their nearest parent, also on (single) attribute updates."""
+    node_data = make_node_data()
+    # endpoint 1 is a composed device with endpoint 2, which itself is composed of endpoint 3
+    node_data.attributes["1/29/3"] = [2, 3]
+    node_data.attributes["2/29/0"] = [{"0": 256, "1": 1}]
+    node_data.attributes["2/29/3"] = [3]
+    node_data.attributes["3/29/0"] = [{"0": 256, "1": 1}]
+    node_data.attributes["3/6/0"] = True
+    node = MatterNode(node_data, lazy=lazy)
+    assert node.get_compose_parent(1) is None
+    assert node.get_compose_parent(2) is node.endpoints[1]
+    assert node.get_compose_parent(3) is node.endpoints[2]
+    assert node.get_compose_child_ids(1) == (2,)
+    assert node.get_compose_child_ids(2) == (3,)
+    assert node.endpoints[3].is_composed_device
+
+    node.update_attribute("2/29/3", [])
+    assert node.get_compose_parent(3) is node.endpoints[1]
+    assert node.get_compose_child_ids(1) == (2, 3)
+    assert node.get_compose_child_ids(2) == ()
+    node.update_attribute("1/29/0", [{"0": 14, "1": 1}])
+    assert Aggregator in node.endpoints[1].device_types
+    assert node.get_compose_parent(2) is None
+    assert node.get_compose_child_ids(1) == ()
+
+    node.update_attribute("1/29/0", [{"0": 269, "1": 1}])
+    node.remove_endpoint(2)
+    assert node.get_compose_child_ids(1) == (3,)
+    node.remove_endpoint(1)
+    assert node.get_compose_parent(3) is None
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_cluster_endpoints_index(lazy: bool) -> None:
+    """The endpoints per cluster follow attribute updates and removals."""
+    node = MatterNode(make_node_data(), lazy=lazy)
+    assert node.has_cluster(clusters.OnOff)
+    assert node.has_cluster(clusters.OnOff, endpoint=1)
+    assert not node.has_cluster(clusters.OnOff, endpoint=0)
+    assert not node.has_cluster(CUSTOM_CLUSTER_ID)
+    assert [x.endpoint_id for x in node.get_cluster_endpoints(clusters.Descriptor)] == [0, 1]
+    assert node.get_cluster_endpoints(clusters.ColorControl) == []
+
+    node.update_attribute("1/768/7", 300)
+    assert node.get_cluster_endpoints(clusters.ColorControl.id) == [node.endpoints[1]]
+    node_data = make_node_data()
+    del node_data.attributes["1/8/0"]
+    node.update(node_data)
+    assert not node.has_cluster(clusters.LevelControl)
+    assert not node.has_cluster(clusters.ColorControl)
+    node.remove_endpoint(1)
+    assert not node.has_cluster(clusters.OnOff)
+    assert [x.endpoint_id for x in node.get_cluster_endpoints(clusters.Descriptor)] == [0]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_node_snapshot(lazy: bool) -> None:
+    """Snapshots are immutable, share the unchanged clusters and are diffable."""
+    node = MatterNode(make_node_data(), lazy=lazy)
+    snapshot = node.snapshot()
+    assert isinstance(snapshot, NodeSnapshot)
+    assert node.snapshot() is snapshot
+    assert snapshot.get_attribute_value(1, 6, 0) is True
+    assert snapshot.get_attribute_value(1, 8, 0) == 128
+    assert snapshot.get_attribute_value(1, 768, 7) is None
+    # only known attributes are in the snapshot
+    assert CUSTOM_CLUSTER_ID not in snapshot.endpoints[1]
+    with pytest.raises(TypeError):
+        snapshot.endpoints[1][6][0] = False  # type: ignore[index]
+
+    node.update_attribute("1/6/0", False)
+    node.update_attribute("1/768/7", 300)
+    updated = node.snapshot()
+    assert snapshot.get_attribute_value(1, 6, 0) is True
+    assert updated.get_attribute_value(1, 6, 0) is False
+    assert updated.endpoints[0] is snapshot.endpoints[0]
+    assert updated.get_cluster(1, 8) is snapshot.get_cluster(1, 8)
+    assert updated.changed_paths(snapshot) == ["1/6/0", "1/768/7"]
+    assert snapshot.changed_paths(updated) == ["1/6/0", "1/768/7"]
+
+    node.update_attribute("1/8/0", 128)
+    assert node.snapshot().changed_paths(updated) == []
+    node.remove_endpoint(1)
+    assert 1 not in node.snapshot().endpoints
+    assert updated.get_attribute_value(1, 8, 0) == 128
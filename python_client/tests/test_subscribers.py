@@ -0,0 +1,145 @@
+"""Tests for matter_server.client.subscribers."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from chip.clusters import Objects as clusters
+from matter_server.client import MatterClient
+from matter_server.client.subscribers import SubscriberIndex, make_path_filters, parse_path_filter
+from matter_server.common.models import EventType
+
+
+def test_parse_path_filter() -> None:
+    """Path filters accept decimal and hex ids and wildcards, trailing wildcards are dropped."""
+    assert parse_path_filter("1/6/0") == (1, 6, 0)
+    assert parse_path_filter("1/0x0006/*") == (1, 6)
+    assert parse_path_filter("1/*/*") == (1,)
+    assert parse_path_filter("*/6/0") == ("*", 6, 0)
+    assert parse_path_filter("*/*/*") == ("*",)
+    with pytest.raises(ValueError, match="Invalid attribute path filter"):
+        parse_path_filter("1/6/0/1")
+    with pytest.raises(ValueError, match="Invalid attribute path filter"):
+        parse_path_filter("1/OnOff")
+
+
+def test_signal() -> None:
+    """Subscribers are called for the events matching their filters."""
+    index = SubscriberIndex()
+    received: dict[str, list[Any]] = {}
+
+    def subscribe(
+        name: str, event_filter: EventType | None = None, node_filter: int | None = None, path: str | None = None
+    ) -> None:
+        path_filters = None if path is None else [parse_path_filter(path)]
+        index.subscribe(
+            lambda _, data: received.setdefault(name, []).append(data), event_filter, node_filter, path_filters
+        )
+
+    subscribe("all")
+    subscribe("attributes", EventType.ATTRIBUTE_UPDATED)
+    subscribe("node 1", None, 1)
+    subscribe("exact", EventType.ATTRIBUTE_UPDATED, 1, "1/6/0")
+    subscribe("exact hex", EventType.ATTRIBUTE_UPDATED, 1, "0x1/0x0006/0x0")
+    subscribe("cluster", EventType.ATTRIBUTE_UPDATED, 1, "1/0x0006/*")
+    subscribe("any endpoint", EventType.ATTRIBUTE_UPDATED, None, "*/6/0")
+    subscribe("any path", EventType.ATTRIBUTE_UPDATED, 1, "*/*/*")
+
+    index.signal(EventType.ATTRIBUTE_UPDATED, "a", 1, "1/6/0")
+    index.signal(EventType.ATTRIBUTE_UPDATED, "b", 1, "1/6/16387")
+    index.signal(EventType.ATTRIBUTE_UPDATED, "c", 2, "2/6/0")
+    index.signal(EventType.NODE_UPDATED, "d", 1)
+    index.signal(EventType.SERVER_SHUTDOWN, "e")
+    assert received == {
+        "all": ["a", "b", "c", "d", "e"],
+        "attributes": ["a", "b", "c"],
+        "node 1": ["a", "b", "d"],
+        "exact": ["a"],
+        "exact hex": ["a"],
+        "cluster": ["a", "b"],
+        "any endpoint": ["a", "c"],
+        "any path": ["a", "b"],
+    }
+
+
+def test_unsubscribe() -> None:
+    """Unsubscribing removes only that subscriber (also during a signal) and prunes empty branches."""
+    index = SubscriberIndex()
+    received: list[str] = []
+    unsubscribe_1 = index.subscribe(lambda *_: received.append("1"), None, 1, [(1, 6, 0)])
+    unsubscribe_2 = index.subscribe(lambda *_: received.append("2"), None, 1, [(1, 6, 0)])
+
+    def unsubscribe_self(*_: Any) -> None:
+        received.append("3")
+        unsubscribe_3()
+
+    unsubscribe_3 = index.subscribe(unsubscribe_self, None, 1, [(1, 6, 0)])
+    index.signal(EventType.ATTRIBUTE_UPDATED, None, 1, "1/6/0")
+    unsubscribe_1()
+    unsubscribe_1()
+    index.signal(EventType.ATTRIBUTE_UPDATED, None, 1, "1/6/0")
+    assert received == ["1", "2", "3", "2"]
+    assert len(index) == 1
+    unsubscribe_2()
+    assert len(index) == 0
+    assert index._root.children == {}
+
+
+def test_make_path_filters() -> None:
+    """Structured filters expand to a path filter per combination of ids."""
+    assert make_path_filters(1) == [(1,)]
+    assert make_path_filters(None, clusters.OnOff) == [("*", 6)]
+    assert make_path_filters([1, 2], [6, 8], 0) == [(1, 6, 0), (1, 8, 0), (2, 6, 0), (2, 8, 0)]
+    assert make_path_filters(None, None, clusters.OnOff.Attributes.OnOff) == [("*", 6, 0)]
+    assert make_path_filters(1, clusters.LevelControl, clusters.OnOff.Attributes.OnOff) == []
+    assert make_path_filters(1, [6, 8], [clusters.OnOff.Attributes.OnOff, 0x4000]) == [
+        (1, 6, 0),
+        (1, 6, 0x4000),
+        (1, 8, 0x4000),
+    ]
+    assert make_path_filters([]) == []
+
+
+def test_overlapping_path_filters() -> None:
+    """A subscriber with overlapping path filters is called once per event."""
+    index = SubscriberIndex()
+    received: list[Any] = []
+    index.subscribe(lambda _, data: received.append(data), path_filters=[("*", 6, 0), ("*", "*", 0), (1, 6, 0), (3,)])
+    assert len(index._subscriptions[0]) == 2
+    index.signal(EventType.ATTRIBUTE_UPDATED, "a", 1, "1/6/0")
+    index.signal(EventType.ATTRIBUTE_UPDATED, "b", 1, "2/8/0")
+    index.signal(EventType.ATTRIBUTE_UPDATED, "c", 1, "3/8/1")
+    index.signal(EventType.ATTRIBUTE_UPDATED, "d", 1, "1/6/1")
+    assert received == ["a", "b", "c"]
+
+    client = MatterClient("ws://localhost:5580/ws", MagicMock())
+    received.clear()
+    client.subscribe_events(
+        lambda _, data: received.append(data),
+        EventType.ATTRIBUTE_UPDATED,
+        attribute_filter=[clusters.OnOff.Attributes.OnOff, 0],
+    )
+    client._signal_event(EventType.ATTRIBUTE_UPDATED, "a", 1, "1/6/0")
+    assert received == ["a"]
+
+
+def test_client_structured_filters() -> None:
+    """MatterClient.subscribe_events accepts structured endpoint/cluster/attribute filters."""
+    client = MatterClient("ws://localhost:5580/ws", MagicMock())
+    received: list[Any] = []
+    client.subscribe_events(
+        lambda _, data: received.append(data),
+        EventType.ATTRIBUTE_UPDATED,
+        endpoint_filter=[1, 2],
+        cluster_filter=clusters.OnOff,
+    )
+    client._signal_event(EventType.ATTRIBUTE_UPDATED, "a", 1, "1/6/0")
+    client._signal_event(EventType.ATTRIBUTE_UPDATED, "b", 1, "2/6/16387")
+    client._signal_event(EventType.ATTRIBUTE_UPDATED, "c", 1, "3/6/0")
+    client._signal_event(EventType.ATTRIBUTE_UPDATED, "d", 1, "1/8/0")
+    assert received == ["a", "b"]
+    with pytest.raises(ValueError, match="Use either"):
+        client.subscribe_events(print, attr_path_filter="1/6/0", endpoint_filter=1)
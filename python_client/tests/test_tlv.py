@@ -0,0 +1,196 @@
+"""Tests for the TLV encoding and decoding (chip.tlv)."""
+
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+import pytest
+
+from chip.tlv import (
+    TLV_TYPE_ARRAY,
+    TLV_TYPE_NULL,
+    TLV_TYPE_STRUCTURE,
+    TLVBoolean_True,
+    TLVElement,
+    TLVEndOfContainer,
+    TLVReader,
+    TLVStreamReader,
+    TLVWriter,
+    float32,
+    uint,
+)
+
+
+def _encode(value: Any) -> bytes:
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+def test_reader_nested_containers() -> None:
+    """Structs, arrays and scalars decode into dicts, lists and python values."""
+    value = {
+        0: uint(1),
+        1: -300,
+        2: [uint(1), uint(300), uint(70000), uint(2**40)],
+        3: {0: "hello", 1: b"\x00\x01", 2: None, 3: True, 4: False},
+        4: [{0: uint(5)}, {0: uint(6), 1: []}],
+        5: 1.5,
+    }
+    result = TLVReader(_encode(value)).get()
+    assert result == {"Any": value}
+    decoded = result["Any"]
+    assert isinstance(decoded[0], uint)
+    assert not isinstance(decoded[1], uint)
+    assert all(isinstance(item, uint) for item in decoded[2])
+    assert type(decoded[5]) is float
+
+
+def test_reader_scalar_types() -> None:
+    """Unsigned integers and single precision floats keep their Matter types."""
+    decoded = TLVReader(_encode([uint(0), float32(0.5), -1, uint(2**62), "ü" * 300, b"x" * 300])).get()["Any"]
+    assert decoded == [0, 0.5, -1, 2**62, "ü" * 300, b"x" * 300]
+    assert isinstance(decoded[0], uint)
+    assert isinstance(decoded[1], float32)
+    assert type(decoded[3]) is uint
+
+
+def test_reader_invalid_utf8_string() -> None:
+    """A UTF-8 string that does not decode is returned as raw bytes."""
+    assert TLVReader(b"\x2c\x01\x03\xff\xfe\x41").get() == {1: b"\xff\xfeA"}
+
+
+@pytest.mark.parametrize("buffer_type", [bytes, bytearray, memoryview])
+def test_reader_buffer_types(buffer_type: type) -> None:
+    """The reader accepts any buffer, without changing the result."""
+    payload = _encode({0: [uint(1), "a"], 1: b"b"})
+    assert TLVReader(buffer_type(payload)).get() == {"Any": {0: [1, "a"], 1: b"b"}}
+
+
+def test_reader_errors() -> None:
+    """Truncated and unsupported input raise the same errors as before."""
+    with pytest.raises(struct.error):
+        TLVReader(b"\x24").get()
+    with pytest.raises(struct.error):
+        TLVReader(b"\x25\x01\x00").get()
+    with pytest.raises(ValueError, match="unsupported TLV type"):
+        TLVReader(b"\x17").get()
+
+
+def test_stream_reader_elements() -> None:
+    """The stream reader returns (depth, tag, type, value) elements in encoding order."""
+    payload = _encode({0: uint(1), 1: [True, None], 2: {0: "a"}})
+    assert [tuple(element) for element in TLVStreamReader(payload)] == [
+        (0, None, TLV_TYPE_STRUCTURE, None),
+        (1, 0, 0x04, 1),
+        (1, 1, TLV_TYPE_ARRAY, None),
+        (2, None, TLVBoolean_True, True),
+        (2, None, TLV_TYPE_NULL, None),
+        (1, None, TLVEndOfContainer, None),
+        (1, 2, TLV_TYPE_STRUCTURE, None),
+        (2, 0, 0x0C, "a"),
+        (1, None, TLVEndOfContainer, None),
+        (0, None, TLVEndOfContainer, None),
+    ]
+
+
+def test_stream_reader_skip_and_read_container() -> None:
+    """Containers can be skipped or decoded as a whole, matching TLVReader."""
+    value = {0: [uint(1), uint(2)], 1: {0: b"x", 1: [{}]}, 2: -1}
+    payload = _encode(value)
+    reader = TLVStreamReader(payload)
+    assert reader.read() == (0, None, TLV_TYPE_STRUCTURE, None)
+    assert reader.read() == (1, 0, TLV_TYPE_ARRAY, None)
+    reader.skip()
+    assert reader.read() == (1, 1, TLV_TYPE_STRUCTURE, None)
+    assert reader.readContainer() == TLVReader(payload).get()["Any"][1]
+    assert reader.read() == (1, 2, 0x00, -1)
+    assert reader.read() == (0, None, TLVEndOfContainer, None)
+    assert reader.read() is None
+    assert reader.depth == 0
+
+    reader = TLVStreamReader(payload)
+    reader.read()
+    assert reader.readContainer() == value
+
+
+def test_stream_reader_incremental() -> None:
+    """Data can be fed in chunks, elements are returned once they are complete."""
+    payload = _encode({0: "hello" * 100, 1: [uint(70000)] * 10, 2: {0: 1.5}})
+    expected = list(TLVStreamReader(payload))
+    for chunk_size in (1, 3, 64):
+        reader = TLVStreamReader()
+        elements: list[TLVElement] = []
+        for index in range(0, len(payload), chunk_size):
+            reader.feed(payload[index : index + chunk_size])
+            elements.extend(reader)
+        assert elements == expected
+        assert reader.pending == 0
+
+
+def test_stream_reader_incremental_skip_and_read_container() -> None:
+    """A skip spans chunks, reading an incomplete container can be retried."""
+    payload = _encode({0: [uint(1)] * 10, 1: {0: "a"}, 2: True})
+    reader = TLVStreamReader(payload[:6])
+    reader.read()
+    reader.read()
+    reader.skip()
+    assert reader.read() is None
+    reader.feed(payload[6:26])
+    assert reader.read() == (1, 1, TLV_TYPE_STRUCTURE, None)
+    with pytest.raises(ValueError, match="not completely buffered"):
+        reader.readContainer()
+    reader.feed(payload[26:])
+    assert reader.readContainer() == {0: "a"}
+    assert reader.read() == (1, 2, TLVBoolean_True, True)
+
+
+def test_stream_reader_errors() -> None:
+    """Reading or skipping outside of a container and unsupported types raise."""
+    with pytest.raises(ValueError, match="No open container"):
+        TLVStreamReader(b"").skip()
+    with pytest.raises(ValueError, match="No open container"):
+        TLVStreamReader(b"").readContainer()
+    with pytest.raises(ValueError, match="Unexpected end of container"):
+        TLVStreamReader(b"\x18").read()
+    with pytest.raises(ValueError, match="unsupported TLV type"):
+        TLVStreamReader(b"\x17").read()
+
+
+def test_writer_encoding() -> None:
+    """Values are encoded with the smallest integer/length size and context tags in structs."""
+    assert _encode(
+        {
+            2: [uint(1), uint(300), -2, -40000, True, None],
+            0: "ab",
+            1: b"\x00" * 256,
+            3: float32(1.0),
+            4: 1.0,
+        }
+    ) == (
+        b"\x15\x2c\x00\x02ab\x31\x01\x00\x01"
+        + bytes(256)
+        + (
+            b"\x36\x02\x04\x01\x05\x2c\x01\x00\xfe\x02\xc0\x63\xff\xff\x09\x14\x18"
+            b"\x2a\x03\x00\x00\x80\x3f"
+            b"\x2b\x04\x00\x00\x00\x00\x00\x00\xf0\x3f"
+            b"\x18"
+        )
+    )
+
+
+def test_writer_errors() -> None:
+    """Invalid tags and values raise a ValueError."""
+    with pytest.raises(ValueError, match="at top level"):
+        TLVWriter().put(1, uint(1))
+    with pytest.raises(ValueError, match="anonymous tag within TLV structure"):
+        TLVWriter().put(None, {None: 1})
+    writer = TLVWriter()
+    writer.startArray(None)
+    with pytest.raises(ValueError, match="context-specific tag within TLV array"):
+        writer.put(1, uint(1))
+    with pytest.raises(ValueError, match="out of range"):
+        TLVWriter().put(None, uint(2**64))
+    with pytest.raises(ValueError, match="unsupported value"):
+        TLVWriter().put(None, object())
@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+import typing
+
+import pytest
+
 from chip.clusters import Objects as clusters
 from chip.clusters.Types import NullValue
 from chip.tlv import uint
-from matter_server.common.helpers.util import dataclass_to_dict, dataclass_to_tag_dict
+from matter_server.common.helpers.util import (
+    _dataclass_from_dict_reflective,
+    compile_dataclass_decoder,
+    compile_value_parser,
+    dataclass_from_dict,
+    dataclass_to_dict,
+    dataclass_to_tag_dict,
+    parse_value,
+)
+from matter_server.common.models import (
+    EventMessage,
+    EventType,
+    MatterNodeData,
+    NetworkTopology,
+    ServerInfoMessage,
+)
 
 
 def test_dataclass_to_tag_dict_uses_tlv_tags() -> None:
@@ -130,3 +150,132 @@ def test_dataclass_to_dict_still_uses_field_names() -> None:
 
     assert result["presetHandle"] == b"\x01"
     assert result["presetScenario"] == clusters.Thermostat.Enums.PresetScenarioEnum.kOccupied
+
+
+_RAW_NODE = {
+    "node_id": 5,
+    "date_commissioned": "2024-01-01T10:00:00",
+    "last_interview": "2024-02-01T10:00:00+00:00",
+    "interview_version": 6,
+    "available": True,
+    "attributes": {
+        "0/29/0": [{"0": 22, "1": 1}],
+        "1/6/0": True,
+        "1/8/0": {"TLVValue": None, "Reason": None},
+        "0/40/5": "Living room",
+    },
+    "attribute_subscriptions": [[1, 6, None], [None, None, None]],
+}
+
+
+@pytest.mark.parametrize(
+    ("cls", "raw"),
+    [
+        (MatterNodeData, _RAW_NODE),
+        (EventMessage, {"event": "attribute_updated", "data": [5, "1/6/0", False]}),
+        (EventMessage, {"event": "some_future_event", "data": {"x": 1}}),
+        (
+            ServerInfoMessage,
+            {
+                "fabric_id": 1,
+                "compressed_fabric_id": "1234",
+                "schema_version": 11,
+                "min_supported_schema_version": 9,
+                "sdk_version": "1.0",
+                "wifi_credentials_set": False,
+                "thread_credentials_set": True,
+                "bluetooth_enabled": False,
+            },
+        ),
+        (
+            NetworkTopology,
+            {
+                "collected_at": 1,
+                "nodes": [{"id": "a", "kind": "matter", "network_type": "thread", "rloc16": 1024}],
+                "connections": [
+                    {
+                        "source": "a",
+                        "target": "b",
+                        "network": "thread",
+                        "strength": "weak",
+                        "source_to_target": {"strength": "weak", "lqi": 1},
+                    }
+                ],
+            },
+        ),
+    ],
+)
+def test_compiled_decoder_matches_reflective(cls: type, raw: dict) -> None:
+    """The compiled decoder must produce exactly what the reflective implementation does."""
+    for strict in (False, True):
+        for allow_sdk_types in (False, True):
+            expected: typing.Any = _dataclass_from_dict_reflective(cls, raw, strict, allow_sdk_types)
+            assert dataclass_from_dict(cls, raw, strict, allow_sdk_types) == expected
+
+
+def test_compiled_decoder_is_cached() -> None:
+    """A decoder is only compiled once per dataclass/mode combination."""
+    assert compile_dataclass_decoder(MatterNodeData, False, False) is compile_dataclass_decoder(
+        MatterNodeData, False, False
+    )
+    assert compile_dataclass_decoder(MatterNodeData, True, False) is not compile_dataclass_decoder(
+        MatterNodeData, False, False
+    )
+
+
+def test_compiled_decoder_values() -> None:
+    """Spot check the conversions done by the compiled decoder."""
+    node = dataclass_from_dict(MatterNodeData, _RAW_NODE)
+    assert node.date_commissioned.year == 2024
+    assert node.attributes["1/8/0"] is None  # sdk parse error
+    assert node.attributes["0/29/0"] == [{"0": 22, "1": 1}]
+    event = dataclass_from_dict(EventMessage, {"event": "node_removed", "data": 5})
+    assert event.event is EventType.NODE_REMOVED
+
+
+def test_compiled_decoder_errors() -> None:
+    """Invalid input raises the same errors as the reflective implementation."""
+    with pytest.raises(KeyError, match="Extra key"):
+        dataclass_from_dict(EventMessage, {"event": "node_removed", "data": 5, "x": 1}, strict=True)
+    with pytest.raises(KeyError, match="is required"):
+        dataclass_from_dict(ServerInfoMessage, {"fabric_id": 1}, strict=True)
+    with pytest.raises(TypeError, match=r"is invalid for MatterNodeData\.node_id"):
+        dataclass_from_dict(MatterNodeData, {**_RAW_NODE, "node_id": "abc"})
+
+
+@dataclass
+class _OptionalUnion:
+    value: int | None
+    items: list[float]
+
+
+def test_compiled_union_logs_when_optional(caplog: pytest.LogCaptureFixture) -> None:
+    """An unparsable optional value is logged and replaced by None."""
+    result = dataclass_from_dict(_OptionalUnion, {"value": "abc", "items": [1, 2.5, None]})
+    assert result == _OptionalUnion(value=None, items=[1.0, 2.5])
+    assert "is invalid for _OptionalUnion.value" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("value_type", "raw"),
+    [
+        (clusters.Descriptor.Attributes.DeviceTypeList.attribute_type.Type, [{"0": 22, "1": 1}, {"0": "14", "1": 2}]),
+        (clusters.OnOff.Attributes.StartUpOnOff.attribute_type.Type, None),
+        (clusters.OnOff.Attributes.StartUpOnOff.attribute_type.Type, 1),
+        (clusters.OnOff.Attributes.StartUpOnOff.attribute_type.Type, 99),
+        (clusters.BasicInformation.Attributes.UniqueID.attribute_type.Type, "abc"),
+        (clusters.OperationalCredentials.Structs.NOCStruct, {"1": "AQID", "2": None, "254": 1}),
+        (
+            clusters.GeneralDiagnostics.Attributes.NetworkInterfaces.attribute_type.Type,
+            [{"4": "AQID", "5": ["not base64!"]}],
+        ),
+        (clusters.ElectricalPowerMeasurement.Attributes.ActivePower.attribute_type.Type, 1500),
+        (clusters.Thermostat.Structs.PresetStruct, {"0": "AQ==", "1": 1, "5": True}),
+    ],
+)
+def test_compiled_value_parser_matches_parse_value(value_type: typing.Any, raw: typing.Any) -> None:
+    """A compiled value parser behaves like parse_value for cluster attribute types."""
+    for allow_sdk_types in (False, True):
+        parser = compile_value_parser("test", value_type, allow_sdk_types=allow_sdk_types)
+        expected = parse_value("test", raw, value_type, allow_sdk_types=allow_sdk_types)
+        assert parser(raw) == expected